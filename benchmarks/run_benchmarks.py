@@ -0,0 +1,633 @@
+"""
+Benchmarks of MCEVS (timings and accuracy of the fast paths against the reference ones)
+
+Usage:
+        python benchmarks/run_benchmarks.py                 (all benchmarks; those requiring OpenVSP are skipped without it)
+        python benchmarks/run_benchmarks.py name [name ...]  (e.g., atmosphere_provider serialization)
+        python benchmarks/run_benchmarks.py --list
+"""
+from MCEVS.Constants.Container import EarthGravityAndAtmosphere, AtmosphereProvider, get_atmosphere_provider
+from MCEVS.Utils.Serialization import to_dict, from_dict, dumps, loads, save, load
+from MCEVS.Missions.Container import Mission
+from MCEVS.Missions.Standard import StandardMissionProfile
+from MCEVS.Missions.Segments.Discretization import discretization_error
+from MCEVS.Missions.Segments.Vectorized import channels
+from MCEVS.Missions.Segments.HoverClimb.Constant_Speed import HoverClimbConstantSpeed
+from MCEVS.Missions.Segments.Climb.No_Credit import NoCreditClimb
+from MCEVS.Missions.Segments.Cruise.Constant_Speed import CruiseConstantSpeed
+from MCEVS.Missions.Segments.Descent.No_Credit import NoCreditDescent
+from MCEVS.Missions.Segments.HoverDescent.Constant_Speed import HoverDescentConstantSpeed
+from MCEVS.Vehicles.Standard import StandardMultirotorEVTOL, StandardLiftPlusCruiseEVTOL
+from MCEVS.Analyses.Energy.Simulation import BatteryEquivalentCircuit, simulate_battery
+from MCEVS.Analyses.Aerodynamics.Empirical import calc_multirotor_parasite_drag, MultirotorParasiteDragViaWeightBasedRegression
+from MCEVS.Analyses.Aerodynamics.Parasite import ParasiteDragNonHubFidelityOne, FlatPlateAreaCache, calc_flat_plate_area, calc_flat_plate_area_segments
+from MCEVS.Analyses.Weight.Analysis import WeightAnalysis
+from MCEVS.Analyses.Network.Analysis import RouteNetworkAnalysis
+from MCEVS.Wrappers.OpenVSP.Cache import WettedAreaCache, wetted_area_inputs
+from MCEVS.Wrappers.OpenVSP.Utils import _compute_wetted_area
+from MCEVS.Wrappers.OpenVSP.Session import OpenVSPSession
+from MCEVS.Wrappers.OpenVSP.Pool import OpenVSPWorkerPool
+from MCEVS.Wrappers.OpenVSP.Surrogate import fit_wetted_area_surrogate, accuracy_report
+from MCEVS.Wrappers.OpenVSP.Export import GeometryStore, export_geometry
+from MCEVS.Wrappers.OpenVSP.Standard_Vehicles import create_NASA_LiftPlusCruise_vsp3
+from concurrent.futures import ProcessPoolExecutor
+import openmdao.api as om
+import pandas as pd
+import numpy as np
+import importlib.util
+import argparse
+import tempfile
+import hashlib
+import pickle
+import time
+import os
+
+
+# --- MCEVS.Constants.Container --- #
+
+def benchmark_atmosphere_provider(n_queries=100000, n_altitudes=50, table_resolution=10.0, seed=0):
+    """
+    Times n_queries scalar queries drawn from n_altitudes distinct altitudes (0 to 3000 m),
+    for the unmemoized model, the process-wide provider, and a table-based provider.
+    Returns the elapsed times [s] and the maximum relative error of the table-based provider.
+    """
+    rng = np.random.default_rng(seed)
+    altitudes = rng.choice(np.linspace(0.0, 3000.0, n_altitudes), size=n_queries)
+
+    model = EarthGravityAndAtmosphere('US_Standard_1976')
+    providers = {'singleton': get_atmosphere_provider('US_Standard_1976'),
+                 'table': AtmosphereProvider('US_Standard_1976', table_resolution=table_resolution)}
+
+    results = {}
+    t0 = time.perf_counter()
+    for altitude in altitudes:
+        model.compute_constants(altitude)
+    results['model'] = time.perf_counter() - t0
+
+    for name, provider in providers.items():
+        t0 = time.perf_counter()
+        for altitude in altitudes:
+            provider.compute_constants(altitude)
+        results[name] = time.perf_counter() - t0
+
+    H = np.linspace(0.0, 3000.0, 1001)
+    exact = model.compute_constants_array(H)
+    table = providers['table'].compute_constants_array(H)
+    results['table_max_rel_error'] = max(np.max(np.abs(table[key] / exact[key] - 1)) for key in ['P', 'T', 'rho', 'mu', 'v_sound', 'g'])
+
+    return results
+
+
+# --- MCEVS.Utils.Serialization --- #
+
+def benchmark_serialization(n_repeat=200):
+    """
+    Times reconstruction from Python code, to_dict/from_dict, dumps/loads, save/load (.npz) and plain pickle
+    for a standard vehicle and a standard mission
+    """
+    builders = {'vehicle': lambda: StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0},
+                                                               operation_var={'RPM_lift_rotor': {'hover_climb': 400.0}, 'RPM_propeller': {'cruise': 450.0}}),
+                'mission': lambda: StandardMissionProfile(50e3, 50.0)}
+
+    def per_call(func, *args):
+        t0 = time.perf_counter()
+        for _ in range(n_repeat):
+            out = func(*args)
+        return (time.perf_counter() - t0) / n_repeat, out
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, build in builders.items():
+            obj = build()
+            path = os.path.join(directory, f'{name}.npz')
+            result = {'reconstruction': per_call(build)[0]}
+            result['to_dict'], d = per_call(to_dict, obj)
+            result['from_dict'] = per_call(from_dict, *d)[0]
+            result['dumps'], blob = per_call(dumps, obj)
+            result['loads'] = per_call(loads, blob)[0]
+            result['save'] = per_call(save, obj, path)[0]
+            result['load'] = per_call(load, path)[0]
+            result['pickle_dumps'], p = per_call(pickle.dumps, obj)
+            result['pickle_loads'] = per_call(pickle.loads, p)[0]
+            result['bytes'] = len(blob)
+            result['npz_bytes'] = os.path.getsize(path)
+            results[name] = result
+
+    return results
+
+
+# --- MCEVS.Missions.Segments.Discretization --- #
+
+def benchmark_adaptive_discretization():
+    """
+    Compares the number of nodes of the Uber mission profile with the fixed discretization (n_discrete given
+    per segment) and with the adaptive one, using the errors of the fixed discretization as tolerances
+    """
+    def uber_mission(discretization_tol):
+        mission = Mission(planet='Earth', takeoff_altitude=0.0, n_repetition=1, discretization_tol=discretization_tol)
+        mission.add_segment(name='Hover Climb', kind='HoverClimbConstantAcceleration', final_speed=2.54, distance=15.24, n_discrete=10)
+        mission.add_segment(name='Transition + Climb', kind='ClimbConstantVyConstantAx', distance_Y=76.2, speed_Y=2.54, final_speed_X=40.0, n_discrete=10)
+        mission.add_segment(name='Departure Terminal Procedures', kind='CruiseConstantSpeed', speed=40.0, duration=60.0, n_discrete=5)
+        mission.add_segment(name='Accel + Climb', kind='ClimbConstantVyConstantAx', distance_Y=365.76, speed_Y=2.54, final_speed_X=67.0, n_discrete=10)
+        mission.add_segment(name='Cruise', kind='CruiseConstantSpeed', speed=67.0, distance=40e3, n_discrete=5)
+        mission.add_segment(name='Decel + Descent', kind='DescentConstantVyConstantAx', distance_Y=365.76, speed_Y=2.54, final_speed_X=40.0, n_discrete=10)
+        mission.add_segment(name='Arrival Terminal Procedures', kind='CruiseConstantSpeed', speed=40.0, duration=60.0, n_discrete=5)
+        mission.add_segment(name='Transition + Descent', kind='DescentConstantVyConstantAx', distance_Y=76.2, speed_Y=1.524, final_speed_X=0.0, n_discrete=10)
+        mission.add_segment(name='Hover Descent', kind='HoverDescentConstantDeceleration', initial_speed=1.524, final_speed=0.0, distance=15.24, n_discrete=10)
+        return mission
+
+    results = {}
+    discretization_tol = None
+    for mode in ['fixed', 'adaptive']:
+        mission = uber_mission(discretization_tol)
+        error = discretization_error(mission)
+        results[mode] = {'n_nodes': mission.trajectory.n_nodes,
+                         'n_discrete': [segment.n_discrete for segment in mission.segments],
+                         'position_error': float(error['position']),
+                         'velocity_error': float(error['velocity'])}
+        discretization_tol = {'position': error['position'], 'velocity': error['velocity']}
+
+    return results
+
+
+# --- MCEVS.Missions.Segments.Vectorized --- #
+
+def benchmark_segment_kinematics(n_missions=100000, seed=0):
+    """
+    Times the kinematics of n_missions random variations of StandardMissionProfile() (cruise range and speed,
+    hover climb/descent speeds), computed segment by segment with vectorized_kinematics, against building
+    (non-lazy) Mission objects for the first 1000 of them
+    """
+    rng = np.random.default_rng(seed)
+    mission_range = rng.uniform(10e3, 100e3, n_missions)
+    cruise_speed = rng.uniform(40.0, 70.0, n_missions)
+    hover_climb_speed = rng.uniform(2.0, 3.0, n_missions)
+    hover_descent_speed = rng.uniform(1.0, 2.0, n_missions)
+
+    t0 = time.perf_counter()
+    hover_climb = HoverClimbConstantSpeed.vectorized_kinematics(10, None, speed=hover_climb_speed, distance=304.8)
+    no_credit_climb = NoCreditClimb.vectorized_kinematics(10, hover_climb, distance_Y=152.4, distance_X=0.0)
+    cruise = CruiseConstantSpeed.vectorized_kinematics(10, no_credit_climb, speed=cruise_speed, distance=mission_range)
+    no_credit_descent = NoCreditDescent.vectorized_kinematics(10, cruise, distance_Y=152.4, distance_X=0.0)
+    hover_descent = HoverDescentConstantSpeed.vectorized_kinematics(10, no_credit_descent, speed=hover_descent_speed, distance=304.8)
+    elapsed_vectorized = time.perf_counter() - t0
+
+    n_objects = min(n_missions, 1000)
+    t0 = time.perf_counter()
+    for i in range(n_objects):
+        mission = Mission(planet='Earth', takeoff_altitude=5000 * 0.3048, n_repetition=1)
+        mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=hover_climb_speed[i], distance=304.8, n_discrete=10)
+        mission.add_segment(name='No Credit Climb', kind='NoCreditClimb', distance_Y=152.4, distance_X=0.0, n_discrete=10)
+        mission.add_segment('Cruise', kind='CruiseConstantSpeed', speed=cruise_speed[i], distance=mission_range[i], n_discrete=10)
+        mission.add_segment(name='No Credit Descent', kind='NoCreditDescent', distance_Y=152.4, distance_X=0.0, n_discrete=10)
+        mission.add_segment(name='Hover Descent', kind='HoverDescentConstantSpeed', speed=hover_descent_speed[i], distance=304.8, n_discrete=10)
+    elapsed_objects = (time.perf_counter() - t0) * n_missions / n_objects
+
+    # Check against the last Mission object built
+    i = n_objects - 1
+    max_error = max(np.max(np.abs(segment[channel][i] - np.asarray(getattr(mission, channel)[j])))
+                    for j, segment in enumerate([hover_climb, no_credit_climb, cruise, no_credit_descent, hover_descent])
+                    for channel in channels)
+
+    return {'elapsed_vectorized': elapsed_vectorized,
+            'elapsed_objects (extrapolated)': elapsed_objects,
+            'speedup': elapsed_objects / elapsed_vectorized,
+            'final_time_mean': float(np.mean(hover_descent['t'][:, -1])),
+            'max_error': float(max_error)}
+
+
+# --- MCEVS.Analyses.Energy.Simulation --- #
+
+def benchmark_simulate_battery(n_missions=10000, n_nodes=500, seed=0):
+    """
+    Times simulate_battery on n_missions random variations of a generic hover-cruise-hover power profile
+    """
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0.0, 1800.0, n_nodes)
+    profile = np.where((t < 60.0) | (t > 1740.0), 400e3, 150e3)
+    power = profile * rng.uniform(0.8, 1.2, size=(n_missions, 1))
+    battery = BatteryEquivalentCircuit(capacity=rng.uniform(90e3, 140e3, size=n_missions), soc_floor=0.1)
+
+    t0 = time.perf_counter()
+    results = simulate_battery(t, power, battery)
+    elapsed = time.perf_counter() - t0
+
+    return {'elapsed': elapsed,
+            'missions_per_minute': n_missions / elapsed * 60.0,
+            'n_terminated': int(np.sum(results['terminated']))}
+
+
+# --- MCEVS.Analyses.Aerodynamics.Empirical --- #
+
+def benchmark_weight_regression_drag(n_samples=1000000, n_components=1000, rho_air=1.225, seed=0):
+    """
+    Times the weight-based regression parasite drag of n_samples random multirotors (take-off weight, cruise speed,
+    rotor radius) in one vectorized call of calc_multirotor_parasite_drag, against running a problem with
+    MultirotorParasiteDragViaWeightBasedRegression for the first n_components of them (extrapolated),
+    and checks both against each other
+    """
+    rng = np.random.default_rng(seed)
+    W_takeoff = rng.uniform(500.0, 3000.0, n_samples)
+    v = rng.uniform(20.0, 60.0, n_samples)
+    r = rng.uniform(1.0, 3.0, n_samples)
+
+    t0 = time.perf_counter()
+    results = calc_multirotor_parasite_drag(rho_air, W_takeoff, v, r, 4)
+    elapsed_vectorized = time.perf_counter() - t0
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('drag', MultirotorParasiteDragViaWeightBasedRegression(N_rotor=4, rho_air=rho_air), promotes=['*'])
+    prob.setup(check=False)
+
+    n = min(n_samples, n_components)
+    drag = np.zeros(n)
+    t0 = time.perf_counter()
+    for i in range(n):
+        prob.set_val('Weight|takeoff', W_takeoff[i])
+        prob.set_val('Aero|speed', v[i])
+        prob.set_val('Rotor|radius', r[i])
+        prob.run_model()
+        drag[i] = prob.get_val('Aero|total_drag')[0]
+    elapsed_components = (time.perf_counter() - t0) * n_samples / n
+
+    return {'elapsed_vectorized': elapsed_vectorized,
+            'elapsed_components (extrapolated)': elapsed_components,
+            'speedup': elapsed_components / elapsed_vectorized,
+            'max_error': float(np.max(np.abs(drag - results['drag'][:n]) / drag))}
+
+
+# --- MCEVS.Analyses.Aerodynamics.Parasite --- #
+
+def benchmark_flat_plate_area_cache(n_designs=10, n_revisits=5, seed=0):
+    """
+    Times ParasiteDragNonHubFidelityOne of the standard LPC on a sequence of design points (wing area and aspect ratio,
+    lift rotor radius, cruise speed), each visited n_revisits times as in line searches and finite differences,
+    with and without the flat plate area cache, and checks every output against a fresh uncached evaluation.
+    Requires OpenVSP (the wetted areas themselves are served by the in-memory cache of calc_wetted_area).
+    """
+    rng = np.random.default_rng(seed)
+    designs = [{'Wing|area': rng.uniform(10.0, 20.0), 'Wing|aspect_ratio': rng.uniform(8.0, 12.0),
+                'Rotor|radius': rng.uniform(1.0, 2.0), 'Aero|speed': rng.uniform(40.0, 70.0)} for _ in range(n_designs)]
+    sequence = [designs[i % n_designs] for i in range(n_designs * n_revisits)]
+
+    def build(cache):
+        vehicle = StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0})
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem('parasite', ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=1.225, mu_air=1.789e-5, segment_name='cruise', cache=cache), promotes=['*'])
+        prob.setup(check=False)
+        return prob
+
+    def run(prob, design):
+        for name, value in design.items():
+            prob.set_val(name, value)
+        prob.run_model()
+        return prob.get_val('Aero|f_non_hub')[0]
+
+    results = {}
+    for mode, cache in [('uncached', False), ('cached', FlatPlateAreaCache())]:
+        prob = build(cache)
+        t0 = time.perf_counter()
+        values = [run(prob, design) for design in sequence]
+        results[mode] = {'elapsed': time.perf_counter() - t0, 'f_non_hub': values}
+        if cache:
+            results[mode]['statistics'] = cache.statistics()
+
+    reference = [run(build(False), design) for design in designs]
+    results['max_error'] = max(abs(value - reference[i % n_designs]) for i, value in enumerate(results['cached']['f_non_hub']))
+    results['speedup'] = results['uncached']['elapsed'] / results['cached']['elapsed']
+
+    return results
+
+
+def benchmark_build_up_partials(n_linearize=200):
+    """
+    Cost of one Jacobian evaluation of ParasiteDragNonHubFidelityOne of the standard LPC (as in every iteration of the
+    sizing Newton solver), with analytic partials with respect to the speed and with complex step, and largest relative
+    difference between both (the partials with respect to the geometry are finite differences of OpenVSP in both).
+    Requires OpenVSP (the wetted areas themselves are served by the in-memory cache of calc_wetted_area).
+    """
+    class ComplexStep(ParasiteDragNonHubFidelityOne):
+        def setup(self):
+            super(ComplexStep, self).setup()
+            self.declare_partials('*', 'Aero|speed', method='cs')
+
+        compute_partials = om.ExplicitComponent.compute_partials
+
+    results = {}
+    for mode, component in [('analytic', ParasiteDragNonHubFidelityOne), ('cs', ComplexStep)]:
+        vehicle = StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0})
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem('parasite', component(vehicle=vehicle, rho_air=1.225, mu_air=1.789e-5, segment_name='cruise'), promotes=['*'])
+        prob.setup(check=False, force_alloc_complex=True)
+        prob.set_val('Aero|speed', 60.0)
+        prob.run_model()
+        t0 = time.perf_counter()
+        for _ in range(n_linearize):
+            prob.model.run_linearize()
+        results[mode] = {'latency': (time.perf_counter() - t0) / n_linearize,
+                         'jacobian': prob.compute_totals(of=['Aero|f_non_hub', 'Aero|parasite_drag_non_hub', 'Aero|Cd0'], wrt=['Aero|speed'])}
+
+    results['speedup'] = results['cs']['latency'] / results['analytic']['latency']
+    results['max_difference'] = max(np.max(np.abs(value - results['cs']['jacobian'][key]) / np.maximum(np.abs(value), 1e-30))
+                                    for key, value in results['analytic']['jacobian'].items())
+
+    return results
+
+
+def benchmark_build_up_segments(n_segments=5, n_repeat=200):
+    """
+    Cost of the flat plate areas of the standard LPC at the flow conditions of n_segments segments (speeds and
+    altitudes of a typical mission), segment by segment with calc_flat_plate_area and at once with
+    calc_flat_plate_area_segments, and largest relative difference between both.
+    Requires OpenVSP (the wetted areas themselves are served by the in-memory cache of calc_wetted_area).
+    """
+    vehicle = StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0})
+    rho_air = np.linspace(1.225, 1.0, n_segments)
+    flow_conditions = {f'segment_{i}': (rho_air[i], 1.789e-5, v) for i, v in enumerate(np.linspace(30.0, 70.0, n_segments))}
+
+    t0 = time.perf_counter()
+    for _ in range(n_repeat):
+        separate = {name: calc_flat_plate_area(vehicle, *flow_condition, partials=True) for name, flow_condition in flow_conditions.items()}
+    latency_separate = (time.perf_counter() - t0) / n_repeat
+
+    t0 = time.perf_counter()
+    for _ in range(n_repeat):
+        vectorized = calc_flat_plate_area_segments(vehicle, flow_conditions, partials=True)
+    latency_vectorized = (time.perf_counter() - t0) / n_repeat
+
+    max_difference = max(abs(vectorized[name][key] - value) / abs(value)
+                         for name, results in separate.items() for key, value in results.items() if key != 'partials' and value != 0.0)
+
+    return {'latency_separate': latency_separate,
+            'latency_vectorized': latency_vectorized,
+            'speedup': latency_separate / latency_vectorized,
+            'max_difference': float(max_difference)}
+
+
+# --- MCEVS.Wrappers.OpenVSP.Cache --- #
+
+def benchmark_wetted_area_cache(n_entries=1000, n_processes=4):
+    """
+    Times stores and lookups (in memory and from the database, as in a new process) of a cache in a temporary
+    directory, and checks that concurrent processes can fill and read the same database
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'wetted_area.sqlite')
+        cache = WettedAreaCache(path)
+        keys = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n_entries)]
+        value = {'wetted_area': {'Fuselage': 25.0, 'Wing': 28.0, 'HTail': 4.0, 'VTail': 3.0}}
+
+        t0 = time.perf_counter()
+        for key in keys:
+            cache.set(key, value)
+        t_set = (time.perf_counter() - t0) / n_entries
+
+        t0 = time.perf_counter()
+        for key in keys:
+            cache.get(key)
+        t_get_memory = (time.perf_counter() - t0) / n_entries
+
+        cache = WettedAreaCache(path)
+        t0 = time.perf_counter()
+        for key in keys:
+            cache.get(key)
+        t_get_database = (time.perf_counter() - t0) / n_entries
+
+        # Concurrent processes storing and reading the same keys
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            counts = list(executor.map(_benchmark_worker, [path] * n_processes, range(n_processes)))
+
+        return {'set': t_set,
+                'get_memory': t_get_memory,
+                'get_database': t_get_database,
+                'concurrent_entries': WettedAreaCache(path).statistics()['n_entries'] - n_entries,
+                'concurrent_hits': sum(counts)}
+
+
+def _benchmark_worker(path, worker_id, n_keys=200):
+    cache = WettedAreaCache(path)
+    keys = [f'shared-{i}' for i in range(n_keys)]
+    for key in keys:
+        if cache.get(key) is None:
+            cache.set(key, {'wetted_area': {'Fuselage': 25.0}})
+    return sum(WettedAreaCache(path).get(key) is not None for key in keys)
+
+
+# --- MCEVS.Wrappers.OpenVSP.Session --- #
+
+def benchmark_openvsp_session(n_designs=20, seed=0):
+    """
+    Per-call latency of the wetted areas of the standard LPC for n_designs random wing areas, wing aspect ratios
+    and lift rotor radii, rebuilding the OpenVSP model at every call versus updating a persistent session,
+    and the largest difference of wetted area between both approaches
+    """
+    rng = np.random.default_rng(seed)
+    vehicles = [StandardLiftPlusCruiseEVTOL({'r_lift_rotor': rng.uniform(1.0, 2.0), 'r_propeller': 1.4,
+                                             'wing_area': rng.uniform(10.0, 20.0), 'wing_aspect_ratio': rng.uniform(8.0, 12.0)})
+                for _ in range(n_designs)]
+
+    t0 = time.perf_counter()
+    rebuilt = [_compute_wetted_area(vehicle)[0] for vehicle in vehicles]
+    latency_rebuild = (time.perf_counter() - t0) / n_designs
+
+    session = OpenVSPSession()
+    updated = [session.wetted_area(vehicle)[0] for vehicle in vehicles]
+    session.close()
+
+    max_difference = max(abs(res_1[name] - res_2[name]) for res_1, res_2 in zip(rebuilt, updated) for name in res_1)
+
+    return {'latency_rebuild': latency_rebuild, **session.statistics(), 'max_difference': max_difference}
+
+
+# --- MCEVS.Wrappers.OpenVSP.Pool --- #
+
+def benchmark_openvsp_worker_pool(n_designs=32, n_workers_list=(1, 2, 4), seed=0):
+    """
+    Throughput (designs per second) of the wetted areas of n_designs random variations of the standard LPC
+    (wing area and aspect ratio, lift rotor radius) with pools of different sizes (no cache)
+    """
+    rng = np.random.default_rng(seed)
+    vehicles = [StandardLiftPlusCruiseEVTOL({'r_lift_rotor': rng.uniform(1.0, 2.0), 'r_propeller': 1.4,
+                                             'wing_area': rng.uniform(10.0, 20.0), 'wing_aspect_ratio': rng.uniform(8.0, 12.0)})
+                for _ in range(n_designs)]
+
+    results = {}
+    for n_workers in n_workers_list:
+        with OpenVSPWorkerPool(n_workers=n_workers) as pool:
+            pool.run([wetted_area_inputs(vehicles[0])] * n_workers)  # start-up
+            t0 = time.perf_counter()
+            pool.map(vehicles, cache=False)
+            results[n_workers] = n_designs / (time.perf_counter() - t0)
+
+    return results
+
+
+# --- MCEVS.Wrappers.OpenVSP.Surrogate --- #
+
+def benchmark_wetted_area_surrogate(n_evaluations=1000):
+    """
+    Fits surrogates of the standard multirotor and LPC (requires OpenVSP), prints their accuracy reports,
+    and compares the time of one surrogate evaluation (with gradient) with one OpenVSP evaluation
+    """
+    vehicles = [StandardMultirotorEVTOL({'r_lift_rotor': 1.5}),
+                StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.0, 'r_propeller': 1.0, 'wing_area': 8.0, 'wing_aspect_ratio': 10.0})]
+
+    results = {}
+    for vehicle in vehicles:
+        surrogate = fit_wetted_area_surrogate(vehicle)
+        print(accuracy_report(surrogate))
+        x = surrogate.parameter_values(vehicle)
+        t0 = time.perf_counter()
+        for _ in range(n_evaluations):
+            surrogate.predict_with_gradient(x)
+        results[vehicle.configuration] = {'latency_surrogate': (time.perf_counter() - t0) / n_evaluations,
+                                          'latency_openvsp': surrogate.report['elapsed_sampling'] / (surrogate.report['n_samples'] + surrogate.report['n_test'])}
+
+    return results
+
+
+# --- MCEVS.Wrappers.OpenVSP.Export --- #
+
+def benchmark_geometry_store(n_queries=10):
+    """
+    Latency of n_queries exports of the standard LPC as vsp3 files, building the model every time (create_NASA_LiftPlusCruise_vsp3)
+    and copying the stored geometry, and of the first export into an empty store (in a temporary directory).
+    Requires OpenVSP.
+    """
+    vehicle = StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, 'vehicle.vsp3')
+        store = GeometryStore(os.path.join(tmp, 'store'))
+
+        t0 = time.perf_counter()
+        for _ in range(n_queries):
+            create_NASA_LiftPlusCruise_vsp3(fname, vehicle)
+        latency_build = (time.perf_counter() - t0) / n_queries
+
+        t0 = time.perf_counter()
+        export_geometry(vehicle, store)
+        latency_export = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(n_queries):
+            create_NASA_LiftPlusCruise_vsp3(fname, vehicle, store=store)
+        latency_stored = (time.perf_counter() - t0) / n_queries
+
+        return {'latency_build': latency_build,
+                'latency_first_export': latency_export,
+                'latency_stored': latency_stored,
+                'speedup': latency_build / latency_stored,
+                **store.statistics()}
+
+
+# --- MCEVS.Analyses.Network.Analysis --- #
+
+def benchmark_route_network(n_routes=200, n_workers=1, seed=0):
+    """
+    Sizes the standard LPC on a 60 km mission, then analyzes a random network of n_routes routes
+    (range, cruise speed and altitude, departure hover time) with RouteNetworkAnalysis and reports its throughput
+    """
+    fidelity = {'aerodynamics': {'parasite': 'WeightBasedRegression', 'induced': 'ParabolicDragPolar'},
+                'power_model': {'hover_climb': 'MomentumTheory'},
+                'weight_model': {'structure': 'Roskam'},
+                'stability': {'AoA_trim': {'cruise': 'ManualFixedValue'}}}
+    design_var = {'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0}
+    operation_var = {'RPM_lift_rotor': {'hover_climb': 400.0}, 'RPM_propeller': {'cruise': 450.0}}
+
+    # Size the vehicle on the design mission
+    vehicle = StandardLiftPlusCruiseEVTOL(design_var, operation_var)
+    WeightAnalysis(vehicle, StandardMissionProfile(60e3, 50.0), fidelity, weight_type='maximum', sizing_mode=True, solved_by='optimization').evaluate(print=False)
+
+    # Random network
+    rng = np.random.default_rng(seed)
+    routes = pd.DataFrame({'range': rng.uniform(10e3, 60e3, n_routes),
+                           'cruise_speed': rng.uniform(40.0, 60.0, n_routes),
+                           'cruise_altitude': rng.choice([1981.2, 2286.0], n_routes),
+                           'hover_time_departure': rng.choice([0.0, 30.0], n_routes)})
+
+    analysis = RouteNetworkAnalysis(vehicle, routes, fidelity)
+    results = analysis.evaluate(n_workers=n_workers)
+
+    return {'results': results, 'throughput': analysis.throughput}
+
+
+def print_serialization(results):
+    for name, result in results.items():
+        print(name)
+        for key, value in result.items():
+            print(f'{key:>15s} : {value * 1e6:10.1f} us' if isinstance(value, float) else f'{key:>15s} : {value} bytes')
+
+
+def print_adaptive_discretization(results):
+    for mode, result in results.items():
+        print(mode, result)
+
+
+def print_build_up_partials(results):
+    print(f"jacobian: analytic = {results['analytic']['latency'] * 1e3:.3f} ms, cs = {results['cs']['latency'] * 1e3:.3f} ms, "
+          f"speedup = {results['speedup']:.1f}, max relative difference = {results['max_difference']:.2e}")
+
+
+def print_build_up_segments(results):
+    print(f"segments: separate = {results['latency_separate'] * 1e3:.3f} ms, vectorized = {results['latency_vectorized'] * 1e3:.3f} ms, "
+          f"speedup = {results['speedup']:.1f}, max relative difference = {results['max_difference']:.2e}")
+
+
+def print_flat_plate_area_cache(results):
+    print(f"uncached = {results['uncached']['elapsed']:.3f} s, cached = {results['cached']['elapsed']:.3f} s, speedup = {results['speedup']:.1f}")
+    print(f"max error = {results['max_error']:.3e}, {results['cached']['statistics']}")
+
+
+def print_openvsp_worker_pool(results):
+    for n_workers, throughput in results.items():
+        print(f'{n_workers} workers: {throughput:.2f} designs/s')
+
+
+def print_route_network(results):
+    print(results['results'].describe().T)
+    print(f"Throughput = {results['throughput']:.1f} routes/s")
+
+
+# name: (benchmark, printer, requires OpenVSP)
+benchmarks = {'atmosphere_provider': (benchmark_atmosphere_provider, print, False),
+              'serialization': (benchmark_serialization, print_serialization, False),
+              'adaptive_discretization': (benchmark_adaptive_discretization, print_adaptive_discretization, False),
+              'segment_kinematics': (benchmark_segment_kinematics, print, False),
+              'simulate_battery': (benchmark_simulate_battery, print, False),
+              'weight_regression_drag': (benchmark_weight_regression_drag, print, False),
+              'build_up_partials': (benchmark_build_up_partials, print_build_up_partials, True),
+              'build_up_segments': (benchmark_build_up_segments, print_build_up_segments, True),
+              'flat_plate_area_cache': (benchmark_flat_plate_area_cache, print_flat_plate_area_cache, True),
+              'wetted_area_cache': (benchmark_wetted_area_cache, print, False),
+              'openvsp_session': (benchmark_openvsp_session, print, True),
+              'openvsp_worker_pool': (benchmark_openvsp_worker_pool, print_openvsp_worker_pool, True),
+              'wetted_area_surrogate': (benchmark_wetted_area_surrogate, print, True),
+              'geometry_store': (benchmark_geometry_store, print, True),
+              'route_network': (benchmark_route_network, print_route_network, False)}
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Benchmarks of MCEVS')
+    parser.add_argument('names', nargs='*', help='benchmarks to run (default: all)')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, _, requires_openvsp) in benchmarks.items():
+            print(name + (' (requires OpenVSP)' if requires_openvsp else ''))
+        raise SystemExit
+
+    unknown = [name for name in args.names if name not in benchmarks]
+    if unknown:
+        parser.error(f'unknown benchmarks {unknown}, see --list')
+
+    has_openvsp = importlib.util.find_spec('openvsp') is not None
+    for name in args.names or list(benchmarks):
+        benchmark, printer, requires_openvsp = benchmarks[name]
+        if requires_openvsp and not has_openvsp and not args.names:
+            print(f'--- {name}: skipped (requires OpenVSP)')
+            continue
+        print(f'--- {name}')
+        printer(benchmark())
@@ -1,6 +1,125 @@
 import numpy as np
 import openmdao.api as om
 
+# Unit conversions of the regressions (weights in [lb] and flat plate areas in [ft**2])
+kg_to_lb = 2.20462
+ft2_to_m2 = 0.3048 * 0.3048
+
+# Coefficient of the rotor hub flat plate area regression of each configuration
+rotor_hub_flat_plate_coefficient = {'Multirotor': 0.85, 'LiftPlusCruise': 0.40}
+
+
+def calc_cylindrical_body_drag(rho_air, r, v, sin_beta, partials=False):
+    """
+    Drag of a cylindrical body (see CylindricalBodyDrag), for scalars or arrays (broadcast) of air density [kg/m**3],
+    rotor radius [m], air speed [m/s] and sin(beta), beta: incidence angle of the body.
+    With partials=True, results['partials'][x]['drag'] is the derivative of the drag with respect to x ('r', 'v' or 'sin_beta').
+    """
+    S_body = 1.682 * r**2 				# body area
+    CD_body = 0.1 + 0.2 * sin_beta**3 	# body drag coefficient
+    q = 0.5 * rho_air * v * v
+
+    results = {'drag': q * S_body * CD_body}
+
+    if partials:
+        results['partials'] = {'r': {'drag': q * CD_body * 1.682 * 2 * r},
+                               'v': {'drag': rho_air * v * S_body * CD_body},
+                               'sin_beta': {'drag': q * S_body * 0.2 * 3 * sin_beta**2}}
+
+    return results
+
+
+def calc_multirotor_parasite_drag(rho_air, W_takeoff, v, r, N_rotor, partials=False):
+    """
+    Parasite drag of a multirotor body via the weight-based regression (see MultirotorParasiteDragViaWeightBasedRegression),
+    for scalars or arrays (broadcast) of air density [kg/m**3], take-off weight [kg], air speed [m/s], rotor radius [m] and number of rotors.
+    Outputs (results):
+            f 		: equivalent flat plate area [m**2]
+            Cd0 	: parasite drag coefficient (reference area: total rotor disk area)
+            drag 	: parasite drag [N]
+    With partials=True, results['partials'][x][name] is the derivative of results[name] with respect to x ('W_takeoff', 'v' or 'r').
+    """
+    # Equivalent flat plate area "f"
+    k = 0.0327 * kg_to_lb**0.8903 * ft2_to_m2
+    f = k * W_takeoff**0.8903
+
+    # Parasite drag coefficient
+    S_ref = N_rotor * np.pi * r**2  # total rotor area
+    q = 0.5 * rho_air * v * v
+
+    results = {'f': f, 'Cd0': f / S_ref, 'drag': q * f}
+
+    if partials:
+        df_dW = k * 0.8903 * W_takeoff**(-0.1097)
+        results['partials'] = {'W_takeoff': {'f': df_dW, 'Cd0': df_dW / S_ref, 'drag': q * df_dW},
+                               'v': {'drag': rho_air * v * f},
+                               'r': {'Cd0': -2 * f / (S_ref * r)}}
+
+    return results
+
+
+def calc_winged_parasite_drag(rho_air, W_takeoff, v, S_wing, partials=False):
+    """
+    Parasite drag of a winged configuration via the weight-based regression (see WingedParasiteDragViaWeightBasedRegression),
+    for scalars or arrays (broadcast) of air density [kg/m**3], take-off weight [kg], air speed [m/s] and wing area [m**2].
+    Outputs (results):
+            f 		: equivalent flat plate area [m**2]
+            Cd0 	: parasite drag coefficient (reference area: wing area)
+            drag 	: parasite drag [N]
+    With partials=True, results['partials'][x][name] is the derivative of results[name] with respect to x ('W_takeoff', 'v' or 'S_wing').
+    """
+    # Equivalent flat plate area "f"
+    k = 1.6 * (1 / 1000)**(2 / 3) * kg_to_lb**(2 / 3) * ft2_to_m2
+    f = k * W_takeoff**(2 / 3)
+    q = 0.5 * rho_air * v * v
+
+    results = {'f': f, 'Cd0': f / S_wing, 'drag': q * f}
+
+    if partials:
+        df_dW = k * (2 / 3) * W_takeoff**(-1 / 3)
+        results['partials'] = {'W_takeoff': {'f': df_dW, 'Cd0': df_dW / S_wing, 'drag': q * df_dW},
+                               'v': {'drag': rho_air * v * f},
+                               'S_wing': {'Cd0': -f / S_wing**2}}
+
+    return results
+
+
+def calc_rotor_hub_parasite_drag(rho_air, W_takeoff, v, N_rotor, configuration: str, partials=False):
+    """
+    Parasite drag of the rotor hubs via the weight-based regression (see RotorHubParasiteDragFidelityZero),
+    for scalars or arrays (broadcast) of air density [kg/m**3], take-off weight [kg], air speed [m/s] and number of rotors
+    (lift rotors and propellers), for a 'Multirotor' or a 'LiftPlusCruise' configuration.
+    Outputs (results):
+            f 		: equivalent flat plate area of the rotor hubs [m**2]
+            drag 	: parasite drag of the rotor hubs [N]
+    With partials=True, results['partials'][x][name] is the derivative of results[name] with respect to x ('W_takeoff' or 'v').
+    """
+    if configuration not in rotor_hub_flat_plate_coefficient:
+        raise ValueError(f'Rotor hub parasite drag is not defined for configuration "{configuration}"!')
+
+    # Equivalent flat plate area "f"
+    k = rotor_hub_flat_plate_coefficient[configuration] * (1 / 1000)**(2 / 3) * kg_to_lb**(2 / 3) * ft2_to_m2
+    f = k * N_rotor**(1 / 3) * W_takeoff**(2 / 3)
+    q = 0.5 * rho_air * v * v
+
+    results = {'f': f, 'drag': q * f}
+
+    if partials:
+        df_dW = k * N_rotor**(1 / 3) * (2 / 3) * W_takeoff**(-1 / 3)
+        results['partials'] = {'W_takeoff': {'f': df_dW, 'drag': q * df_dW},
+                               'v': {'drag': rho_air * v * f}}
+
+    return results
+
+
+def rotor_hub_count(vehicle: object):
+    """
+    Number of rotor hubs of the rotor hub parasite drag regression (lift rotors, and propellers of a LiftPlusCruise)
+    """
+    if vehicle.configuration == 'LiftPlusCruise':
+        return vehicle.lift_rotor.n_rotor + vehicle.propeller.n_propeller
+    return vehicle.lift_rotor.n_rotor
+
 
 class CylindricalBodyDrag(om.ExplicitComponent):
     """
@@ -31,30 +150,13 @@ class CylindricalBodyDrag(om.ExplicitComponent):
         self.declare_partials('*', '*')
 
     def compute(self, inputs, outputs):
-        rho_air = self.options['rho_air']
-        r = inputs['Rotor|radius']
-        v = inputs['Aero|speed']
-        sin_beta = inputs['Body|sin_beta']
-
-        S_body = 1.682 * r**2 				# body area
-        CD_body = 0.1 + 0.2 * sin_beta**3 	# body drag coefficient
-
-        outputs['Aero|total_drag'] = 0.5 * rho_air * v * v * S_body * CD_body
+        results = calc_cylindrical_body_drag(self.options['rho_air'], inputs['Rotor|radius'], inputs['Aero|speed'], inputs['Body|sin_beta'])
+        outputs['Aero|total_drag'] = results['drag']
 
     def compute_partials(self, inputs, partials):
-        rho_air = self.options['rho_air']
-        r = inputs['Rotor|radius']
-        v = inputs['Aero|speed']
-        sin_beta = inputs['Body|sin_beta']
-
-        S_body = 1.682 * r**2 				# body area
-        dS_dr = 1.682 * 2 * r
-        CD_body = 0.1 + 0.2 * sin_beta**3 	# body drag coefficient
-        dCD_dsinB = 0.2 * 3 * sin_beta**2
-
-        partials['Aero|total_drag', 'Rotor|radius'] = 0.5 * rho_air * v * v * CD_body * dS_dr
-        partials['Aero|total_drag', 'Aero|speed'] = rho_air * v * S_body * CD_body
-        partials['Aero|total_drag', 'Body|sin_beta'] = 0.5 * rho_air * v * v * S_body * dCD_dsinB
+        results = calc_cylindrical_body_drag(self.options['rho_air'], inputs['Rotor|radius'], inputs['Aero|speed'], inputs['Body|sin_beta'], partials=True)
+        for x, name in [('r', 'Rotor|radius'), ('v', 'Aero|speed'), ('sin_beta', 'Body|sin_beta')]:
+            partials['Aero|total_drag', name] = results['partials'][x]['drag']
 
 
 class MultirotorParasiteDragViaWeightBasedRegression(om.ExplicitComponent):
@@ -92,45 +194,15 @@ class MultirotorParasiteDragViaWeightBasedRegression(om.ExplicitComponent):
         self.declare_partials('*', '*')
 
     def compute(self, inputs, outputs):
-        rho_air = self.options['rho_air']
-        N_rotor = self.options['N_rotor']
-        r = inputs['Rotor|radius']			  # in [m]
-        W_takeoff = inputs['Weight|takeoff']  # in [kg]
-        v = inputs['Aero|speed']		# in [m/s**2]
-
-        # Equivalent flat plate area "f"
-        kg_to_lb = 2.20462**0.8903
-        ft2_to_m2 = 0.3048 * 0.3048
-
-        f = 0.0327 * W_takeoff**0.8903 * kg_to_lb * ft2_to_m2
-
-        # Parasite drag coefficient
-        S_ref = N_rotor * np.pi * r**2  # total rotor area
-        CD0 = f / S_ref
-
-        outputs['Aero|Cd0'] = CD0
-        outputs['Aero|total_drag'] = 0.5 * rho_air * v * v * S_ref * CD0
+        results = calc_multirotor_parasite_drag(self.options['rho_air'], inputs['Weight|takeoff'], inputs['Aero|speed'], inputs['Rotor|radius'], self.options['N_rotor'])
+        outputs['Aero|Cd0'] = results['Cd0']
+        outputs['Aero|total_drag'] = results['drag']
 
     def compute_partials(self, inputs, partials):
-        rho_air = self.options['rho_air']
-        N_rotor = self.options['N_rotor']
-        r = inputs['Rotor|radius']			  # in [m]
-        W_takeoff = inputs['Weight|takeoff']  # in [kg]
-        v = inputs['Aero|speed']		# in [m/s**2]
-
-        # Equivalent flat plate area "f"
-        kg_to_lb = 2.20462**0.8903
-        ft2_to_m2 = 0.3048 * 0.3048
-
-        f = 0.0327 * W_takeoff**0.8903 * kg_to_lb * ft2_to_m2
-        df_dW = 0.0327 * 0.8903 * W_takeoff**(-0.1097) * kg_to_lb * ft2_to_m2
-
-        partials['Aero|Cd0', 'Rotor|radius'] = f / (N_rotor * np.pi) * (-2 / r**3)
-        partials['Aero|Cd0', 'Weight|takeoff'] = 1 / (N_rotor * np.pi * r**2) * df_dW
-        partials['Aero|Cd0', 'Aero|speed'] = 0
-        partials['Aero|total_drag', 'Rotor|radius'] = 0.0
-        partials['Aero|total_drag', 'Weight|takeoff'] = 0.5 * rho_air * v**2 * df_dW
-        partials['Aero|total_drag', 'Aero|speed'] = rho_air * v * f
+        results = calc_multirotor_parasite_drag(self.options['rho_air'], inputs['Weight|takeoff'], inputs['Aero|speed'], inputs['Rotor|radius'], self.options['N_rotor'], partials=True)
+        for x, name in [('W_takeoff', 'Weight|takeoff'), ('v', 'Aero|speed'), ('r', 'Rotor|radius')]:
+            partials['Aero|Cd0', name] = results['partials'][x].get('Cd0', 0.0)
+            partials['Aero|total_drag', name] = results['partials'][x].get('drag', 0.0)
 
 
 class WingedParasiteDragViaWeightBasedRegression(om.ExplicitComponent):
@@ -166,44 +238,15 @@ class WingedParasiteDragViaWeightBasedRegression(om.ExplicitComponent):
         self.declare_partials('*', '*')
 
     def compute(self, inputs, outputs):
-        rho_air = self.options['rho_air']
-        W_takeoff = inputs['Weight|takeoff']  # in [kg]
-        v = inputs['Aero|speed']			  # in [m/s**2]
-        S_wing = inputs['Wing|area']		  # in [m**2]
-
-        # Equivalent flat plate area "f"
-        kg_to_lb = 2.20462**(2 / 3)
-        ft2_to_m2 = 0.3048 * 0.3048
-
-        f = 1.6 * (W_takeoff / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-
-        # Parasite drag coefficient
-        S_ref = S_wing 	# ref area is the wing area
-        CD0 = f / S_ref
-
-        outputs['Aero|Cd0'] = CD0
-        outputs['Aero|parasite_drag'] = 0.5 * rho_air * v * v * S_ref * CD0
+        results = calc_winged_parasite_drag(self.options['rho_air'], inputs['Weight|takeoff'], inputs['Aero|speed'], inputs['Wing|area'])
+        outputs['Aero|Cd0'] = results['Cd0']
+        outputs['Aero|parasite_drag'] = results['drag']
 
     def compute_partials(self, inputs, partials):
-        rho_air = self.options['rho_air']
-        W_takeoff = inputs['Weight|takeoff']  # in [kg]
-        v = inputs['Aero|speed']			  # in [m/s**2]
-        S_wing = inputs['Wing|area']		  # in [m**2]
-
-        # Equivalent flat plate area "f"
-        kg_to_lb = 2.20462**(2 / 3)
-        ft2_to_m2 = 0.3048 * 0.3048
-
-        f = 1.6 * (W_takeoff / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-        df_dW = 1.6 * (2 / 3) * W_takeoff**(-1 / 3) * (1 / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-        S_ref = S_wing
-
-        partials['Aero|Cd0', 'Weight|takeoff'] = 1 / S_ref * df_dW
-        partials['Aero|Cd0', 'Aero|speed'] = 0
-        partials['Aero|Cd0', 'Wing|area'] = -f / (S_ref**2)
-        partials['Aero|parasite_drag', 'Weight|takeoff'] = 0.5 * rho_air * v**2 * df_dW
-        partials['Aero|parasite_drag', 'Aero|speed'] = rho_air * v * f
-        partials['Aero|parasite_drag', 'Wing|area'] = 0
+        results = calc_winged_parasite_drag(self.options['rho_air'], inputs['Weight|takeoff'], inputs['Aero|speed'], inputs['Wing|area'], partials=True)
+        for x, name in [('W_takeoff', 'Weight|takeoff'), ('v', 'Aero|speed'), ('S_wing', 'Wing|area')]:
+            partials['Aero|Cd0', name] = results['partials'][x].get('Cd0', 0.0)
+            partials['Aero|parasite_drag', name] = results['partials'][x].get('drag', 0.0)
 
 
 class RotorHubParasiteDragFidelityZero(om.ExplicitComponent):
@@ -240,44 +283,13 @@ class RotorHubParasiteDragFidelityZero(om.ExplicitComponent):
 
     def compute(self, inputs, outputs):
         vehicle = self.options['vehicle']
-        rho_air = self.options['rho_air']
-        W_takeoff = inputs['Weight|takeoff']  # in [kg]
-        v = inputs['Aero|speed']			  # in [m/s**2]
-
-        # Equivalent flat plate area "f"
-        kg_to_lb = 2.20462**(2 / 3)
-        ft2_to_m2 = 0.3048 * 0.3048
-
-        if vehicle.configuration in ['Multirotor']:
-            N_rotor = vehicle.lift_rotor.n_rotor
-            f = N_rotor * 0.85 * ((W_takeoff / N_rotor) / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-        elif vehicle.configuration in ['LiftPlusCruise']:
-            N_rotor = vehicle.lift_rotor.n_rotor + vehicle.propeller.n_propeller
-            f = N_rotor * 0.40 * ((W_takeoff / N_rotor) / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-
-        outputs['Aero|f_rotor_hub'] = f
-        outputs['Aero|parasite_drag_rotor_hub'] = 0.5 * rho_air * v * v * f
+        results = calc_rotor_hub_parasite_drag(self.options['rho_air'], inputs['Weight|takeoff'], inputs['Aero|speed'], rotor_hub_count(vehicle), vehicle.configuration)
+        outputs['Aero|f_rotor_hub'] = results['f']
+        outputs['Aero|parasite_drag_rotor_hub'] = results['drag']
 
     def compute_partials(self, inputs, partials):
         vehicle = self.options['vehicle']
-        rho_air = self.options['rho_air']
-        W_takeoff = inputs['Weight|takeoff']  # in [kg]
-        v = inputs['Aero|speed']			  # in [m/s**2]
-
-        # Equivalent flat plate area "f"
-        kg_to_lb = 2.20462**(2 / 3)
-        ft2_to_m2 = 0.3048 * 0.3048
-
-        if vehicle.configuration in ['Multirotor']:
-            N_rotor = vehicle.lift_rotor.n_rotor
-            f = N_rotor * 0.85 * ((W_takeoff / N_rotor) / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-            df_dW = N_rotor * 0.85 * (2 / 3) * W_takeoff**(-1 / 3) * (1 / N_rotor / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-        elif vehicle.configuration in ['LiftPlusCruise']:
-            N_rotor = vehicle.lift_rotor.n_rotor + vehicle.propeller.n_propeller
-            f = N_rotor * 0.40 * ((W_takeoff / N_rotor) / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-            df_dW = N_rotor * 0.40 * (2 / 3) * W_takeoff**(-1 / 3) * (1 / N_rotor / 1000)**(2 / 3) * kg_to_lb * ft2_to_m2
-
-        partials['Aero|f_rotor_hub', 'Weight|takeoff'] = df_dW
-        partials['Aero|f_rotor_hub', 'Aero|speed'] = 0
-        partials['Aero|parasite_drag_rotor_hub', 'Weight|takeoff'] = 0.5 * rho_air * v**2 * df_dW
-        partials['Aero|parasite_drag_rotor_hub', 'Aero|speed'] = rho_air * v * f
+        results = calc_rotor_hub_parasite_drag(self.options['rho_air'], inputs['Weight|takeoff'], inputs['Aero|speed'], rotor_hub_count(vehicle), vehicle.configuration, partials=True)
+        for x, name in [('W_takeoff', 'Weight|takeoff'), ('v', 'Aero|speed')]:
+            partials['Aero|f_rotor_hub', name] = results['partials'][x].get('f', 0.0)
+            partials['Aero|parasite_drag_rotor_hub', name] = results['partials'][x].get('drag', 0.0)
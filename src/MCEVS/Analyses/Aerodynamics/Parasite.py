@@ -1,7 +1,12 @@
 import numpy as np
 import openmdao.api as om
+from collections import OrderedDict
 from MCEVS.Analyses.Aerodynamics.Empirical import RotorHubParasiteDragFidelityZero
 from MCEVS.Wrappers.OpenVSP.Utils import calc_wetted_area
+from MCEVS.Wrappers.OpenVSP.Cache import wetted_area_key
+from MCEVS.Wrappers.OpenVSP.Surrogate import WettedAreaSurrogate
+import json
+import copy
 
 
 class BacchiniExperimentalFixedValueForLPC(om.ExplicitComponent):
@@ -59,12 +64,17 @@ class BacchiniExperimentalFixedValueForLPC(om.ExplicitComponent):
 class ParasiteDragViaComponentBuildUpApproach(om.Group):
     """
     Computes the parasite drag coefficient via a component build-up approach and empirical rotor hub drag
+    With shared_non_hub=True, the drag without rotor hubs is not computed here: Aero|f_non_hub and Aero|parasite_drag_non_hub
+    are inputs, computed for all segments at once by a ParasiteDragViaComponentBuildUpMultiSegment (see PowerRequirement)
     """
     def initialize(self):
         self.options.declare('vehicle', types=object, desc='Vehicle object')
         self.options.declare('rho_air', types=float, desc='Air density')
         self.options.declare('mu_air', types=float, desc='Air dynamic viscosity')
         self.options.declare('segment_name', types=str, desc='Segment name')
+        self.options.declare('cache', default=True, desc='Flat plate area cache: True (shared), False (disabled) or a FlatPlateAreaCache')
+        self.options.declare('surrogate', default=None, desc='Wetted area surrogate (WettedAreaSurrogate or path of a saved one), or None for OpenVSP')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
 
@@ -72,11 +82,11 @@ class ParasiteDragViaComponentBuildUpApproach(om.Group):
         rho_air = self.options['rho_air']
         mu_air = self.options['mu_air']
         segment_name = self.options['segment_name']
+        cache = self.options['cache']
+        surrogate = self.options['surrogate']
 
-        self.add_subsystem('parasite_drag_without_rotor_hub',
-                           ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name=segment_name),
-                           promotes_inputs=['Aero|speed'] if vehicle.configuration == 'Multirotor' else ['Aero|speed', 'Wing|area'],
-                           promotes_outputs=['Aero|f_non_hub', 'Aero|parasite_drag_non_hub'] if vehicle.configuration == 'Multirotor' else ['Aero|f_non_hub', 'Aero|parasite_drag_non_hub', 'Aero|Cd0'])
+        if not self.options['shared_non_hub']:
+            self._add_non_hub(vehicle, rho_air, mu_air, segment_name, cache, surrogate)
 
         self.add_subsystem('parasite_drag_rotor_hub',
                            RotorHubParasiteDragFidelityZero(vehicle=vehicle, rho_air=rho_air),
@@ -99,18 +109,107 @@ class ParasiteDragViaComponentBuildUpApproach(om.Group):
                            promotes_inputs=['*'],
                            promotes_outputs=['Aero|f_total', 'Aero|parasite_drag'])
 
+    def _add_non_hub(self, vehicle, rho_air, mu_air, segment_name, cache, surrogate):
+        """
+        Adds the drag without rotor hubs of this segment (and the wetted area surrogate, if any)
+        """
+        promotes_inputs = ['Aero|speed', 'Rotor|radius'] if vehicle.configuration == 'Multirotor' else ['Aero|speed', 'Rotor|radius', 'Wing|area', 'Wing|aspect_ratio']
+        if surrogate is not None:
+            if isinstance(surrogate, str):
+                surrogate = WettedAreaSurrogate.load(surrogate)
+            self.add_subsystem('wetted_area',
+                               WettedAreaSurrogateComp(vehicle=vehicle, surrogate=surrogate),
+                               promotes_inputs=['*'],
+                               promotes_outputs=['*'])
+            promotes_inputs += ['Aero|S_wetted', 'Boom|area', 'Boom|aspect_ratio'] if vehicle.configuration == 'Multirotor' else ['Aero|S_wetted']
+
+        self.add_subsystem('parasite_drag_without_rotor_hub',
+                           ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name=segment_name, cache=cache, surrogate=surrogate),
+                           promotes_inputs=promotes_inputs,
+                           promotes_outputs=['Aero|f_non_hub', 'Aero|parasite_drag_non_hub'] if vehicle.configuration == 'Multirotor' else ['Aero|f_non_hub', 'Aero|parasite_drag_non_hub', 'Aero|Cd0'])
+
+
+class ParasiteDragViaComponentBuildUpMultiSegment(om.Group):
+    """
+    Computes the parasite drag without rotor hubs of several segments at once via a component build-up approach
+    (see ParasiteDragNonHubMultiSegment); the wetted area surrogate, if any, is evaluated once for all of them.
+    The rotor hub drag, which depends on the take-off weight, is left to each segment (ParasiteDragViaComponentBuildUpApproach with shared_non_hub=True)
+    Parameters:
+            vehicle				: MCEVS vehicle object
+            rho_air				: air density of each segment [kg/m**3]
+            mu_air 				: air dynamic viscosity of each segment [Ns/m**2]
+            segment_names 		: name of each segment (e.g., ['climb', 'cruise', 'descent'])
+            surrogate 			: WettedAreaSurrogate (or path of a saved one), or None (OpenVSP)
+    Inputs:
+            Aero|speed_{i} 		: air speed in the i-th segment [m/s]
+            Rotor|radius		: lift rotor radius [m]
+            Wing|area 			: wing area [m**2]
+            Wing|aspect_ratio 	: wing aspect ratio
+    Outputs:
+            Aero|f_non_hub 				: flat plate area without rotor hubs in each segment [m**2]
+            Aero|parasite_drag_non_hub	: parasite drag without rotor hubs in each segment [N]
+            Aero|Cd0					: parasite drag coefficient in each segment (LPC)
+    """
+    def initialize(self):
+        self.options.declare('vehicle', types=object, desc='Vehicle object')
+        self.options.declare('rho_air', desc='Air density of each segment')
+        self.options.declare('mu_air', desc='Air dynamic viscosity of each segment')
+        self.options.declare('segment_names', types=list, desc='Segment names')
+        self.options.declare('surrogate', default=None, desc='Wetted area surrogate (WettedAreaSurrogate or path of a saved one), or None for OpenVSP')
+
+    def setup(self):
+        vehicle = self.options['vehicle']
+        segment_names = self.options['segment_names']
+        surrogate = self.options['surrogate']
+
+        speeds = om.MuxComp(vec_size=len(segment_names))
+        speeds.add_var('Aero|speed', shape=(1,), axis=0, units='m/s')
+        self.add_subsystem('speeds', speeds, promotes_inputs=['*'])
+
+        promotes_inputs = ['Rotor|radius'] if vehicle.configuration == 'Multirotor' else ['Rotor|radius', 'Wing|area', 'Wing|aspect_ratio']
+        if surrogate is not None:
+            if isinstance(surrogate, str):
+                surrogate = WettedAreaSurrogate.load(surrogate)
+            self.add_subsystem('wetted_area',
+                               WettedAreaSurrogateComp(vehicle=vehicle, surrogate=surrogate),
+                               promotes_inputs=['*'],
+                               promotes_outputs=['*'])
+            promotes_inputs += ['Aero|S_wetted', 'Boom|area', 'Boom|aspect_ratio'] if vehicle.configuration == 'Multirotor' else ['Aero|S_wetted']
+
+        self.add_subsystem('parasite_drag_without_rotor_hub',
+                           ParasiteDragNonHubMultiSegment(vehicle=vehicle, rho_air=self.options['rho_air'], mu_air=self.options['mu_air'], segment_names=segment_names, surrogate=surrogate),
+                           promotes_inputs=promotes_inputs,
+                           promotes_outputs=['*'])
+        self.connect('speeds.Aero|speed', 'parasite_drag_without_rotor_hub.Aero|speed', src_indices=om.slicer[:, 0])
+
 
 class ParasiteDragNonHubFidelityOne(om.ExplicitComponent):
     """
     Computes the parasite drag coefficient via a component build-up approach (fidelity one)
+    The flat plate areas are evaluated for the actual design (lift rotor radius, and wing area and aspect ratio for a LPC)
+    and flow (rho, mu, v), and kept in a bounded FlatPlateAreaCache keyed by these inputs, so that design changes
+    during an optimization are never served stale values.
+    The last evaluated flat plate areas are recorded on the vehicle per segment (e.g., vehicle.f_total_non_hub[segment_name]).
+    In surrogate mode, the wetted areas (and boom geometry of a multirotor) are inputs computed by a WettedAreaSurrogateComp,
+    so that the flat plate areas are differentiable with respect to the geometry, and the cache is not used.
+    Partials are analytic (Reynolds number and skin friction chain of flat_plate_area_from_geometry). With OpenVSP wetted areas,
+    which are not differentiable, the partials with respect to the geometry (lift rotor radius, and wing area and aspect ratio
+    for a LPC) are finite differences, each step being a new OpenVSP evaluation (served by the cache when repeated).
     Parameters:
             vehicle				: MCEVS vehicle object
             rho_air				: air density [kg/m**3]
             mu_air 				: air dynamic viscosity [Ns/m**2]
+            segment_name 		: segment name ('climb', 'cruise' or 'descent')
+            cache 				: True (shared cache), False (no cache) or a FlatPlateAreaCache object
+            surrogate 			: WettedAreaSurrogate (surrogate mode), or None (OpenVSP)
     Inputs:
             Aero|speed 			: air speed of the eVTOL [m/s]
-            Rotor|radius		: rotor radius [m]
+            Rotor|radius		: lift rotor radius [m]
             Wing|area 			: wing area [m**2]
+            Wing|aspect_ratio 	: wing aspect ratio
+            Aero|S_wetted 		: wetted area of each component [m**2] (surrogate mode)
+            Boom|area 			: area of each boom [m**2] (surrogate mode, multirotor)
+            Boom|aspect_ratio 	: aspect ratio of each boom (surrogate mode, multirotor)
     Outputs:
             Aero|Cd0			: parasite drag coefficient
             Aero|parasite_drag	: parasite drag [N]
@@ -123,78 +222,491 @@ class ParasiteDragNonHubFidelityOne(om.ExplicitComponent):
         self.options.declare('rho_air', types=float, desc='Air density')
         self.options.declare('mu_air', types=float, desc='Air dynamic viscosity')
         self.options.declare('segment_name', types=str, desc='Segment name')
+        self.options.declare('cache', default=True, desc='Flat plate area cache: True (shared), False (disabled) or a FlatPlateAreaCache')
+        self.options.declare('surrogate', default=None, desc='Wetted area surrogate, or None for OpenVSP')
 
     def setup(self):
+        vehicle = self.options['vehicle']
+        surrogate = self.options['surrogate']
         self.add_input('Aero|speed', units='m/s', desc='Air speed')
-        if self.options['vehicle'].configuration == 'LiftPlusCruise':
-            self.add_input('Wing|area', units='m**2', desc='Wing reference area')
+        self.add_input('Rotor|radius', vehicle.lift_rotor.radius, units='m', desc='Lift rotor radius')
+        if vehicle.configuration == 'LiftPlusCruise':
+            self.add_input('Wing|area', vehicle.wing.area, units='m**2', desc='Wing reference area')
+            self.add_input('Wing|aspect_ratio', vehicle.wing.aspect_ratio, desc='Wing aspect ratio')
             self.add_output('Aero|Cd0', units=None, desc='Parasite drag coefficient')
+        if surrogate is not None:
+            self.add_input('Aero|S_wetted', np.ones(len(surrogate.components)), units='m**2', desc='Wetted area of each component')
+            if vehicle.configuration == 'Multirotor':
+                n_boom = len([name for name in surrogate.outputs if name.startswith('boom_area_')])
+                self.add_input('Boom|area', np.ones(n_boom), units='m**2', desc='Area of each boom')
+                self.add_input('Boom|aspect_ratio', np.ones(n_boom), desc='Aspect ratio of each boom')
         self.add_output('Aero|f_non_hub', units='m**2', desc='Total quivalent flat plate area of vehicle without rotor hubs')
         self.add_output('Aero|parasite_drag_non_hub', units='N', desc='Parasite drag')
-        self.declare_partials('*', '*', method='cs')
+
+        outputs = ['Aero|f_non_hub', 'Aero|parasite_drag_non_hub']
+        geometry = ['Rotor|radius']
+        if vehicle.configuration == 'LiftPlusCruise':
+            outputs.append('Aero|Cd0')
+            geometry += ['Wing|area', 'Wing|aspect_ratio']
+        if surrogate is not None:
+            wrt = ['Aero|speed', 'Aero|S_wetted', 'Boom|area', 'Boom|aspect_ratio'] if vehicle.configuration == 'Multirotor' else ['Aero|speed', 'Aero|S_wetted', 'Wing|area', 'Wing|aspect_ratio']
+            self.declare_partials(outputs, wrt)
+        else:
+            self.declare_partials(outputs, 'Aero|speed')
+            self.declare_partials(outputs, geometry, method='fd')
+
+        cache = self.options['cache']
+        self._cache = flat_plate_area_cache if cache is True else (cache or None)
+
+    def _flat_plate_areas(self, inputs):
+        """
+        Design vehicle and flat plate areas (with their partials) at the inputs
+        """
+        rho_air = self.options['rho_air']
+        mu_air = self.options['mu_air']
+        surrogate = self.options['surrogate']
+        v = inputs['Aero|speed'][0]		# in [m/s**2]
+
+        design = _design_from_inputs(self.options['vehicle'], inputs, surrogate)
+        if surrogate is not None:
+            flat_plate_areas = calc_flat_plate_area(design, rho_air, mu_air, v, S_wetted=inputs['Aero|S_wetted'], partials=True)
+        elif self._cache is None or self.under_complex_step:
+            flat_plate_areas = calc_flat_plate_area(design, rho_air, mu_air, v, partials=True)
+        else:
+            key = flat_plate_area_key(design, rho_air, mu_air, float(v))
+            entry = self._cache.get(key)
+            if entry is None:
+                flat_plate_areas = calc_flat_plate_area(design, rho_air, mu_air, v, partials=True)
+                self._cache.set(key, {'flat_plate_areas': flat_plate_areas, 'design_geometry': _design_geometry(design)})
+            else:
+                flat_plate_areas = entry['flat_plate_areas']
+                _restore_design_geometry(design, entry['design_geometry'])
+
+        return design, flat_plate_areas
 
     def compute(self, inputs, outputs):
         vehicle = self.options['vehicle']
         rho_air = self.options['rho_air']
-        mu_air = self.options['mu_air']
-        segment_name = self.options['segment_name']
         v = inputs['Aero|speed']		# in [m/s**2]
 
+        design, flat_plate_areas = self._flat_plate_areas(inputs)
+        f_total, Cd0_wing, f_total_non_hub_non_wing = _non_hub_flat_plate_area(vehicle, design, flat_plate_areas, inputs, self.options['surrogate'])
+
+        # Bookkeeping of the last evaluated (real, unperturbed) flat plate areas
+        if not self.under_approx:
+            _record_flat_plate_areas(vehicle, design, self.options['segment_name'], flat_plate_areas, f_total, Cd0_wing, f_total_non_hub_non_wing)
+
+        outputs['Aero|f_non_hub'] = f_total
+        outputs['Aero|parasite_drag_non_hub'] = 0.5 * rho_air * v * v * f_total
+
         if vehicle.configuration == 'LiftPlusCruise':
-            S_ref = inputs['Wing|area']	 # in [m**2]
+            outputs['Aero|Cd0'] = f_total / inputs['Wing|area']
 
-        if vehicle.configuration == 'Multirotor':
-            if vehicle.f_total_non_hub[segment_name] is None:
-                flat_plate_areas = calc_flat_plate_area(vehicle, rho_air, mu_air, v)
-                f_total = flat_plate_areas['f_total']
-                vehicle.fuselage.flat_plate_area[segment_name] = flat_plate_areas['f_fuselage']
-                vehicle.boom.flat_plate_area[segment_name] = flat_plate_areas['f_booms']
-                vehicle.landing_gear.flat_plate_area[segment_name] = flat_plate_areas['f_landing_gears']
-                vehicle.f_total_non_hub[segment_name] = f_total
-            else:
-                # f_fuselage = vehicle.fuselage.flat_plate_area[segment_name]
-                f_booms = vehicle.boom.flat_plate_area[segment_name]
-                # f_landing_gears = vehicle.landing_gear.flat_plate_area[segment_name]
-                f_total = vehicle.f_total_non_hub[segment_name]
-
-        elif vehicle.configuration == 'LiftPlusCruise':
-            if vehicle.f_total_non_hub_non_wing[segment_name] is None:
-                flat_plate_areas = calc_flat_plate_area(vehicle, rho_air, mu_air, v)
-                f_fuse = flat_plate_areas['f_fuselage']
-                f_wing = flat_plate_areas['f_wing']
-                f_htail = flat_plate_areas['f_horizontal_tail']
-                f_vtail = flat_plate_areas['f_vertical_tail']
-                f_booms = flat_plate_areas['f_booms']
-                f_LGs = flat_plate_areas['f_landing_gears']
-                f_total_non_hub_non_wing = f_fuse + f_htail + f_vtail + f_booms + f_LGs
-                Cd0_wing = f_wing / S_ref
-                vehicle.fuselage.flat_plate_area[segment_name] = f_fuse
-                vehicle.wing.Cd0[segment_name] = Cd0_wing[0]
-                vehicle.horizontal_tail.flat_plate_area[segment_name] = f_htail
-                vehicle.vertical_tail.flat_plate_area[segment_name] = f_vtail
-                vehicle.boom.flat_plate_area[segment_name] = f_booms
-                vehicle.landing_gear.flat_plate_area[segment_name] = f_LGs
-                vehicle.f_total_non_hub_non_wing[segment_name] = f_total_non_hub_non_wing
-                f_total = f_total_non_hub_non_wing + Cd0_wing * S_ref
-            else:
-                # f_fuselage = vehicle.fuselage.flat_plate_area[segment_name]
-                Cd0_wing = vehicle.wing.Cd0[segment_name]
-                f_htail = vehicle.horizontal_tail.flat_plate_area[segment_name]
-                f_vtail = vehicle.vertical_tail.flat_plate_area[segment_name]
-                f_booms = vehicle.boom.flat_plate_area[segment_name]
-                # f_landing_gears = vehicle.landing_gear.flat_plate_area[segment_name]
-                f_total = vehicle.f_total_non_hub_non_wing[segment_name] + Cd0_wing * S_ref
+    def compute_partials(self, inputs, partials):
+        vehicle = self.options['vehicle']
+        rho_air = self.options['rho_air']
+        v = inputs['Aero|speed']		# in [m/s**2]
+
+        flat_plate_areas = self._flat_plate_areas(inputs)[1]
+        f_total = flat_plate_areas['f_total']
+        df = _non_hub_flat_plate_area_partials(vehicle, flat_plate_areas, inputs, self.options['surrogate'])
+
+        for name, value in df.items():
+            partials['Aero|f_non_hub', name] = value
+            partials['Aero|parasite_drag_non_hub', name] = 0.5 * rho_air * v * v * value
+            if vehicle.configuration == 'LiftPlusCruise':
+                partials['Aero|Cd0', name] = value / inputs['Wing|area']
+        partials['Aero|parasite_drag_non_hub', 'Aero|speed'] += rho_air * v * f_total
+        if vehicle.configuration == 'LiftPlusCruise' and self.options['surrogate'] is not None:
+            partials['Aero|Cd0', 'Wing|area'] -= f_total / inputs['Wing|area']**2
+
+
+class ParasiteDragNonHubMultiSegment(om.ExplicitComponent):
+    """
+    Computes the parasite drag of several flight segments via the component build-up approach (fidelity one) in one call:
+    the geometric part of the build-up (wetted areas, form factors, reference lengths) is evaluated once per geometry,
+    and the Reynolds-dependent skin friction and flat plate areas of all segments in one vectorized evaluation
+    (see calc_flat_plate_area_segments). Same model, surrogate mode and partials as ParasiteDragNonHubFidelityOne,
+    whose outputs it gives for each segment; the flat plate areas are recorded on the vehicle under each segment name.
+    Parameters:
+            vehicle				: MCEVS vehicle object
+            rho_air				: air density of each segment [kg/m**3]
+            mu_air 				: air dynamic viscosity of each segment [Ns/m**2]
+            segment_names 		: name of each segment (e.g., ['climb', 'cruise', 'descent'])
+            surrogate 			: WettedAreaSurrogate (surrogate mode), or None (OpenVSP)
+    Inputs:
+            Aero|speed 			: air speed in each segment [m/s]
+            Rotor|radius		: lift rotor radius [m]
+            Wing|area 			: wing area [m**2]
+            Wing|aspect_ratio 	: wing aspect ratio
+            Aero|S_wetted 		: wetted area of each component [m**2] (surrogate mode)
+            Boom|area 			: area of each boom [m**2] (surrogate mode, multirotor)
+            Boom|aspect_ratio 	: aspect ratio of each boom (surrogate mode, multirotor)
+    Outputs:
+            Aero|f_non_hub 				: flat plate area without rotor hubs in each segment [m**2]
+            Aero|parasite_drag_non_hub	: parasite drag in each segment [N]
+            Aero|Cd0					: parasite drag coefficient in each segment (LPC)
+    """
+    def initialize(self):
+        self.options.declare('vehicle', types=object, desc='Vehicle object')
+        self.options.declare('rho_air', desc='Air density of each segment')
+        self.options.declare('mu_air', desc='Air dynamic viscosity of each segment')
+        self.options.declare('segment_names', types=list, desc='Segment names')
+        self.options.declare('surrogate', default=None, desc='Wetted area surrogate, or None for OpenVSP')
+
+    def setup(self):
+        vehicle = self.options['vehicle']
+        surrogate = self.options['surrogate']
+        n = len(self.options['segment_names'])
+        self.add_input('Aero|speed', np.ones(n), units='m/s', desc='Air speed in each segment')
+        self.add_input('Rotor|radius', vehicle.lift_rotor.radius, units='m', desc='Lift rotor radius')
+        if vehicle.configuration == 'LiftPlusCruise':
+            self.add_input('Wing|area', vehicle.wing.area, units='m**2', desc='Wing reference area')
+            self.add_input('Wing|aspect_ratio', vehicle.wing.aspect_ratio, desc='Wing aspect ratio')
+            self.add_output('Aero|Cd0', np.ones(n), units=None, desc='Parasite drag coefficient in each segment')
+        if surrogate is not None:
+            self.add_input('Aero|S_wetted', np.ones(len(surrogate.components)), units='m**2', desc='Wetted area of each component')
+            if vehicle.configuration == 'Multirotor':
+                n_boom = len([name for name in surrogate.outputs if name.startswith('boom_area_')])
+                self.add_input('Boom|area', np.ones(n_boom), units='m**2', desc='Area of each boom')
+                self.add_input('Boom|aspect_ratio', np.ones(n_boom), desc='Aspect ratio of each boom')
+        self.add_output('Aero|f_non_hub', np.ones(n), units='m**2', desc='Flat plate area without rotor hubs in each segment')
+        self.add_output('Aero|parasite_drag_non_hub', np.ones(n), units='N', desc='Parasite drag in each segment')
+
+        outputs = ['Aero|f_non_hub', 'Aero|parasite_drag_non_hub'] + (['Aero|Cd0'] if vehicle.configuration == 'LiftPlusCruise' else [])
+        self.declare_partials(outputs, 'Aero|speed', rows=np.arange(n), cols=np.arange(n))
+        if surrogate is not None:
+            wrt = ['Aero|S_wetted', 'Boom|area', 'Boom|aspect_ratio'] if vehicle.configuration == 'Multirotor' else ['Aero|S_wetted', 'Wing|area', 'Wing|aspect_ratio']
+            self.declare_partials(outputs, wrt)
+        else:
+            geometry = ['Rotor|radius'] if vehicle.configuration == 'Multirotor' else ['Rotor|radius', 'Wing|area', 'Wing|aspect_ratio']
+            self.declare_partials(outputs, geometry, method='fd')
+
+    def _flat_plate_areas(self, inputs):
+        """
+        Design vehicle and flat plate areas (with their partials) of all segments at the inputs
+        """
+        surrogate = self.options['surrogate']
+        design = _design_from_inputs(self.options['vehicle'], inputs, surrogate)
+        S_wetted = None if surrogate is None else inputs['Aero|S_wetted']
+        geometry = build_up_geometry(design, S_wetted=S_wetted)
+        flat_plate_areas = flat_plate_area_from_geometry(geometry, np.asarray(self.options['rho_air'], dtype=float),
+                                                         np.asarray(self.options['mu_air'], dtype=float), inputs['Aero|speed'], partials=True)
+        return design, flat_plate_areas
+
+    def compute(self, inputs, outputs):
+        vehicle = self.options['vehicle']
+        rho_air = np.asarray(self.options['rho_air'], dtype=float)
+        v = inputs['Aero|speed']		# in [m/s**2]
+
+        design, flat_plate_areas = self._flat_plate_areas(inputs)
+        f_total, Cd0_wing, f_total_non_hub_non_wing = _non_hub_flat_plate_area(vehicle, design, flat_plate_areas, inputs, self.options['surrogate'])
+
+        # Bookkeeping of the last evaluated (real, unperturbed) flat plate areas of each segment
+        if not self.under_approx:
+            for i, segment_name in enumerate(self.options['segment_names']):
+                segment = {name: value[i] for name, value in flat_plate_areas.items() if name != 'partials'}
+                _record_flat_plate_areas(vehicle, design, segment_name, segment, f_total[i],
+                                         None if Cd0_wing is None else Cd0_wing[i], None if f_total_non_hub_non_wing is None else f_total_non_hub_non_wing[i])
 
         outputs['Aero|f_non_hub'] = f_total
         outputs['Aero|parasite_drag_non_hub'] = 0.5 * rho_air * v * v * f_total
 
         if vehicle.configuration == 'LiftPlusCruise':
-            outputs['Aero|Cd0'] = f_total / S_ref
+            outputs['Aero|Cd0'] = f_total / inputs['Wing|area']
 
+    def compute_partials(self, inputs, partials):
+        vehicle = self.options['vehicle']
+        rho_air = np.asarray(self.options['rho_air'], dtype=float)
+        v = inputs['Aero|speed']		# in [m/s**2]
 
-def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf: float):
+        flat_plate_areas = self._flat_plate_areas(inputs)[1]
+        f_total = flat_plate_areas['f_total']
+        df = _non_hub_flat_plate_area_partials(vehicle, flat_plate_areas, inputs, self.options['surrogate'])
+
+        # Segments are independent: diagonal derivatives with respect to the speeds, one row per segment otherwise
+        q = 0.5 * rho_air * v * v
+        for name, value in df.items():
+            scale = q if name == 'Aero|speed' else q[:, np.newaxis]
+            value = value if name == 'Aero|speed' else np.reshape(value, (len(v), -1))
+            partials['Aero|f_non_hub', name] = value
+            partials['Aero|parasite_drag_non_hub', name] = scale * value
+            if vehicle.configuration == 'LiftPlusCruise':
+                partials['Aero|Cd0', name] = value / inputs['Wing|area']
+        partials['Aero|parasite_drag_non_hub', 'Aero|speed'] += rho_air * v * f_total
+        if vehicle.configuration == 'LiftPlusCruise' and self.options['surrogate'] is not None:
+            partials['Aero|Cd0', 'Wing|area'] -= (f_total / inputs['Wing|area']**2)[:, np.newaxis]
+
+
+def _design_from_inputs(vehicle: object, inputs, surrogate=None):
+    """
+    Design vehicle of the build-up components at their inputs (real parts, e.g., when checking partials by complex step;
+    in surrogate mode, the boom geometry or the wing planform of the inputs are kept as is)
+    """
+    if vehicle.configuration == 'Multirotor':
+        design = design_vehicle(vehicle, r_lift_rotor=np.real(inputs['Rotor|radius'][0]))
+        if surrogate is not None:
+            design.boom.area, design.boom.aspect_ratio = inputs['Boom|area'], inputs['Boom|aspect_ratio']
+    elif vehicle.configuration == 'LiftPlusCruise':
+        design = design_vehicle(vehicle, r_lift_rotor=np.real(inputs['Rotor|radius'][0]),
+                                wing_area=np.real(inputs['Wing|area'][0]), wing_aspect_ratio=np.real(inputs['Wing|aspect_ratio'][0]))
+        if surrogate is not None:
+            design.wing.area, design.wing.aspect_ratio = inputs['Wing|area'][0], inputs['Wing|aspect_ratio'][0]
+    return design
+
+
+def _design_geometry(design: object):
+    """
+    Geometry set on a design vehicle by calc_flat_plate_area(): the wetted areas, and the boom geometry of a multirotor
+    """
+    geometry = {'S_wetted': design.S_wetted}
+    if design.configuration == 'Multirotor':
+        geometry['boom_area'], geometry['boom_aspect_ratio'] = design.boom.area, design.boom.aspect_ratio
+    return geometry
+
+
+def _restore_design_geometry(design: object, geometry: dict):
+    """
+    Sets the geometry of _design_geometry() on a design vehicle (when its flat plate areas are served by the cache)
+    """
+    design.S_wetted = geometry['S_wetted']
+    if design.configuration == 'Multirotor':
+        design.boom.area, design.boom.aspect_ratio = geometry['boom_area'], geometry['boom_aspect_ratio']
+
+
+def _non_hub_flat_plate_area(vehicle: object, design: object, flat_plate_areas: dict, inputs, surrogate=None):
+    """
+    Total flat plate area without rotor hubs, and for a LPC the wing Cd0 and the flat plate area without hubs and wing (None otherwise)
+    """
+    if vehicle.configuration == 'Multirotor':
+        return flat_plate_areas['f_total'], None, None
+
+    S_ref = inputs['Wing|area']	 # in [m**2]
+    f_total_non_hub_non_wing = flat_plate_areas['f_fuselage'] + flat_plate_areas['f_horizontal_tail'] + flat_plate_areas['f_vertical_tail'] \
+        + flat_plate_areas['f_booms'] + flat_plate_areas['f_landing_gears']
+    if surrogate is not None:
+        # Wing wetted area is a function of the wing area
+        Cd0_wing = flat_plate_areas['f_wing'] / S_ref
+        f_total = f_total_non_hub_non_wing + flat_plate_areas['f_wing']
+    else:
+        # Wing drag scales with the reference area at a fixed Cd0 (OpenVSP wetted areas are not differentiable)
+        Cd0_wing = flat_plate_areas['f_wing'] / design.wing.area
+        f_total = f_total_non_hub_non_wing + Cd0_wing * S_ref
+    return f_total, Cd0_wing, f_total_non_hub_non_wing
+
+
+def _non_hub_flat_plate_area_partials(vehicle: object, flat_plate_areas: dict, inputs, surrogate=None):
+    """
+    Analytic derivatives of the total flat plate area without rotor hubs with respect to the inputs of the build-up components
+    (the geometric ones in surrogate mode only; they are finite differences with OpenVSP wetted areas)
+    """
+    d = flat_plate_areas['partials']
+    df = {'Aero|speed': d['v']['f_total']}
+    if surrogate is not None:
+        df['Aero|S_wetted'] = d['S_wetted']['f_total']
+        if vehicle.configuration == 'Multirotor':
+            # Boom reference length L = sqrt(area / aspect_ratio)
+            area, aspect_ratio = inputs['Boom|area'], inputs['Boom|aspect_ratio']
+            L_boom = np.sqrt(area / aspect_ratio)
+            df['Boom|area'] = d['L_ref']['f_total'][..., 1:] * 0.5 * L_boom / area
+            df['Boom|aspect_ratio'] = -d['L_ref']['f_total'][..., 1:] * 0.5 * L_boom / aspect_ratio
+    if vehicle.configuration == 'LiftPlusCruise' and surrogate is not None:
+        # Wing reference length L = sqrt(area / aspect_ratio)
+        S_ref, aspect_ratio = inputs['Wing|area'], inputs['Wing|aspect_ratio']
+        L_wing = np.sqrt(S_ref / aspect_ratio)
+        df['Wing|area'] = d['L_ref']['f_total'][..., 1] * 0.5 * L_wing / S_ref
+        df['Wing|aspect_ratio'] = -d['L_ref']['f_total'][..., 1] * 0.5 * L_wing / aspect_ratio
+    return df
+
+
+def _record_flat_plate_areas(vehicle: object, design: object, segment_name: str, flat_plate_areas: dict, f_total, Cd0_wing, f_total_non_hub_non_wing):
+    """
+    Records the flat plate areas of a segment (and the wetted areas, and the boom geometry of a multirotor) on the vehicle
+    """
+    vehicle.S_wetted = np.real(design.S_wetted)
+    vehicle.fuselage.flat_plate_area[segment_name] = flat_plate_areas['f_fuselage']
+    vehicle.boom.flat_plate_area[segment_name] = flat_plate_areas['f_booms']
+    vehicle.landing_gear.flat_plate_area[segment_name] = flat_plate_areas['f_landing_gears']
+    if vehicle.configuration == 'Multirotor':
+        vehicle.f_total_non_hub[segment_name] = f_total
+        if vehicle.boom.area is None:
+            vehicle.boom.area = [float(value) for value in np.real(design.boom.area)]
+            vehicle.boom.aspect_ratio = [float(value) for value in np.real(design.boom.aspect_ratio)]
+    elif vehicle.configuration == 'LiftPlusCruise':
+        vehicle.wing.Cd0[segment_name] = np.ravel(Cd0_wing)[0]
+        vehicle.horizontal_tail.flat_plate_area[segment_name] = flat_plate_areas['f_horizontal_tail']
+        vehicle.vertical_tail.flat_plate_area[segment_name] = flat_plate_areas['f_vertical_tail']
+        vehicle.f_total_non_hub_non_wing[segment_name] = f_total_non_hub_non_wing
+
+
+# Promoted name and units of each surrogate parameter
+surrogate_input_names = {'fuselage_length': ('Fuselage|length', 'm'),
+                         'fuselage_max_diameter': ('Fuselage|max_diameter', 'm'),
+                         'wing_area': ('Wing|area', 'm**2'),
+                         'wing_aspect_ratio': ('Wing|aspect_ratio', None),
+                         'htail_area': ('HorizontalTail|area', 'm**2'),
+                         'htail_aspect_ratio': ('HorizontalTail|aspect_ratio', None),
+                         'vtail_area': ('VerticalTail|area', 'm**2'),
+                         'vtail_aspect_ratio': ('VerticalTail|aspect_ratio', None),
+                         'r_lift_rotor': ('Rotor|radius', 'm'),
+                         'boom_length': ('Boom|length', 'm'),
+                         'boom_max_diameter': ('Boom|max_diameter', 'm')}
+
+
+class WettedAreaSurrogateComp(om.ExplicitComponent):
+    """
+    Computes the wetted areas (and, for a multirotor, the boom geometry) with a WettedAreaSurrogate fitted to OpenVSP,
+    with analytic partials
+    Parameters:
+            vehicle				: MCEVS vehicle object (its geometric inputs other than the surrogate parameters should be those of the surrogate)
+            surrogate 			: WettedAreaSurrogate
+    Inputs:
+            one input per surrogate parameter (see surrogate_input_names, e.g., Wing|area [m**2], Rotor|radius [m])
+    Outputs:
+            Aero|S_wetted 		: wetted area of each component in the order of calc_wetted_area [m**2]
+            Boom|area 			: area of each boom [m**2] (multirotor)
+            Boom|aspect_ratio 	: aspect ratio of each boom (multirotor)
+    """
+    def initialize(self):
+        self.options.declare('vehicle', types=object, desc='Vehicle object')
+        self.options.declare('surrogate', types=WettedAreaSurrogate, desc='Wetted area surrogate')
+
+    def setup(self):
+        vehicle = self.options['vehicle']
+        surrogate = self.options['surrogate']
+        if vehicle.configuration != surrogate.configuration:
+            raise ValueError(f'Wetted area surrogate of a {surrogate.configuration} cannot be used for a {vehicle.configuration}!')
+        x = surrogate.parameter_values(vehicle)
+
+        for i, name in enumerate(surrogate.parameters):
+            self.add_input(surrogate_input_names[name][0], x[i], units=surrogate_input_names[name][1])
+
+        # Output name and indices in surrogate.outputs
+        self._output_indices = {'Aero|S_wetted': [i for i, name in enumerate(surrogate.outputs) if name in surrogate.components]}
+        if vehicle.configuration == 'Multirotor':
+            self._output_indices['Boom|area'] = [i for i, name in enumerate(surrogate.outputs) if name.startswith('boom_area_')]
+            self._output_indices['Boom|aspect_ratio'] = [i for i, name in enumerate(surrogate.outputs) if name.startswith('boom_aspect_ratio_')]
+        y = surrogate.predict(x)
+        for output_name, indices in self._output_indices.items():
+            self.add_output(output_name, y[indices], units=None if output_name == 'Boom|aspect_ratio' else 'm**2')
+            self.declare_partials(output_name, [surrogate_input_names[name][0] for name in surrogate.parameters])
+
+    def _parameters(self, inputs):
+        surrogate = self.options['surrogate']
+        return np.array([inputs[surrogate_input_names[name][0]][0] for name in surrogate.parameters])
+
+    def compute(self, inputs, outputs):
+        y = self.options['surrogate'].predict(self._parameters(inputs))
+        for output_name, indices in self._output_indices.items():
+            outputs[output_name] = y[indices]
+
+    def compute_partials(self, inputs, partials):
+        surrogate = self.options['surrogate']
+        jacobian = surrogate.predict_with_gradient(self._parameters(inputs))[1]
+        for output_name, indices in self._output_indices.items():
+            for k, name in enumerate(surrogate.parameters):
+                partials[output_name, surrogate_input_names[name][0]] = jacobian[indices, k]
+
+
+def design_vehicle(vehicle: object, r_lift_rotor: float, wing_area=None, wing_aspect_ratio=None):
+    """
+    Shallow copy of a vehicle with the given design variables; the copied components are the only ones modified
+    (for a multirotor, boom area and aspect ratio are reset, since they are derived from the OpenVSP geometry)
+    """
+    design = copy.copy(vehicle)
+    design.lift_rotor = copy.copy(vehicle.lift_rotor)
+    design.lift_rotor.radius = float(r_lift_rotor)
+    if vehicle.configuration == 'Multirotor':
+        design.boom = copy.copy(vehicle.boom)
+        design.boom.area = None
+        design.boom.aspect_ratio = None
+    elif vehicle.configuration == 'LiftPlusCruise':
+        design.wing = copy.copy(vehicle.wing)
+        design.wing.area = float(wing_area)
+        design.wing.aspect_ratio = float(wing_aspect_ratio)
+    design.S_wetted = None
+    return design
+
+
+def flat_plate_area_key(vehicle: object, rho_air: float, mu_air: float, v_inf: float):
+    """
+    Cache key of calc_flat_plate_area(): the wetted area key, every other vehicle parameter of the build-up, and the flow condition
+    """
+    parameters = {'fuselage_fineness_ratio': vehicle.fuselage.fineness_ratio,
+                  'n_boom': vehicle.boom.number_of_booms,
+                  'boom_fineness_ratio': vehicle.boom.fineness_ratio,
+                  'boom_thickness_to_chord_ratio': vehicle.boom.thickness_to_chord_ratio}
+    if vehicle.configuration == 'LiftPlusCruise':
+        parameters['wing_thickness_to_chord_ratio'] = vehicle.wing.thickness_to_chord_ratio
+        parameters['htail_thickness_to_chord_ratio'] = vehicle.horizontal_tail.thickness_to_chord_ratio
+        parameters['vtail_thickness_to_chord_ratio'] = vehicle.vertical_tail.thickness_to_chord_ratio
+    return (wetted_area_key(vehicle), json.dumps(parameters, sort_keys=True, default=float), float(rho_air), float(mu_air), float(v_inf))
+
+
+class FlatPlateAreaCache(object):
+    """
+    Bounded (least recently used) in-memory cache of calc_flat_plate_area() results, keyed by flat_plate_area_key();
+    each entry also holds the geometry that the evaluation set on the design vehicle (see _design_geometry)
+    Parameters:
+            maxsize : maximum number of entries
+    """
+
+    def __init__(self, maxsize=256):
+        super(FlatPlateAreaCache, self).__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: tuple):
+        """
+        Cached entry for a key, or None (counted as a hit or a miss)
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: tuple, value: dict):
+        """
+        Stores an entry, evicting the least recently used entry when full
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics
+        """
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def statistics(self):
+        """
+        Hit/miss statistics and number of entries
+        """
+        n_calls = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / n_calls if n_calls > 0 else 0.0,
+                'n_entries': len(self._entries),
+                'maxsize': self.maxsize}
+
+
+# Cache shared by all ParasiteDragNonHubFidelityOne components (cache=True)
+flat_plate_area_cache = FlatPlateAreaCache()
+
+
+def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf: float, S_wetted=None, partials=False):
     """
     Calculating parasite drag via a component build-up approach
+    The wetted areas are computed by OpenVSP, unless given (S_wetted: array in the order of calc_wetted_area, e.g., from a surrogate)
+    With partials=True, the analytic derivatives of the flat plate areas are returned in results['partials'] (see flat_plate_area_from_geometry)
     Component list for a Multirotor
             1. Fuselage
             2. Boom 1
@@ -223,16 +735,21 @@ def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf:
             13. Main Wheel LG 1
             14. Main Wheel LG 2
     """
-    # Flow condition
-    Re_L = rho_air * v_inf / mu_air
+    return flat_plate_area_from_geometry(build_up_geometry(vehicle, S_wetted), rho_air, mu_air, v_inf, partials=partials)
 
-    # Wetted area !!!expensive, evaluate once!!!
-    if vehicle.S_wetted is None:
-        S_wetted = calc_wetted_area(vehicle)
-        S_wetted = np.array(list(S_wetted.values()))[:-6]  # excluding lg struts and wheels
-        vehicle.S_wetted = S_wetted
-    else:
-        S_wetted = vehicle.S_wetted
+
+def build_up_geometry(vehicle: object, S_wetted=None):
+    """
+    Flow-independent part of the component build-up: wetted area, interference factor, form factor and reference length
+    of each component, flat plate areas of the landing gears, and the components of each group (fuselage, booms, ...).
+    The wetted areas are computed by OpenVSP (and recorded in vehicle.S_wetted), unless given.
+    """
+    # Wetted area (expensive; cached per geometry by calc_wetted_area)
+    if S_wetted is None:
+        S_wetted = list(calc_wetted_area(vehicle).values())
+    n_all = len(S_wetted)
+    S_wetted = np.asarray(S_wetted)[:-6]  # excluding lg struts and wheels
+    vehicle.S_wetted = S_wetted
 
     if vehicle.configuration == 'Multirotor':
         n_components = 1 + int(vehicle.lift_rotor.n_rotor)
@@ -253,32 +770,15 @@ def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf:
             FF[1 + i] = 1.0 + 2.0 * FR[1 + i] + 60 * FR[1 + i]**4
 
         # Reference lengths
-        L_ref = np.ones(n_components)
+        L_ref = np.ones(n_components, dtype=np.result_type(S_wetted, *vehicle.boom.area))
         L_ref[0] = vehicle.fuselage.length
         for i in range(vehicle.boom.number_of_booms):
             L_ref[1 + i] = np.sqrt(vehicle.boom.area[i] / vehicle.boom.aspect_ratio[i])
 
-        # Reynold numbers
-        Re = Re_L * L_ref
-
-        # Coefficient of frictions Cf (Schlichting compressible)
-        # Cf = Cf_100%turb - %lam * Cf_partialturb + %lam * Cf_partiallam
-        # Cf_100%turb = f_turb(Re)
-        # Cf_partialturb = f_turb(%lam*Re)
-        # Cf_partiallam = f_lam(%lam*Re)
-        # assumption: fully turbulent (i.e., %lam = 0)
-        Cf = 0.455 / ((np.log10(Re))**2.58)
-
         # Interference factor Q (fuselage=1.0, wing=1.0, htail=1.08, vtail=1.03, boom=1.3)
         Q = 1.3 * np.ones(n_components)
         Q[0] = 1.0
 
-        # print(S_wetted.shape, Q.shape, Cf.shape, FF.shape)
-        # print(S_wetted, Q, Cf, FF)
-
-        # Flat plate drag
-        f = S_wetted * Q * Cf * FF
-
         if vehicle.landing_gear.gear_type == 'wheeled':
             # Parasite drag of landing gear (strut and wheel)
             CD_pi = np.array([0.13, 0.13, 0.13, 0.13, 0.13, 0.13])
@@ -287,14 +787,8 @@ def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf:
             # Parasite drag of landing skid (front, side, rear)
             CD_pi = np.array([1.01, 1.01, 1.01, 1.01, 1.01, 1.01])
             S_front = np.array([0.0156419, 0.0156419, 0.00823901, 0.00823901, 0.0177222, 0.0177222])
-        f_LG = CD_pi * S_front
 
-        # Bookkeeping
-        results = {}
-        results['f_total'] = np.sum(f) + np.sum(f_LG)
-        results['f_fuselage'] = f[0]
-        results['f_booms'] = f[1] + f[2] + f[3] + f[4]
-        results['f_landing_gears'] = np.sum(f_LG)
+        groups = {'f_fuselage': [0], 'f_booms': list(range(1, n_components))}
 
     elif vehicle.configuration == 'LiftPlusCruise':
         n_components = 4 + int(vehicle.lift_rotor.n_rotor / 2)
@@ -318,7 +812,7 @@ def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf:
             FF[4 + i] = 1.0 + 1.5 / (FR[4 + i]**1.5) + 7.0 / (FR[4 + i]**3)
 
         # Reference lengths
-        L_ref = np.ones(n_components)
+        L_ref = np.ones(n_components, dtype=np.result_type(S_wetted, vehicle.wing.area, vehicle.wing.aspect_ratio))
         L_ref[0] = vehicle.fuselage.length
         L_ref[1] = np.sqrt(vehicle.wing.area / vehicle.wing.aspect_ratio)
         L_ref[2] = np.sqrt(vehicle.horizontal_tail.area / vehicle.horizontal_tail.aspect_ratio)
@@ -326,17 +820,6 @@ def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf:
         for i in range(vehicle.boom.number_of_booms):
             L_ref[4 + i] = vehicle.boom.length
 
-        # Reynold numbers
-        Re = Re_L * L_ref
-
-        # Coefficient of frictions Cf (Schlichting compressible)
-        # Cf = Cf_100%turb - %lam * Cf_partialturb + %lam * Cf_partiallam
-        # Cf_100%turb = f_turb(Re)
-        # Cf_partialturb = f_turb(%lam*Re)
-        # Cf_partiallam = f_lam(%lam*Re)
-        # assumption: fully turbulent (i.e., %lam = 0)
-        Cf = 0.455 / ((np.log10(Re))**2.58)
-
         # Interference factor Q (fuselage=1.0, wing=1.0, htail=1.08, vtail=1.03, boom=1.3)
         Q = 1.3 * np.ones(n_components)
         Q[0] = 1.0
@@ -344,25 +827,85 @@ def calc_flat_plate_area(vehicle: object, rho_air: float, mu_air: float, v_inf:
         Q[2] = 1.08
         Q[3] = 1.03
 
-        # print(S_wetted.shape, Q.shape, Cf.shape, FF.shape)
-        # print(S_wetted, Q, Cf, FF)
-
-        # Flat plate drag
-        f = S_wetted * Q * Cf * FF
-
         # Parasite drag of landing gear (strut and wheel)
         CD_pi = np.array([0.13, 0.13, 0.13, 0.13, 0.13, 0.13])
         S_front = np.array([0.0333752, 0.0333752, 0.0333752, 0.101213, 0.101213, 0.101213])
-        f_LG = CD_pi * S_front
-
-        # Bookkeeping
-        results = {}
-        results['f_total'] = np.sum(f) + np.sum(f_LG)
-        results['f_fuselage'] = f[0]
-        results['f_wing'] = f[1]
-        results['f_horizontal_tail'] = f[2]
-        results['f_vertical_tail'] = f[3]
-        results['f_booms'] = f[4] + f[5] + f[6] + f[7]
-        results['f_landing_gears'] = np.sum(f_LG)
+
+        groups = {'f_fuselage': [0], 'f_wing': [1], 'f_horizontal_tail': [2], 'f_vertical_tail': [3], 'f_booms': list(range(4, n_components))}
+
+    return {'S_wetted': S_wetted, 'n_wetted_area': n_all, 'Q': Q, 'FF': FF, 'L_ref': L_ref, 'f_LG': CD_pi * S_front, 'groups': groups}
+
+
+def flat_plate_area_from_geometry(geometry: dict, rho_air, mu_air, v_inf, partials=False):
+    """
+    Flat plate areas (f = S_wetted * Q * Cf * FF) of the components of a build_up_geometry() at a flow condition,
+    or at several flow conditions at once when rho_air, mu_air and v_inf are arrays (results then have their shape,
+    with the component axis last for the partials).
+    With partials=True, results['partials'][x][name] is the derivative of results[name] with respect to x, where x is
+    'v', 'rho' or 'mu' (flow condition), 'S_wetted' (array over all wetted areas of calc_wetted_area) or 'L_ref'
+    (array over the reference lengths of the components); only the skin friction depends on the Reynolds number:
+            Re = rho * v * L_ref / mu, 	Cf = 0.455 / log10(Re)**2.58, 	dCf/dln(Re) = -2.58 * Cf / (ln(10) * log10(Re))
+    """
+    S_wetted, Q, FF, L_ref = geometry['S_wetted'], geometry['Q'], geometry['FF'], geometry['L_ref']
+
+    # Reynold numbers (flow conditions first, components last)
+    Re_L = np.asarray(rho_air * v_inf / mu_air)
+    Re = Re_L[..., np.newaxis] * L_ref
+
+    # Coefficient of frictions Cf (Schlichting compressible)
+    # Cf = Cf_100%turb - %lam * Cf_partialturb + %lam * Cf_partiallam
+    # Cf_100%turb = f_turb(Re)
+    # Cf_partialturb = f_turb(%lam*Re)
+    # Cf_partiallam = f_lam(%lam*Re)
+    # assumption: fully turbulent (i.e., %lam = 0)
+    Cf = 0.455 / ((np.log10(Re))**2.58)
+
+    # Flat plate drag
+    f = S_wetted * Q * Cf * FF
+    f_LG = np.sum(geometry['f_LG']) + np.zeros(np.shape(Re_L))
+
+    # Bookkeeping
+    results = {}
+    results['f_total'] = np.sum(f, axis=-1) + f_LG
+    for name, indices in geometry['groups'].items():
+        results[name] = np.sum(f[..., indices], axis=-1)
+    results['f_landing_gears'] = f_LG
+
+    if partials:
+        # Derivative of each flat plate area with respect to the log of its Reynolds number
+        n = np.shape(f)[-1]
+        df_dlnRe = S_wetted * Q * FF * (-2.58 * Cf / (np.log(10.0) * np.log10(Re)))
+        df_dS = np.zeros(np.shape(Re_L) + (geometry['n_wetted_area'],), dtype=np.result_type(f))
+        df_dS[..., :n] = Q * Cf * FF
+
+        members = dict(geometry['groups'], f_total=list(range(n)), f_landing_gears=[])
+        results['partials'] = {'v': {}, 'rho': {}, 'mu': {}, 'S_wetted': {}, 'L_ref': {}}
+        for name, indices in members.items():
+            mask = np.zeros(n)
+            mask[indices] = 1.0
+            dlnRe = np.sum(mask * df_dlnRe, axis=-1)
+            results['partials']['v'][name] = dlnRe / v_inf
+            results['partials']['rho'][name] = dlnRe / rho_air
+            results['partials']['mu'][name] = -dlnRe / mu_air
+            results['partials']['S_wetted'][name] = np.concatenate([mask, np.zeros(geometry['n_wetted_area'] - n)]) * df_dS
+            results['partials']['L_ref'][name] = mask * df_dlnRe / L_ref
 
     return results
+
+
+def calc_flat_plate_area_segments(vehicle: object, flow_conditions: dict, S_wetted=None, partials=False):
+    """
+    Flat plate areas (as returned by calc_flat_plate_area) of a vehicle at the flow conditions of several segments,
+    given as {segment name: (rho_air, mu_air, v_inf)}. The wetted areas and the other geometric terms of the build-up
+    are computed once, and the skin friction of all segments in one vectorized evaluation.
+    """
+    names = list(flow_conditions)
+    rho_air, mu_air, v_inf = (np.array([flow_conditions[name][i] for name in names], dtype=float) for i in range(3))
+    flat_plate_areas = flat_plate_area_from_geometry(build_up_geometry(vehicle, S_wetted), rho_air, mu_air, v_inf, partials=partials)
+
+    def segment(value, i):
+        if isinstance(value, dict):
+            return {key: segment(item, i) for key, item in value.items()}
+        return value[i]
+
+    return {name: segment(flat_plate_areas, i) for i, name in enumerate(names)}
@@ -1,10 +1,13 @@
-from MCEVS.Analyses.Power.Analysis import PowerRequirement
+from MCEVS.Analyses.Power.Analysis import PowerRequirement, segment_has_power_nodes
+from MCEVS.Analyses.Power.TimeResolved import compute_node_conditions, fixed_duration_kinds
+from MCEVS.Analyses.Energy.TimeResolved import trapezoid_weights
 from MCEVS.Analyses.Geometry.Rotor import MeanChord
 from MCEVS.Utils.Performance import record_performance_by_segments
 from MCEVS.Utils.Checks import check_fidelity_dict
 from MCEVS.Utils.IndepsVarComp import promote_indeps_var_comp
 
 import openmdao.api as om
+import numpy as np
 
 
 class EnergyAnalysis(object):
@@ -98,6 +101,8 @@ class EnergyConsumption(om.Group):
     Outputs:
     (major performances)
             Energy|entire_mission
+    If fidelity['power_model']['time_resolved'] is True, the energy of vertical flight segments is
+    integrated with the trapezoidal rule over their node-wise power instead of power * duration.
     """
     def initialize(self):
         self.options.declare('mission', types=object, desc='Mission object')
@@ -112,6 +117,10 @@ class EnergyConsumption(om.Group):
         vehicle = self.options['vehicle']
         fidelity = self.options['fidelity']
         rhs_checking = self.options['rhs_checking']
+        time_resolved = fidelity['power_model'].get('time_resolved', False)
+
+        # Segments whose duration does not depend on speed and distance
+        fixed_time_kinds = fixed_duration_kinds(fidelity)
 
         # -------------------------------------------------------------#
         # --- Calculate power consumptions for each flight segment --- #
@@ -125,84 +134,166 @@ class EnergyConsumption(om.Group):
                            promotes_inputs=['*'],
                            promotes_outputs=['*'])
 
-        # Mission variables
-        indep = self.add_subsystem('mission_var', om.IndepVarComp())
-        for i in range(1, mission.n_segments + 1):
-            if mission.segments[i - 1].kind in ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise']:
-                indep.add_output(f'segment_time_{i}', val=mission.segments[i - 1].duration, units='s')
-            else:
-                kwargs_time_id = {f'segment_time_{i}': {'units': 's'}}
-                self.add_subsystem(f'calc_segment_time_{i}',
-                                   om.ExecComp(f'segment_time_{i} = distance / speed', **kwargs_time_id, distance={'units': 'm'}, speed={'units': 'm/s'}),
-                                   promotes_inputs=[('distance', f'Mission|segment_{i}|distance'), ('speed', f'Mission|segment_{i}|speed')],
-                                   promotes_outputs=[(f'segment_time_{i}', f'Mission|segment_{i}|duration')])
-        indep.add_output('n_repetition', val=mission.n_repetition)
-
-        # Calculate total mission time
-        total_mission_time_eq = 'total_mission_time = '
-        kwargs_time = {}
-        for i in range(1, mission.n_segments + 1):
-            kwargs_time[f'segment_time_{i}'] = {'units': 's'}
-            total_mission_time_eq += f'segment_time_{i}' if i == mission.n_segments else f'segment_time_{i} + '
-
-        self.add_subsystem('calc_total_mission_time',
-                           om.ExecComp(total_mission_time_eq, **kwargs_time, total_mission_time={'units': 's'}),
-                           promotes_outputs=[('total_mission_time', 'Mission|total_time')])
-
-        for i in range(1, mission.n_segments + 1):
-            if mission.segments[i - 1].kind in ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise']:
-                self.connect(f'mission_var.segment_time_{i}', f'calc_total_mission_time.segment_time_{i}')
-            else:
-                self.connect(f'Mission|segment_{i}|duration', f'calc_total_mission_time.segment_time_{i}')
-
-        # Writing energy equation from power
-        # energy_cnsmp = power_segment_1 * segment_time_1 + ... + power_segment_n * segment_time_n
-        energy_eq = 'energy_cnsmp = '
-        kwargs_power = {}
-        kwargs_time = {}
-        for i in range(1, mission.n_segments + 1):
-            if i == mission.n_segments:
-                energy_eq += f'power_segment_{i} * segment_time_{i}'
-            else:
-                energy_eq += f'power_segment_{i} * segment_time_{i} + '
-            kwargs_power[f'power_segment_{i}'] = {'units': 'W'}
-            kwargs_time[f'segment_time_{i}'] = {'units': 's'}
-
         # ------------------------------------------------------------#
         # --- Calculate energy consumptions for the whole mission --- #
         # ------------------------------------------------------------#
 
-        # -- One mission energy --- #
-        energy_comp_one = om.ExecComp(energy_eq,
-                                      energy_cnsmp={'units': 'W * s'},
-                                      **kwargs_power, **kwargs_time)
+        # Trapezoid weights of the node-wise powers (a single unit weight for segments with a constant power)
+        weights_list = []
+        for segment in mission.segments[:mission.n_segments]:
+            if time_resolved and segment_has_power_nodes(segment, fidelity):
+                weights_list.append(trapezoid_weights(compute_node_conditions(mission, segment)['tau']))
+            else:
+                weights_list.append(trapezoid_weights([0.0]))
 
-        self.add_subsystem('energy_one_mission', energy_comp_one, promotes_outputs=[('energy_cnsmp', 'Energy|one_mission')])
+        # Fixed durations (NaN where the duration is distance / speed)
+        fixed_durations = [segment.duration if segment.kind in fixed_time_kinds else np.nan for segment in mission.segments[:mission.n_segments]]
+        has_reserve = len(mission.segments) > mission.n_segments
 
+        promotes_inputs = []
         for i in range(1, mission.n_segments + 1):
-            self.connect(f'Power|segment_{i}', f'energy_one_mission.power_segment_{i}')
-            if mission.segments[i - 1].kind in ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise']:
-                self.connect(f'mission_var.segment_time_{i}', f'energy_one_mission.segment_time_{i}')
+            if time_resolved and segment_has_power_nodes(mission.segments[i - 1], fidelity):
+                promotes_inputs.append((f'power_segment_{i}', f'Power|LiftRotor|segment_{i}|nodes'))
             else:
-                self.connect(f'Mission|segment_{i}|duration', f'energy_one_mission.segment_time_{i}')
+                promotes_inputs.append((f'power_segment_{i}', f'Power|segment_{i}'))
+            if np.isnan(fixed_durations[i - 1]):
+                promotes_inputs += [(f'distance_segment_{i}', f'Mission|segment_{i}|distance'), (f'speed_segment_{i}', f'Mission|segment_{i}|speed')]
+        if has_reserve:
+            promotes_inputs.append(('power_reserve', 'Power|reserve_segment'))
 
-        # -- Reserve mission energy --- #
-        if len(mission.segments) == mission.n_segments:  # meaning that there is no reserve mission
-            indep.add_output('Energy|reserve_mission', val=0.0, units='W * s')
+        # Mission variables
+        indep = self.add_subsystem('mission_var', om.IndepVarComp())
+        indep.add_output('n_repetition', val=mission.n_repetition)
 
-        else:
-            indep.add_output('reserve_segment_time', val=mission.reserve_mission_duration, units='s')
-            energy_comp_reserve = om.ExecComp('reserve_energy = reserve_power * reserve_segment_time',
-                                              reserve_energy={'units': 'W*s'}, reserve_power={'units': 'W'}, reserve_segment_time={'units': 's'})
+        self.add_subsystem('mission_energy',
+                           MissionEnergy(weights_list=weights_list,
+                                         fixed_durations=fixed_durations,
+                                         reserve_duration=mission.reserve_mission_duration if has_reserve else None),
+                           promotes_inputs=promotes_inputs,
+                           promotes_outputs=[('energy_one_mission', 'Energy|one_mission'),
+                                             ('energy_reserve', 'Energy|reserve_mission'),
+                                             ('energy_total', 'Energy|entire_mission'),
+                                             ('total_time', 'Mission|total_time'),
+                                             ('segment_durations', 'Mission|segment_durations')])
+        self.connect('mission_var.n_repetition', 'mission_energy.n_repetition')
 
-            self.add_subsystem('reserve_energy', energy_comp_reserve,
-                               promotes_inputs=[('reserve_power', 'Power|reserve_segment'), ('reserve_segment_time', 'mission_var.reserve_segment_time')],
-                               promotes_outputs=[('reserve_energy', 'Energy|reserve_mission')])
 
-        # -- Entire mission energy --- #
-        energy_comp_total = om.ExecComp('total_energy = n * energy_one_mission + reserve_energy',
-                                        total_energy={'units': 'W * s'}, energy_one_mission={'units': 'W * s'}, reserve_energy={'units': 'W * s'})
+class MissionEnergy(om.ExplicitComponent):
+    """
+    Computes the energy consumption of the entire mission in one (vectorized) component:
+            energy_one_mission 	= sum_i duration_i * dot(w_i, power_i)
+            energy_total 		= n_repetition * energy_one_mission + reserve_power * reserve_duration
+    where duration_i = distance_i / speed_i unless segment i has a fixed duration, and w_i are its trapezoid weights
+    (a single unit weight when the segment has a constant power). The inputs are stacked into vectors, so the
+    cost does not grow with the number of segments beyond that of copying them, and all partials are analytic and sparse.
+    Parameters:
+            weights_list 		: list of trapezoid weights, one array per segment (see trapezoid_weights)
+            fixed_durations 	: duration of each segment [s], NaN for segments whose duration is distance / speed
+            reserve_duration 	: duration of the reserve mission [s] (None if there is no reserve)
+    Inputs:
+            n_repetition 			: number of repetitions of the mission (reserve excluded)
+            power_segment_{i} 		: power at the nodes of segment i [W]
+            distance_segment_{i} 	: distance of segment i [m] 	(only for segments without fixed duration)
+            speed_segment_{i} 		: speed of segment i [m/s] 		(only for segments without fixed duration)
+            power_reserve 			: power of the reserve mission [W] (only if there is a reserve)
+    Outputs:
+            energy_one_mission 	: energy consumption of one mission [W*s]
+            energy_reserve 		: energy consumption of the reserve mission [W*s]
+            energy_total 		: energy consumption of the entire mission [W*s]
+            total_time 			: duration of one mission [s]
+            segment_durations 	: duration of each segment [s]
+    """
 
-        self.add_subsystem('total_energy', energy_comp_total,
-                           promotes_inputs=[('n', 'mission_var.n_repetition'), ('energy_one_mission', 'Energy|one_mission'), ('reserve_energy', 'Energy|reserve_mission')],
-                           promotes_outputs=[('total_energy', 'Energy|entire_mission')])
+    def initialize(self):
+        self.options.declare('weights_list', types=list, desc='Trapezoid weights of each segment')
+        self.options.declare('fixed_durations', types=list, desc='Fixed durations of the segments (NaN if distance / speed)')
+        self.options.declare('reserve_duration', default=None, types=(float, type(None)), desc='Duration of the reserve mission')
+
+    def setup(self):
+        weights_list = self.options['weights_list']
+        fixed_durations = np.asarray(self.options['fixed_durations'], dtype=float)
+        n_segments = len(weights_list)
+
+        # Stacked layout: node powers back to back, segment k occupying offsets[k]:offsets[k+1]
+        sizes = np.array([len(w) for w in weights_list], dtype=int)
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)])
+        self.segment_of_node = np.repeat(np.arange(n_segments), sizes)
+        self.weights = np.concatenate(weights_list)
+        self.variable = np.isnan(fixed_durations)  # duration = distance / speed
+        self.fixed_durations = np.where(self.variable, 0.0, fixed_durations)
+
+        self.power_names = [f'power_segment_{i}' for i in range(1, n_segments + 1)]
+        self.distance_names = [f'distance_segment_{i}' for i in np.flatnonzero(self.variable) + 1]
+        self.speed_names = [f'speed_segment_{i}' for i in np.flatnonzero(self.variable) + 1]
+
+        self.add_output('energy_one_mission', units='W*s', desc='Energy consumption of one mission')
+        self.add_output('energy_reserve', units='W*s', desc='Energy consumption of the reserve mission')
+        self.add_output('energy_total', units='W*s', desc='Energy consumption of the entire mission')
+        self.add_output('total_time', units='s', desc='Duration of one mission')
+        self.add_output('segment_durations', shape=(n_segments,), units='s', desc='Duration of each segment')
+
+        self.add_input('n_repetition', val=1.0, desc='Number of repetitions of the mission')
+        self.declare_partials('energy_total', 'n_repetition')
+
+        for k, name in enumerate(self.power_names):
+            n = sizes[k]
+            self.add_input(name, shape=(n,), units='W', desc=f'Power at the nodes of segment {k + 1}')
+            self.declare_partials(['energy_one_mission', 'energy_total'], name, rows=np.zeros(n, dtype=int), cols=np.arange(n))
+
+        for k, (distance_name, speed_name) in zip(np.flatnonzero(self.variable), zip(self.distance_names, self.speed_names)):
+            self.add_input(distance_name, units='m', desc=f'Distance of segment {k + 1}')
+            self.add_input(speed_name, units='m/s', desc=f'Speed of segment {k + 1}')
+            self.declare_partials(['energy_one_mission', 'energy_total', 'total_time'], [distance_name, speed_name])
+            self.declare_partials('segment_durations', [distance_name, speed_name], rows=[k], cols=[0])
+
+        if self.options['reserve_duration'] is not None:
+            self.add_input('power_reserve', units='W', desc='Power of the reserve mission')
+            self.declare_partials(['energy_reserve', 'energy_total'], 'power_reserve', val=self.options['reserve_duration'])
+
+    def _gather(self, inputs):
+        """
+        Stacked node powers, distances and speeds of the variable-duration segments, and all segment durations
+        """
+        power = np.concatenate([inputs[name] for name in self.power_names])
+        distance = np.array([inputs[name][0] for name in self.distance_names])
+        speed = np.array([inputs[name][0] for name in self.speed_names])
+        durations = self.fixed_durations.astype(np.result_type(self.fixed_durations, power, distance, speed))  # complex under complex step
+        durations[self.variable] = distance / speed
+        return power, distance, speed, durations
+
+    def compute(self, inputs, outputs):
+        power, _, _, durations = self._gather(inputs)
+        reserve_duration = self.options['reserve_duration']
+
+        segment_energy = durations * np.add.reduceat(self.weights * power, self.offsets[:-1])
+        outputs['segment_durations'] = durations
+        outputs['total_time'] = np.sum(durations)
+        outputs['energy_one_mission'] = np.sum(segment_energy)
+        outputs['energy_reserve'] = 0.0 if reserve_duration is None else inputs['power_reserve'] * reserve_duration
+        outputs['energy_total'] = inputs['n_repetition'] * outputs['energy_one_mission'] + outputs['energy_reserve']
+
+    def compute_partials(self, inputs, partials):
+        power, distance, speed, durations = self._gather(inputs)
+        n_repetition = inputs['n_repetition'][0]
+
+        # d(energy_one_mission)/d(power) = duration * w (node-wise)
+        dE_dP = durations[self.segment_of_node] * self.weights
+        partials['energy_total', 'n_repetition'] = np.dot(dE_dP, power)
+        for k, name in enumerate(self.power_names):
+            s = slice(self.offsets[k], self.offsets[k + 1])
+            partials['energy_one_mission', name] = dE_dP[s]
+            partials['energy_total', name] = n_repetition * dE_dP[s]
+
+        # d(energy_one_mission)/d(duration) = dot(w, power), with duration = distance / speed
+        dE_dT = np.add.reduceat(self.weights * power, self.offsets[:-1])[self.variable]
+        dT_dd = 1.0 / speed
+        dT_ds = -distance / speed**2
+        for j, (distance_name, speed_name) in enumerate(zip(self.distance_names, self.speed_names)):
+            partials['energy_one_mission', distance_name] = dE_dT[j] * dT_dd[j]
+            partials['energy_one_mission', speed_name] = dE_dT[j] * dT_ds[j]
+            partials['energy_total', distance_name] = n_repetition * dE_dT[j] * dT_dd[j]
+            partials['energy_total', speed_name] = n_repetition * dE_dT[j] * dT_ds[j]
+            partials['total_time', distance_name] = dT_dd[j]
+            partials['total_time', speed_name] = dT_ds[j]
+            partials['segment_durations', distance_name] = dT_dd[j]
+            partials['segment_durations', speed_name] = dT_ds[j]
@@ -0,0 +1,194 @@
+import numpy as np
+
+
+class BatteryEquivalentCircuit(object):
+    """
+    First-order Thevenin equivalent circuit of a battery pack (open-circuit voltage as a function of SOC,
+    series resistance R0 and one RC pair), built from identical cells arranged in n_series x n_parallel.
+    The number of cells in parallel follows from the pack capacity, so the capacity may be an array
+    (one pack per simulated mission).
+    Parameters:
+            capacity 			: pack energy capacity [Wh] (scalar or array)
+            n_series 			: number of cells in series
+            cell_capacity 		: cell charge capacity [Ah]
+            cell_voltage 		: cell nominal voltage [V]
+            cell_R0 			: cell series resistance [ohm]
+            cell_R1 			: cell RC-pair resistance [ohm]
+            cell_C1 			: cell RC-pair capacitance [F]
+            cell_ocv_table 		: (SOC points, cell open-circuit voltage points [V]), SOC increasing
+            efficiency 			: battery efficiency (power drawn = power required / efficiency)
+            soc_floor 			: minimum allowable state of charge
+            cell_voltage_cutoff	: minimum cell terminal voltage [V] (None to disable)
+    """
+
+    default_cell_ocv_table = (np.array([0.0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]),
+                              np.array([3.00, 3.30, 3.45, 3.55, 3.62, 3.67, 3.72, 3.79, 3.87, 3.95, 4.06, 4.20]))
+
+    def __init__(self, capacity, n_series=200, cell_capacity=3.0, cell_voltage=3.6, cell_R0=0.025, cell_R1=0.01, cell_C1=2000.0,
+                 cell_ocv_table=None, efficiency=1.0, soc_floor=0.0, cell_voltage_cutoff=None):
+        super(BatteryEquivalentCircuit, self).__init__()
+        self.capacity = np.asarray(capacity, dtype=float)
+        self.n_series = n_series
+        self.cell_capacity = cell_capacity
+        self.cell_voltage = cell_voltage
+        self.cell_R0 = cell_R0
+        self.cell_R1 = cell_R1
+        self.cell_C1 = cell_C1
+        self.cell_ocv_table = self.default_cell_ocv_table if cell_ocv_table is None else cell_ocv_table
+        self.efficiency = efficiency
+        self.soc_floor = soc_floor
+        self.cell_voltage_cutoff = cell_voltage_cutoff
+
+        # Pack-level parameters
+        self.n_parallel = self.capacity / (n_series * cell_voltage * cell_capacity)
+        self.charge = self.n_parallel * cell_capacity * 3600.0  # [A*s]
+        self.R0 = cell_R0 * n_series / self.n_parallel
+        self.R1 = cell_R1 * n_series / self.n_parallel
+        self.tau = cell_R1 * cell_C1  # RC time constant [s], independent of the arrangement
+
+    @classmethod
+    def from_vehicle(cls, vehicle: object, battery_weight: float, **kwargs):
+        """
+        Pack sized from the battery weight [kg] and the battery component of a vehicle
+        (its density, efficiency and maximum discharge)
+        """
+        battery = vehicle.battery
+        kwargs.setdefault('efficiency', battery.efficiency)
+        kwargs.setdefault('soc_floor', 1.0 - battery.max_discharge)
+        return cls(capacity=np.asarray(battery_weight, dtype=float) * battery.density, **kwargs)
+
+    def open_circuit_voltage(self, soc):
+        """
+        Pack open-circuit voltage [V] at a given state of charge
+        """
+        soc_points, ocv_points = self.cell_ocv_table
+        return self.n_series * np.interp(soc, soc_points, ocv_points)
+
+
+def mission_power_profile(prob: object, mission: object):
+    """
+    Extracts the power required at every trajectory node of one mission (reserve excluded) from an evaluated
+    EnergyAnalysis/PowerAnalysis problem. Node-wise powers of time-resolved segments are used as they are,
+    while the other segments contribute their constant power at each of their nodes.
+    Inputs:
+            prob 	: evaluated OpenMDAO problem
+            mission : Mission object
+    Outputs:
+            t 		: time at each node [s]
+            power 	: power required at each node [W]
+    """
+    t_list, power_list = [], []
+    for i in range(1, mission.n_segments + 1):
+        t = mission.trajectory.channel('t', i - 1)
+        try:
+            power = prob.get_val(f'Power|LiftRotor|segment_{i}|nodes', 'W')
+        except KeyError:
+            power = np.full(len(t), prob.get_val(f'Power|segment_{i}', 'W')[0])
+        t_list.append(t)
+        power_list.append(power)
+
+    return np.concatenate(t_list), np.concatenate(power_list)
+
+
+def _solve_current(power, ocv, v_rc, R0):
+    """
+    Current drawn to deliver the given power through the equivalent circuit, i.e., the smaller root of
+    R0 * I**2 - (ocv - v_rc) * I + power = 0. Returns NaN where the power cannot be delivered.
+    """
+    v = ocv - v_rc
+    disc = v**2 - 4.0 * R0 * power
+    with np.errstate(invalid='ignore'):
+        current = 2.0 * power / (v + np.sqrt(disc))  # = (v - sqrt(disc)) / (2 * R0), without cancellation
+    return np.where(disc >= 0.0, current, np.nan)
+
+
+def simulate_battery(t, power, battery: BatteryEquivalentCircuit, soc_initial=1.0):
+    """
+    Computes the battery state along N missions by time marching over their K trajectory nodes.
+    At each node the current is solved from the power drawn through the equivalent circuit; state of charge
+    (coulomb counting) and RC-pair voltage are advanced with a predictor-corrector (trapezoidal) step,
+    the RC pair being integrated exactly over each time step. All missions are advanced together (vectorized),
+    and a mission terminates at the first node where its SOC reaches the floor, its terminal voltage falls
+    below the cutoff, or the power cannot be delivered; its states are NaN afterwards. The termination time
+    of an SOC floor crossing is interpolated between the two nodes that bracket it.
+    The marching stops as soon as every mission has terminated.
+    Inputs:
+            t 			: time at each node [s], shape (K,) or (N, K)
+            power 		: power required at each node [W], shape (K,) or (N, K)
+            battery 	: BatteryEquivalentCircuit (its capacity may be a scalar or shape (N,))
+            soc_initial : initial state of charge (scalar or shape (N,))
+    Outputs:
+            dict with the following arrays:
+                    soc 				: state of charge at each node, shape (N, K)
+                    current 			: pack current at each node [A], shape (N, K)
+                    voltage 			: pack terminal voltage at each node [V], shape (N, K)
+                    energy 				: energy drawn from the battery up to the termination (or last) node [W*s], shape (N,)
+                    terminated 			: whether the mission terminated early, shape (N,)
+                    termination_time 	: time of termination [s] (NaN if not terminated), shape (N,)
+    """
+    t = np.atleast_2d(np.asarray(t, dtype=float))
+    power = np.atleast_2d(np.asarray(power, dtype=float)) / battery.efficiency
+    N = max(t.shape[0], power.shape[0], battery.capacity.size, np.size(soc_initial))
+    K = power.shape[1]
+    t = np.broadcast_to(t, (N, K))
+    power = np.broadcast_to(power, (N, K))
+
+    Q = np.broadcast_to(battery.charge, (N,))
+    R0 = np.broadcast_to(battery.R0, (N,))
+    R1 = np.broadcast_to(battery.R1, (N,))
+    tau = battery.tau
+    v_cutoff = -np.inf if battery.cell_voltage_cutoff is None else battery.cell_voltage_cutoff * battery.n_series
+
+    soc_hist = np.full((N, K), np.nan)
+    current_hist = np.full((N, K), np.nan)
+    voltage_hist = np.full((N, K), np.nan)
+    termination_time = np.full(N, np.nan)
+    energy = np.zeros(N)
+
+    soc = np.broadcast_to(np.asarray(soc_initial, dtype=float), (N,)).copy()
+    soc_prev = soc
+    v_rc = np.zeros(N)
+    active = np.ones(N, dtype=bool)
+
+    for k in range(K):
+        ocv = battery.open_circuit_voltage(soc)
+        current = _solve_current(power[:, k], ocv, v_rc, R0)
+        voltage = ocv - v_rc - current * R0
+
+        # Termination checks at this node (NaN current means the power cannot be delivered)
+        failed = active & ~((soc > battery.soc_floor) & (voltage >= v_cutoff))
+        soc_hist[active, k] = soc[active]
+        current_hist[active, k] = current[active]
+        voltage_hist[active, k] = voltage[active]
+        termination_time[failed] = t[failed, k]
+
+        # SOC floor crossed between two nodes: locate the crossing by linear interpolation
+        crossed = failed & (soc <= battery.soc_floor) & (soc_prev > battery.soc_floor)
+        if k > 0 and crossed.any():
+            frac = (soc_prev[crossed] - battery.soc_floor) / (soc_prev[crossed] - soc[crossed])
+            termination_time[crossed] = t[crossed, k - 1] + frac * (t[crossed, k] - t[crossed, k - 1])
+        active &= ~failed
+
+        if k == K - 1 or not active.any():
+            break
+
+        # Predictor-corrector step to the next node
+        dt = t[:, k + 1] - t[:, k]
+        decay = np.exp(-dt / tau) if tau > 0.0 else np.zeros(N)
+        soc_pred = soc - current * dt / Q
+        v_rc_pred = v_rc * decay + R1 * current * (1.0 - decay)
+        current_next = _solve_current(power[:, k + 1], battery.open_circuit_voltage(soc_pred), v_rc_pred, R0)
+        current_next = np.where(np.isnan(current_next), current, current_next)  # infeasibility is flagged at the next node
+        current_avg = 0.5 * (current + current_next)
+
+        soc_prev = soc
+        soc = np.where(active, soc - current_avg * dt / Q, soc)
+        v_rc = np.where(active, v_rc * decay + R1 * current_avg * (1.0 - decay), v_rc)
+        energy += np.where(active, 0.5 * (power[:, k] + power[:, k + 1]) * dt, 0.0)
+
+    return {'soc': soc_hist,
+            'current': current_hist,
+            'voltage': voltage_hist,
+            'energy': energy,
+            'terminated': ~np.isnan(termination_time),
+            'termination_time': termination_time}
@@ -0,0 +1,17 @@
+import numpy as np
+
+
+def trapezoid_weights(tau: np.ndarray):
+    """
+    Trapezoidal quadrature weights on normalized node times (from 0 to 1),
+    such that the integral over the segment is duration * dot(weights, f_nodes).
+    Zero-duration segments (e.g., no-credit climb/descent) get a single unit weight.
+    """
+    tau = np.atleast_1d(np.asarray(tau, dtype=float))
+    if len(tau) < 2 or tau[-1] <= tau[0]:
+        return np.array([1.0])
+    dtau = np.diff(tau)
+    w = np.zeros_like(tau)
+    w[:-1] += 0.5 * dtau
+    w[1:] += 0.5 * dtau
+    return w
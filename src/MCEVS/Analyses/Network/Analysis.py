@@ -0,0 +1,214 @@
+from MCEVS.Analyses.Weight.Analysis import GTOWEstimation
+from MCEVS.Analyses.Geometry.Rotor import MeanChord
+from MCEVS.Missions.Standard import RouteMissionProfile
+from MCEVS.Utils.Checks import check_fidelity_dict
+from MCEVS.Utils.IndepsVarComp import promote_indeps_var_comp
+
+from concurrent.futures import ProcessPoolExecutor
+import openmdao.api as om
+import pandas as pd
+import numpy as np
+import time
+import os
+
+# Route table columns: name -> default value (None means required); lengths in [m], speeds in [m/s], times in [s]
+route_columns = {'range': None,
+                 'cruise_speed': None,
+                 'takeoff_altitude': 5000 * 0.3048,
+                 'cruise_altitude': 6500 * 0.3048,
+                 'hover_time_departure': 0.0,
+                 'hover_time_arrival': 0.0}
+
+
+def read_route_table(path: str):
+    """
+    Reads a route network table (CSV or Parquet) into a DataFrame with one route per row.
+    Required columns are "range" [m] and "cruise_speed" [m/s]; "takeoff_altitude" [m], "cruise_altitude" [m],
+    "hover_time_departure" [s] and "hover_time_arrival" [s] are optional (StandardMissionProfile values by default).
+    Any other column (e.g., an origin/destination name) is kept as is.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        routes = pd.read_csv(path)
+    elif extension in ['.parquet', '.pq']:
+        routes = pd.read_parquet(path)  # requires pyarrow or fastparquet
+    else:
+        raise ValueError('Route table should be either a ".csv" or a ".parquet" file!')
+
+    return complete_route_table(routes)
+
+
+def complete_route_table(routes: pd.DataFrame):
+    """
+    Checks the required columns of a route table and fills in the optional ones with their default values
+    """
+    routes = routes.copy()
+    for column, default in route_columns.items():
+        if column not in routes.columns:
+            if default is None:
+                raise ValueError(f'Route table is missing the required column "{column}"!')
+            routes[column] = default
+        routes[column] = routes[column].astype(float)
+    return routes.reset_index(drop=True)
+
+
+def route_mission_parameters(routes: pd.DataFrame):
+    """
+    Compact (picklable) mission descriptions: one dict of RouteMissionProfile() arguments per route
+    """
+    return [{'mission_range': row['range'],
+             'cruise_speed': row['cruise_speed'],
+             'takeoff_altitude': row['takeoff_altitude'],
+             'cruise_altitude': row['cruise_altitude'],
+             'hover_time_departure': row['hover_time_departure'],
+             'hover_time_arrival': row['hover_time_arrival']} for row in routes[list(route_columns)].to_dict('records')]
+
+
+class RouteNetworkAnalysis(object):
+    """
+    Evaluates the energy consumption and the gross takeoff weight of one (sized) vehicle on every route of a network.
+    Routes that differ only in range and cruise speed share one OpenMDAO problem, so that each route costs only
+    a few model evaluations instead of a problem setup; groups of routes may also be spread over worker processes.
+    """
+    def __init__(self, vehicle: object, routes: pd.DataFrame, fidelity: dict):
+        super(RouteNetworkAnalysis, self).__init__()
+        self.vehicle = vehicle
+        self.routes = complete_route_table(routes)
+        self.fidelity = fidelity
+        self.throughput = None  # routes per second of the last evaluation
+
+        # Check solver fidelity
+        if vehicle.configuration == 'Multirotor':
+            modules_to_check = ['aerodynamics', 'power_model', 'weight_model']
+        elif vehicle.configuration == 'LiftPlusCruise':
+            modules_to_check = ['aerodynamics', 'power_model', 'stability', 'weight_model']
+        check_fidelity_dict(self.fidelity, self.vehicle.configuration, modules_to_check)
+
+        if not self.vehicle.weight.is_sized:
+            raise ValueError('vehicle.weight.is_sized == False; vehicle should be sized first!')
+
+    def evaluate(self, n_workers=1, tol=1e-6, maxiter=50):
+        """
+        Returns the route table with the following columns appended:
+                Energy|entire_mission 	: energy consumption at the gross takeoff weight [W*s]
+                Weight|takeoff 			: gross takeoff weight [kg]
+                Weight|battery 			: battery weight needed for the route [kg]
+                feasible 				: whether the gross takeoff weight does not exceed the MTOW
+                converged 				: whether the gross takeoff weight iteration converged
+        """
+        t0 = time.perf_counter()
+
+        # Group the routes sharing the same mission structure (everything but range and cruise speed)
+        parameters = route_mission_parameters(self.routes)
+        groups = {}
+        for i, params in enumerate(parameters):
+            key = (params['takeoff_altitude'], params['cruise_altitude'], params['hover_time_departure'], params['hover_time_arrival'])
+            groups.setdefault(key, []).append(i)
+        tasks = [[parameters[i] for i in indices] for indices in groups.values()]
+
+        if n_workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                outputs = list(executor.map(evaluate_route_group, [self.vehicle] * len(tasks), tasks, [self.fidelity] * len(tasks),
+                                            [tol] * len(tasks), [maxiter] * len(tasks)))
+        else:
+            outputs = [evaluate_route_group(self.vehicle, task, self.fidelity, tol, maxiter) for task in tasks]
+
+        results = [None] * len(parameters)
+        for indices, output in zip(groups.values(), outputs):
+            for i, result in zip(indices, output):
+                results[i] = result
+
+        self.throughput = len(parameters) / (time.perf_counter() - t0)
+
+        return pd.concat([self.routes, pd.DataFrame(results)], axis=1)
+
+
+def build_route_problem(vehicle: object, mission: object, fidelity: dict):
+    """
+    OpenMDAO problem computing the energy consumption and the weight breakdown of a sized vehicle at a given takeoff weight
+    """
+    prob = om.Problem(reports=False)
+    indeps = prob.model.add_subsystem('indeps', om.IndepVarComp(), promotes=['*'])
+    indeps.add_output('Weight|takeoff', vehicle.weight.max_takeoff, units='kg')
+    indeps.add_output('Weight|propulsion', vehicle.weight.propulsion, units='kg')
+    indeps.add_output('Weight|structure', vehicle.weight.structure, units='kg')
+    indeps.add_output('Weight|equipment', vehicle.weight.equipment, units='kg')
+
+    # Promoting independent variable components
+    indeps = promote_indeps_var_comp(indeps, vehicle, mission, fidelity)
+
+    # Convert mean_c_to_R into mean_chord
+    prob.model.add_subsystem('chord_calc_lift_rotor',
+                             MeanChord(),
+                             promotes_inputs=[('mean_c_to_R', 'LiftRotor|mean_c_to_R'), ('R', 'LiftRotor|radius')],
+                             promotes_outputs=[('mean_chord', 'LiftRotor|chord')])
+    if vehicle.configuration == 'LiftPlusCruise':
+        prob.model.add_subsystem('chord_calc_propeller',
+                                 MeanChord(),
+                                 promotes_inputs=[('mean_c_to_R', 'Propeller|mean_c_to_R'), ('R', 'Propeller|radius')],
+                                 promotes_outputs=[('mean_chord', 'Propeller|chord')])
+
+    prob.model.add_subsystem('gtow_model',
+                             GTOWEstimation(mission=mission, vehicle=vehicle, fidelity=fidelity, sizing_mode=False, rhs_checking=False),
+                             promotes_inputs=['*'],
+                             promotes_outputs=['*'])
+    prob.setup(check=False)
+
+    return prob
+
+
+def evaluate_route_group(vehicle: object, parameters_list: list, fidelity: dict, tol=1e-6, maxiter=50, W_upper=10000.0):
+    """
+    Evaluates routes sharing the same mission structure (see RouteNetworkAnalysis) with a single OpenMDAO problem.
+    For each route, the gross takeoff weight W solves W = W_fixed + W_battery(W), where W_fixed is the sum of the
+    payload, propulsion, structure and equipment weights. This is done with secant iterations starting from the MTOW,
+    falling back to a fixed-point step whenever the secant step leaves [W_fixed, W_upper]. Routes for which
+    no gross takeoff weight below W_upper closes the weight balance are reported as not converged (NaN).
+    """
+    mission = RouteMissionProfile(**parameters_list[0], lazy=True)  # the trajectory is materialized only if the power model needs it
+    cruise_id = [segment.kind for segment in mission.segments].index('CruiseConstantSpeed') + 1
+    prob = build_route_problem(vehicle, mission, fidelity)
+    W_mtow = float(np.ravel(vehicle.weight.max_takeoff)[0])
+
+    prob.run_model()
+    W_fixed = sum(prob.get_val(f'Weight|{name}', 'kg')[0] for name in ['payload', 'propulsion', 'structure', 'equipment'])
+
+    def residual(W):
+        prob.set_val('Weight|takeoff', W, 'kg')
+        prob.run_model()
+        return W - W_fixed - prob.get_val('Weight|battery', 'kg')[0]
+
+    results = []
+    for parameters in parameters_list:
+        prob.set_val(f'Mission|segment_{cruise_id}|distance', parameters['mission_range'], 'm')
+        prob.set_val(f'Mission|segment_{cruise_id}|speed', parameters['cruise_speed'], 'm/s')
+
+        W0 = W_mtow
+        r0 = residual(W0)
+        W1 = W0 - r0  # fixed-point step
+        r1 = residual(W1)
+
+        converged = False
+        for _ in range(maxiter):
+            if abs(W1 - W0) < tol * abs(W1):
+                converged = True
+                break
+            W2 = W1 - r1 * (W1 - W0) / (r1 - r0) if r1 != r0 else np.nan
+            if not W_fixed <= W2 <= W_upper:
+                W2 = W1 - r1
+            if not W2 <= W_upper:
+                break
+            W0, r0 = W1, r1
+            W1, r1 = W2, residual(W2)
+
+        if converged:
+            results.append({'Energy|entire_mission': prob.get_val('Energy|entire_mission', 'W*s')[0],
+                            'Weight|takeoff': W1,
+                            'Weight|battery': prob.get_val('Weight|battery', 'kg')[0],
+                            'feasible': bool(W1 <= W_mtow),
+                            'converged': True})
+        else:
+            results.append({'Energy|entire_mission': np.nan, 'Weight|takeoff': np.nan, 'Weight|battery': np.nan,
+                            'feasible': False, 'converged': False})
+
+    return results
@@ -5,9 +5,14 @@ from MCEVS.Analyses.Power.Climb.Constant_Vy_Constant_Vx import PowerClimbConstan
 from MCEVS.Analyses.Power.Descent.Constant_Vy_Constant_Vx import PowerDescentConstantVyConstantVxWithWing, PowerDescentConstantVyConstantVxEdgewise
 from MCEVS.Analyses.Power.Cruise.Constant_Speed import PowerCruiseConstantSpeedEdgewise, PowerCruiseConstantSpeedWithWing
 from MCEVS.Analyses.Power.Others.Constant_Power import PowerConstantFractionOfMaxPower
+from MCEVS.Analyses.Power.Others.Duplicate_Segment import PowerDuplicateSegment
+from MCEVS.Analyses.Aerodynamics.Parasite import ParasiteDragViaComponentBuildUpMultiSegment
+from MCEVS.Analyses.Power.Rotor import DiskLoadingComp, RotorState
+from MCEVS.Analyses.Power.TimeResolved import PowerVerticalFlightNodes, compute_node_conditions
 from MCEVS.Analyses.Geometry.Rotor import MeanChord
 from MCEVS.Utils.Performance import record_performance_by_segments
 from MCEVS.Utils.Checks import check_fidelity_dict
+from MCEVS.Utils.Functions import Maximum
 from MCEVS.Utils.IndepsVarComp import promote_indeps_var_comp
 
 import openmdao.api as om
@@ -89,6 +94,17 @@ class PowerAnalysis(object):
 class PowerRequirement(om.Group):
     """
     docstring for PowerRequirement
+    If fidelity['power_model']['time_resolved'] is True, vertical flight segments are additionally
+    evaluated at every discretization node, and their node-wise power is promoted as
+    'Power|LiftRotor|segment_{id}|nodes' for trapezoidal energy integration.
+    Accelerating vertical segments are only supported in this mode.
+    If fidelity['power_model']['deduplicate_segments'] is True, segments with the same power-relevant
+    inputs as a previous segment (see find_duplicate_segments) are not evaluated again; the power and thrust
+    of the first one are fanned out to them. Their speeds are then taken from the first segment, so this
+    should not be used when the speeds of duplicates are independent design variables.
+    With the component build-up parasite drag, the drag without rotor hubs of all cruise, climb, and descent segments
+    is computed at once (ParasiteDragViaComponentBuildUpMultiSegment), at the speeds 'Mission|segment_{id}|speed',
+    and fed to each segment, which adds its own rotor hub drag.
     """
 
     def initialize(self):
@@ -104,6 +120,7 @@ class PowerRequirement(om.Group):
         vehicle = self.options['vehicle']
         fidelity = self.options['fidelity']
         rhs_checking = self.options['rhs_checking']
+        time_resolved = fidelity['power_model'].get('time_resolved', False)
 
         # Unpacking cruise AoA
         for segment in mission.segments:
@@ -130,6 +147,8 @@ class PowerRequirement(om.Group):
             n_blade_propeller = vehicle.propeller.n_blade 			 # number of blades per propeller
             Cd0_propeller = vehicle.propeller.Cd0 				     # propeller's drag coefficient
             hover_FM_propeller = vehicle.propeller.figure_of_merit	 # hover figure of merit
+            # The lift rotor radius enters forward flight only through the component build-up parasite drag, shared by the segments
+            forward_flight_inputs = ['Wing|*', 'Propeller|*']
         else:
             raise RuntimeError('eVTOL configuration is not available.')
 
@@ -139,6 +158,37 @@ class PowerRequirement(om.Group):
 
         ids_for_max_p = []
 
+        # Rotor states shared by all segments, computed once per design
+        operating_points = find_rotor_operating_points(mission, vehicle, fidelity)
+        if operating_points:
+            self.add_subsystem('rotor_state',
+                               RotorState(operating_points=operating_points),
+                               promotes_inputs=['*'],
+                               promotes_outputs=['*'])
+
+        # Segments whose power is evaluated once and fanned out
+        duplicate_of = find_duplicate_segments(mission) if fidelity['power_model'].get('deduplicate_segments', False) else {}
+
+        # Build-up drag without rotor hubs of the forward flight segments, computed once for all of them
+        shared_non_hub = fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp'
+        build_up_phases = {'CruiseConstantSpeed': 'Cruise', 'ClimbConstantVyConstantVx': 'Climb', 'DescentConstantVyConstantVx': 'Descent'}
+        build_up_segments = [segment for segment in mission.segments if shared_non_hub and segment.kind in build_up_phases and segment.id not in duplicate_of]
+        if build_up_segments:
+            promotes_inputs = [(f'Aero|speed_{i}', f'Mission|segment_{segment.id}|speed') for i, segment in enumerate(build_up_segments)]
+            promotes_inputs += [('Rotor|radius', 'LiftRotor|radius')] if vehicle.configuration == 'Multirotor' else [('Rotor|radius', 'LiftRotor|radius'), 'Wing|area', 'Wing|aspect_ratio']
+            self.add_subsystem('parasite_drag_non_hub',
+                               ParasiteDragViaComponentBuildUpMultiSegment(vehicle=vehicle,
+                                                                           rho_air=[segment.constants['rho'] for segment in build_up_segments],
+                                                                           mu_air=[segment.constants['mu'] for segment in build_up_segments],
+                                                                           segment_names=[build_up_phases[segment.kind].lower() for segment in build_up_segments],
+                                                                           surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate')),
+                               promotes_inputs=promotes_inputs)
+            for i, segment in enumerate(build_up_segments):
+                self.connect('parasite_drag_non_hub.Aero|f_non_hub', f'segment_{segment.id}_power.parasite_drag.Aero|f_non_hub', src_indices=[i])
+                self.connect('parasite_drag_non_hub.Aero|parasite_drag_non_hub', f'segment_{segment.id}_power.parasite_drag.Aero|parasite_drag_non_hub', src_indices=[i])
+                if vehicle.configuration == 'LiftPlusCruise':
+                    self.connect('parasite_drag_non_hub.Aero|Cd0', f'segment_{segment.id}_power.Aero|{build_up_phases[segment.kind]}|Cd0', src_indices=[i])
+
         for segment in mission.segments:
 
             # Unpacking constants for each segment that needs them
@@ -152,7 +202,7 @@ class PowerRequirement(om.Group):
             # LiftPlusCruise's propellers do not work during hover, hoverclimb, or hoverdescent
             # and its lift rotor does not work during cruise, climb, descent, or constant power segment
             if vehicle.configuration == 'LiftPlusCruise':
-                if segment.kind in ['HoverStay', 'HoverClimbConstantSpeed', 'HoverDescentConstantSpeed', 'ConstantPower', 'NoCreditClimb', 'NoCreditDescent']:
+                if segment.kind in ['HoverStay', 'HoverClimbConstantSpeed', 'HoverClimbConstantAcceleration', 'HoverDescentConstantSpeed', 'HoverDescentConstantDeceleration', 'ConstantPower', 'NoCreditClimb', 'NoCreditDescent']:
                     zero_p = om.IndepVarComp(f'Power|Propeller|segment_{segment.id}', val=0.0, units='W')
                     self.add_subsystem(f'zero_p_{segment.id}', zero_p, promotes=['*'])
                     zero_t = om.IndepVarComp(f'Propeller|thrust_each|segment_{segment.id}', val=0.0, units='N')
@@ -163,6 +213,43 @@ class PowerRequirement(om.Group):
                     zero_t = om.IndepVarComp(f'LiftRotor|thrust_each|segment_{segment.id}', val=0.0, units='N')
                     self.add_subsystem(f'zero_t_{segment.id}', zero_t, promotes=['*'])
 
+            # Node-wise power of vertical flight segments (time-resolved mode)
+            if time_resolved and segment_has_power_nodes(segment, fidelity):
+                node_conditions = compute_node_conditions(mission, segment)
+                promotes_inputs = ['Weight|takeoff', 'LiftRotor|radius']
+                promotes_outputs = [('Power|nodes', f'Power|LiftRotor|segment_{segment.id}|nodes'),
+                                    ('LiftRotor|thrust_nodes', f'LiftRotor|thrust_each|segment_{segment.id}|nodes')]
+                speed_ref = None
+                if segment.kind in ['HoverClimbConstantSpeed', 'HoverDescentConstantSpeed']:
+                    speed_ref = segment.speed
+                    promotes_inputs.append(('Mission|segment_speed', f'Mission|segment_{segment.id}|speed'))
+                if segment.kind in ['HoverClimbConstantAcceleration', 'HoverDescentConstantDeceleration']:
+                    # No segment-level model exists; the peak along the segment is used for sizing
+                    promotes_outputs += [('Power|peak', f'Power|LiftRotor|segment_{segment.id}'),
+                                         ('LiftRotor|thrust_peak', f'LiftRotor|thrust_each|segment_{segment.id}')]
+                self.add_subsystem(f'segment_{segment.id}_power_nodes',
+                                   PowerVerticalFlightNodes(N_rotor=N_lift_rotor, hover_FM=hover_FM_lift_rotor, speed_ref=speed_ref,
+                                                            vy=node_conditions['vy'], ay=node_conditions['ay'], rho_air=node_conditions['rho'], g=node_conditions['g']),
+                                   promotes_inputs=promotes_inputs,
+                                   promotes_outputs=promotes_outputs)
+
+            # Segments with the same flight conditions as a previous one reuse its power
+            if segment.id in duplicate_of:
+                reference_id = duplicate_of[segment.id]
+                if vehicle.configuration == 'LiftPlusCruise' and segment.kind in ['CruiseConstantSpeed', 'ClimbConstantVyConstantVx', 'DescentConstantVyConstantVx']:
+                    component = 'Propeller'
+                else:
+                    component = 'LiftRotor'
+                if segment.kind == 'CruiseConstantSpeed':
+                    cruise_segment_id = segment.id
+                self.add_subsystem(f'segment_{segment.id}_power',
+                                   PowerDuplicateSegment(),
+                                   promotes_inputs=[('reference_power', f'Power|{component}|segment_{reference_id}'),
+                                                    ('reference_thrust', f'{component}|thrust_each|segment_{reference_id}')],
+                                   promotes_outputs=[('duplicate_power', f'Power|{component}|segment_{segment.id}'),
+                                                     ('duplicate_thrust', f'{component}|thrust_each|segment_{segment.id}')])
+                continue
+
             if segment.kind == 'HoverStay':
                 self.add_subsystem(f'segment_{segment.id}_power',
                                    PowerHoverStay(N_rotor=N_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, g=g),
@@ -206,30 +293,30 @@ class PowerRequirement(om.Group):
             if segment.kind == 'ClimbConstantVyConstantVx':
                 if vehicle.configuration == 'Multirotor':
                     self.add_subsystem(f'segment_{segment.id}_power',
-                                       PowerClimbConstantVyConstantVxEdgewise(vehicle=vehicle, N_rotor=N_lift_rotor, n_blade=n_blade_lift_rotor, Cd0=Cd0_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, mu_air=mu_air, g=g, climb_airspeed=segment.speed, gamma=segment.gamma, fidelity=fidelity),
+                                       PowerClimbConstantVyConstantVxEdgewise(vehicle=vehicle, N_rotor=N_lift_rotor, n_blade=n_blade_lift_rotor, Cd0=Cd0_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, mu_air=mu_air, g=g, climb_airspeed=segment.speed, gamma=segment.gamma, fidelity=fidelity, shared_non_hub=shared_non_hub),
                                        promotes_inputs=['Weight|takeoff', 'LiftRotor|*'],
                                        promotes_outputs=[('Power|ClimbConstantVyConstantVx', f'Power|LiftRotor|segment_{segment.id}'),
                                                          ('LiftRotor|Climb|thrust', f'LiftRotor|thrust_each|segment_{segment.id}')])
 
                 elif vehicle.configuration == 'LiftPlusCruise':
                     self.add_subsystem(f'segment_{segment.id}_power',
-                                       PowerClimbConstantVyConstantVxWithWing(vehicle=vehicle, N_propeller=N_propeller, n_blade=n_blade_propeller, Cd0=Cd0_propeller, hover_FM=hover_FM_propeller, rho_air=rho_air, mu_air=mu_air, g=g, AoA=AoA, gamma=segment.gamma, climb_airspeed=segment.speed, fidelity=fidelity),
-                                       promotes_inputs=['Weight|takeoff', 'Wing|*', 'Propeller|*'],
+                                       PowerClimbConstantVyConstantVxWithWing(vehicle=vehicle, N_propeller=N_propeller, n_blade=n_blade_propeller, Cd0=Cd0_propeller, hover_FM=hover_FM_propeller, rho_air=rho_air, mu_air=mu_air, g=g, AoA=AoA, gamma=segment.gamma, climb_airspeed=segment.speed, fidelity=fidelity, shared_non_hub=shared_non_hub),
+                                       promotes_inputs=['Weight|takeoff', *forward_flight_inputs],
                                        promotes_outputs=[('Power|ClimbConstantVyConstantVx', f'Power|Propeller|segment_{segment.id}'),
                                                          ('Propeller|Climb|thrust', f'Propeller|thrust_each|segment_{segment.id}')])
 
             if segment.kind == 'DescentConstantVyConstantVx':
                 if vehicle.configuration == 'Multirotor':
                     self.add_subsystem(f'segment_{segment.id}_power',
-                                       PowerDescentConstantVyConstantVxEdgewise(vehicle=vehicle, N_rotor=N_lift_rotor, n_blade=n_blade_lift_rotor, Cd0=Cd0_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, mu_air=mu_air, g=g, descent_airspeed=segment.speed, gamma=segment.gamma, fidelity=fidelity),
+                                       PowerDescentConstantVyConstantVxEdgewise(vehicle=vehicle, N_rotor=N_lift_rotor, n_blade=n_blade_lift_rotor, Cd0=Cd0_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, mu_air=mu_air, g=g, descent_airspeed=segment.speed, gamma=segment.gamma, fidelity=fidelity, shared_non_hub=shared_non_hub),
                                        promotes_inputs=['Weight|takeoff', 'LiftRotor|*'],
                                        promotes_outputs=[('Power|DescentConstantVyConstantVx', f'Power|LiftRotor|segment_{segment.id}'),
                                                          ('LiftRotor|Descent|thrust', f'LiftRotor|thrust_each|segment_{segment.id}')])
 
                 elif vehicle.configuration == 'LiftPlusCruise':
                     self.add_subsystem(f'segment_{segment.id}_power',
-                                       PowerDescentConstantVyConstantVxWithWing(vehicle=vehicle, N_propeller=N_propeller, n_blade=n_blade_propeller, Cd0=Cd0_propeller, hover_FM=hover_FM_propeller, rho_air=rho_air, mu_air=mu_air, g=g, AoA=AoA, gamma=segment.gamma, descent_airspeed=segment.speed, fidelity=fidelity),
-                                       promotes_inputs=['Weight|takeoff', 'Wing|*', 'Propeller|*'],
+                                       PowerDescentConstantVyConstantVxWithWing(vehicle=vehicle, N_propeller=N_propeller, n_blade=n_blade_propeller, Cd0=Cd0_propeller, hover_FM=hover_FM_propeller, rho_air=rho_air, mu_air=mu_air, g=g, AoA=AoA, gamma=segment.gamma, descent_airspeed=segment.speed, fidelity=fidelity, shared_non_hub=shared_non_hub),
+                                       promotes_inputs=['Weight|takeoff', *forward_flight_inputs],
                                        promotes_outputs=[('Power|DescentConstantVyConstantVx', f'Power|Propeller|segment_{segment.id}'),
                                                          ('Propeller|Descent|thrust', f'Propeller|thrust_each|segment_{segment.id}')])
 
@@ -241,13 +328,17 @@ class PowerRequirement(om.Group):
             if segment.kind == 'CruiseConstantSpeed':
                 cruise_segment_id = segment.id
                 if vehicle.configuration == 'Multirotor':
+                    output_list = [('Power|CruiseConstantSpeed', f'Power|LiftRotor|segment_{segment.id}'), 'LiftRotor|Cruise|T_to_P', ('Power|profile_power', f'Power|segment_{segment.id}|profile_power'),
+                                   ('Power|induced_power', f'Power|segment_{segment.id}|induced_power'), ('Power|propulsive_power', f'Power|segment_{segment.id}|propulsive_power'),
+                                   ('LiftRotor|Cruise|thrust', f'LiftRotor|thrust_each|segment_{segment.id}'), 'LiftRotor|Cruise|mu', 'LiftRotor|Cruise|thrust_coefficient',
+                                   'Aero|Cruise|total_drag']
+                    # The weight-based regression gives no flat plate area for a multirotor
+                    if fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
+                        output_list.append('Aero|Cruise|f_total')
                     self.add_subsystem(f'segment_{segment.id}_power',
-                                       PowerCruiseConstantSpeedEdgewise(vehicle=vehicle, N_rotor=N_lift_rotor, n_blade=n_blade_lift_rotor, Cd0=Cd0_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, mu_air=mu_air, g=g, fidelity=fidelity),
+                                       PowerCruiseConstantSpeedEdgewise(vehicle=vehicle, N_rotor=N_lift_rotor, n_blade=n_blade_lift_rotor, Cd0=Cd0_lift_rotor, hover_FM=hover_FM_lift_rotor, rho_air=rho_air, mu_air=mu_air, g=g, fidelity=fidelity, shared_non_hub=shared_non_hub),
                                        promotes_inputs=['Weight|*', ('Mission|cruise_speed', f'Mission|segment_{segment.id}|speed'), 'LiftRotor|*'],
-                                       promotes_outputs=[('Power|CruiseConstantSpeed', f'Power|LiftRotor|segment_{segment.id}'), 'LiftRotor|Cruise|T_to_P', ('Power|profile_power', f'Power|segment_{segment.id}|profile_power'),
-                                                         ('Power|induced_power', f'Power|segment_{segment.id}|induced_power'), ('Power|propulsive_power', f'Power|segment_{segment.id}|propulsive_power'),
-                                                         ('LiftRotor|Cruise|thrust', f'LiftRotor|thrust_each|segment_{segment.id}'), 'LiftRotor|Cruise|mu', 'LiftRotor|Cruise|thrust_coefficient',
-                                                         'Aero|Cruise|total_drag', 'Aero|Cruise|f_total'])
+                                       promotes_outputs=output_list)
 
                 elif vehicle.configuration == 'LiftPlusCruise':
                     output_list = [('Power|CruiseConstantSpeed', f'Power|Propeller|segment_{segment.id}'), 'Propeller|Cruise|T_to_P', ('Power|profile_power', f'Power|segment_{segment.id}|profile_power'),
@@ -258,8 +349,8 @@ class PowerRequirement(om.Group):
                     if fidelity['aerodynamics']['induced'] == 'VortexLatticeMethod':
                         output_list.append('Aero|Cruise|CL_residual')
                     self.add_subsystem(f'segment_{segment.id}_power',
-                                       PowerCruiseConstantSpeedWithWing(vehicle=vehicle, N_propeller=N_propeller, n_blade=n_blade_propeller, rho_air=rho_air, mu_air=mu_air, v_sound=v_sound, Cd0=Cd0_propeller, hover_FM=hover_FM_propeller, g=g, AoA=AoA, fidelity=fidelity),
-                                       promotes_inputs=['Weight|*', ('Mission|cruise_speed', f'Mission|segment_{segment.id}|speed'), 'Wing|*', 'Propeller|*'],
+                                       PowerCruiseConstantSpeedWithWing(vehicle=vehicle, N_propeller=N_propeller, n_blade=n_blade_propeller, rho_air=rho_air, mu_air=mu_air, v_sound=v_sound, Cd0=Cd0_propeller, hover_FM=hover_FM_propeller, g=g, AoA=AoA, fidelity=fidelity, shared_non_hub=shared_non_hub),
+                                       promotes_inputs=['Weight|*', ('Mission|cruise_speed', f'Mission|segment_{segment.id}|speed'), *forward_flight_inputs],
                                        promotes_outputs=output_list)
             if segment.kind == 'ConstantPower':
 
@@ -279,109 +370,53 @@ class PowerRequirement(om.Group):
                                    promotes_inputs=[('max_power', f'Power|{component}|segment_{cruise_segment_id}')],
                                    promotes_outputs=[('fractional_power', 'Power|reserve_segment')])
 
-        # ------------------------------------------ #
-        # ---- Writing maximum thrust equations ---- #
-        # ------------------------------------------ #
-        # T_max = max(T_segment_1, ..., T_segment_n)
-
-        if vehicle.configuration == 'Multirotor':
-            max_thrust_eq = 'T_max = '
-            kwargs_T = {'T_max': {'units': 'N'}}
-            for ctr, i in enumerate(ids_for_max_p):
-                if ctr == len(ids_for_max_p) - 1:
-                    max_thrust_eq += f'T_segment_{i}' + (len(ids_for_max_p) - 1) * ')'
-                else:
-                    max_thrust_eq += f'maximum(T_segment_{i}, '
-                kwargs_T[f'T_segment_{i}'] = {'units': 'N'}
-
-        elif vehicle.configuration == 'LiftPlusCruise':
-            max_thrust_liftrotor_eq = 'T1_max = '
-            max_thrust_propeller_eq = 'T2_max = '
-            kwargs_T1 = {'T1_max': {'units': 'N'}}
-            kwargs_T2 = {'T2_max': {'units': 'N'}}
-            for ctr, i in enumerate(ids_for_max_p):
-                if ctr == len(ids_for_max_p) - 1:
-                    max_thrust_liftrotor_eq += f'T1_segment_{i}' + (len(ids_for_max_p) - 1) * ')'
-                    max_thrust_propeller_eq += f'T2_segment_{i}' + (len(ids_for_max_p) - 1) * ')'
-                else:
-                    max_thrust_liftrotor_eq += f'maximum(T1_segment_{i}, '
-                    max_thrust_propeller_eq += f'maximum(T2_segment_{i}, '
-                kwargs_T1[f'T1_segment_{i}'] = {'units': 'N'}
-                kwargs_T2[f'T2_segment_{i}'] = {'units': 'N'}
-
-        # ----------------------------------------- #
-        # ---- Writing maximum power equations ---- #
-        # ----------------------------------------- #
-        # p_max = max(p_segment_1, ..., p_segment_n)
-
-        if vehicle.configuration == 'Multirotor':
-            max_power_eq = 'p_max = '
-            kwargs_p = {'p_max': {'units': 'W'}}
-            for ctr, i in enumerate(ids_for_max_p):
-                if ctr == len(ids_for_max_p) - 1:
-                    max_power_eq += f'p_segment_{i}' + (len(ids_for_max_p) - 1) * ')'
-                else:
-                    max_power_eq += f'maximum(p_segment_{i}, '
-                kwargs_p[f'p_segment_{i}'] = {'units': 'W'}
-
-        elif vehicle.configuration == 'LiftPlusCruise':
-            max_power_liftrotor_eq = 'p1_max = '
-            max_power_propeller_eq = 'p2_max = '
-            kwargs_p1 = {'p1_max': {'units': 'W'}}
-            kwargs_p2 = {'p2_max': {'units': 'W'}}
-            for ctr, i in enumerate(ids_for_max_p):
-                if ctr == len(ids_for_max_p) - 1:
-                    max_power_liftrotor_eq += f'p1_segment_{i}' + (len(ids_for_max_p) - 1) * ')'
-                    max_power_propeller_eq += f'p2_segment_{i}' + (len(ids_for_max_p) - 1) * ')'
-                else:
-                    max_power_liftrotor_eq += f'maximum(p1_segment_{i}, '
-                    max_power_propeller_eq += f'maximum(p2_segment_{i}, '
-                kwargs_p1[f'p1_segment_{i}'] = {'units': 'W'}
-                kwargs_p2[f'p2_segment_{i}'] = {'units': 'W'}
-
         # ----------------------------------------------------------------------------- #
         # --- Calculate maximum thrust requirement per component for sizing purpose --- #
         # ----------------------------------------------------------------------------- #
+        # T_max = max(T_segment_1, ..., T_segment_n)
+
         if vehicle.configuration == 'Multirotor':
-            max_thrust_comp = om.ExecComp(max_thrust_eq, **kwargs_T)
-            self.add_subsystem('max_thrust_req', max_thrust_comp,
-                               promotes_outputs=[('T_max', 'LiftRotor|thrust_each|maximum')])
+            self.add_subsystem('max_thrust_req',
+                               Maximum(names=[f'T_segment_{i}' for i in ids_for_max_p], units='N'),
+                               promotes_outputs=[('fmax', 'LiftRotor|thrust_each|maximum')])
 
-            for ctr, i in enumerate(ids_for_max_p):
+            for i in ids_for_max_p:
                 self.connect(f'LiftRotor|thrust_each|segment_{i}', f'max_thrust_req.T_segment_{i}')
 
         elif vehicle.configuration == 'LiftPlusCruise':
-            max_thrust_liftrotor_comp = om.ExecComp(max_thrust_liftrotor_eq, **kwargs_T1)
-            max_thrust_propeller_comp = om.ExecComp(max_thrust_propeller_eq, **kwargs_T2)
-            self.add_subsystem('max_thrust_liftrotor_req', max_thrust_liftrotor_comp,
-                               promotes_outputs=[('T1_max', 'LiftRotor|thrust_each|maximum')])
-            self.add_subsystem('max_thrust_propeller_req', max_thrust_propeller_comp,
-                               promotes_outputs=[('T2_max', 'Propeller|thrust_each|maximum')])
-
-            for ctr, i in enumerate(ids_for_max_p):
+            self.add_subsystem('max_thrust_liftrotor_req',
+                               Maximum(names=[f'T1_segment_{i}' for i in ids_for_max_p], units='N'),
+                               promotes_outputs=[('fmax', 'LiftRotor|thrust_each|maximum')])
+            self.add_subsystem('max_thrust_propeller_req',
+                               Maximum(names=[f'T2_segment_{i}' for i in ids_for_max_p], units='N'),
+                               promotes_outputs=[('fmax', 'Propeller|thrust_each|maximum')])
+
+            for i in ids_for_max_p:
                 self.connect(f'LiftRotor|thrust_each|segment_{i}', f'max_thrust_liftrotor_req.T1_segment_{i}')
                 self.connect(f'Propeller|thrust_each|segment_{i}', f'max_thrust_propeller_req.T2_segment_{i}')
 
         # ---------------------------------------------------------------------------- #
         # --- Calculate maximum power requirement per component for sizing purpose --- #
         # ---------------------------------------------------------------------------- #
+        # p_max = max(p_segment_1, ..., p_segment_n)
+
         if vehicle.configuration == 'Multirotor':
-            max_power_comp = om.ExecComp(max_power_eq, **kwargs_p)
-            self.add_subsystem('max_power_req', max_power_comp,
-                               promotes_outputs=[('p_max', 'Power|LiftRotor|maximum')])
+            self.add_subsystem('max_power_req',
+                               Maximum(names=[f'p_segment_{i}' for i in ids_for_max_p], units='W'),
+                               promotes_outputs=[('fmax', 'Power|LiftRotor|maximum')])
 
-            for ctr, i in enumerate(ids_for_max_p):
+            for i in ids_for_max_p:
                 self.connect(f'Power|LiftRotor|segment_{i}', f'max_power_req.p_segment_{i}')
 
         elif vehicle.configuration == 'LiftPlusCruise':
-            max_power_liftrotor_comp = om.ExecComp(max_power_liftrotor_eq, **kwargs_p1)
-            max_power_propeller_comp = om.ExecComp(max_power_propeller_eq, **kwargs_p2)
-            self.add_subsystem('max_power_liftrotor_req', max_power_liftrotor_comp,
-                               promotes_outputs=[('p1_max', 'Power|LiftRotor|maximum')])
-            self.add_subsystem('max_power_propeller_req', max_power_propeller_comp,
-                               promotes_outputs=[('p2_max', 'Power|Propeller|maximum')])
-
-            for ctr, i in enumerate(ids_for_max_p):
+            self.add_subsystem('max_power_liftrotor_req',
+                               Maximum(names=[f'p1_segment_{i}' for i in ids_for_max_p], units='W'),
+                               promotes_outputs=[('fmax', 'Power|LiftRotor|maximum')])
+            self.add_subsystem('max_power_propeller_req',
+                               Maximum(names=[f'p2_segment_{i}' for i in ids_for_max_p], units='W'),
+                               promotes_outputs=[('fmax', 'Power|Propeller|maximum')])
+
+            for i in ids_for_max_p:
                 self.connect(f'Power|LiftRotor|segment_{i}', f'max_power_liftrotor_req.p1_segment_{i}')
                 self.connect(f'Power|Propeller|segment_{i}', f'max_power_propeller_req.p2_segment_{i}')
 
@@ -413,33 +448,21 @@ class PowerRequirement(om.Group):
         # -----------------------------------------------------#
         if vehicle.configuration == 'Multirotor':
             for i in range(1, mission.n_segments + 1):
-                DL_comp = om.ExecComp('disk_loading = thrust / (pi * r**2)',
-                                      disk_loading={'units': 'N/m**2'},
-                                      thrust={'units': 'N'},
-                                      r={'units': 'm'})
-                self.add_subsystem(f'DL_segment_{i}', DL_comp,
-                                   promotes_inputs=[('r', 'LiftRotor|radius')],
+                self.add_subsystem(f'DL_segment_{i}', DiskLoadingComp(),
+                                   promotes_inputs=[('Rotor|radius', 'LiftRotor|radius')],
                                    promotes_outputs=[('disk_loading', f'DiskLoading|LiftRotor|segment_{i}')])
-                self.connect(f'LiftRotor|thrust_each|segment_{i}', f'DL_segment_{i}.thrust')
+                self.connect(f'LiftRotor|thrust_each|segment_{i}', f'DL_segment_{i}.Rotor|thrust')
 
         elif vehicle.configuration == 'LiftPlusCruise':
             for i in range(1, mission.n_segments + 1):
-                DL_1_comp = om.ExecComp('disk_loading = thrust / (pi * r**2)',
-                                        disk_loading={'units': 'N/m**2'},
-                                        thrust={'units': 'N'},
-                                        r={'units': 'm'})
-                DL_2_comp = om.ExecComp('disk_loading = thrust / (pi * r**2)',
-                                        disk_loading={'units': 'N/m**2'},
-                                        thrust={'units': 'N'},
-                                        r={'units': 'm'})
-                self.add_subsystem(f'DL_1_segment_{i}', DL_1_comp,
-                                   promotes_inputs=[('r', 'LiftRotor|radius')],
+                self.add_subsystem(f'DL_1_segment_{i}', DiskLoadingComp(),
+                                   promotes_inputs=[('Rotor|radius', 'LiftRotor|radius')],
                                    promotes_outputs=[('disk_loading', f'DiskLoading|LiftRotor|segment_{i}')])
-                self.connect(f'LiftRotor|thrust_each|segment_{i}', f'DL_1_segment_{i}.thrust')
-                self.add_subsystem(f'DL_2_segment_{i}', DL_2_comp,
-                                   promotes_inputs=[('r', 'Propeller|radius')],
+                self.connect(f'LiftRotor|thrust_each|segment_{i}', f'DL_1_segment_{i}.Rotor|thrust')
+                self.add_subsystem(f'DL_2_segment_{i}', DiskLoadingComp(),
+                                   promotes_inputs=[('Rotor|radius', 'Propeller|radius')],
                                    promotes_outputs=[('disk_loading', f'DiskLoading|Propeller|segment_{i}')])
-                self.connect(f'Propeller|thrust_each|segment_{i}', f'DL_2_segment_{i}.thrust')
+                self.connect(f'Propeller|thrust_each|segment_{i}', f'DL_2_segment_{i}.Rotor|thrust')
 
         # -----------------------------------------------------#
         # --- Add nonlinear solvers for implicit equations --- #
@@ -452,3 +475,64 @@ class PowerRequirement(om.Group):
         # self.nonlinear_solver.linesearch.options['maxiter'] = 10
         # self.nonlinear_solver.linesearch.options['iprint'] = 0
         # self.linear_solver = om.DirectSolver(assemble_jac=True, rhs_checking=rhs_checking)
+
+
+def segment_has_power_nodes(segment: object, fidelity: dict):
+    """
+    Whether a segment is evaluated node by node in the time-resolved mode.
+    Hover climb is only resolved when its segment-level model is also Momentum Theory,
+    so that energy and sizing powers stay consistent.
+    """
+    if segment.kind in ['HoverStay', 'HoverDescentConstantSpeed', 'HoverClimbConstantAcceleration', 'HoverDescentConstantDeceleration']:
+        return True
+    if segment.kind == 'HoverClimbConstantSpeed':
+        return fidelity['power_model']['hover_climb'] == 'MomentumTheory'
+    return False
+
+
+def find_duplicate_segments(mission: object):
+    """
+    Detects segments whose power-relevant inputs (kind, speed, flight path angle, fraction of max power,
+    and atmosphere/gravity at the segment altitude) are identical to those of a previous segment.
+    The rotors that are active are given by the segment kind for a given vehicle.
+    Returns a dict mapping each duplicate segment id to the id of the first identical segment.
+    """
+    dedupable_kinds = ['HoverStay', 'HoverClimbConstantSpeed', 'HoverDescentConstantSpeed', 'ClimbConstantVyConstantVx',
+                       'DescentConstantVyConstantVx', 'CruiseConstantSpeed', 'ConstantPower']
+
+    duplicate_of = {}
+    first_id = {}
+    for segment in mission.segments:
+        if segment.kind not in dedupable_kinds:
+            continue
+        key = (segment.kind,)
+        for attr in ['speed', 'gamma', 'percent_max_power']:
+            value = getattr(segment, attr, None)
+            key += (None if value is None else round(float(value), 9),)
+        if segment.constants is not None:
+            key += tuple(round(float(segment.constants[c]), 9) for c in ['rho', 'mu', 'v_sound', 'g'])
+        if key in first_id:
+            duplicate_of[segment.id] = first_id[key]
+        else:
+            first_id[key] = segment.id
+    return duplicate_of
+
+
+def find_rotor_operating_points(mission: object, vehicle: object, fidelity: dict):
+    """
+    Lists the RPM-driven operating points, as (component, phase) tuples, whose angular velocity
+    is consumed by the segment power groups of a mission (see RotorState).
+    Segments that compute omega from an advance ratio (descent) or that do not need it are skipped.
+    """
+    operating_points = []
+    for segment in mission.segments:
+        if segment.kind == 'HoverClimbConstantSpeed' and fidelity['power_model']['hover_climb'] == 'ModifiedMomentumTheory':
+            point = ('LiftRotor', 'HoverClimb')
+        elif segment.kind in ['ClimbConstantVyConstantVx', 'CruiseConstantSpeed']:
+            component = 'LiftRotor' if vehicle.configuration == 'Multirotor' else 'Propeller'
+            point = (component, 'Climb' if segment.kind == 'ClimbConstantVyConstantVx' else 'Cruise')
+        else:
+            continue
+        if point not in operating_points:
+            operating_points.append(point)
+    return operating_points
@@ -45,6 +45,7 @@ class PowerClimbConstantVyConstantVxEdgewise(om.Group):
         self.options.declare('climb_airspeed', desc='Climb air speed')
         self.options.declare('gamma', desc='Flight path angle during climb/descent')
         self.options.declare('fidelity', types=dict, desc='Fidelity of the analysis')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the build-up drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
         vehicle = self.options['vehicle']
@@ -58,6 +59,7 @@ class PowerClimbConstantVyConstantVxEdgewise(om.Group):
         gamma = self.options['gamma']
         climb_airspeed = self.options['climb_airspeed']
         fidelity = self.options['fidelity']
+        shared_non_hub = self.options['shared_non_hub']
 
         # Step 1: Calculate the drag for the multirotor in climb
         indep = self.add_subsystem('climb', om.IndepVarComp())
@@ -71,9 +73,9 @@ class PowerClimbConstantVyConstantVxEdgewise(om.Group):
                                promotes_outputs=[('Aero|total_drag', 'Aero|Climb|total_drag'), ('Aero|Cd0', 'Aero|Climb|Cd0')])
         elif fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
             self.add_subsystem('parasite_drag',
-                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='climb'),
-                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'climb.climb_airspeed'), ('Rotor|radius', 'LiftRotor|radius')],
-                               promotes_outputs=[('Aero|Cd0', 'Aero|Climb|Cd0'), ('Aero|parasite_drag', 'Aero|Climb|total_drag')])
+                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='climb', surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate'), shared_non_hub=shared_non_hub),
+                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'climb.climb_airspeed')] + ([] if shared_non_hub else [('Rotor|radius', 'LiftRotor|radius')]),
+                               promotes_outputs=[('Aero|parasite_drag', 'Aero|Climb|total_drag')] + ([] if shared_non_hub else [('Aero|Cd0', 'Aero|Climb|Cd0')]))
 
         # Step 2: Calculate thrust required for trim and the body tilt angle
         self.add_subsystem('trim',
@@ -93,11 +95,7 @@ class PowerClimbConstantVyConstantVxEdgewise(om.Group):
                            promotes_inputs=[('Thrust_all', 'Thrust_all_climb')],
                            promotes_outputs=[('Rotor|thrust', 'LiftRotor|Climb|thrust')])
 
-        # Step 5: Calculate rotor omega and advance ratio from RPM
-        self.add_subsystem('rpm2omega',
-                           om.ExecComp('omega = rpm * 2*pi/60.0', omega={'units': 'rad/s'}, rpm={'units': 'rpm'}),
-                           promotes_inputs=[('rpm', 'LiftRotor|Climb|RPM')],
-                           promotes_outputs=[('omega', 'LiftRotor|Climb|omega')])
+        # Step 5: Rotor omega (LiftRotor|Climb|omega) is computed once per design by RotorState in PowerRequirement
 
         self.add_subsystem('mu',
                            RotorAdvanceRatio(),
@@ -196,6 +194,7 @@ class PowerClimbConstantVyConstantVxWithWing(om.Group):
         self.options.declare('climb_airspeed', desc='Climb air speed')
         self.options.declare('gamma', desc='Flight path angle during climb/descent')
         self.options.declare('fidelity', types=dict, desc='Fidelity of the analysis')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the build-up drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
         vehicle = self.options['vehicle']
@@ -210,6 +209,7 @@ class PowerClimbConstantVyConstantVxWithWing(om.Group):
         gamma = self.options['gamma']
         climb_airspeed = self.options['climb_airspeed']
         fidelity = self.options['fidelity']
+        shared_non_hub = self.options['shared_non_hub']
 
         # Step 1: Trim analysis
         self.add_subsystem('trim_lift',
@@ -229,9 +229,9 @@ class PowerClimbConstantVyConstantVxWithWing(om.Group):
 
         elif fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
             self.add_subsystem('parasite_drag',
-                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='climb'),
-                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'climb.climb_airspeed'), 'Wing|area'],
-                               promotes_outputs=[('Aero|Cd0', 'Aero|Climb|Cd0'), ('Aero|parasite_drag', 'Aero|Climb|parasite_drag')])
+                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='climb', surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate'), shared_non_hub=shared_non_hub),
+                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'climb.climb_airspeed')] + ([] if shared_non_hub else [('Rotor|radius', 'LiftRotor|radius'), 'Wing|area', 'Wing|aspect_ratio']),
+                               promotes_outputs=[('Aero|parasite_drag', 'Aero|Climb|parasite_drag')] + ([] if shared_non_hub else [('Aero|Cd0', 'Aero|Climb|Cd0')]))
 
         elif fidelity['aerodynamics']['parasite'] == 'BacchiniExperimentalFixedValueForLPC':
             self.add_subsystem('parasite_drag',
@@ -254,11 +254,7 @@ class PowerClimbConstantVyConstantVxWithWing(om.Group):
                            promotes_inputs=['Thrust_all'],
                            promotes_outputs=[('Rotor|thrust', 'Propeller|Climb|thrust')])
 
-        # Step 4: Calculate propeller omega from RPM
-        self.add_subsystem('rpm2omega',
-                           om.ExecComp('omega = rpm * 2*pi/60.0', omega={'units': 'rad/s'}, rpm={'units': 'rpm'}),
-                           promotes_inputs=[('rpm', 'Propeller|Climb|RPM')],
-                           promotes_outputs=[('omega', 'Propeller|Climb|omega')])
+        # Step 4: Propeller omega (Propeller|Climb|omega) is computed once per design by RotorState in PowerRequirement
 
         # Step 5: Calculate rotor advance ratio mu and thrust coefficient Ct
         # Treating propeller as a rotor
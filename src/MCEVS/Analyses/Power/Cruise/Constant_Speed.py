@@ -48,6 +48,7 @@ class PowerCruiseConstantSpeedEdgewise(om.Group):
         self.options.declare('mu_air', types=float, desc='Air dynamic viscosity')
         self.options.declare('g', types=float, desc='Gravitational acceleration')
         self.options.declare('fidelity', types=dict, desc='Fidelity of the analysis')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the build-up drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
         vehicle = self.options['vehicle']
@@ -59,6 +60,7 @@ class PowerCruiseConstantSpeedEdgewise(om.Group):
         mu_air = self.options['mu_air']
         g = self.options['g']
         fidelity = self.options['fidelity']
+        shared_non_hub = self.options['shared_non_hub']
 
         # Step 1: Calculate the drag for the multirotor in cruise
         if fidelity['aerodynamics']['parasite'] == 'WeightBasedRegression':
@@ -68,8 +70,8 @@ class PowerCruiseConstantSpeedEdgewise(om.Group):
                                promotes_outputs=[('Aero|total_drag', 'Aero|Cruise|total_drag'), ('Aero|Cd0', 'Aero|Cruise|Cd0')])
         elif fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
             self.add_subsystem('parasite_drag',
-                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='cruise'),
-                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'Mission|cruise_speed')],
+                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='cruise', surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate'), shared_non_hub=shared_non_hub),
+                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'Mission|cruise_speed')] + ([] if shared_non_hub else [('Rotor|radius', 'LiftRotor|radius')]),
                                promotes_outputs=[('Aero|f_total', 'Aero|Cruise|f_total'), ('Aero|parasite_drag', 'Aero|Cruise|total_drag')])
 
         # Step 2: Calculate thrust required for trim and the body tilt angle
@@ -90,11 +92,7 @@ class PowerCruiseConstantSpeedEdgewise(om.Group):
                            promotes_inputs=[('Thrust_all', 'Thrust_all_cruise')],
                            promotes_outputs=[('Rotor|thrust', 'LiftRotor|Cruise|thrust')])
 
-        # Step 5: Calculate rotor omega from RPM
-        self.add_subsystem('rpm2omega',
-                           om.ExecComp('omega = rpm * 2*pi/60.0', omega={'units': 'rad/s'}, rpm={'units': 'rpm'}),
-                           promotes_inputs=[('rpm', 'LiftRotor|Cruise|RPM')],
-                           promotes_outputs=[('omega', 'LiftRotor|Cruise|omega')])
+        # Step 5: Rotor omega (LiftRotor|Cruise|omega) is computed once per design by RotorState in PowerRequirement
 
         self.add_subsystem('mu',
                            RotorAdvanceRatio(),
@@ -191,6 +189,7 @@ class PowerCruiseConstantSpeedWithWing(om.Group):
         self.options.declare('g', types=float, desc='Gravitational acceleration')
         self.options.declare('AoA', desc='Aircraft angle of attack')
         self.options.declare('fidelity', types=dict, desc='Fidelity of the analysis')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the build-up drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
         vehicle = self.options['vehicle']
@@ -204,6 +203,7 @@ class PowerCruiseConstantSpeedWithWing(om.Group):
         g = self.options['g']
         AoA = self.options['AoA']
         fidelity = self.options['fidelity']
+        shared_non_hub = self.options['shared_non_hub']
 
         # Step 1: Lift should be equal to total weight
         indep = self.add_subsystem('cruise', om.IndepVarComp())
@@ -223,9 +223,9 @@ class PowerCruiseConstantSpeedWithWing(om.Group):
 
         elif fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
             self.add_subsystem('parasite_drag',
-                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='cruise'),
-                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'Mission|cruise_speed'), 'Wing|area'],
-                               promotes_outputs=[('Aero|Cd0', 'Aero|Cruise|Cd0'), ('Aero|parasite_drag', 'Aero|Cruise|parasite_drag')])
+                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='cruise', surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate'), shared_non_hub=shared_non_hub),
+                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'Mission|cruise_speed')] + ([] if shared_non_hub else [('Rotor|radius', 'LiftRotor|radius'), 'Wing|area', 'Wing|aspect_ratio']),
+                               promotes_outputs=[('Aero|parasite_drag', 'Aero|Cruise|parasite_drag')] + ([] if shared_non_hub else [('Aero|Cd0', 'Aero|Cruise|Cd0')]))
 
         elif fidelity['aerodynamics']['parasite'] == 'BacchiniExperimentalFixedValueForLPC':
             self.add_subsystem('parasite_drag',
@@ -276,11 +276,7 @@ class PowerCruiseConstantSpeedWithWing(om.Group):
                            promotes_inputs=[('Thrust_all', 'Aero|Cruise|total_drag')],
                            promotes_outputs=[('Rotor|thrust', 'Propeller|Cruise|thrust')])
 
-        # Step 5: Calculate rotor omega from RPM and propeller advance ratio
-        self.add_subsystem('rpm2omega',
-                           om.ExecComp('omega = rpm * 2*pi/60.0', omega={'units': 'rad/s'}, rpm={'units': 'rpm'}),
-                           promotes_inputs=[('rpm', 'Propeller|Cruise|RPM')],
-                           promotes_outputs=[('omega', 'Propeller|Cruise|omega')])
+        # Step 5: Propeller omega (Propeller|Cruise|omega) is computed once per design by RotorState in PowerRequirement
 
         self.add_subsystem('J',
                            PropellerAdvanceRatio(),
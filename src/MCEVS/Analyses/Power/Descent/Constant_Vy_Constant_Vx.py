@@ -45,6 +45,7 @@ class PowerDescentConstantVyConstantVxEdgewise(om.Group):
         self.options.declare('descent_airspeed', desc='Descent air speed')
         self.options.declare('gamma', desc='Flight path angle during climb/descent')
         self.options.declare('fidelity', types=dict, desc='Fidelity of the analysis')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the build-up drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
         vehicle = self.options['vehicle']
@@ -58,6 +59,7 @@ class PowerDescentConstantVyConstantVxEdgewise(om.Group):
         gamma = self.options['gamma']
         descent_airspeed = self.options['descent_airspeed']
         fidelity = self.options['fidelity']
+        shared_non_hub = self.options['shared_non_hub']
 
         # Step 1: Calculate the drag for the multirotor in descent
         indep = self.add_subsystem('descent', om.IndepVarComp())
@@ -71,9 +73,9 @@ class PowerDescentConstantVyConstantVxEdgewise(om.Group):
                                promotes_outputs=[('Aero|total_drag', 'Aero|Descent|total_drag'), ('Aero|Cd0', 'Aero|Descent|Cd0')])
         elif fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
             self.add_subsystem('parasite_drag',
-                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='descent'),
-                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'descent.descent_airspeed'), ('Rotor|radius', 'LiftRotor|radius')],
-                               promotes_outputs=[('Aero|Cd0', 'Aero|Descent|Cd0'), ('Aero|parasite_drag', 'Aero|Descent|total_drag')])
+                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='descent', surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate'), shared_non_hub=shared_non_hub),
+                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'descent.descent_airspeed')] + ([] if shared_non_hub else [('Rotor|radius', 'LiftRotor|radius')]),
+                               promotes_outputs=[('Aero|parasite_drag', 'Aero|Descent|total_drag')] + ([] if shared_non_hub else [('Aero|Cd0', 'Aero|Descent|Cd0')]))
 
         # Step 2: Calculate thrust required for trim and the body tilt angle
         self.add_subsystem('trim',
@@ -191,6 +193,7 @@ class PowerDescentConstantVyConstantVxWithWing(om.Group):
         self.options.declare('descent_airspeed', desc='Descent air speed')
         self.options.declare('gamma', desc='Flight path angle during climb/descent')
         self.options.declare('fidelity', types=dict, desc='Fidelity of the analysis')
+        self.options.declare('shared_non_hub', types=bool, default=False, desc='Whether the build-up drag without rotor hubs is an input shared with other segments')
 
     def setup(self):
         vehicle = self.options['vehicle']
@@ -205,6 +208,7 @@ class PowerDescentConstantVyConstantVxWithWing(om.Group):
         gamma = self.options['gamma']
         descent_airspeed = self.options['descent_airspeed']
         fidelity = self.options['fidelity']
+        shared_non_hub = self.options['shared_non_hub']
 
         # Step 1: Trim analysis
         self.add_subsystem('trim_lift',
@@ -224,9 +228,9 @@ class PowerDescentConstantVyConstantVxWithWing(om.Group):
 
         elif fidelity['aerodynamics']['parasite'] == 'ComponentBuildUp':
             self.add_subsystem('parasite_drag',
-                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='descent'),
-                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'descent.descent_airspeed'), 'Wing|area'],
-                               promotes_outputs=[('Aero|Cd0', 'Aero|Descent|Cd0'), ('Aero|parasite_drag', 'Aero|Descent|parasite_drag')])
+                               ParasiteDragViaComponentBuildUpApproach(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_name='descent', surrogate=fidelity['aerodynamics'].get('wetted_area_surrogate'), shared_non_hub=shared_non_hub),
+                               promotes_inputs=['Weight|takeoff', ('Aero|speed', 'descent.descent_airspeed')] + ([] if shared_non_hub else [('Rotor|radius', 'LiftRotor|radius'), 'Wing|area', 'Wing|aspect_ratio']),
+                               promotes_outputs=[('Aero|parasite_drag', 'Aero|Descent|parasite_drag')] + ([] if shared_non_hub else [('Aero|Cd0', 'Aero|Descent|Cd0')]))
 
         elif fidelity['aerodynamics']['parasite'] == 'BacchiniExperimentalFixedValueForLPC':
             self.add_subsystem('parasite_drag',
@@ -29,7 +29,8 @@ class PowerHoverStay(om.ExplicitComponent):
         self.add_input('LiftRotor|radius', units='m', desc='Lift rotor radius')
         self.add_output('Power|HoverStay', units='W', desc='Power required for hover stay')
         self.add_output('LiftRotor|thrust', units='N', desc='Thrust of each rotor during hover')
-        self.declare_partials('*', '*')
+        self.declare_partials('Power|HoverStay', ['Weight|takeoff', 'LiftRotor|radius'])
+        self.declare_partials('LiftRotor|thrust', 'Weight|takeoff', val=self.options['g'] / self.options['N_rotor'])
 
     def compute(self, inputs, outputs):
         N_rotor = self.options['N_rotor']
@@ -58,4 +59,3 @@ class PowerHoverStay(om.ExplicitComponent):
 
         partials['Power|HoverStay', 'Weight|takeoff'] = 1.5 / hover_FM * np.sqrt((W_takeoff * g**3) / (2 * rho_air * S_disk * N_rotor))
         partials['Power|HoverStay', 'LiftRotor|radius'] = -0.5 / hover_FM * np.sqrt(((W_takeoff * g)**3) / (2 * rho_air * N_rotor * S_disk**3)) * dSdisk_dr
-        partials['LiftRotor|thrust', 'Weight|takeoff'] = g / N_rotor
@@ -1,5 +1,6 @@
 import numpy as np
 import openmdao.api as om
+import warnings
 from MCEVS.Analyses.Aerodynamics.Rotor import ThrustOfEachRotor, RotorAdvanceRatio, ThrustCoefficient, RotorInflowGroup, InducedVelocity
 from MCEVS.Analyses.Power.Rotor import RotorProfilePower, PowerForwardComp, InducedPowerFactor
 
@@ -7,6 +8,81 @@ from MCEVS.Analyses.Aerodynamics.BEMT.Solver import BEMTSolverOMGroup
 from MCEVS.Analyses.Aerodynamics.BEMT.SectionOM import SectionLocalPitch, SectionLocalRadiusChordWidth
 
 
+def hover_climb_power_MT(thrust, radius, v_climb, rho_air, hover_FM, N_rotor=1):
+    """
+    Vectorized Momentum Theory hover climb power, evaluated without building an OpenMDAO model
+    All array arguments are broadcast against each other
+    Inputs:
+            thrust 		: thrust of each rotor [N]
+            radius 		: rotor radius [m]
+            v_climb 	: hover climb speed [m/s]
+            rho_air 	: air density [kg/m**3]
+            hover_FM 	: hover figure of merit
+            N_rotor 	: number of rotors
+    Outputs:
+            power 		: power required for hover climb (sum of all rotors) [W]
+            FM 			: hover climb figure of merit
+    """
+    thrust, radius, v_climb, rho_air = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (thrust, radius, v_climb, rho_air)])
+
+    S_disk = np.pi * radius**2
+    power = N_rotor * thrust / hover_FM * ((v_climb / 2) + np.sqrt((v_climb / 2)**2 + thrust / (2 * rho_air * S_disk)))
+
+    return power, np.full_like(power, hover_FM)
+
+
+def hover_climb_power_MMT(thrust, radius, v_climb, rho_air, rpm, chord, n_blade, Cd0, hover_FM, N_rotor=1):
+    """
+    Vectorized Modified Momentum Theory hover climb power, evaluated without building an OpenMDAO model
+    All array arguments are broadcast against each other
+    Inputs:
+            thrust 		: thrust of each rotor [N]
+            radius 		: rotor radius [m]
+            v_climb 	: hover climb speed [m/s]
+            rho_air 	: air density [kg/m**3]
+            rpm 		: rotor revolution [rpm]
+            chord 		: rotor chord length [m]
+            n_blade 	: number of blades per rotor
+            Cd0 		: rotor parasite_drag coefficient
+            hover_FM 	: hover figure of merit
+            N_rotor 	: number of rotors
+    Outputs:
+            power 		: power required for hover climb (sum of all rotors) [W]
+            FM 			: hover climb figure of merit
+    Notes:
+            > Same chain as PowerHoverClimbConstantSpeedMMT, with the rotor tilt angle fixed to 90 deg.
+              The advance ratio is then zero, so the implicit inflow equation
+                    lambda = v_climb / (omega * r) + Ct / (2 * lambda)
+              is solved in closed form instead of with a Newton solver.
+    """
+    thrust, radius, v_climb, rho_air, rpm, chord = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (thrust, radius, v_climb, rho_air, rpm, chord)])
+
+    omega = rpm * 2 * np.pi / 60.0
+    S_disk = np.pi * radius**2
+    V_tip = omega * radius
+
+    # Thrust coefficient and inflow ratio
+    Ct = thrust / (rho_air * S_disk * V_tip**2)
+    lmbd_climb = v_climb / V_tip
+    lmbd = lmbd_climb / 2 + np.sqrt((lmbd_climb / 2)**2 + Ct / 2)
+    v_induced = V_tip * lmbd - v_climb
+
+    # Profile power of a rotor (advance ratio is zero)
+    sigma = n_blade * chord / (np.pi * radius)
+    P0_each = (sigma * Cd0 / 8) * (np.pi * rho_air * omega**3 * radius**5)
+
+    # Induced power factor, softmax-ed with its minimum value (see InducedPowerFactor)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        kappa_raw = 1 / hover_FM - P0_each * np.sqrt((2 * rho_air * S_disk) / thrust**3)
+        kappa = (1 / 30) * np.log(np.exp(30 * kappa_raw) + np.exp(30 * 1.15))
+
+    power = N_rotor * (P0_each + thrust * (kappa * v_induced + v_climb))
+    P_ideal = N_rotor * thrust * ((v_climb / 2) + np.sqrt((v_climb / 2)**2 + thrust / (2 * rho_air * S_disk)))
+
+    return power, P_ideal / power
+
+
 class PowerHoverClimbConstantSpeedMT(om.ExplicitComponent):
     """
     Computes the power required for hover climb with constant speed using Momentum Theory
@@ -38,7 +114,8 @@ class PowerHoverClimbConstantSpeedMT(om.ExplicitComponent):
         self.add_output('LiftRotor|thrust', units='N', desc='Thrust of each rotor during hover')
         self.add_output('LiftRotor|T_to_P', units='g/W', desc='Thrust to power ratio of a single rotor/propeller')
         self.add_output('FM', desc='Hover climb figure of merit')
-        self.declare_partials('*', '*')
+        self.declare_partials(['Power|HoverClimbConstantSpeed', 'LiftRotor|T_to_P'], ['Weight|takeoff', 'LiftRotor|radius', 'Mission|hover_climb_speed'])
+        self.declare_partials('LiftRotor|thrust', 'Weight|takeoff', val=self.options['g'] / self.options['N_rotor'])
 
     def compute(self, inputs, outputs):
         N_rotor = self.options['N_rotor']
@@ -81,15 +158,9 @@ class PowerHoverClimbConstantSpeedMT(om.ExplicitComponent):
         partials['Power|HoverClimbConstantSpeed', 'Weight|takeoff'] = dP_dW
         partials['Power|HoverClimbConstantSpeed', 'LiftRotor|radius'] = dP_dr
         partials['Power|HoverClimbConstantSpeed', 'Mission|hover_climb_speed'] = dP_dv
-        partials['LiftRotor|thrust', 'Weight|takeoff'] = g / N_rotor
-        partials['LiftRotor|thrust', 'LiftRotor|radius'] = 0.0
-        partials['LiftRotor|thrust', 'Mission|hover_climb_speed'] = 0.0
         partials['LiftRotor|T_to_P', 'Weight|takeoff'] = (1 * 1000.0) / P_total + dTP_P * dP_dW
         partials['LiftRotor|T_to_P', 'LiftRotor|radius'] = dTP_P * dP_dr
         partials['LiftRotor|T_to_P', 'Mission|hover_climb_speed'] = dTP_P * dP_dv
-        partials['FM', 'Weight|takeoff'] = 0.0
-        partials['FM', 'LiftRotor|radius'] = 0.0
-        partials['FM', 'Mission|hover_climb_speed'] = 0.0
 
 
 class PowerHoverClimbConstantSpeedMMT(om.Group):
@@ -104,6 +175,7 @@ class PowerHoverClimbConstantSpeedMMT(om.Group):
             Weight|takeoff  			: total take-off weight [kg]
             LiftRotor|radius			: lift rotor radius [m]
             Mission|hover_climb_speed 	: hover climb speed [m/s]
+            LiftRotor|HoverClimb|omega 	: lift rotor angular velocity [rad/s] (see RotorState)
     Outputs:
             Power|HoverClimbConstantSpeed	: power required for hover climb [W]
             LiftRotor|thrust 				: thrust produced by each rotor during hover climb [N]
@@ -140,11 +212,7 @@ class PowerHoverClimbConstantSpeedMMT(om.Group):
                            promotes_inputs=['Thrust_all'],
                            promotes_outputs=[('Rotor|thrust', 'LiftRotor|HoverClimb|thrust')])
 
-        # Step 3: Calculate rotor omega from RPM
-        self.add_subsystem('rpm2omega',
-                           om.ExecComp('omega = rpm * 2*pi/60.0', omega={'units': 'rad/s'}, rpm={'units': 'rpm'}),
-                           promotes_inputs=[('rpm', 'LiftRotor|HoverClimb|RPM')],
-                           promotes_outputs=[('omega', 'LiftRotor|HoverClimb|omega')])
+        # Step 3: Rotor omega (LiftRotor|HoverClimb|omega) is computed once per design by RotorState in PowerRequirement
 
         # Step 4: Rotor advance ratio
         self.add_subsystem('mu',
@@ -327,7 +395,7 @@ class FigureOfMerit(om.ExplicitComponent):
         self.add_input('LiftRotor|radius', units='m', desc='Lift rotor radius')
         self.add_input('Mission|hover_climb_speed', units='m/s', desc='Hover climb speed')
         self.add_output('FM', desc='Hover climb figure of merit')
-        self.declare_partials('*', '*')
+        self.declare_partials('FM', ['P_calculated', 'Weight|takeoff', 'LiftRotor|radius', 'Mission|hover_climb_speed'])
 
     def compute(self, inputs, outputs):
         N_rotor = self.options['N_rotor']
@@ -32,7 +32,8 @@ class PowerHoverDescentConstantSpeed(om.ExplicitComponent):
         self.add_output('Power|HoverDescentConstantSpeed', units='W', desc='Power required for hover descent')
         self.add_output('LiftRotor|thrust', units='N', desc='Thrust of each rotor during hover')
         self.add_output('LiftRotor|T_to_P', units='g/W', desc='Thrust to power ratio of a single rotor/propeller')
-        self.declare_partials('*', '*')
+        self.declare_partials(['Power|HoverDescentConstantSpeed', 'LiftRotor|T_to_P'], ['Weight|takeoff', 'LiftRotor|radius', 'Mission|hover_descent_speed'])
+        self.declare_partials('LiftRotor|thrust', 'Weight|takeoff', val=self.options['g'] / self.options['N_rotor'])
 
     def compute(self, inputs, outputs):
         N_rotor = self.options['N_rotor']
@@ -75,20 +76,16 @@ class PowerHoverDescentConstantSpeed(om.ExplicitComponent):
             P_total = (W_takeoff * g) / hover_FM * ((v_descent / 2) - np.sqrt((v_descent / 2)**2 - (W_takeoff * g) / (2 * rho_air * S_disk * N_rotor)))
             dP_dW = g * v_descent / (2 * hover_FM) - g / hover_FM * np.sqrt((v_descent / 2)**2 - (W_takeoff * g) / (2 * rho_air * S_disk * N_rotor)) + (W_takeoff * g**2) / (4 * hover_FM * rho_air * S_disk * N_rotor) * ((v_descent / 2)**2 - (W_takeoff * g) / (2 * rho_air * S_disk * N_rotor))**(-0.5)
             dP_dr = - (W_takeoff * g)**2 / (4 * hover_FM * rho_air * N_rotor * S_disk**2) * ((v_descent / 2)**2 - (W_takeoff * g) / (2 * rho_air * N_rotor * S_disk))**(-0.5) * dSdisk_dr
-            partials['Power|HoverDescentConstantSpeed', 'Weight|takeoff'] = dP_dW
-            partials['Power|HoverDescentConstantSpeed', 'LiftRotor|radius'] = dP_dr
-            partials['Power|HoverDescentConstantSpeed', 'Mission|hover_descent_speed'] = 0.0
+            dP_dv = (W_takeoff * g) / hover_FM * (0.5 - 0.5 * ((v_descent / 2)**2 - (W_takeoff * g) / (2 * rho_air * S_disk * N_rotor))**(-0.5) * (v_descent / 2))
         else:
             P_total = 1 / hover_FM * np.sqrt(((W_takeoff * g)**3) / (2 * rho_air * S_disk * N_rotor))
             dP_dW = 1.5 / hover_FM * np.sqrt((W_takeoff * g**3) / (2 * rho_air * S_disk * N_rotor))
             dP_dr = - 0.5 / hover_FM * np.sqrt(((W_takeoff * g)**3) / (2 * rho_air * N_rotor * S_disk**3)) * dSdisk_dr
-            partials['Power|HoverDescentConstantSpeed', 'Weight|takeoff'] = dP_dW
-            partials['Power|HoverDescentConstantSpeed', 'LiftRotor|radius'] = dP_dr
-            partials['Power|HoverDescentConstantSpeed', 'Mission|hover_descent_speed'] = 0.0
+            dP_dv = 0.0
 
-        partials['LiftRotor|thrust', 'Weight|takeoff'] = g / N_rotor
-        partials['LiftRotor|thrust', 'LiftRotor|radius'] = 0.0
-        partials['LiftRotor|thrust', 'Mission|hover_descent_speed'] = 0.0
+        partials['Power|HoverDescentConstantSpeed', 'Weight|takeoff'] = dP_dW
+        partials['Power|HoverDescentConstantSpeed', 'LiftRotor|radius'] = dP_dr
+        partials['Power|HoverDescentConstantSpeed', 'Mission|hover_descent_speed'] = dP_dv
         partials['LiftRotor|T_to_P', 'Weight|takeoff'] = (1 * 1000.0) / P_total + (W_takeoff * 1000.0) * (-1 / P_total**2) * dP_dW
         partials['LiftRotor|T_to_P', 'LiftRotor|radius'] = (W_takeoff * 1000.0) * (-1 / P_total**2) * dP_dr
-        partials['LiftRotor|T_to_P', 'Mission|hover_descent_speed'] = 0.0
+        partials['LiftRotor|T_to_P', 'Mission|hover_descent_speed'] = (W_takeoff * 1000.0) * (-1 / P_total**2) * dP_dv
@@ -20,7 +20,7 @@ class PowerConstantFractionOfMaxPower(om.ExplicitComponent):
         self.add_input('max_power', units='W', desc='Maximum deliverable power')
         self.add_output('fractional_power', units='W', desc='Fractional power')
         self.add_output('zero_thrust', units='N', desc='Zero thrust assumption')
-        self.declare_partials('*', '*')
+        self.declare_partials('fractional_power', 'max_power', val=self.options['percent_max_power'] / 100)
 
     def compute(self, inputs, outputs):
         percent_max_power = self.options['percent_max_power'] / 100
@@ -28,9 +28,3 @@ class PowerConstantFractionOfMaxPower(om.ExplicitComponent):
 
         outputs['fractional_power'] = percent_max_power * max_power
         outputs['zero_thrust'] = 0.0
-
-    def compute_partials(self, inputs, partials):
-        percent_max_power = self.options['percent_max_power'] / 100
-
-        partials['fractional_power', 'max_power'] = percent_max_power
-        partials['zero_thrust', 'max_power'] = 0.0
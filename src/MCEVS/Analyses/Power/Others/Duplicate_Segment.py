@@ -0,0 +1,25 @@
+import openmdao.api as om
+
+
+class PowerDuplicateSegment(om.ExplicitComponent):
+    """
+    Fans out the power and thrust of a segment to another segment with identical flight conditions
+    Inputs:
+            reference_power 	: power required by the reference segment [W]
+            reference_thrust 	: thrust of each rotor in the reference segment [N]
+    Outputs:
+            duplicate_power 	: power required by the duplicate segment [W]
+            duplicate_thrust 	: thrust of each rotor in the duplicate segment [N]
+    """
+
+    def setup(self):
+        self.add_input('reference_power', units='W', desc='Power required by the reference segment')
+        self.add_input('reference_thrust', units='N', desc='Thrust of each rotor in the reference segment')
+        self.add_output('duplicate_power', units='W', desc='Power required by the duplicate segment')
+        self.add_output('duplicate_thrust', units='N', desc='Thrust of each rotor in the duplicate segment')
+        self.declare_partials('duplicate_power', 'reference_power', val=1.0)
+        self.declare_partials('duplicate_thrust', 'reference_thrust', val=1.0)
+
+    def compute(self, inputs, outputs):
+        outputs['duplicate_power'] = inputs['reference_power']
+        outputs['duplicate_thrust'] = inputs['reference_thrust']
@@ -45,7 +45,10 @@ class PowerForwardComp(om.ExplicitComponent):
         self.add_output('Power|induced_power', units='W', desc='Induced power (sum of all rotors)')
         self.add_output('Power|propulsive_power', units='W', desc='Propulsive power (sum of all rotors)')
         self.add_output('Rotor|T_to_P', units='g/W', desc='Thrust to power ratio of a single rotor/propeller')
-        self.declare_partials('*', '*')
+        self.declare_partials(['Power|forward', 'Rotor|T_to_P'], '*')
+        self.declare_partials('Power|profile_power', 'Rotor|profile_power', val=self.options['N_rotor'])
+        self.declare_partials('Power|induced_power', ['Rotor|thrust', 'Rotor|kappa', 'v_induced'])
+        self.declare_partials('Power|propulsive_power', ['Rotor|thrust', 'Rotor|alpha', 'v_inf'])
 
     def compute(self, inputs, outputs):
         N_rotor = self.options['N_rotor']
@@ -91,26 +94,13 @@ class PowerForwardComp(om.ExplicitComponent):
         partials['Power|forward', 'v_inf'] = N_rotor * dP_dv1
         partials['Power|forward', 'v_induced'] = N_rotor * dP_dv2
 
-        partials['Power|profile_power', 'Rotor|thrust'] = 0.0
-        partials['Power|profile_power', 'Rotor|profile_power'] = N_rotor
-        partials['Power|profile_power', 'Rotor|alpha'] = 0.0
-        partials['Power|profile_power', 'Rotor|kappa'] = 0.0
-        partials['Power|profile_power', 'v_inf'] = 0.0
-        partials['Power|profile_power', 'v_induced'] = 0.0
-
         partials['Power|induced_power', 'Rotor|thrust'] = N_rotor * k * v_ind
-        partials['Power|induced_power', 'Rotor|profile_power'] = 0.0
-        partials['Power|induced_power', 'Rotor|alpha'] = 0.0
         partials['Power|induced_power', 'Rotor|kappa'] = N_rotor * T_rotor * v_ind
-        partials['Power|induced_power', 'v_inf'] = 0.0
         partials['Power|induced_power', 'v_induced'] = N_rotor * T_rotor * k
 
         partials['Power|propulsive_power', 'Rotor|thrust'] = N_rotor * v_inf * np.sin(a)
-        partials['Power|propulsive_power', 'Rotor|profile_power'] = 0.0
         partials['Power|propulsive_power', 'Rotor|alpha'] = N_rotor * T_rotor * v_inf * np.cos(a)
-        partials['Power|propulsive_power', 'Rotor|kappa'] = 0.0
         partials['Power|propulsive_power', 'v_inf'] = N_rotor * T_rotor * np.sin(a)
-        partials['Power|propulsive_power', 'v_induced'] = 0.0
 
         partials['Rotor|T_to_P', 'Rotor|thrust'] = (1 / g * 1000.0) / power_fwd_each + (T_rotor / g * 1000.0) * (-1 / power_fwd_each**2) * dP_dT
         partials['Rotor|T_to_P', 'Rotor|profile_power'] = (T_rotor / g * 1000.0) * (-1 / power_fwd_each**2) * dP_dP0
@@ -149,7 +139,7 @@ class RotorProfilePower(om.ExplicitComponent):
         self.add_input('Rotor|mu', desc='Rotor advance ratio')
         self.add_input('Rotor|omega', units='rad/s', desc='Rotor angular velocity')
         self.add_output('Rotor|profile_power', units='W', desc='Profile power of a rotor, P0')
-        self.declare_partials('*', '*')
+        self.declare_partials('Rotor|profile_power', ['Rotor|radius', 'Rotor|chord', 'Rotor|mu', 'Rotor|omega'])
 
     def compute(self, inputs, outputs):
         n_blade = self.options['n_blade']
@@ -209,7 +199,7 @@ class InducedPowerFactorComp(om.ExplicitComponent):
         self.add_input('Rotor|profile_power', units='W', desc='Profile power of a rotor, P0')
         self.add_input('Rotor|radius', units='m', desc='Rotor radius')
         self.add_output('kappa_raw', desc='Induced power factor')
-        self.declare_partials('*', '*')
+        self.declare_partials('kappa_raw', ['Rotor|thrust', 'Rotor|profile_power', 'Rotor|radius'])
 
     def compute(self, inputs, outputs):
         hover_FM = self.options['hover_FM']
@@ -278,3 +268,59 @@ class InducedPowerFactor(om.Group):
 
         self.connect('kappa_raw.kappa_raw', 'softmax.f1')
         self.connect('kappa_min.kappa_min', 'softmax.f2')
+
+
+class DiskLoadingComp(om.ExplicitComponent):
+    """
+    Computes the disk loading of a rotor
+    Inputs:
+            Rotor|thrust	: thrust of a rotor [N]
+            Rotor|radius	: rotor radius [m]
+    Outputs:
+            disk_loading	: disk loading of a rotor [N/m**2]
+    """
+
+    def setup(self):
+        self.add_input('Rotor|thrust', units='N', desc='Thrust of a rotor')
+        self.add_input('Rotor|radius', units='m', desc='Rotor radius')
+        self.add_output('disk_loading', units='N/m**2', desc='Disk loading of a rotor')
+        self.declare_partials('disk_loading', ['Rotor|thrust', 'Rotor|radius'])
+
+    def compute(self, inputs, outputs):
+        thrust = inputs['Rotor|thrust']
+        r = inputs['Rotor|radius']
+
+        outputs['disk_loading'] = thrust / (np.pi * r**2)
+
+    def compute_partials(self, inputs, partials):
+        thrust = inputs['Rotor|thrust']
+        r = inputs['Rotor|radius']
+
+        partials['disk_loading', 'Rotor|thrust'] = 1 / (np.pi * r**2)
+        partials['disk_loading', 'Rotor|radius'] = -2 * thrust / (np.pi * r**3)
+
+
+class RotorState(om.ExplicitComponent):
+    """
+    Computes the rotor states shared by every segment of a mission, once per design,
+    so that segment power groups connect to them instead of recomputing them
+    Parameters:
+            operating_points	: list of (component, phase) tuples, e.g., [('LiftRotor', 'HoverClimb'), ('Propeller', 'Cruise')]
+    Inputs:
+            {component}|{phase}|RPM 	: rotor revolution at the operating point [rpm]
+    Outputs:
+            {component}|{phase}|omega 	: rotor angular velocity at the operating point [rad/s]
+    """
+
+    def initialize(self):
+        self.options.declare('operating_points', types=list, desc='List of (component, phase) tuples')
+
+    def setup(self):
+        for component, phase in self.options['operating_points']:
+            self.add_input(f'{component}|{phase}|RPM', units='rpm', desc=f'{component} revolution at {phase}')
+            self.add_output(f'{component}|{phase}|omega', units='rad/s', desc=f'{component} angular velocity at {phase}')
+            self.declare_partials(f'{component}|{phase}|omega', f'{component}|{phase}|RPM', val=2 * np.pi / 60.0)
+
+    def compute(self, inputs, outputs):
+        for component, phase in self.options['operating_points']:
+            outputs[f'{component}|{phase}|omega'] = inputs[f'{component}|{phase}|RPM'] * 2 * np.pi / 60.0
@@ -0,0 +1,181 @@
+import numpy as np
+import openmdao.api as om
+from MCEVS.Constants.Container import get_atmosphere_provider
+
+
+def fixed_duration_kinds(fidelity: dict):
+    """
+    Kinds of segments whose duration is fixed by the mission rather than computed as distance / speed.
+    The accelerating vertical segments only have a fixed duration in the time-resolved mode,
+    which is the only mode able to analyze them node by node.
+    """
+    kinds = ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise', 'HoverStay']
+    if fidelity['power_model'].get('time_resolved', False):
+        kinds += ['HoverClimbConstantAcceleration', 'HoverDescentConstantDeceleration']
+    return kinds
+
+
+def compute_node_conditions(mission: object, segment: object):
+    """
+    Extracts the flight conditions at every discretization node of a segment
+    Inputs:
+            mission : Mission object
+            segment : segment object belonging to the mission
+    Outputs:
+            dict with the following arrays (one value per node):
+                    vy 		: vertical speed [m/s]
+                    ay 		: vertical acceleration [m/s**2]
+                    rho 	: air density [kg/m**3]
+                    g 		: gravitational acceleration [m/s**2]
+                    tau 	: normalized time within the segment, from 0 to 1
+    """
+    nodes = mission.trajectory.segment(segment.id - 1)
+    t, y, vy = nodes['t'], nodes['y'], nodes['vy']
+
+    duration = t[-1] - t[0]
+    if duration > 0.0:
+        tau = (t - t[0]) / duration
+        ay = np.gradient(vy, t)
+    else:
+        tau = np.zeros_like(t)
+        ay = np.zeros_like(t)
+
+    constants = get_atmosphere_provider('US_Standard_1976', mission.atmosphere_table_resolution).compute_constants_array(altitude=y + mission.takeoff_altitude)
+
+    return {'vy': vy, 'ay': ay, 'rho': constants['rho'], 'g': constants['g'], 'tau': tau}
+
+
+class PowerVerticalFlightNodes(om.ExplicitComponent):
+    """
+    Computes the power required at every discretization node of a vertical flight segment
+    (hover stay, hover climb, hover descent) using Momentum Theory. Density, gravity, vertical speed
+    and vertical acceleration may vary from node to node, which is what makes accelerating segments
+    and tall climbs resolved correctly.
+    Parameters:
+            N_rotor		: number or lift rotors
+            hover_FM	: hover figure of merit
+            vy 			: vertical speed at each node [m/s]
+            ay 			: vertical acceleration at each node [m/s**2]
+            rho_air		: air density at each node [kg/m**3]
+            g 			: gravitational acceleration at each node [m/s**2]
+            speed_ref 	: reference segment speed used to scale vy when the segment speed is an input [m/s]
+    Inputs:
+            Weight|takeoff  	: total take-off weight [kg]
+            LiftRotor|radius	: lift rotor radius [m]
+            Mission|segment_speed	: segment speed [m/s] 	(only if speed_ref is given)
+    Outputs:
+            Power|nodes 			: total power required at each node [W]
+            LiftRotor|thrust_nodes 	: thrust produced by each rotor at each node [N]
+            Power|peak 				: peak power along the segment [W]
+            LiftRotor|thrust_peak 	: peak thrust of each rotor along the segment [N]
+    """
+
+    def initialize(self):
+        self.options.declare('N_rotor', types=int, desc='Number of rotors')
+        self.options.declare('hover_FM', types=float, desc='Hover figure of merit')
+        self.options.declare('vy', types=np.ndarray, desc='Vertical speed at each node')
+        self.options.declare('ay', types=np.ndarray, desc='Vertical acceleration at each node')
+        self.options.declare('rho_air', types=np.ndarray, desc='Air density at each node')
+        self.options.declare('g', types=np.ndarray, desc='Gravitational acceleration at each node')
+        self.options.declare('speed_ref', default=None, allow_none=True, desc='Reference segment speed')
+
+    def setup(self):
+        n = len(self.options['vy'])
+        arange = np.arange(n)
+
+        self.add_input('Weight|takeoff', units='kg', desc='Total take-off weight')
+        self.add_input('LiftRotor|radius', units='m', desc='Lift rotor radius')
+        self.add_output('Power|nodes', shape=(n,), units='W', desc='Power required at each node')
+        self.add_output('LiftRotor|thrust_nodes', shape=(n,), units='N', desc='Thrust of each rotor at each node')
+        self.add_output('Power|peak', units='W', desc='Peak power along the segment')
+        self.add_output('LiftRotor|thrust_peak', units='N', desc='Peak thrust of each rotor along the segment')
+
+        self.declare_partials('Power|nodes', ['Weight|takeoff', 'LiftRotor|radius'], rows=arange, cols=np.zeros(n, dtype=int))
+        self.declare_partials('LiftRotor|thrust_nodes', 'Weight|takeoff', rows=arange, cols=np.zeros(n, dtype=int))
+        self.declare_partials('Power|peak', ['Weight|takeoff', 'LiftRotor|radius'])
+        self.declare_partials('LiftRotor|thrust_peak', 'Weight|takeoff')
+
+        if self.options['speed_ref'] is not None:
+            self.add_input('Mission|segment_speed', units='m/s', desc='Segment speed')
+            self.declare_partials('Power|nodes', 'Mission|segment_speed', rows=arange, cols=np.zeros(n, dtype=int))
+            self.declare_partials('Power|peak', 'Mission|segment_speed')
+
+    def _node_power(self, inputs):
+        N_rotor = self.options['N_rotor']
+        hover_FM = self.options['hover_FM']
+        ay = self.options['ay']
+        rho_air = self.options['rho_air']
+        g = self.options['g']
+        speed_ref = self.options['speed_ref']
+
+        W_takeoff = inputs['Weight|takeoff']
+        r = inputs['LiftRotor|radius']
+
+        if speed_ref is None:
+            v = self.options['vy']
+            dv_dspeed = np.zeros_like(v)
+        else:
+            dv_dspeed = self.options['vy'] / speed_ref
+            v = dv_dspeed * inputs['Mission|segment_speed']
+
+        # Total thrust balances weight and vertical inertia (drag is considered negligible)
+        T = W_takeoff * (g + ay)
+        c = 1 / (2 * rho_air * N_rotor * np.pi * r**2)  # v_hover**2 = T * c
+
+        # Three regimes: climb (and hover), windmill-brake descent, and slow descent treated as hover
+        climb = v >= 0.0
+        windmill = ~climb & (-v >= 2.0 * np.sqrt(T * c))
+        slow = ~climb & ~windmill
+
+        P = np.zeros_like(v)
+        dP_dT, dP_dc, dP_dv = np.zeros_like(v), np.zeros_like(v), np.zeros_like(v)
+
+        s = np.sqrt((v[climb] / 2)**2 + T[climb] * c[climb])
+        P[climb] = T[climb] / hover_FM * (v[climb] / 2 + s)
+        dP_dT[climb] = (v[climb] / 2 + s) / hover_FM + T[climb] * c[climb] / (2 * hover_FM * s)
+        dP_dc[climb] = T[climb]**2 / (2 * hover_FM * s)
+        dP_dv[climb] = T[climb] / hover_FM * (0.5 + v[climb] / (4 * s))
+
+        u = -v[windmill]
+        s = np.sqrt((u / 2)**2 - T[windmill] * c[windmill])
+        P[windmill] = T[windmill] / hover_FM * (u / 2 - s)
+        dP_dT[windmill] = (u / 2 - s) / hover_FM + T[windmill] * c[windmill] / (2 * hover_FM * s)
+        dP_dc[windmill] = T[windmill]**2 / (2 * hover_FM * s)
+        dP_dv[windmill] = -T[windmill] / hover_FM * (0.5 - u / (4 * s))
+
+        P[slow] = T[slow] * np.sqrt(T[slow] * c[slow]) / hover_FM
+        dP_dT[slow] = 1.5 * np.sqrt(T[slow] * c[slow]) / hover_FM
+        dP_dc[slow] = 0.5 * T[slow]**1.5 / np.sqrt(c[slow]) / hover_FM
+
+        dP_dW = dP_dT * (g + ay)
+        dP_dr = dP_dc * (-2 * c / r)
+        dP_dspeed = dP_dv * dv_dspeed
+
+        return P, T / N_rotor, dP_dW, dP_dr, dP_dspeed
+
+    def compute(self, inputs, outputs):
+        P, T_each, _, _, _ = self._node_power(inputs)
+
+        outputs['Power|nodes'] = P
+        outputs['LiftRotor|thrust_nodes'] = T_each
+        outputs['Power|peak'] = np.max(P)
+        outputs['LiftRotor|thrust_peak'] = np.max(T_each)
+
+    def compute_partials(self, inputs, partials):
+        N_rotor = self.options['N_rotor']
+        ay = self.options['ay']
+        g = self.options['g']
+
+        P, T_each, dP_dW, dP_dr, dP_dspeed = self._node_power(inputs)
+        k_P, k_T = np.argmax(P), np.argmax(T_each)
+
+        partials['Power|nodes', 'Weight|takeoff'] = dP_dW
+        partials['Power|nodes', 'LiftRotor|radius'] = dP_dr
+        partials['LiftRotor|thrust_nodes', 'Weight|takeoff'] = (g + ay) / N_rotor
+        partials['Power|peak', 'Weight|takeoff'] = dP_dW[k_P]
+        partials['Power|peak', 'LiftRotor|radius'] = dP_dr[k_P]
+        partials['LiftRotor|thrust_peak', 'Weight|takeoff'] = (g[k_T] + ay[k_T]) / N_rotor
+
+        if self.options['speed_ref'] is not None:
+            partials['Power|nodes', 'Mission|segment_speed'] = dP_dspeed
+            partials['Power|peak', 'Mission|segment_speed'] = dP_dspeed[k_P]
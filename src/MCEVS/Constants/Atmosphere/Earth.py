@@ -71,6 +71,40 @@ class Constant_Temperature(object):
                 data['v_sound'] = np.sqrt(self.gamma * data['P'] / data['rho'])
                 return data
 
+    def compute_constants_array(self, altitude, gravity=9.80665):
+        """
+        Vectorized version of compute_constants
+        Inputs:
+                altitude in m 		(array-like of any shape)
+                gravity  in m/s**2 	(scalar or array broadcastable to altitude)
+        Output:
+                a dictionary of arrays with the shape of altitude: H, P, T, rho, mu, nu, v_sound
+        """
+        H = np.asarray(altitude, dtype=float)
+        gravity = np.broadcast_to(np.asarray(gravity, dtype=float), H.shape)
+
+        if np.any(H < -2000.0) or np.any(H > 84852.0):
+            raise ValueError('Altitude is outside the range [-2000,84852] m')
+
+        # Sub-layer of each altitude and whether it sits exactly at a break altitude
+        i = np.clip(np.searchsorted(self.break_altitudes, H, side='right') - 1, 0, 7)
+        j = np.clip(np.searchsorted(self.break_altitudes, H, side='left'), 0, 8)
+        at_break = self.break_altitudes[j] == H
+
+        H0 = self.break_altitudes[i]
+        P0 = self.break_pressures[i]
+        T0 = self.break_temperatures[i]
+
+        P = np.where(at_break, self.break_pressures[j], P0 * np.exp(-gravity / (self.R * T0) * (H - H0)))
+        T = np.where(at_break, self.break_temperatures[j], T0)
+        rho = np.where(at_break, self.break_densities[j], P / (self.R * T))
+
+        data = {'H': H, 'P': P, 'T': T, 'rho': rho}
+        data['mu'] = self.beta * (T**1.5 / (T + self.S))
+        data['nu'] = data['mu'] / rho
+        data['v_sound'] = np.sqrt(self.gamma * P / rho)
+        return data
+
 
 class US_Standard_1976(object):
     """
@@ -144,3 +178,44 @@ class US_Standard_1976(object):
                 data['nu'] = data['mu'] / data['rho']
                 data['v_sound'] = np.sqrt(self.gamma * data['P'] / data['rho'])
                 return data
+
+    def compute_constants_array(self, altitude, gravity=9.80665):
+        """
+        Vectorized version of compute_constants: sub-layers are located with np.searchsorted
+        and the closed-form layer equations are evaluated for all altitudes at once
+        Inputs:
+                altitude in m 		(array-like of any shape)
+                gravity  in m/s**2 	(scalar or array broadcastable to altitude)
+        Output:
+                a dictionary of arrays with the shape of altitude: H, P, T, rho, mu, nu, v_sound
+        """
+        H = np.asarray(altitude, dtype=float)
+        gravity = np.broadcast_to(np.asarray(gravity, dtype=float), H.shape)
+
+        if np.any(H < -2000.0) or np.any(H > 84852.0):
+            raise ValueError('Altitude is outside the range [-2000,84852] m')
+
+        # Sub-layer of each altitude and whether it sits exactly at a break altitude
+        i = np.clip(np.searchsorted(self.break_altitudes, H, side='right') - 1, 0, 7)
+        j = np.clip(np.searchsorted(self.break_altitudes, H, side='left'), 0, 8)
+        at_break = self.break_altitudes[j] == H
+
+        H0 = self.break_altitudes[i]
+        P0 = self.break_pressures[i]
+        T0 = self.break_temperatures[i]
+        rate = self.T_lapse_rate[i]
+
+        # Same expressions as compute_constants (including its isothermal sub-layers, where rate = 0)
+        with np.errstate(divide='ignore'):
+            P_layer = P0 * (1 + (H - H0) / T0 * rate)**(-gravity / (self.R * rate))
+        T_layer = T0 + rate * (H - H0)
+
+        P = np.where(at_break, self.break_pressures[j], P_layer)
+        T = np.where(at_break, self.break_temperatures[j], T_layer)
+        rho = np.where(at_break, self.break_densities[j], P / (self.R * T))
+
+        data = {'H': H, 'P': P, 'T': T, 'rho': rho}
+        data['mu'] = self.beta * (T**1.5 / (T + self.S))
+        data['nu'] = data['mu'] / rho
+        data['v_sound'] = np.sqrt(self.gamma * P / rho)
+        return data
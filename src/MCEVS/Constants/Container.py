@@ -1,3 +1,6 @@
+import numpy as np
+from functools import lru_cache
+from scipy.interpolate import PchipInterpolator
 from MCEVS.Constants.Gravity.Earth import EarthGravityModel
 from MCEVS.Constants.Atmosphere.Earth import Constant_Temperature, US_Standard_1976
 
@@ -12,14 +15,33 @@ class EarthGravityAndAtmosphere(object):
         super(EarthGravityAndAtmosphere, self).__init__()
         self.atmosphere_model = atmosphere_model
 
+        # Model objects are constructed once
+        self.gravity = EarthGravityModel()
+        if atmosphere_model == 'US_Standard_1976':
+            self.atmosphere = US_Standard_1976()
+        elif atmosphere_model == 'Constant_Temperature':
+            self.atmosphere = Constant_Temperature()
+        else:
+            raise ValueError(f'Atmosphere model "{atmosphere_model}" is not available.')
+
     def compute_constants(self, altitude: float):
 
-        g = EarthGravityModel().compute_gravity(altitude)
+        g = self.gravity.compute_gravity(altitude)
+        data = self.atmosphere.compute_constants(altitude=altitude, gravity=g)
 
-        if self.atmosphere_model == 'US_Standard_1976':
-            data = US_Standard_1976().compute_constants(altitude=altitude, gravity=g)
-        if self.atmosphere_model == 'Constant_Temperature':
-            data = Constant_Temperature().compute_constants(altitude=altitude, gravity=g)
+        # Add gravity data
+        data['g'] = g
+
+        return data
+
+    def compute_constants_array(self, altitude):
+        """
+        Vectorized version of compute_constants: altitude may be an array of any shape,
+        and every constant (including g) is returned as an array of that shape
+        """
+        altitude = np.asarray(altitude, dtype=float)
+        g = self.gravity.compute_gravity(altitude)
+        data = self.atmosphere.compute_constants_array(altitude=altitude, gravity=g)
 
         # Add gravity data
         data['g'] = g
@@ -27,6 +49,84 @@ class EarthGravityAndAtmosphere(object):
         return data
 
 
+class AtmosphereProvider(object):
+    """
+    Memoized gravity and atmosphere provider
+    The gravity and atmosphere models are constructed once. Scalar queries go through a bounded LRU cache
+    keyed on the altitude rounded to `decimals` (the constants are evaluated at the rounded altitude).
+    If `table_resolution` is given, constants are instead interpolated from a precomputed table spanning
+    the whole model range, with that spacing in m plus all layer break altitudes, using monotone (PCHIP) interpolation.
+    Parameters:
+            atmosphere_model 	: 'US_Standard_1976' or 'Constant_Temperature'
+            cache_size 			: maximum number of cached altitudes
+            decimals 			: altitude rounding for the cache key [number of decimals in m]
+            table_resolution 	: spacing of the precomputed table [m], or None to evaluate the model exactly
+    """
+
+    keys = ('H', 'P', 'T', 'rho', 'mu', 'nu', 'v_sound', 'g')
+
+    def __init__(self, atmosphere_model='US_Standard_1976', cache_size=1024, decimals=6, table_resolution=None):
+        super(AtmosphereProvider, self).__init__()
+        self.model = EarthGravityAndAtmosphere(atmosphere_model)
+        self.decimals = decimals
+        self.table_resolution = table_resolution
+        self._compute_cached = lru_cache(maxsize=cache_size)(self._compute)
+
+        self._table = None
+        if table_resolution is not None:
+            breaks = self.model.atmosphere.break_altitudes
+            H = np.union1d(np.arange(breaks[0], breaks[-1], table_resolution), breaks)
+            data = self.model.compute_constants_array(H)
+            self._table = {key: PchipInterpolator(H, data[key]) for key in self.keys if key != 'H'}
+
+    def _compute(self, altitude: float):
+        if self._table is None:
+            return self.model.compute_constants(altitude=altitude)
+        data = {key: float(interpolant(altitude)) for key, interpolant in self._table.items()}
+        data['H'] = float(altitude)
+        return data
+
+    def compute_constants(self, altitude: float):
+        """
+        Same output as EarthGravityAndAtmosphere.compute_constants, memoized
+        """
+        return dict(self._compute_cached(round(float(altitude), self.decimals)))
+
+    def compute_constants_array(self, altitude):
+        """
+        Same output as EarthGravityAndAtmosphere.compute_constants_array (not memoized)
+        """
+        if self._table is None:
+            return self.model.compute_constants_array(altitude)
+        altitude = np.asarray(altitude, dtype=float)
+        breaks = self.model.atmosphere.break_altitudes
+        if np.any(altitude < breaks[0]) or np.any(altitude > breaks[-1]):
+            raise ValueError(f'Altitude is outside the range [{breaks[0]:.0f},{breaks[-1]:.0f}] m')
+        data = {key: interpolant(altitude) for key, interpolant in self._table.items()}
+        data['H'] = altitude
+        return data
+
+    def cache_info(self):
+        return self._compute_cached.cache_info()
+
+    def clear_cache(self):
+        self._compute_cached.cache_clear()
+
+
+_atmosphere_providers = {}
+
+
+def get_atmosphere_provider(atmosphere_model='US_Standard_1976', table_resolution=None):
+    """
+    Process-wide AtmosphereProvider for the given atmosphere model and table resolution
+    (None: exact evaluation; see AtmosphereProvider), with the default cache
+    """
+    key = (atmosphere_model, table_resolution)
+    if key not in _atmosphere_providers:
+        _atmosphere_providers[key] = AtmosphereProvider(atmosphere_model, table_resolution=table_resolution)
+    return _atmosphere_providers[key]
+
+
 if __name__ == '__main__':
 
     model = EarthGravityAndAtmosphere('US_Standard_1976')
@@ -13,16 +13,31 @@ from MCEVS.Missions.Segments.HoverDescent.Constant_Speed import HoverDescentCons
 from MCEVS.Missions.Segments.Hover.Stay import HoverStay
 from MCEVS.Missions.Segments.Others.Constant_Power import ConstantPower
 from MCEVS.Missions.Segments.Others.Reserve_Cruise import ReserveCruise
-from MCEVS.Constants.Container import EarthGravityAndAtmosphere
+from MCEVS.Missions.Trajectory import MissionTrajectory
+from MCEVS.Constants.Container import get_atmosphere_provider
 import numpy as np
 
 
 class Mission(object):
     """
     A container for a mission. Users can add segments to this container.
+    The trajectory is stored contiguously in self.trajectory (see MissionTrajectory);
+    self.t, self.x, self.y, self.vx, self.vy, self.ax, and self.ay are lists of per-segment views into it.
+    With lazy=True, only the segment parameters and their scalar summaries (see segment_summary) are computed
+    when segments are added; the trajectory arrays are materialized the first time self.trajectory is accessed
+    (e.g., by plotting, record_performance_by_segments or the time-resolved power model).
+    With discretization_tol = {'position': [m], 'velocity': [m/s]}, the n_discrete given to add_segment is ignored
+    and each segment picks the smallest number of nodes meeting these interpolation tolerances
+    (see Segments/Discretization.py); missing keys take the values of default_discretization_tol.
+    With atmosphere_table_resolution [m], the atmosphere and gravity constants of the segments (and of the nodes in
+    the time-resolved power model) are interpolated from a precomputed table with that spacing instead of being
+    evaluated exactly (see AtmosphereProvider).
     """
 
-    def __init__(self, planet: str, takeoff_altitude: float, n_repetition: float):
+    default_discretization_tol = {'position': 1.0, 'velocity': 1.0}
+    atmosphere_table_resolution = None  # default of missions serialized before the option existed
+
+    def __init__(self, planet: str, takeoff_altitude: float, n_repetition: float, lazy=False, discretization_tol=None, atmosphere_table_resolution=None):
         super(Mission, self).__init__()
 
         self.planet = planet  # available: 'Earth'
@@ -31,13 +46,16 @@ class Mission(object):
         self.curr_id = 0
         self.segments = []
         self.n_segments = 0  # number of segments excluding reserve segment
-        self.x = [np.array([0.0])]
-        self.y = [np.array([0.0])]
-        self.vx = [np.array([0.0])]
-        self.vy = [np.array([0.0])]
-        self.ax = [np.array([0.0])]
-        self.ay = [np.array([0.0])]
-        self.t = [np.array([0.0])]
+        self.lazy = lazy
+        self._trajectory = None if lazy else MissionTrajectory()
+        self._tail = None  # coarse nodes of the last segment (lazy mode)
+        self._segment_states = []  # start/end states and mean altitude of each segment
+
+        # Atmosphere table resolution (None: exact atmosphere)
+        self.atmosphere_table_resolution = atmosphere_table_resolution
+
+        # Adaptive discretization (None: fixed n_discrete per segment)
+        self.discretization_tol = None if discretization_tol is None else {**self.default_discretization_tol, **discretization_tol}
 
         # how many times the mission should be repeated
         # (not including reserve mission)
@@ -76,16 +94,16 @@ class Mission(object):
             self.segments.append(HoverClimbConstantSpeed(id=self.curr_id, name=name, n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'HoverClimbConstantAcceleration':
-            self.segments.append(HoverClimbConstantAcceleration(id=self.curr_id, name=name, initial_speed=self.vy[-1][-1], n_discrete=n_discrete, kwargs=kwargs))
+            self.segments.append(HoverClimbConstantAcceleration(id=self.curr_id, name=name, initial_speed=self._last_value('vy'), n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'ClimbConstantVyConstantVx':
             self.segments.append(ClimbConstantVyConstantVx(id=self.curr_id, name=name, n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'ClimbConstantVyConstantAx':
-            self.segments.append(ClimbConstantVyConstantAx(id=self.curr_id, name=name, initial_speed_X=self.vx[-1][-1], n_discrete=n_discrete, kwargs=kwargs))
+            self.segments.append(ClimbConstantVyConstantAx(id=self.curr_id, name=name, initial_speed_X=self._last_value('vx'), n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'TransitionConstantAcceleration':
-            self.segments.append(TransitionConstantAcceleration(id=self.curr_id, name=name, initial_speed=self.vx[-1][-1], n_discrete=n_discrete, kwargs=kwargs))
+            self.segments.append(TransitionConstantAcceleration(id=self.curr_id, name=name, initial_speed=self._last_value('vx'), n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'CruiseConstantSpeed':
             self.segments.append(CruiseConstantSpeed(id=self.curr_id, name=name, n_discrete=n_discrete, kwargs=kwargs))
@@ -94,7 +112,7 @@ class Mission(object):
             self.segments.append(DescentConstantVyConstantVx(id=self.curr_id, name=name, n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'DescentConstantVyConstantAx':
-            self.segments.append(DescentConstantVyConstantAx(id=self.curr_id, name=name, initial_speed_X=self.vx[-1][-1], n_discrete=n_discrete, kwargs=kwargs))
+            self.segments.append(DescentConstantVyConstantAx(id=self.curr_id, name=name, initial_speed_X=self._last_value('vx'), n_discrete=n_discrete, kwargs=kwargs))
 
         elif kind == 'NoCreditClimb':
             self.segments.append(NoCreditClimb(id=self.curr_id, name=name, n_discrete=n_discrete, kwargs=kwargs))
@@ -114,31 +132,38 @@ class Mission(object):
         elif kind == 'ReserveCruise':
             self.segments.append(ReserveCruise(id=self.curr_id, name=name, n_discrete=n_discrete, kwargs=kwargs))
 
-        self.segments[self.curr_id - 1]._initialize()
+        segment = self.segments[self.curr_id - 1]
+        segment._initialize()
+        if self.discretization_tol is not None:
+            segment.n_discrete = segment._adaptive_n_discrete(self.discretization_tol['position'], self.discretization_tol['velocity'])
 
         # Calculate the next timestamp, position, velocity, and acceleration
-        t_next = self.segments[self.curr_id - 1]._calc_time(self.t)
-        self.x, self.y = self.segments[self.curr_id - 1]._calc_position(self.x, self.y, t_next)
-        self.vx, self.vy = self.segments[self.curr_id - 1]._calc_velocity(self.vx, self.vy, t_next)
-        self.ax, self.ay = self.segments[self.curr_id - 1]._calc_acceleration(self.ax, self.ay, t_next)
+        if self._trajectory is not None:
+            nodes = self._calc_segment_nodes(segment, self._trajectory.segment(-1) if self._trajectory.n_segments > 0 else None)
+            self._trajectory.append_segment(**nodes)
+            mean_altitude = np.mean(nodes['y']) + self.takeoff_altitude
+        else:
+            # Three nodes suffice, since positions are at most quadratic in time within a segment
+            n_discrete = segment.n_discrete
+            segment.n_discrete = 2
+            try:
+                nodes = self._calc_segment_nodes(segment, self._tail)
+            finally:
+                segment.n_discrete = n_discrete
+            self._tail = nodes
+            # Mean of y = y0 + b * s + c * s**2 over the n_discrete + 1 equally spaced nodes s = 0, 1/n, ..., 1
+            c = 2 * (nodes['y'][2] - 2 * nodes['y'][1] + nodes['y'][0])
+            b = nodes['y'][2] - nodes['y'][0] - c
+            mean_altitude = nodes['y'][0] + b / 2 + c * (2 * n_discrete + 1) / (6 * n_discrete) + self.takeoff_altitude
+
+        self._segment_states.append({'t': (nodes['t'][0], nodes['t'][-1]),
+                                     'x': (nodes['x'][0], nodes['x'][-1]),
+                                     'y': (nodes['y'][0], nodes['y'][-1]),
+                                     'mean_altitude': mean_altitude})
 
         # Calculate atmosphere and gravity constants
         if kind not in ['ConstantPower', 'NoCreditDescent', 'ReserveCruise']:
-            curr_alt = np.mean(self.y[-1]) + self.takeoff_altitude
-            self.segments[self.curr_id - 1].constants = EarthGravityAndAtmosphere('US_Standard_1976').compute_constants(altitude=curr_alt)
-
-        # Append the time list
-        self.t.append(t_next)
-
-        # Delete first point
-        if self.curr_id == 1:
-            self.x = self.x[1:]
-            self.y = self.y[1:]
-            self.vx = self.vx[1:]
-            self.vy = self.vy[1:]
-            self.ax = self.ax[1:]
-            self.ay = self.ay[1:]
-            self.t = self.t[1:]
+            segment.constants = get_atmosphere_provider('US_Standard_1976', self.atmosphere_table_resolution).compute_constants(mean_altitude)
 
         # Counting number of segments
         if kind == 'ReserveCruise':
@@ -146,6 +171,84 @@ class Mission(object):
         else:
             self.n_segments += 1
 
+    @staticmethod
+    def _calc_segment_nodes(segment: object, previous: dict):
+        """
+        Nodes of a segment continuing from the nodes of the previous segment (None: a single point at rest)
+        """
+        if previous is not None:
+            history = {channel: [view] for channel, view in previous.items()}
+        else:
+            history = {channel: [np.array([0.0])] for channel in MissionTrajectory.channels}
+
+        t_next = segment._calc_time(history['t'])
+        x_list, y_list = segment._calc_position(history['x'], history['y'], t_next)
+        vx_list, vy_list = segment._calc_velocity(history['vx'], history['vy'], t_next)
+        ax_list, ay_list = segment._calc_acceleration(history['ax'], history['ay'], t_next)
+        return {'t': t_next, 'x': x_list[-1], 'y': y_list[-1], 'vx': vx_list[-1], 'vy': vy_list[-1], 'ax': ax_list[-1], 'ay': ay_list[-1]}
+
+    def _last_value(self, name: str):
+        """
+        Value of a trajectory channel at the end of the last segment (0.0 if there is none yet)
+        """
+        if self._trajectory is not None:
+            return self._trajectory.last_value(name)
+        return self._tail[name][-1] if self._tail is not None else 0.0
+
+    @property
+    def trajectory(self):
+        if self._trajectory is None:
+            trajectory = MissionTrajectory()
+            for segment in self.segments:
+                trajectory.append_segment(**self._calc_segment_nodes(segment, trajectory.segment(-1) if trajectory.n_segments > 0 else None))
+            self._trajectory = trajectory
+        return self._trajectory
+
+    def segment_summary(self, i: int):
+        """
+        Scalar summary of segment i (0-based), available without materializing the trajectory
+        Outputs:
+                duration 		: segment duration [s]
+                distance 		: straight-line distance between the segment end points [m]
+                mean_altitude 	: mean altitude over the segment nodes (ASL) [m]
+                mean_speed 		: distance / duration [m/s] (0.0 for zero-duration segments)
+        """
+        state = self._segment_states[i]
+        duration = state['t'][1] - state['t'][0]
+        distance = np.hypot(state['x'][1] - state['x'][0], state['y'][1] - state['y'][0])
+        return {'duration': float(duration),
+                'distance': float(distance),
+                'mean_altitude': float(state['mean_altitude']),
+                'mean_speed': float(distance / duration) if duration > 0.0 else 0.0}
+
+    @property
+    def t(self):
+        return self.trajectory.segment_list('t')
+
+    @property
+    def x(self):
+        return self.trajectory.segment_list('x')
+
+    @property
+    def y(self):
+        return self.trajectory.segment_list('y')
+
+    @property
+    def vx(self):
+        return self.trajectory.segment_list('vx')
+
+    @property
+    def vy(self):
+        return self.trajectory.segment_list('vy')
+
+    @property
+    def ax(self):
+        return self.trajectory.segment_list('ax')
+
+    @property
+    def ay(self):
+        return self.trajectory.segment_list('ay')
+
     def print_info(self):
         print('Mission Info')
         print(f'\tNumber of segment(s) = {len(self.segments)}')
@@ -0,0 +1,27 @@
+from MCEVS.Missions.Segments.Vectorized import segment_kinematics
+
+
+class Segment(object):
+    """
+    Base class of the mission segments
+    """
+    # Constructor arguments of the initial state -> channel of the previous segment they are taken from
+    # (unless given in kwargs), or None if they must be given in kwargs; see Segments/Vectorized.py
+    initial_values = {}
+
+    @classmethod
+    def vectorized_kinematics(cls, n_discrete=10, previous=None, **kwargs):
+        """
+        Kinematics of this segment for N missions at once (kwargs as in Mission.add_segment(), scalars or arrays of shape (N,));
+        see Segments/Vectorized.py
+        """
+        return segment_kinematics(cls, n_discrete, previous, kwargs, **cls.initial_values)
+
+    def _adaptive_n_discrete(self, tol_position, tol_velocity):
+        """
+        Number of intervals meeting the position [m] and velocity [m/s] interpolation tolerances (see Discretization.py).
+        A single interval by default, which is exact for segments without acceleration: either their positions are linear
+        in time (constant velocity, or none in hover stay), or they take no time in the trajectory (no-credit climb and
+        descent, reserve cruise) and all their nodes coincide. Accelerating segments override it.
+        """
+        return 1
@@ -1,7 +1,9 @@
+from MCEVS.Missions.Segments.Base import Segment
+from MCEVS.Missions.Segments.Discretization import adaptive_n_discrete
 import numpy as np
 
 
-class ClimbConstantVyConstantAx():
+class ClimbConstantVyConstantAx(Segment):
     """
     docstring for ClimbConstantVyConstantAx
     kwargs:
@@ -13,6 +15,7 @@ class ClimbConstantVyConstantAx():
             distance_X 		: distance of the climb in X-direction [m]
             duration		: total duration of the climb [s]
     """
+    initial_values = {'initial_speed_X': 'vx'}
 
     def __init__(self, id: int, name: str, initial_speed_X: float, kwargs: dict, n_discrete=10):
         super(ClimbConstantVyConstantAx, self).__init__()
@@ -69,6 +72,10 @@ class ClimbConstantVyConstantAx():
         self.distance_X = self.initial_speed_X * self.duration + 0.5 * self.acceleration_X * self.duration**2
         self.distance = np.sqrt(self.distance_X**2 + self.distance_Y**2)
 
+    def _adaptive_n_discrete(self, tol_position, tol_velocity):
+        # Number of intervals meeting the position [m] and velocity [m/s] tolerances under constant acceleration
+        return adaptive_n_discrete(self.duration, self.acceleration_X, tol_position, tol_velocity)
+
     def _calc_time(self, t_list):
         t0 = t_list[-1][-1]
         t_next = np.linspace(t0, t0 + self.duration, self.n_discrete + 1)
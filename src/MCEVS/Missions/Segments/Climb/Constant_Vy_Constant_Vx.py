@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class ClimbConstantVyConstantVx():
+class ClimbConstantVyConstantVx(Segment):
     """
     docstring for ClimbConstantVyConstantVx
     kwargs:
@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class NoCreditClimb():
+class NoCreditClimb(Segment):
     """
     docstring for NoCreditClimb
     kwargs:
@@ -37,21 +38,20 @@ class NoCreditClimb():
 
     def _calc_time(self, t_list):
         t0 = t_list[-1][-1]
-        t_next = t0 * np.ones(self.n_discrete + 1)
+        t_next = np.multiply.outer(np.ones(self.n_discrete + 1), t0)
         return t_next
 
     def _calc_position(self, x_list, y_list, t_next):
         x0, y0, _ = x_list[-1][-1], y_list[-1][-1], t_next[0]
         # Position under hypothetical constant Vy and constant Vx
-        # print(np.arange(0,10,1))
-        x_next = x0 + self.distance_X / self.n_discrete * np.arange(0, self.n_discrete + 1)
-        y_next = y0 + self.distance_Y / self.n_discrete * np.arange(0, self.n_discrete + 1)
+        x_next = x0 + np.multiply.outer(np.arange(0, self.n_discrete + 1), self.distance_X / self.n_discrete)
+        y_next = y0 + np.multiply.outer(np.arange(0, self.n_discrete + 1), self.distance_Y / self.n_discrete)
         x_list.append(x_next)
         y_list.append(y_next)
         return x_list, y_list
 
     def _calc_velocity(self, vx_list, vy_list, t_next):
-        vx0, vy0, t0 = vx_list[-1], vy_list[-1], t_next[0]
+        vx0, vy0, t0 = vx_list[-1][-1], vy_list[-1][-1], t_next[0]
         # Velocity under hypothetical zero acceleration
         vx_next = vx0 + 0.0 * (t_next - t0)
         vy_next = vy0 + 0.0 * (t_next - t0)
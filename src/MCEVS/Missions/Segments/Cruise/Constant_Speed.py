@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class CruiseConstantSpeed():
+class CruiseConstantSpeed(Segment):
     """
     docstring for CruiseConstantSpeed
     kwargs:
@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class DescentConstantVyConstantVx():
+class DescentConstantVyConstantVx(Segment):
     """
     docstring for DescentConstantVyConstantVx
     kwargs:
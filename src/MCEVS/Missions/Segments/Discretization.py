@@ -0,0 +1,50 @@
+import numpy as np
+
+
+def adaptive_n_discrete(duration: float, acceleration: float, tol_position: float, tol_velocity: float, n_min=1, n_max=500):
+    """
+    Smallest number of intervals of a constant-acceleration segment for which, between two equally spaced nodes
+    (spacing h = duration / n), the linearly interpolated position deviates from the exact one by at most
+    tol_position (error = |a| * h**2 / 8) and the mean velocity implied by the node positions deviates from
+    the node velocities by at most tol_velocity (error = |a| * h / 2).
+    Segments without acceleration (or of zero duration) are exact with n_min intervals.
+    Inputs:
+            duration 		: segment duration [s]
+            acceleration 	: magnitude of the constant acceleration [m/s**2]
+            tol_position 	: position tolerance [m]
+            tol_velocity 	: velocity tolerance [m/s]
+            n_min, n_max 	: bounds of the number of intervals
+    """
+    if tol_position <= 0.0 or tol_velocity <= 0.0:
+        raise ValueError('Discretization tolerances should be positive!')
+    a = abs(acceleration)
+    n_position = duration * np.sqrt(a / (8.0 * tol_position))
+    n_velocity = duration * a / (2.0 * tol_velocity)
+    return int(min(max(n_min, np.ceil(n_position), np.ceil(n_velocity)), n_max))
+
+
+def discretization_error(mission: object, n_sample=50):
+    """
+    Maximum position [m] and velocity [m/s] errors of the piecewise-linear interpolation of a mission trajectory,
+    measured against the exact segment kinematics evaluated at n_sample points between each pair of nodes
+    """
+    from MCEVS.Missions.Container import Mission
+    trajectory = mission.trajectory
+    error = {'position': 0.0, 'velocity': 0.0}
+    for i, segment in enumerate(mission.segments):
+        nodes = trajectory.segment(i)
+        previous = trajectory.segment(i - 1) if i > 0 else None
+        n_discrete = segment.n_discrete
+        segment.n_discrete = n_discrete * n_sample
+        try:
+            fine = Mission._calc_segment_nodes(segment, previous)
+        finally:
+            segment.n_discrete = n_discrete
+        if nodes['t'][-1] > nodes['t'][0]:
+            for channel, rate in [('x', 'vx'), ('y', 'vy')]:
+                interpolated = np.interp(fine['t'], nodes['t'], nodes[channel])
+                error['position'] = max(error['position'], np.max(np.abs(interpolated - fine[channel])))
+                mean_velocity = np.diff(nodes[channel]) / np.diff(nodes['t'])
+                node_error = np.maximum(np.abs(mean_velocity - nodes[rate][:-1]), np.abs(mean_velocity - nodes[rate][1:]))
+                error['velocity'] = max(error['velocity'], np.max(node_error))
+    return error
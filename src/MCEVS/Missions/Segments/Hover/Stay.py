@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class HoverStay():
+class HoverStay(Segment):
     """
     docstring for HoverStay
     kwargs:
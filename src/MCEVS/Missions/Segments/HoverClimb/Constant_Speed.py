@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class HoverClimbConstantSpeed():
+class HoverClimbConstantSpeed(Segment):
     """
     docstring for HoverClimbConstantSpeed
     kwargs:
@@ -1,7 +1,9 @@
+from MCEVS.Missions.Segments.Base import Segment
+from MCEVS.Missions.Segments.Discretization import adaptive_n_discrete
 import numpy as np
 
 
-class HoverDescentConstantDeceleration():
+class HoverDescentConstantDeceleration(Segment):
     """
     docstring for HoverDescentConstantDeceleration
     kwargs:
@@ -10,6 +12,7 @@ class HoverDescentConstantDeceleration():
             distance 		: distance of the hover climb [m]
             duration		: duration of the hover climb [s]
     """
+    initial_values = {'initial_speed': None}
 
     def __init__(self, id: int, name: str, initial_speed: float, kwargs: dict, n_discrete=10):
         super(HoverDescentConstantDeceleration, self).__init__()
@@ -65,6 +68,10 @@ class HoverDescentConstantDeceleration():
         except NameError:
             raise NameError("Need to define at least two of the followings: Final_Speed, Distance, Duration, Deceleration")
 
+    def _adaptive_n_discrete(self, tol_position, tol_velocity):
+        # Number of intervals meeting the position [m] and velocity [m/s] tolerances under constant acceleration
+        return adaptive_n_discrete(self.duration, self.deceleration, tol_position, tol_velocity)
+
     def _calc_time(self, t_list):
         t0 = t_list[-1][-1]
         t_next = np.linspace(t0, t0 + self.duration, self.n_discrete + 1)
@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class HoverDescentConstantSpeed():
+class HoverDescentConstantSpeed(Segment):
     """
     docstring for HoverDescentConstantSpeed
     kwargs:
@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class ConstantPower():
+class ConstantPower(Segment):
     """
     docstring for ConstantPower
     kwargs:
@@ -1,7 +1,8 @@
+from MCEVS.Missions.Segments.Base import Segment
 import numpy as np
 
 
-class ReserveCruise():
+class ReserveCruise(Segment):
     """
     docstring for ReserveCruise
     kwargs:
@@ -24,21 +25,20 @@ class ReserveCruise():
 
     def _calc_time(self, t_list):
         t0 = t_list[-1][-1]
-        t_next = t0 * np.ones(self.n_discrete + 1)
+        t_next = np.multiply.outer(np.ones(self.n_discrete + 1), t0)
         return t_next
 
     def _calc_position(self, x_list, y_list, t_next):
         x0, y0, _ = x_list[-1][-1], y_list[-1][-1], t_next[0]
         # Position under zero velocity
-        # print(np.arange(0,10,1))
-        x_next = x0 + 0.0 * np.arange(0, self.n_discrete + 1)
-        y_next = y0 + 0.0 * np.arange(0, self.n_discrete + 1)
+        x_next = x0 + np.zeros_like(t_next)
+        y_next = y0 + np.zeros_like(t_next)
         x_list.append(x_next)
         y_list.append(y_next)
         return x_list, y_list
 
     def _calc_velocity(self, vx_list, vy_list, t_next):
-        vx0, vy0, t0 = vx_list[-1], vy_list[-1], t_next[0]
+        vx0, vy0, t0 = vx_list[-1][-1], vy_list[-1][-1], t_next[0]
         # Velocity under zero acceleration
         vx_next = vx0 + 0.0 * (t_next - t0)
         vy_next = vy0 + 0.0 * (t_next - t0)
@@ -1,7 +1,9 @@
+from MCEVS.Missions.Segments.Base import Segment
+from MCEVS.Missions.Segments.Discretization import adaptive_n_discrete
 import numpy as np
 
 
-class TransitionConstantAcceleration():
+class TransitionConstantAcceleration(Segment):
     """
     docstring for TransitionConstantAcceleration in x-direction
     kwargs:
@@ -10,6 +12,7 @@ class TransitionConstantAcceleration():
             distance 		: distance of the transition [m]
             duration		: duration of the transition [s]
     """
+    initial_values = {'initial_speed': 'vx'}
 
     def __init__(self, id: int, name: str, initial_speed: float, kwargs: dict, n_discrete=5):
         super(TransitionConstantAcceleration, self).__init__()
@@ -65,6 +68,10 @@ class TransitionConstantAcceleration():
         except NameError:
             raise NameError("Need to define at least two of the followings: Final_Speed, Distance, Duration, Acceleration")
 
+    def _adaptive_n_discrete(self, tol_position, tol_velocity):
+        # Number of intervals meeting the position [m] and velocity [m/s] tolerances under constant acceleration
+        return adaptive_n_discrete(self.duration, self.acceleration, tol_position, tol_velocity)
+
     def _calc_time(self, t_list):
         t0 = t_list[-1][-1]
         t_next = np.linspace(t0, t0 + self.duration, self.n_discrete + 1)
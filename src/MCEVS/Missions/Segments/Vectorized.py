@@ -0,0 +1,58 @@
+import numpy as np
+
+channels = ('t', 'x', 'y', 'vx', 'vy', 'ax', 'ay')
+
+
+def segment_kinematics(cls, n_discrete: int, previous: dict, kwargs: dict, **initial_values):
+    """
+    Computes the kinematics of one kind of segment for N missions at once, with a single segment object whose
+    parameters are arrays of shape (N,); the parameters are resolved by the segment's own _initialize() and
+    the nodes by its own _calc_time/_calc_position/_calc_velocity/_calc_acceleration (node axis first).
+    Inputs:
+            cls 			: segment class (e.g., CruiseConstantSpeed)
+            n_discrete 		: number of intervals (same for all missions)
+            previous 		: output of the previous segment (its last nodes are the initial state), or None (at rest at the origin)
+            kwargs 			: segment parameters as in Mission.add_segment(), scalars or arrays of shape (N,)
+            initial_values 	: constructor argument -> channel of the initial state it is taken from (unless given in kwargs),
+                              or None if the argument must be given in kwargs
+    Outputs:
+            dict with the duration of shape (N,) and one array of shape (N, n_discrete + 1) per channel (t, x, y, vx, vy, ax, ay)
+    """
+    from MCEVS.Missions.Container import Mission
+
+    kwargs = {key: np.asarray(value, dtype=float) for key, value in kwargs.items()}
+    if previous is None:
+        start = {channel: np.zeros(1) for channel in channels}
+    else:
+        start = {channel: np.asarray(previous[channel], dtype=float)[..., -1] for channel in channels}
+
+    shape = np.broadcast_shapes(*[np.shape(value) for value in kwargs.values()], *[np.shape(value) for value in start.values()])
+    if len(shape) > 1:
+        raise ValueError('Segment parameters and initial states should be scalars or 1D arrays (one value per mission)!')
+    N = shape[0] if shape else 1
+    kwargs = {key: np.broadcast_to(value, (N,)) for key, value in kwargs.items()}
+    start = {channel: np.broadcast_to(value, (N,)) for channel, value in start.items()}
+
+    init_args = {}
+    for name, channel in initial_values.items():
+        if name in kwargs:
+            init_args[name] = kwargs.pop(name)
+        elif channel is None:
+            raise ValueError(f'{cls.__name__} requires "{name}"!')
+        else:
+            init_args[name] = start[channel]
+
+    # The parameters are set as attributes (rather than parsed from kwargs, which converts them to float)
+    segment = cls(id=0, name=cls.__name__, kwargs={}, n_discrete=n_discrete, **init_args)
+    for key, value in kwargs.items():
+        if key not in vars(segment):
+            raise ValueError(f'Unknown parameter "{key}" for {cls.__name__}!')
+        setattr(segment, key, value)
+    segment._initialize()
+
+    nodes = Mission._calc_segment_nodes(segment, {channel: value[np.newaxis, :] for channel, value in start.items()})
+    outputs = {'duration': np.broadcast_to(np.asarray(segment.duration, dtype=float), (N,)).copy()}
+    for channel in channels:
+        outputs[channel] = np.ascontiguousarray(np.broadcast_to(nodes[channel], (n_discrete + 1, N)).T)
+
+    return outputs
@@ -1,7 +1,7 @@
 from MCEVS.Missions.Container import Mission
 
 
-def StandardMissionProfile(mission_range, cruise_speed):
+def StandardMissionProfile(mission_range, cruise_speed, lazy=False):
 
     # Hover climb config
     hover_climb_speed = 500 * 0.3048 / 60  # m/s; 500 ft/min
@@ -15,7 +15,7 @@ def StandardMissionProfile(mission_range, cruise_speed):
     no_credit_distance = (6500 - 6000) * 0.3048  # m; 500 ft
 
     # Take-off from 5000 ft ASL
-    mission = Mission(planet='Earth', takeoff_altitude=5000 * 0.3048, n_repetition=1)
+    mission = Mission(planet='Earth', takeoff_altitude=5000 * 0.3048, n_repetition=1, lazy=lazy)
     mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=hover_climb_speed, distance=hover_climb_distance, n_discrete=10)
     mission.add_segment(name='No Credit Climb', kind='NoCreditClimb', distance_Y=no_credit_distance, distance_X=0.0, n_discrete=10)
     mission.add_segment('Cruise', kind='CruiseConstantSpeed', speed=cruise_speed, distance=mission_range, AoA=5.0, n_discrete=10)
@@ -27,6 +27,38 @@ def StandardMissionProfile(mission_range, cruise_speed):
     return mission
 
 
+def RouteMissionProfile(mission_range, cruise_speed, takeoff_altitude=5000 * 0.3048, cruise_altitude=6500 * 0.3048, hover_time_departure=0.0, hover_time_arrival=0.0, lazy=False):
+    """
+    StandardMissionProfile() for one route of a network: takeoff and cruise altitudes [m] and the hover times [s]
+    at departure and arrival may differ from route to route. Defaults reproduce StandardMissionProfile().
+    """
+
+    # Hover climb/descent config (same as StandardMissionProfile)
+    hover_climb_speed = 500 * 0.3048 / 60  # m/s; 500 ft/min
+    hover_climb_distance = 1000 * 0.3048  # m; 1000 ft
+    hover_descent_speed = 300 * 0.3048 / 60  # m/s; 300 ft/min
+    hover_descent_distance = 1000 * 0.3048  # m; 1000 ft
+
+    # No credit climb/descent up to/down from the cruise altitude
+    no_credit_distance = cruise_altitude - takeoff_altitude - hover_climb_distance
+    if no_credit_distance < 0.0:
+        raise ValueError(f'Cruise altitude should be at least {hover_climb_distance} m above the takeoff altitude!')
+
+    mission = Mission(planet='Earth', takeoff_altitude=takeoff_altitude, n_repetition=1, lazy=lazy)
+    mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=hover_climb_speed, distance=hover_climb_distance, n_discrete=10)
+    if hover_time_departure > 0.0:
+        mission.add_segment(name='Departure Hover', kind='HoverStay', duration=hover_time_departure, n_discrete=10)
+    mission.add_segment(name='No Credit Climb', kind='NoCreditClimb', distance_Y=no_credit_distance, distance_X=0.0, n_discrete=10)
+    mission.add_segment('Cruise', kind='CruiseConstantSpeed', speed=cruise_speed, distance=mission_range, AoA=5.0, n_discrete=10)
+    mission.add_segment(name='No Credit Descent', kind='NoCreditDescent', distance_Y=no_credit_distance, distance_X=0.0, n_discrete=10)
+    if hover_time_arrival > 0.0:
+        mission.add_segment(name='Arrival Hover', kind='HoverStay', duration=hover_time_arrival, n_discrete=10)
+    mission.add_segment(name='Hover Descent', kind='HoverDescentConstantSpeed', speed=hover_descent_speed, distance=hover_descent_distance, n_discrete=10)
+    mission.add_segment(name='Reserve Cruise', kind='ReserveCruise', duration=20 * 60)
+
+    return mission
+
+
 def UberMissionProfile(v_stall=40.0):
     mission_range = 96560.6  # m
     cruise_speed = 67.056  # m/s
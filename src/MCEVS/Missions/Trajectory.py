@@ -0,0 +1,86 @@
+import numpy as np
+
+
+class MissionTrajectory(object):
+    """
+    Contiguous (struct-of-arrays) storage of a mission trajectory.
+    Each channel (t, x, y, vx, vy, ax, ay) is one float64 array holding the nodes of all segments back to back,
+    and segment i occupies the slice offsets[i]:offsets[i+1]. Per-segment accessors return views (no copy).
+    The buffers grow geometrically, so views taken before an append refer to the previous buffer;
+    their values stay valid since a segment is never modified once appended.
+    """
+
+    channels = ('t', 'x', 'y', 'vx', 'vy', 'ax', 'ay')
+
+    def __init__(self, capacity=64):
+        super(MissionTrajectory, self).__init__()
+        self._capacity = max(int(capacity), 1)
+        self._data = {channel: np.empty(self._capacity, dtype=np.float64) for channel in self.channels}
+        self.offsets = [0]  # segment i occupies offsets[i]:offsets[i+1]
+
+    @property
+    def n_segments(self):
+        return len(self.offsets) - 1
+
+    @property
+    def n_nodes(self):
+        return self.offsets[-1]
+
+    def append_segment(self, **arrays):
+        """
+        Appends the nodes of one segment; one keyword argument per channel, all of the same length
+        """
+        missing = set(self.channels) - set(arrays)
+        if missing:
+            raise ValueError(f'Missing trajectory channel(s): {sorted(missing)}')
+
+        n = len(arrays['t'])
+        start, end = self.n_nodes, self.n_nodes + n
+
+        if end > self._capacity:
+            self._capacity = max(2 * self._capacity, end)
+            for channel in self.channels:
+                buffer = np.empty(self._capacity, dtype=np.float64)
+                buffer[:start] = self._data[channel][:start]
+                self._data[channel] = buffer
+
+        for channel in self.channels:
+            self._data[channel][start:end] = arrays[channel]
+        self.offsets.append(end)
+
+    def segment_slice(self, i):
+        """
+        Slice of segment i (0-based; negative indices count from the last segment) in every channel
+        """
+        if i < 0:
+            i += self.n_segments
+        if not 0 <= i < self.n_segments:
+            raise IndexError(f'Segment index out of range (number of segments = {self.n_segments})')
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def channel(self, name, i=None):
+        """
+        View of one channel, for segment i or for the entire mission if i is None
+        """
+        if i is None:
+            return self._data[name][:self.n_nodes]
+        return self._data[name][self.segment_slice(i)]
+
+    def segment(self, i):
+        """
+        Views of all channels of segment i, as a dict
+        """
+        s = self.segment_slice(i)
+        return {channel: self._data[channel][s] for channel in self.channels}
+
+    def segment_list(self, name):
+        """
+        List of per-segment views of one channel
+        """
+        return [self._data[name][self.offsets[i]:self.offsets[i + 1]] for i in range(self.n_segments)]
+
+    def last_value(self, name, default=0.0):
+        """
+        Value of a channel at the last node, or default if the trajectory is empty
+        """
+        return self._data[name][self.n_nodes - 1] if self.n_nodes > 0 else default
@@ -1,8 +1,8 @@
 import numpy as np
 from MCEVS.Analyses.Weight.Analysis import WeightAnalysis
 from MCEVS.Vehicles.Standard import StandardLiftPlusCruiseEVTOL, StandardMultirotorEVTOL
+from MCEVS.Analyses.Power.TimeResolved import fixed_duration_kinds
 from MCEVS.Optimization.Gradient_Based.Algorithm import run_gradient_based_optimization
-from MCEVS.Optimization.Gradient_Free.Algorithm import run_gradient_free_optimization
 from MCEVS.Utils.Checks import check_fidelity_dict
 
 
@@ -69,7 +69,8 @@ class DesignProblem(object):
             result = run_gradient_based_optimization(self)
 
         elif self.algorithm == 'gradient-free':
-            # Run !!!
+            # Run !!! (pymoo is only imported here)
+            from MCEVS.Optimization.Gradient_Free.Algorithm import run_gradient_free_optimization
             result = run_gradient_free_optimization(self)
 
         return result
@@ -143,7 +144,7 @@ class DesignProblem(object):
 
         # Operation default input values
         for segment in self.mission.segments:
-            if segment.kind not in ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise']:
+            if segment.kind not in fixed_duration_kinds(self.fidelity):
                 self.default_input_values[f'Mission|segment_{segment.id}|speed'] = [segment.speed, 'm/s']
                 self.default_input_values[f'Mission|segment_{segment.id}|distance'] = [segment.distance, 'm']
             if segment.kind == 'HoverClimbConstantSpeed':
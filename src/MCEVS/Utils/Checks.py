@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def check_fidelity_dict(fidelity: object, vehicle_config: str, modules_to_check=[]):
     """
     Validate the 'fidelity' dictionary according to model availability and coupling logic.
@@ -6,6 +9,8 @@ def check_fidelity_dict(fidelity: object, vehicle_config: str, modules_to_check=
     - Aerodynamics:
         - parasite model options depend on vehicle_config (unchanged from original)
         - induced model must be one of ["ParabolicDragPolar", "VortexLatticeMethod"]
+        - wetted_area_surrogate (a WettedAreaSurrogate of vehicle_config, or the path of a saved one)
+          requires the "ComponentBuildUp" parasite drag model
     - Stability (AoA trim @ cruise):
         - Allowed values: ["ManualFixedValue", "Automatic"]
         - If induced == "VortexLatticeMethod": AoA_trim['cruise'] must be "Automatic"
@@ -37,6 +42,14 @@ def check_fidelity_dict(fidelity: object, vehicle_config: str, modules_to_check=
                 if parasite_model not in ['WeightBasedRegression', 'ComponentBuildUp', 'BacchiniExperimentalFixedValueForLPC']:
                     raise ValueError('Parasite drag model should be in ["WeightBasedRegression", "ComponentBuildUp", "BacchiniExperimentalFixedValueForLPC"] for LiftPlusCruise')
 
+        # Wetted area surrogate of the component build-up
+        surrogate = aero.get('wetted_area_surrogate', None)
+        if surrogate is not None:
+            if aero.get('parasite', None) != 'ComponentBuildUp':
+                raise ValueError('wetted_area_surrogate is only used by the "ComponentBuildUp" parasite drag model')
+            if not isinstance(surrogate, str) and getattr(surrogate, 'configuration', None) != vehicle_config:
+                raise ValueError(f'wetted_area_surrogate should be a WettedAreaSurrogate of a {vehicle_config} (or the path of a saved one)')
+
         # Induced drag model constraints
         induced_model = aero.get('induced', None)
         if induced_model is not None:
@@ -50,6 +63,9 @@ def check_fidelity_dict(fidelity: object, vehicle_config: str, modules_to_check=
             if segment == 'hover_climb':
                 if power_model not in ['MomentumTheory', 'ModifiedMomentumTheory', 'BladeElementMomentumTheory']:
                     raise ValueError('Power model should be in ["MomentumTheory", "ModifiedMomentumTheory", "BladeElementMomentumTheory"]')
+            elif segment in ['time_resolved', 'deduplicate_segments']:
+                if not isinstance(power_model, bool):
+                    raise ValueError(f'{segment} should be either True or False')
 
     # Weight model checks (retain previous logic)
     if 'weight_model' in modules_to_check:
@@ -84,3 +100,42 @@ def check_fidelity_dict(fidelity: object, vehicle_config: str, modules_to_check=
             if cruise_trim != 'Automatic':
                 raise ValueError('When induced model is "VortexLatticeMethod", AoA_trim at cruise must be "Automatic" (manual fixed AoA is not allowed).')
         # If induced != VLM, both ManualFixedValue and Automatic are acceptable (already validated above).               
+
+
+def check_jacobian_nonzeros(prob: object, print_info=True):
+    """
+    Reports the number of nonzero entries of the partial Jacobians declared in a problem, i.e., the size of the
+    matrix assembled by DirectSolver(assemble_jac=True) and factorized at every Newton iteration.
+    The problem should have been set up.
+
+    Parameters
+    ----------
+    prob : om.Problem
+    print_info : bool
+
+    Returns
+    -------
+    dict with keys 'total' (total number of nonzeros) and 'by_component' (nonzeros of each component)
+    """
+    from openmdao.core.component import Component
+
+    by_component = {}
+    for comp in prob.model.system_iter(recurse=True, typ=Component):
+        nnz = 0
+        for meta in comp._subjacs_info.values():
+            if not meta.get('dependent', True):
+                continue
+            if meta.get('rows') is not None:
+                nnz += len(meta['rows'])
+            elif meta.get('diagonal'):
+                nnz += meta['shape'][0]
+            else:
+                nnz += int(np.prod(meta['shape']))
+        by_component[comp.pathname] = nnz
+
+    total = sum(by_component.values())
+
+    if print_info:
+        print(f'Jacobian nonzeros = {total} (in {len(by_component)} components)')
+
+    return {'total': total, 'by_component': by_component}
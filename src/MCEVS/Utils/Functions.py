@@ -79,3 +79,37 @@ class BoltzmanSigmoid(om.ExplicitComponent):
         t = inputs['t']
 
         partials['f', 't'] = b * c * np.exp(c * (tau - t)) / (np.exp(c * (tau - t)) + 1)**2
+
+
+class Maximum(om.ExplicitComponent):
+    """
+    Compute the (non-smooth) maximum of several scalars
+    Its derivative is one with respect to the largest input and zero otherwise
+    Parameters:
+            names 	: names of the inputs
+            units 	: units of the inputs and output
+    Inputs:
+            one scalar per name in names
+    Outputs:
+            fmax
+    """
+
+    def initialize(self):
+        self.options.declare('names', types=list, desc='Names of the inputs')
+        self.options.declare('units', default=None, allow_none=True, desc='Units of the inputs and output')
+
+    def setup(self):
+        units = self.options['units']
+        for name in self.options['names']:
+            self.add_input(name, units=units)
+        self.add_output('fmax', units=units)
+        self.declare_partials('fmax', self.options['names'])
+
+    def compute(self, inputs, outputs):
+        outputs['fmax'] = np.max([inputs[name] for name in self.options['names']])
+
+    def compute_partials(self, inputs, partials):
+        names = self.options['names']
+        k = np.argmax([inputs[name] for name in names])
+        for i, name in enumerate(names):
+            partials['fmax', name] = 1.0 if i == k else 0.0
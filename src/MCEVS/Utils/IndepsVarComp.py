@@ -1,4 +1,5 @@
 import numpy as np
+from MCEVS.Analyses.Power.TimeResolved import fixed_duration_kinds
 
 
 def promote_indeps_var_comp(ivc, vehicle, mission, fidelity):
@@ -83,26 +84,30 @@ def promote_indeps_var_comp(ivc, vehicle, mission, fidelity):
 
     # --- Mission parameters --- #
 
+    rpm_outputs = {}  # rotor speeds are shared among segments of the same kind
     for segment in mission.segments:
-        if segment.kind not in ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise', 'HoverStay']:
+        if segment.kind not in fixed_duration_kinds(fidelity):
             ivc.add_output(f'Mission|segment_{segment.id}|speed', segment.speed, units='m/s')
             ivc.add_output(f'Mission|segment_{segment.id}|distance', segment.distance, units='m')
         if segment.kind == 'HoverClimbConstantSpeed':
-            ivc.add_output('LiftRotor|HoverClimb|RPM', vehicle.lift_rotor.RPM['hover_climb'], units='rpm')
+            rpm_outputs['LiftRotor|HoverClimb|RPM'] = vehicle.lift_rotor.RPM['hover_climb']
         if segment.kind == 'CruiseConstantSpeed':
             if vehicle.configuration == 'Multirotor':
-                ivc.add_output('LiftRotor|Cruise|RPM', vehicle.lift_rotor.RPM['cruise'], units='rpm')
+                rpm_outputs['LiftRotor|Cruise|RPM'] = vehicle.lift_rotor.RPM['cruise']
             elif vehicle.configuration == 'LiftPlusCruise':
-                ivc.add_output('Propeller|Cruise|RPM', vehicle.propeller.RPM['cruise'], units='rpm')
+                rpm_outputs['Propeller|Cruise|RPM'] = vehicle.propeller.RPM['cruise']
         if segment.kind == 'ClimbConstantVyConstantVx':
             if vehicle.configuration == 'Multirotor':
-                ivc.add_output('LiftRotor|Climb|RPM', vehicle.lift_rotor.RPM['climb'], units='rpm')
+                rpm_outputs['LiftRotor|Climb|RPM'] = vehicle.lift_rotor.RPM['climb']
             elif vehicle.configuration == 'LiftPlusCruise':
-                ivc.add_output('Propeller|Climb|RPM', vehicle.propeller.RPM['climb'], units='rpm')
+                rpm_outputs['Propeller|Climb|RPM'] = vehicle.propeller.RPM['climb']
         if segment.kind == 'DescentConstantVyConstantVx':
             if vehicle.configuration == 'Multirotor':
-                ivc.add_output('LiftRotor|Descent|RPM', vehicle.lift_rotor.RPM['descent'], units='rpm')
+                rpm_outputs['LiftRotor|Descent|RPM'] = vehicle.lift_rotor.RPM['descent']
             elif vehicle.configuration == 'LiftPlusCruise':
-                ivc.add_output('Propeller|Descent|RPM', vehicle.propeller.RPM['descent'], units='rpm')
+                rpm_outputs['Propeller|Descent|RPM'] = vehicle.propeller.RPM['descent']
+
+    for name, rpm in rpm_outputs.items():
+        ivc.add_output(name, rpm, units='rpm')
 
     return ivc
@@ -0,0 +1,49 @@
+import importlib
+import types
+import sys
+
+# Optional backends, and what they are needed for (shown when they are missing)
+optional_backends = {'openvsp': 'the OpenVSP geometries and the wetted areas of the component build-up (fidelity one parasite drag)',
+                     'openaerostruct': 'the VLM aerodynamics (fidelity two induced drag)',
+                     'pymoo': 'the gradient-free optimization'}
+
+
+class LazyModule(types.ModuleType):
+    """
+    Placeholder of a module that is imported on first attribute access (e.g., vsp.Update()),
+    so that importing MCEVS (or starting a worker process) does not pay for backends it never uses.
+    A missing backend raises an ImportError saying what it is needed for, at first use.
+    """
+    def __init__(self, name: str):
+        super(LazyModule, self).__init__(name)
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            try:
+                module = importlib.import_module(self.__name__)
+            except ImportError as error:
+                backend = self.__name__.split('.')[0]
+                if backend not in optional_backends:
+                    raise
+                raise ImportError(f'{backend} is required for {optional_backends[backend]}, but it cannot be imported: {error}') from error
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'imported' if self.__dict__['_module'] is not None else 'not imported yet'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str):
+    """
+    Module if it is already imported, a LazyModule importing it on first use otherwise
+    """
+    return sys.modules[name] if name in sys.modules else LazyModule(name)
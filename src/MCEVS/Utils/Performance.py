@@ -12,10 +12,10 @@ def record_performance_by_segments(prob: object, config: str, mission: object):
 
         for i, segment in enumerate(mission.segments):
             if segment.kind in constant_segments:
-                P_propeller = np.ones_like(mission.t[i]) * prob.get_val(f'Power|Propeller|segment_{i+1}')[0]
-                P_lift_rotor = np.ones_like(mission.t[i]) * prob.get_val(f'Power|LiftRotor|segment_{i+1}')[0]
-                DL_propeller = np.ones_like(mission.t[i]) * prob.get_val(f'DiskLoading|Propeller|segment_{i+1}')[0]
-                DL_lift_rotor = np.ones_like(mission.t[i]) * prob.get_val(f'DiskLoading|LiftRotor|segment_{i+1}')[0]
+                P_propeller = np.ones_like(mission.trajectory.channel('t', i)) * prob.get_val(f'Power|Propeller|segment_{i+1}')[0]
+                P_lift_rotor = np.ones_like(mission.trajectory.channel('t', i)) * prob.get_val(f'Power|LiftRotor|segment_{i+1}')[0]
+                DL_propeller = np.ones_like(mission.trajectory.channel('t', i)) * prob.get_val(f'DiskLoading|Propeller|segment_{i+1}')[0]
+                DL_lift_rotor = np.ones_like(mission.trajectory.channel('t', i)) * prob.get_val(f'DiskLoading|LiftRotor|segment_{i+1}')[0]
 
                 mission.P['Propeller'].append(P_propeller)
                 mission.P['LiftRotor'].append(P_lift_rotor)
@@ -28,8 +28,8 @@ def record_performance_by_segments(prob: object, config: str, mission: object):
 
         for i, segment in enumerate(mission.segments):
             if segment.kind in constant_segments:
-                P_lift_rotor = np.ones_like(mission.t[i]) * prob.get_val(f'Power|LiftRotor|segment_{i+1}')[0]
-                DL_lift_rotor = np.ones_like(mission.t[i]) * prob.get_val(f'DiskLoading|LiftRotor|segment_{i+1}')[0]
+                P_lift_rotor = np.ones_like(mission.trajectory.channel('t', i)) * prob.get_val(f'Power|LiftRotor|segment_{i+1}')[0]
+                DL_lift_rotor = np.ones_like(mission.trajectory.channel('t', i)) * prob.get_val(f'DiskLoading|LiftRotor|segment_{i+1}')[0]
 
                 mission.P['LiftRotor'].append(P_lift_rotor)
                 mission.DL['LiftRotor'].append(DL_lift_rotor)
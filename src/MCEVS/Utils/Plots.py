@@ -9,24 +9,10 @@ def plot_mission_parameters(mission: object, print_info=False, save_fig=False):
         mission.print_info()
 
     # Preprocessing data
-    t = np.array([])
-    x, y = np.array([]), np.array([])
-    vx, vy = np.array([]), np.array([])
-    ax, ay = np.array([]), np.array([])
-    for t_segment in mission.t:
-        t = np.concatenate((t, t_segment))
-    for x_segment in mission.x:
-        x = np.concatenate((x, x_segment))
-    for y_segment in mission.y:
-        y = np.concatenate((y, y_segment))
-    for vx_segment in mission.vx:
-        vx = np.concatenate((vx, vx_segment))
-    for vy_segment in mission.vy:
-        vy = np.concatenate((vy, vy_segment))
-    for ax_segment in mission.ax:
-        ax = np.concatenate((ax, ax_segment))
-    for ay_segment in mission.ay:
-        ay = np.concatenate((ay, ay_segment))
+    t = mission.trajectory.channel('t')
+    x, y = mission.trajectory.channel('x'), mission.trajectory.channel('y')
+    vx, vy = mission.trajectory.channel('vx'), mission.trajectory.channel('vy')
+    ax, ay = mission.trajectory.channel('ax'), mission.trajectory.channel('ay')
 
     # Plot position
     plt.figure(figsize=(6, 3.5))
@@ -91,7 +77,7 @@ def plot_performance_by_segments(mission: object, vehicle: object):
 
     for i, segment in enumerate(mission.segments):
         if segment.kind in constant_segments:
-            t = np.concatenate((t, mission.t[i]))
+            t = np.concatenate((t, mission.trajectory.channel('t', i)))
 
     if vehicle.configuration == 'LiftPlusCruise':
 
@@ -0,0 +1,230 @@
+from functools import lru_cache
+import numpy as np
+import pickle
+import json
+import io
+
+# Version of the serialization format; bump it (and convert older states in _upgrade) when the layout changes
+FORMAT_VERSION = 1
+
+# Header of the bytes of dumps(); the last byte is FORMAT_VERSION
+_header = b'MCEVS' + bytes([FORMAT_VERSION])
+
+
+@lru_cache(maxsize=None)
+def _serializable_classes():
+    """
+    Classes that may appear in a serialized object graph, by class name
+    """
+    from MCEVS.Vehicles.Container import LiftPlusCruiseEVTOL, MultirotorEVTOL
+    from MCEVS.Vehicles.Components.Wing import Wing
+    from MCEVS.Vehicles.Components.Airfoil import Airfoil
+    from MCEVS.Vehicles.Components.Fuselage import Fuselage
+    from MCEVS.Vehicles.Components.Landing_Gear import LandingGear
+    from MCEVS.Vehicles.Components.Rotors import LiftRotor, Propeller
+    from MCEVS.Vehicles.Components.Battery import Battery
+    from MCEVS.Vehicles.Components.Tails import HorizontalTail, VerticalTail
+    from MCEVS.Vehicles.Components.Boom import Boom
+    from MCEVS.Analyses.Weight.Analysis import VehicleWeight
+    from MCEVS.Missions import Container as missions
+    from MCEVS.Missions.Trajectory import MissionTrajectory
+
+    classes = [LiftPlusCruiseEVTOL, MultirotorEVTOL, Wing, Airfoil, Fuselage, LandingGear, LiftRotor, Propeller, Battery,
+               HorizontalTail, VerticalTail, Boom, VehicleWeight, missions.Mission, MissionTrajectory,
+               missions.HoverClimbConstantSpeed, missions.HoverClimbConstantAcceleration, missions.ClimbConstantVyConstantVx,
+               missions.ClimbConstantVyConstantAx, missions.NoCreditClimb, missions.TransitionConstantAcceleration,
+               missions.CruiseConstantSpeed, missions.DescentConstantVyConstantVx, missions.DescentConstantVyConstantAx,
+               missions.NoCreditDescent, missions.HoverDescentConstantDeceleration, missions.HoverDescentConstantSpeed,
+               missions.HoverStay, missions.ConstantPower, missions.ReserveCruise]
+
+    return {cls.__name__: cls for cls in classes}
+
+
+_primitive_types = (bool, int, float, str, type(None))
+_tags = ('__object__', '__array__', '__tuple__', '__scalar__')
+
+
+def _encode(value, arrays: dict):
+    """
+    JSON-compatible encoding of a value; arrays are moved to the arrays dict and referenced by key.
+    Objects become {'__object__': class name, 'state': encoded __dict__}, or {'__object__': class name, 'plain': __dict__}
+    when all their attributes are None, bool, int, float or str (restored without recursion).
+    """
+    if type(value) in _primitive_types:
+        return value
+    if isinstance(value, np.ndarray):
+        key = f'a{len(arrays)}'
+        arrays[key] = value
+        return {'__array__': key}
+    if isinstance(value, np.generic):
+        return {'__scalar__': value.dtype.str, 'value': value.item()}
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) and k not in _tags for k in value):
+            raise TypeError(f'Only dicts with string keys (other than {_tags}) can be serialized')
+        return {k: _encode(v, arrays) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_encode(v, arrays) for v in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode(v, arrays) for v in value]}
+
+    name = type(value).__name__
+    if _serializable_classes().get(name) is not type(value):
+        raise TypeError(f'Objects of type {name} cannot be serialized')
+    state = dict(vars(value))
+    if name == 'MissionTrajectory':
+        # Only the filled part of the buffers is stored
+        state['_data'] = {channel: value.channel(channel) for channel in value.channels}
+        state['_capacity'] = value.n_nodes
+    if all(type(v) in _primitive_types for v in state.values()):
+        return {'__object__': name, 'plain': state}
+    return {'__object__': name, 'state': {k: _encode(v, arrays) for k, v in state.items()}}
+
+
+def _decoder(arrays: dict):
+    """
+    Function decoding one encoded dict whose values are already decoded (usable as a json object_hook)
+    """
+    classes = _serializable_classes()
+
+    def decode(d):
+        if '__object__' in d:
+            # Objects are restored without calling __init__/_initialize
+            obj = object.__new__(classes[d['__object__']])
+            obj.__dict__.update(d['plain'] if 'plain' in d else d['state'])
+            return obj
+        if '__array__' in d:
+            return arrays[d['__array__']]
+        if '__tuple__' in d:
+            return tuple(d['__tuple__'])
+        if '__scalar__' in d:
+            return np.dtype(d['__scalar__']).type(d['value'])
+        return d
+
+    return decode
+
+
+def _decode(value, decode):
+    """
+    Bottom-up decoding of an encoded value that is not coming from json (where decode is the object_hook)
+    """
+    if type(value) is list:
+        return [_decode(v, decode) for v in value]
+    if type(value) is dict:
+        if 'plain' in value and '__object__' in value:
+            return decode(value)
+        return decode({k: _decode(v, decode) for k, v in value.items()})
+    return value
+
+
+def _upgrade(params: dict):
+    """
+    Converts the parameters of an older format version into the current one
+    """
+    if params.get('format') != 'MCEVS':
+        raise ValueError('Not a serialized MCEVS object')
+    if params['version'] > FORMAT_VERSION:
+        raise ValueError(f'Serialization format version {params["version"]} is newer than the supported one ({FORMAT_VERSION})')
+    return params
+
+
+def to_dict(obj: object):
+    """
+    Serializes a Mission, MultirotorEVTOL or LiftPlusCruiseEVTOL object (including their components, segments and trajectory)
+    Outputs:
+            params 	: flat, JSON-compatible parameter dict (with the format version)
+            arrays 	: dict of the numpy arrays referenced by params
+    """
+    arrays = {}
+    params = {'format': 'MCEVS', 'version': FORMAT_VERSION, 'type': type(obj).__name__, 'object': _encode(obj, arrays)}
+    return params, arrays
+
+
+def from_dict(params: dict, arrays: dict):
+    """
+    Inverse of to_dict
+    """
+    params = _upgrade(params)
+    return _decode(params['object'], _decoder(arrays))
+
+
+class _Unpickler(pickle.Unpickler):
+    """
+    Unpickler restricted to the classes of _serializable_classes() and to the numpy array and scalar constructors
+    """
+    _numpy_globals = ('dtype', 'ndarray', 'scalar', '_reconstruct', '_frombuffer')
+
+    def find_class(self, module, name):
+        cls = _serializable_classes().get(name)
+        if cls is not None and cls.__module__ == module:
+            return cls
+        if module.split('.')[0] == 'numpy' and name in self._numpy_globals:
+            return super(_Unpickler, self).find_class(module, name)
+        raise pickle.UnpicklingError(f'{module}.{name} cannot be deserialized')
+
+
+def dumps(obj: object):
+    """
+    Serializes a Mission, MultirotorEVTOL or LiftPlusCruiseEVTOL object into bytes, e.g., to send it to worker processes.
+    This is a pickle behind a format header: loads() restores a discretized mission several times faster than
+    rebuilding it, whereas a vehicle costs about as much to restore as to rebuild (what it carries is the state set
+    after construction, e.g., sized weights). Being tied to the attributes of the classes of this MCEVS version,
+    it is meant for transport; use save()/load() to store objects across versions.
+    """
+    name = type(obj).__name__
+    if name not in ('Mission', 'MultirotorEVTOL', 'LiftPlusCruiseEVTOL') or _serializable_classes()[name] is not type(obj):
+        raise TypeError(f'Objects of type {name} cannot be serialized')
+    return _header + pickle.dumps(obj, protocol=5)
+
+
+def loads(data: bytes):
+    """
+    Inverse of dumps (only the classes that dumps may write are restored)
+    """
+    if data[:len(_header) - 1] != _header[:-1]:
+        raise ValueError('Not a serialized MCEVS object')
+    if data[len(_header) - 1] != FORMAT_VERSION:
+        raise ValueError(f'Serialization format version {data[len(_header) - 1]} is not the supported one ({FORMAT_VERSION}); use save()/load()')
+    return _Unpickler(io.BytesIO(memoryview(data)[len(_header):])).load()
+
+
+def save(obj: object, path: str):
+    """
+    Saves an object into an .npz file: the parameter dict of to_dict() stored as JSON, along with the arrays.
+    The arrays are packed into one contiguous buffer per dtype, so that the .npz file only holds a few entries.
+    Unlike dumps(), the file is versioned (older versions are converted on loading) and readable without pickle.
+    """
+    params, arrays = to_dict(obj)
+
+    chunks, sizes, index = {}, {}, {}
+    for key, array in arrays.items():
+        dtype = array.dtype.str
+        index[key] = [dtype, list(array.shape), sizes.get(dtype, 0)]
+        chunks.setdefault(dtype, []).append(np.ravel(array))
+        sizes[dtype] = sizes.get(dtype, 0) + array.size
+    buffers = {dtype: f'buffer{i}' for i, dtype in enumerate(chunks)}
+    packed = {buffers[dtype]: np.concatenate(arrays_list) for dtype, arrays_list in chunks.items()}
+
+    with open(path, 'wb') as f:
+        np.savez(f,
+                 __params__=np.frombuffer(json.dumps(params).encode(), dtype=np.uint8),
+                 __index__=np.frombuffer(json.dumps({'arrays': index, 'buffers': buffers}).encode(), dtype=np.uint8),
+                 **packed)
+
+
+def load(path: str):
+    """
+    Loads an object saved with save()
+    """
+    with np.load(path, allow_pickle=False) as npz:
+        text = npz['__params__'].tobytes()
+        index = json.loads(npz['__index__'].tobytes())
+        buffers = {dtype: npz[name] for dtype, name in index['buffers'].items()}
+
+    arrays = {}
+    for key, (dtype, shape, offset) in index['arrays'].items():
+        size = int(np.prod(shape))
+        arrays[key] = buffers[dtype][offset:offset + size].reshape(shape)
+
+    # Objects are decoded by the json parser itself (object hook)
+    params = _upgrade(json.loads(text, object_hook=_decoder(arrays)))
+    return params['object']
@@ -1,8 +1,11 @@
 import numpy as np
 import openmdao.api as om
-from openaerostruct.meshing.mesh_generator import generate_mesh
-from openaerostruct.geometry.geometry_group import Geometry
-from openaerostruct.aerodynamics.aero_groups import AeroPoint
+from MCEVS.Utils.LazyImport import lazy_import
+
+# OpenAeroStruct is imported when the first VLM group is set up
+mesh_generator = lazy_import('openaerostruct.meshing.mesh_generator')
+geometry_group = lazy_import('openaerostruct.geometry.geometry_group')
+aero_groups = lazy_import('openaerostruct.aerodynamics.aero_groups')
 
 
 class VLMAeroSolverGroup(om.Group):
@@ -90,7 +93,7 @@ class VLMAeroSolverGroup(om.Group):
         }
 
         # Generate half-wing mesh of rectangular wing
-        mesh = generate_mesh(mesh_dict)
+        mesh = mesh_generator.generate_mesh(mesh_dict)
 
         # Define input surface dictionary for our wing
         surface = {
@@ -122,10 +125,10 @@ class VLMAeroSolverGroup(om.Group):
 
         # Add geometry group to the problem and add suface as a sub group.
         # These groups are responsible for manipulating the geometry of the mesh.
-        self.add_subsystem(surface_name, Geometry(surface=surface))
+        self.add_subsystem(surface_name, geometry_group.Geometry(surface=surface))
 
         # Create the aero point group for this flight condition and add it to the model
-        self.add_subsystem(segment_name, AeroPoint(surfaces=[surface], rotational=False),
+        self.add_subsystem(segment_name, aero_groups.AeroPoint(surfaces=[surface], rotational=False),
                            promotes_inputs=[('v', 'Aero|speed'), ('alpha', 'Aero|AoA')],
                            promotes_outputs=[(f'{surface_name}_perf.CL', 'Aero|CL'),
                                              (f'{surface_name}_perf.CDi', 'Aero|CDi'),
@@ -0,0 +1,260 @@
+from collections import OrderedDict
+import numpy as np
+import threading
+import hashlib
+import sqlite3
+import json
+import time
+import os
+
+# Part of every cache key; bump it whenever the OpenVSP geometry of calc_wetted_area() changes
+WETTED_AREA_MODEL_VERSION = 1
+
+
+def default_cache_dir():
+    """
+    Directory of the persistent caches: $MCEVS_CACHE_DIR if set, ~/.cache/MCEVS otherwise
+    """
+    return os.environ.get('MCEVS_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'MCEVS'))
+
+
+def _canonical(value):
+    """
+    JSON-compatible canonical form of a geometric input (numbers and arrays become lists of floats)
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return np.asarray(value, dtype=float).ravel().tolist()
+
+
+def wetted_area_inputs(vehicle: object):
+    """
+    Exactly the geometric inputs read by calc_wetted_area(), for a Multirotor or a LiftPlusCruise vehicle
+    """
+    config = vehicle.configuration
+    inputs = {'configuration': config,
+              'fuselage_length': vehicle.fuselage.length,
+              'fuselage_max_diameter': vehicle.fuselage.max_diameter,
+              'gear_type': vehicle.landing_gear.gear_type,
+              'strut_length': vehicle.landing_gear.strut_length,
+              'n_lift_rotor': vehicle.lift_rotor.n_rotor,
+              'r_lift_rotor': vehicle.lift_rotor.radius}
+
+    if config == 'Multirotor':
+        inputs['skid_heights'] = vehicle.landing_gear.skid_heights
+        inputs['skid_length'] = vehicle.landing_gear.skid_length
+
+    elif config == 'LiftPlusCruise':
+        inputs['wing_area'] = vehicle.wing.area
+        inputs['wing_aspect_ratio'] = vehicle.wing.aspect_ratio
+        inputs['htail_area'] = vehicle.horizontal_tail.area
+        inputs['htail_aspect_ratio'] = vehicle.horizontal_tail.aspect_ratio
+        inputs['vtail_area'] = vehicle.vertical_tail.area
+        inputs['vtail_aspect_ratio'] = vehicle.vertical_tail.aspect_ratio
+        inputs['boom_length'] = vehicle.boom.length
+        inputs['boom_max_diameter'] = vehicle.boom.max_diameter
+
+    return {name: _canonical(value) for name, value in inputs.items()}
+
+
+def wetted_area_key(vehicle: object):
+    """
+    Canonical hash (SHA-256) of the geometric inputs of calc_wetted_area() and of the geometry model version
+    """
+    text = json.dumps({'version': WETTED_AREA_MODEL_VERSION, 'inputs': wetted_area_inputs(vehicle)}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class MemoryWettedAreaCache(object):
+    """
+    Bounded (least recently used) in-memory cache of OpenVSP wetted areas, keyed by wetted_area_key();
+    the default cache of calc_wetted_area(), which writes nothing to disk.
+    Hits and misses are counted for this process (self.hits, self.misses).
+    Parameters:
+            maxsize : maximum number of entries
+    """
+
+    def __init__(self, maxsize=1024):
+        super(MemoryWettedAreaCache, self).__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+
+    def _lookup(self, key: str):
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: dict):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _count(self, name: str):
+        setattr(self, name, getattr(self, name) + 1)
+
+    def get(self, key: str):
+        """
+        Cached entry for a key, or None (counted as a hit or a miss)
+        """
+        value = self._lookup(key)
+        self._count('misses' if value is None else 'hits')
+        return value
+
+    def set(self, key: str, value: dict, inputs=None):
+        """
+        Stores an entry, evicting the least recently used entry when full
+        """
+        self._store(key, value)
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics
+        """
+        self._memory.clear()
+        self.hits = self.misses = 0
+
+    def statistics(self):
+        """
+        Hit/miss statistics and number of entries
+        """
+        n_calls = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / n_calls if n_calls > 0 else 0.0,
+                'n_entries': len(self._memory),
+                'maxsize': self.maxsize}
+
+
+class WettedAreaCache(MemoryWettedAreaCache):
+    """
+    Persistent (SQLite) cache of OpenVSP wetted areas, keyed by wetted_area_key(), in front of which the most
+    recently used entries are kept in memory (see MemoryWettedAreaCache).
+    The database is opened in WAL mode with a busy timeout, so that concurrent local processes
+    (e.g., parallel sweeps or optimizer workers) can read and write it at the same time;
+    each process (and thread) uses its own connection. Entries are stored as JSON.
+    Hits and misses are counted for this process (self.hits, self.misses) and for all processes
+    sharing the database (see statistics()); the shared counts are written in batches of flush_every,
+    with the next store, and by statistics(), so that lookups served from memory never write to the database.
+    Parameters:
+            path 		: SQLite database file (default: wetted_area.sqlite in default_cache_dir())
+            timeout 	: how long to wait for a lock held by another process [s]
+            maxsize 	: maximum number of entries kept in memory
+            flush_every : number of lookups after which the shared counts are written
+    """
+
+    def __init__(self, path=None, timeout=60.0, maxsize=1024, flush_every=1000):
+        super(WettedAreaCache, self).__init__(maxsize)
+        self.path = os.path.join(default_cache_dir(), 'wetted_area.sqlite') if path is None else path
+        self.timeout = timeout
+        self.flush_every = flush_every
+        self._unflushed = {'hits': 0, 'misses': 0}
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connection() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS wetted_area (key TEXT PRIMARY KEY, inputs TEXT, value TEXT, created REAL)')
+            connection.execute('CREATE TABLE IF NOT EXISTS statistics (name TEXT PRIMARY KEY, count INTEGER)')
+            connection.execute("INSERT OR IGNORE INTO statistics VALUES ('hits', 0), ('misses', 0)")
+
+    def _connection(self):
+        """
+        Connection of the current process and thread (connections are not shared across fork)
+        """
+        if getattr(self._local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return self._local.connection
+
+    def _count(self, name: str):
+        super(WettedAreaCache, self)._count(name)
+        self._unflushed[name] += 1
+        if sum(self._unflushed.values()) >= self.flush_every:
+            with self._connection() as connection:
+                self._flush(connection)
+
+    def _flush(self, connection):
+        """
+        Adds the counts of this process that are not written yet to the shared counts (within a transaction)
+        """
+        for name, count in self._unflushed.items():
+            if count > 0:
+                connection.execute('UPDATE statistics SET count = count + ? WHERE name = ?', (count, name))
+        self._unflushed = {'hits': 0, 'misses': 0}
+
+    def get(self, key: str):
+        """
+        Cached entry for a key (from memory, or from the database), or None (counted as a hit or a miss)
+        """
+        value = self._lookup(key)
+        if value is None:
+            row = self._connection().execute('SELECT value FROM wetted_area WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+                self._store(key, value)
+        self._count('misses' if value is None else 'hits')
+        return value
+
+    def set(self, key: str, value: dict, inputs=None):
+        """
+        Stores an entry (a JSON-compatible dict); concurrent writers of the same key store the same value
+        """
+        self._store(key, value)
+        with self._connection() as connection:
+            connection.execute('INSERT OR REPLACE INTO wetted_area VALUES (?, ?, ?, ?)',
+                               (key, json.dumps(inputs, sort_keys=True), json.dumps(value), time.time()))
+            self._flush(connection)
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics
+        """
+        super(WettedAreaCache, self).clear()
+        self._unflushed = {'hits': 0, 'misses': 0}
+        with self._connection() as connection:
+            connection.execute('DELETE FROM wetted_area')
+            connection.execute('UPDATE statistics SET count = 0')
+
+    def statistics(self):
+        """
+        Hit/miss statistics of this process and of all processes sharing the database, and the number of entries
+        """
+        with self._connection() as connection:
+            self._flush(connection)
+            shared = dict(connection.execute('SELECT name, count FROM statistics').fetchall())
+            n_entries = connection.execute('SELECT COUNT(*) FROM wetted_area').fetchone()[0]
+        n_process = self.hits + self.misses
+        n_shared = shared['hits'] + shared['misses']
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / n_process if n_process > 0 else 0.0,
+                'shared_hits': shared['hits'],
+                'shared_misses': shared['misses'],
+                'shared_hit_rate': shared['hits'] / n_shared if n_shared > 0 else 0.0,
+                'n_entries': n_entries,
+                'n_memory_entries': len(self._memory),
+                'path': self.path}
+
+
+_default_cache = None
+_default_persistent_cache = None
+
+
+def get_wetted_area_cache(persistent=False):
+    """
+    Process-wide MemoryWettedAreaCache (default), or with persistent=True, process-wide WettedAreaCache
+    at the default location (opt-in: the database is created in default_cache_dir())
+    """
+    global _default_cache, _default_persistent_cache
+    if persistent:
+        if _default_persistent_cache is None:
+            _default_persistent_cache = WettedAreaCache()
+        return _default_persistent_cache
+    if _default_cache is None:
+        _default_cache = MemoryWettedAreaCache()
+    return _default_cache
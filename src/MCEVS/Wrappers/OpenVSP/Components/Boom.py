@@ -1,12 +1,11 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
+
+vsp = lazy_import('openvsp')
 
 
 def NASA_QR_Boom(n_lift_rotor=4, r_lift_rotor=9.159, l_fuse=21.0, d_fuse_max=6.745500, fuse_id=None):
 
     X_Rot = [0.0000000, 180.0000, 0.000000, 180.0000]
-    Span = [[6.4655212, 5.974479], [6.4655212, 5.974479], [2.4901480, 2.023700, 8.100000], [2.4901480, 2.023700, 8.100000]]
-    Root_Chord = [[4.4800000, 2.800000], [4.4800000, 2.800000], [4.2666667, 3.266667, 2.770833], [4.2666667, 3.266667, 2.770833]]
-    Tip_Chord = [[2.8000000, 1.120000], [2.8000000, 1.120000], [3.2666667, 2.770833, 1.066667], [3.2666667, 2.770833, 1.066667]]
     Sweep = [[-45.000000, -45.00000], [-45.000000, -45.00000], [46.685950, 46.68595, 40.00000], [46.685950, 46.68595, 40.00000]]
     Sweep_Location = [[0.0000000, 0.000000], [0.0000000, 0.000000], [0.0000000, 0.000000, 0.000000], [0.0000000, 0.000000, 0.000000]]
     Sec_SW_Location = [[1.0000000, 1.000000], [1.0000000, 1.000000], [1.0000000, 1.000000, 1.000000], [1.0000000, 1.000000, 1.000000]]
@@ -15,6 +14,8 @@ def NASA_QR_Boom(n_lift_rotor=4, r_lift_rotor=9.159, l_fuse=21.0, d_fuse_max=6.7
     Dihedral = [[8.0000000, 8.000000], [-8.0000000, -8.000000], [11.500000, 17.00000, 21.00000], [-11.500000, -17.00000, -21.00000]]
     SectTess_U = [[2.0000000, 2.000000], [2.0000000, 2.000000], [2.0000000, 2.000000, 2.000000], [2.0000000, 2.000000, 2.000000]]
 
+    Span, Root_Chord, Tip_Chord = NASA_QR_Boom_planform(r_lift_rotor, l_fuse)
+
     boom_ids = []
     for i in range(int(n_lift_rotor)):
         boom_id = vsp.AddGeom('WING', fuse_id)
@@ -25,12 +26,6 @@ def NASA_QR_Boom(n_lift_rotor=4, r_lift_rotor=9.159, l_fuse=21.0, d_fuse_max=6.7
         boom_surf = vsp.GetXSecSurf(boom_id, 0)
         xsec_num = vsp.GetNumXSec(boom_surf)
 
-        for j in range(len(Span[i])):
-            # Span[i][j] 			= Span[i][j]/21.0*l_fuse/2.5*r_lift_rotor
-            Span[i][j] = Span[i][j] / 21.0 * l_fuse * r_lift_rotor / (9.159 * 0.3048)
-            Root_Chord[i][j] = Root_Chord[i][j] / 21.0 * l_fuse * r_lift_rotor / (9.159 * 0.3048)
-            Tip_Chord[i][j] = Tip_Chord[i][j] / 21.0 * l_fuse * r_lift_rotor / (9.159 * 0.3048)
-
         vsp.SetParmVal(boom_id, 'X_Rel_Location', 'XForm', 0.0)
         vsp.SetParmVal(boom_id, 'Y_Rel_Location', 'XForm', 0.0)
         vsp.SetParmVal(boom_id, 'Z_Rel_Location', 'XForm', 0.0)
@@ -73,6 +68,36 @@ def NASA_QR_Boom(n_lift_rotor=4, r_lift_rotor=9.159, l_fuse=21.0, d_fuse_max=6.7
     return boom_ids
 
 
+def NASA_QR_Boom_planform(r_lift_rotor: float, l_fuse: float):
+    """
+    Span, root chord and tip chord of each section of each boom, scaled from the baseline to the rotor radius and fuselage length
+    """
+    Span = [[6.4655212, 5.974479], [6.4655212, 5.974479], [2.4901480, 2.023700, 8.100000], [2.4901480, 2.023700, 8.100000]]
+    Root_Chord = [[4.4800000, 2.800000], [4.4800000, 2.800000], [4.2666667, 3.266667, 2.770833], [4.2666667, 3.266667, 2.770833]]
+    Tip_Chord = [[2.8000000, 1.120000], [2.8000000, 1.120000], [3.2666667, 2.770833, 1.066667], [3.2666667, 2.770833, 1.066667]]
+
+    for i in range(len(Span)):
+        for j in range(len(Span[i])):
+            # Span[i][j] 			= Span[i][j]/21.0*l_fuse/2.5*r_lift_rotor
+            Span[i][j] = Span[i][j] / 21.0 * l_fuse * r_lift_rotor / (9.159 * 0.3048)
+            Root_Chord[i][j] = Root_Chord[i][j] / 21.0 * l_fuse * r_lift_rotor / (9.159 * 0.3048)
+            Tip_Chord[i][j] = Tip_Chord[i][j] / 21.0 * l_fuse * r_lift_rotor / (9.159 * 0.3048)
+
+    return Span, Root_Chord, Tip_Chord
+
+
+def update_NASA_QR_Boom(boom_ids: list, r_lift_rotor: float, l_fuse: float):
+    """
+    Sets the planform of booms built by NASA_QR_Boom() in place (vsp.Update() is left to the caller)
+    """
+    Span, Root_Chord, Tip_Chord = NASA_QR_Boom_planform(r_lift_rotor, l_fuse)
+    for i, boom_id in enumerate(boom_ids):
+        for j in range(1, len(Span[i]) + 1):
+            vsp.SetParmVal(boom_id, 'Span', f'XSec_{j}', Span[i][j - 1])
+            vsp.SetParmVal(boom_id, 'Root_Chord', f'XSec_{j}', Root_Chord[i][j - 1])
+            vsp.SetParmVal(boom_id, 'Tip_Chord', f'XSec_{j}', Tip_Chord[i][j - 1])
+
+
 def NASA_LPC_Boom(l_boom: float, d_boom: float, n_lift_rotor=4, r_lift_rotor=1.0, l_fuse=30.0, wing_AR=12.12761, wing_S=210.27814, wing_id=None):
 
     # Parameters
@@ -86,7 +111,7 @@ def NASA_LPC_Boom(l_boom: float, d_boom: float, n_lift_rotor=4, r_lift_rotor=1.0
     # wing_Z0 = (8.499 - 4.249) / 30 * l_fuse
 
     if n_lift_rotor == 4:
-        X_Rel_Locations = [-1.148 if r_lift_rotor <= 1.6 else -1.500]
+        X_Rel_Locations = [NASA_LPC_Boom_X_location(r_lift_rotor)]
         Y_Rel_Locations = [0.00]
         Z_Rel_Locations = [-0.20]
         U_Attach_Locs = [0.31]
@@ -123,3 +148,23 @@ def NASA_LPC_Boom(l_boom: float, d_boom: float, n_lift_rotor=4, r_lift_rotor=1.0
             vsp.SetParmVal(vsp.GetXSecParm(xsec, 'Circle_Diameter'), d_boom)
 
     return boom_ids
+
+
+def NASA_LPC_Boom_X_location(r_lift_rotor: float):
+    """
+    Relative X location of the booms of a 4-rotor LPC (moved aft for large rotors)
+    """
+    return -1.148 if r_lift_rotor <= 1.6 else -1.500
+
+
+def update_NASA_LPC_Boom(boom_ids: list, l_boom: float, d_boom: float, n_lift_rotor=4, r_lift_rotor=1.0):
+    """
+    Sets length, diameter and (4 rotors) location of booms built by NASA_LPC_Boom() in place (vsp.Update() is left to the caller)
+    """
+    for boom_id in boom_ids:
+        vsp.SetParmVal(boom_id, 'Length', 'Design', l_boom)
+        if n_lift_rotor == 4:
+            vsp.SetParmVal(boom_id, 'X_Rel_Location', 'XForm', NASA_LPC_Boom_X_location(r_lift_rotor))
+        boom_surf = vsp.GetXSecSurf(boom_id, 0)
+        for i in range(1, vsp.GetNumXSec(boom_surf) - 1):
+            vsp.SetParmVal(vsp.GetXSecParm(vsp.GetXSec(boom_surf, i), 'Circle_Diameter'), d_boom)
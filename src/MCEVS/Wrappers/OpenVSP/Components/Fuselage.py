@@ -1,4 +1,6 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
+
+vsp = lazy_import('openvsp')
 
 
 def NASA_QR_Fuselage(l_fuse=21.0, d_fuse_max=6.745500):
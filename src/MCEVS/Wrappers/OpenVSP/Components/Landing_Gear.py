@@ -1,6 +1,8 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
 import numpy as np
 
+vsp = lazy_import('openvsp')
+
 
 def NASA_QR_Landing_Gear(gear_type: str, skid_heights=[2.46136, 3.00000], skid_length=9.36364, l_strut=0.3048, fuse_id=None):
 
@@ -1,6 +1,8 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
 import numpy as np
 
+vsp = lazy_import('openvsp')
+
 
 def Human(N_PAX: int, config: str):
 
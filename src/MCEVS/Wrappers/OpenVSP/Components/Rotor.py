@@ -1,5 +1,7 @@
 import MCEVS
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
+
+vsp = lazy_import('openvsp')
 
 
 def NASA_QR_Lift_Rotor(n_lift_rotor=4, r_lift_rotor=9.159, n_blade=5, r_hub=None, l_fuse=21.0, d_fuse_max=6.745500, boom_ids=[None]):
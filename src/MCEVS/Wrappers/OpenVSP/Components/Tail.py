@@ -1,6 +1,8 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
 import numpy as np
 
+vsp = lazy_import('openvsp')
+
 
 def NASA_LPC_Horizontal_Tail(area=19.75560, aspect_ratio=2.15182, l_fuse=30.0, fuse_id=None):
 
@@ -11,7 +13,6 @@ def NASA_LPC_Horizontal_Tail(area=19.75560, aspect_ratio=2.15182, l_fuse=30.0, f
     # x_pos_base = 27.4277
     # y_pos_base = 0.00000
     # z_pos_base = 8.00806
-    tr_base = 0.60
 
     htail_id = vsp.AddGeom('WING', fuse_id)
 
@@ -28,11 +29,7 @@ def NASA_LPC_Horizontal_Tail(area=19.75560, aspect_ratio=2.15182, l_fuse=30.0, f
     vsp.SetParmVal(htail_id, 'V_Attach_Location', 'Attach', 0.7500)
 
     # Calculating other params
-    S = area
-    AR = aspect_ratio
-    b = np.sqrt(S * AR) / 2
-    rc = 2 * S / b / (1 + tr_base) / 2
-    tc = rc * tr_base
+    b, rc, tc = NASA_LPC_Horizontal_Tail_planform(area, aspect_ratio)
 
     vsp.SetParmValUpdate(htail_id, 'Span', 'XSec_1', b)
     vsp.SetParmValUpdate(htail_id, 'Root_Chord', 'XSec_1', rc)
@@ -71,9 +68,6 @@ def NASA_LPC_Vertical_Tail(area=27.34325, aspect_ratio=1.17990, l_fuse=30.0, fus
 
     # Baseline params
 
-    Span = [1.1416544, 0.427290, 0.520148, 3.590907]
-    Root_Chord = [9.7371946, 5.948228, 5.264780, 4.784385]
-    Tip_Chord = [5.9482276, 5.264780, 4.784385, 2.668020]
     Sweep = [15.000000, 15.00000, 15.00000, 15.00000]
     Sweep_Location = [1.0000000, 1.000000, 1.000000, 1.000000]
     Sec_SW_Location = [0.6333330, 0.666667, 0.583333, 0.300000]
@@ -113,27 +107,7 @@ def NASA_LPC_Vertical_Tail(area=27.34325, aspect_ratio=1.17990, l_fuse=30.0, fus
     vsp.SetParmVal(vtail_id, 'V_Attach_Location', 'Attach', 0.7500000)
 
     # Calculating other params
-    S = area
-    AR = aspect_ratio
-    b = np.sqrt(S * AR)
-    Span_i = []
-    Root_Chord_i = []
-    Tip_Chord_i = []
-
-    for i in range(len(Span)):
-
-        # Adjusting span
-        span_i = Span[i] / 5.68 * b
-        Span_i.append(span_i)
-
-        # Adjusting root and tip chords
-        area_i = (Root_Chord[i] + Tip_Chord[i]) / 2 * Span[i]
-        S_i = area_i / 27.34325 * S
-        tr_i = Tip_Chord[i] / Root_Chord[i]
-        rc_i = 2.0 * S_i / span_i / (1 + tr_i)
-        tc_i = tr_i * rc_i
-        Root_Chord_i.append(rc_i)
-        Tip_Chord_i.append(tc_i)
+    Span_i, Root_Chord_i, Tip_Chord_i = NASA_LPC_Vertical_Tail_planform(area, aspect_ratio)
 
     for i in range(1, 5):
         vsp.SetParmValUpdate(vtail_id, 'Span', f'XSec_{i}', Span_i[i - 1])
@@ -169,3 +143,73 @@ def NASA_LPC_Vertical_Tail(area=27.34325, aspect_ratio=1.17990, l_fuse=30.0, fus
         vsp.SetParmVal(vsp.GetXSecParm(vtail_xsec, 'CamberLoc'), 0.0)
 
     return vtail_id
+
+
+def NASA_LPC_Horizontal_Tail_planform(area: float, aspect_ratio: float):
+    """
+    Half span, root chord and tip chord of the horizontal tail for the given area and aspect ratio
+    """
+    tr_base = 0.60
+
+    S = area
+    AR = aspect_ratio
+    b = np.sqrt(S * AR) / 2
+    rc = 2 * S / b / (1 + tr_base) / 2
+    tc = rc * tr_base
+
+    return b, rc, tc
+
+
+def update_NASA_LPC_Horizontal_Tail(htail_id: str, area: float, aspect_ratio: float):
+    """
+    Sets the planform of a horizontal tail built by NASA_LPC_Horizontal_Tail() in place (vsp.Update() is left to the caller)
+    """
+    b, rc, tc = NASA_LPC_Horizontal_Tail_planform(area, aspect_ratio)
+    vsp.SetParmVal(htail_id, 'Span', 'XSec_1', b)
+    vsp.SetParmVal(htail_id, 'Root_Chord', 'XSec_1', rc)
+    vsp.SetParmVal(htail_id, 'Tip_Chord', 'XSec_1', tc)
+
+
+def NASA_LPC_Vertical_Tail_planform(area: float, aspect_ratio: float):
+    """
+    Span, root chord and tip chord of each vertical tail section, scaled from the baseline to the given area and aspect ratio
+    """
+    # Baseline params
+    Span = [1.1416544, 0.427290, 0.520148, 3.590907]
+    Root_Chord = [9.7371946, 5.948228, 5.264780, 4.784385]
+    Tip_Chord = [5.9482276, 5.264780, 4.784385, 2.668020]
+
+    S = area
+    AR = aspect_ratio
+    b = np.sqrt(S * AR)
+    Span_i = []
+    Root_Chord_i = []
+    Tip_Chord_i = []
+
+    for i in range(len(Span)):
+
+        # Adjusting span
+        span_i = Span[i] / 5.68 * b
+        Span_i.append(span_i)
+
+        # Adjusting root and tip chords
+        area_i = (Root_Chord[i] + Tip_Chord[i]) / 2 * Span[i]
+        S_i = area_i / 27.34325 * S
+        tr_i = Tip_Chord[i] / Root_Chord[i]
+        rc_i = 2.0 * S_i / span_i / (1 + tr_i)
+        tc_i = tr_i * rc_i
+        Root_Chord_i.append(rc_i)
+        Tip_Chord_i.append(tc_i)
+
+    return Span_i, Root_Chord_i, Tip_Chord_i
+
+
+def update_NASA_LPC_Vertical_Tail(vtail_id: str, area: float, aspect_ratio: float):
+    """
+    Sets the planform of a vertical tail built by NASA_LPC_Vertical_Tail() in place (vsp.Update() is left to the caller)
+    """
+    Span_i, Root_Chord_i, Tip_Chord_i = NASA_LPC_Vertical_Tail_planform(area, aspect_ratio)
+    for i in range(1, 5):
+        vsp.SetParmVal(vtail_id, 'Span', f'XSec_{i}', Span_i[i - 1])
+        vsp.SetParmVal(vtail_id, 'Root_Chord', f'XSec_{i}', Root_Chord_i[i - 1])
+        vsp.SetParmVal(vtail_id, 'Tip_Chord', f'XSec_{i}', Tip_Chord_i[i - 1])
@@ -1,15 +1,14 @@
 import MCEVS
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
 import numpy as np
 
+vsp = lazy_import('openvsp')
+
 
 def NASA_LPC_Wing(airfoil='LS417', area=210.27814, aspect_ratio=12.12761, l_fuse=30.0, fuse_id=None):
 
     # Baseline params
 
-    Span = [14.745022, 6.626930, 2.083091, 1.809956]
-    Root_Chord = [5.4432819, 4.130830, 3.304664, 2.840884]
-    Tip_Chord = [4.1308305, 3.304664, 2.840884, 1.043961]
     Sweep = [0.0000000, 0.000000, 3.636364, 8.000000]
     Sweep_Location = [0.7000000, 0.700000, 0.700000, 0.700000]
     Sec_SW_Location = [1.0000000, 1.000000, 1.000000, 1.000000]
@@ -30,27 +29,7 @@ def NASA_LPC_Wing(airfoil='LS417', area=210.27814, aspect_ratio=12.12761, l_fuse
     OutLEDihedral = [-2.2667261, -2.583862, -3.114677, -3.157360]
 
     # Calculating other params
-    S = area
-    AR = aspect_ratio
-    b = np.sqrt(S * AR)  # wing span
-    Span_i = []
-    Root_Chord_i = []
-    Tip_Chord_i = []
-
-    for i in range(len(Span)):
-
-        # Adjusting span
-        span_i = Span[i] / 25.26 * b / 2
-        Span_i.append(span_i)
-
-        # Adjusting root and tip chords
-        area_i = (Root_Chord[i] + Tip_Chord[i]) / 2 * Span[i]
-        S_i = area_i / 210.27814 * S
-        tr_i = Tip_Chord[i] / Root_Chord[i]
-        rc_i = 2.0 * S_i / span_i / (1 + tr_i)
-        tc_i = tr_i * rc_i
-        Root_Chord_i.append(rc_i)
-        Tip_Chord_i.append(tc_i)
+    Span_i, Root_Chord_i, Tip_Chord_i = NASA_LPC_Wing_planform(area, aspect_ratio)
 
     wing_id = vsp.AddGeom('WING', fuse_id)
     vsp.InsertXSec(wing_id, 1, vsp.XS_FILE_AIRFOIL)
@@ -134,3 +113,48 @@ def NASA_LPC_Wing(airfoil='LS417', area=210.27814, aspect_ratio=12.12761, l_fuse
     # 	vsp.SetParmVal(vsp.GetXSecParm(wing_xsec, 'CamberLoc'), 0.4)
 
     return wing_id
+
+
+def NASA_LPC_Wing_planform(area: float, aspect_ratio: float):
+    """
+    Span, root chord and tip chord of each wing section, scaled from the baseline to the given area and aspect ratio
+    """
+    # Baseline params
+    Span = [14.745022, 6.626930, 2.083091, 1.809956]
+    Root_Chord = [5.4432819, 4.130830, 3.304664, 2.840884]
+    Tip_Chord = [4.1308305, 3.304664, 2.840884, 1.043961]
+
+    S = area
+    AR = aspect_ratio
+    b = np.sqrt(S * AR)  # wing span
+    Span_i = []
+    Root_Chord_i = []
+    Tip_Chord_i = []
+
+    for i in range(len(Span)):
+
+        # Adjusting span
+        span_i = Span[i] / 25.26 * b / 2
+        Span_i.append(span_i)
+
+        # Adjusting root and tip chords
+        area_i = (Root_Chord[i] + Tip_Chord[i]) / 2 * Span[i]
+        S_i = area_i / 210.27814 * S
+        tr_i = Tip_Chord[i] / Root_Chord[i]
+        rc_i = 2.0 * S_i / span_i / (1 + tr_i)
+        tc_i = tr_i * rc_i
+        Root_Chord_i.append(rc_i)
+        Tip_Chord_i.append(tc_i)
+
+    return Span_i, Root_Chord_i, Tip_Chord_i
+
+
+def update_NASA_LPC_Wing(wing_id: str, area: float, aspect_ratio: float):
+    """
+    Sets the planform of a wing built by NASA_LPC_Wing() in place (vsp.Update() is left to the caller)
+    """
+    Span_i, Root_Chord_i, Tip_Chord_i = NASA_LPC_Wing_planform(area, aspect_ratio)
+    for i in range(1, 5):
+        vsp.SetParmVal(wing_id, 'Span', f'XSec_{i}', Span_i[i - 1])
+        vsp.SetParmVal(wing_id, 'Root_Chord', f'XSec_{i}', Root_Chord_i[i - 1])
+        vsp.SetParmVal(wing_id, 'Tip_Chord', f'XSec_{i}', Tip_Chord_i[i - 1])
@@ -0,0 +1,238 @@
+from MCEVS.Utils.LazyImport import lazy_import
+import tempfile
+import hashlib
+import shutil
+import json
+import os
+from .Cache import default_cache_dir, _canonical
+from .Standard_Vehicles import build_NASA_QuadRotor, build_NASA_LiftPlusCruise
+
+vsp = lazy_import('openvsp')
+
+# Part of every key of the geometry store; bump it whenever the builders of Standard_Vehicles change
+GEOMETRY_EXPORT_VERSION = 1
+
+# Files of an entry of the geometry store (the summary is written last and marks a complete entry)
+vsp3_file_name = 'vehicle.vsp3'
+degen_geom_file_name = 'degen_geom.csv'
+summary_file_name = 'summary.json'
+
+
+def geometry_inputs(vehicle: object):
+    """
+    Exactly the inputs read by the complete geometry builders of Standard_Vehicles (build_NASA_QuadRotor and
+    build_NASA_LiftPlusCruise), for a Multirotor or a LiftPlusCruise vehicle
+    """
+    config = vehicle.configuration
+    inputs = {'configuration': config,
+              'number_of_passenger': vehicle.fuselage.number_of_passenger,
+              'fuselage_length': vehicle.fuselage.length,
+              'fuselage_max_diameter': vehicle.fuselage.max_diameter,
+              'gear_type': vehicle.landing_gear.gear_type,
+              'strut_length': vehicle.landing_gear.strut_length,
+              'n_lift_rotor': vehicle.lift_rotor.n_rotor,
+              'n_blade_lift_rotor': vehicle.lift_rotor.n_blade,
+              'r_lift_rotor': vehicle.lift_rotor.radius}
+
+    if config == 'Multirotor':
+        inputs['r_hub_lift_rotor'] = vehicle.lift_rotor.hub_radius
+        inputs['skid_heights'] = vehicle.landing_gear.skid_heights
+        inputs['skid_length'] = vehicle.landing_gear.skid_length
+
+    elif config == 'LiftPlusCruise':
+        inputs['wing_area'] = vehicle.wing.area
+        inputs['wing_aspect_ratio'] = vehicle.wing.aspect_ratio
+        inputs['wing_airfoil'] = vehicle.wing.airfoil.name
+        inputs['htail_area'] = vehicle.horizontal_tail.area
+        inputs['htail_aspect_ratio'] = vehicle.horizontal_tail.aspect_ratio
+        inputs['vtail_area'] = vehicle.vertical_tail.area
+        inputs['vtail_aspect_ratio'] = vehicle.vertical_tail.aspect_ratio
+        inputs['l_hub_lift_rotor'] = vehicle.lift_rotor.hub_length
+        inputs['d_hub_lift_rotor'] = vehicle.lift_rotor.hub_max_diameter
+        inputs['n_propeller'] = vehicle.propeller.n_propeller
+        inputs['n_blade_propeller'] = vehicle.propeller.n_blade
+        inputs['r_propeller'] = vehicle.propeller.radius
+        inputs['l_hub_propeller'] = vehicle.propeller.hub_length
+        inputs['d_hub_propeller'] = vehicle.propeller.hub_max_diameter
+        inputs['boom_length'] = vehicle.boom.length
+        inputs['boom_max_diameter'] = vehicle.boom.max_diameter
+
+    return {name: _canonical(value) for name, value in inputs.items()}
+
+
+def geometry_key(vehicle: object):
+    """
+    Canonical hash (SHA-256) of the inputs of the geometry builders and of the export version
+    """
+    text = json.dumps({'version': GEOMETRY_EXPORT_VERSION, 'inputs': geometry_inputs(vehicle)}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class GeometryStore(object):
+    """
+    Content-addressed store of exported OpenVSP geometries, keyed by geometry_key(). Each entry is a directory with
+    the complete model (vehicle.vsp3), its DegenGeom (degen_geom.csv), and a summary (summary.json) of the inputs and
+    of the wetted area and volume of each component (CompGeom). Entries are built in a temporary directory and moved
+    in place at once, so that concurrent local processes never see a partial entry; a stored entry is never rebuilt.
+    Hits and misses are counted for this process (self.hits, self.misses).
+    Parameters:
+            directory 	: root directory of the store (default: geometry in default_cache_dir())
+    """
+
+    def __init__(self, directory=None):
+        super(GeometryStore, self).__init__()
+        self.directory = os.path.join(default_cache_dir(), 'geometry') if directory is None else directory
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, key: str, name=''):
+        """
+        Directory of an entry, or one of its files
+        """
+        return os.path.join(self.directory, key[:2], key, name)
+
+    def get(self, key: str):
+        """
+        Stored entry for a key (dict with the paths of its files and its summary), or None (counted as a hit or a miss)
+        """
+        try:
+            with open(self.path(key, summary_file_name)) as file:
+                summary = json.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._entry(key, summary)
+
+    def _entry(self, key: str, summary: dict):
+        return {'key': key,
+                'vsp3': self.path(key, vsp3_file_name),
+                'degen_geom': self.path(key, degen_geom_file_name),
+                'summary': summary}
+
+    def export(self, vehicle: object):
+        """
+        Stored entry of a vehicle, built (and stored) if missing. Building clears the current OpenVSP model.
+        """
+        key = geometry_key(vehicle)
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        os.makedirs(os.path.dirname(os.path.normpath(self.path(key))), exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.directory)
+        try:
+            summary = _export_geometry(vehicle, staging)
+            summary['inputs'] = geometry_inputs(vehicle)
+            with open(os.path.join(staging, summary_file_name), 'w') as file:
+                json.dump(summary, file)
+            try:
+                os.rename(staging, os.path.normpath(self.path(key)))
+            except OSError:
+                pass  # stored meanwhile by another process
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        return self._entry(key, summary)
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics
+        """
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        self.hits = self.misses = 0
+
+    def statistics(self):
+        """
+        Hit/miss statistics of this process, and the number and total size [bytes] of the stored entries
+        """
+        n_entries, size = 0, 0
+        for root, _, files in os.walk(self.directory):
+            if summary_file_name in files and '.staging-' not in root:
+                n_entries += 1
+                size += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        n = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / n if n > 0 else 0.0,
+                'n_entries': n_entries,
+                'size': size,
+                'directory': self.directory}
+
+
+def _export_geometry(vehicle: object, directory: str):
+    """
+    Builds the complete OpenVSP model of the vehicle, writes its vsp3 and DegenGeom files into a directory,
+    and returns the wetted area [m**2] and the volume [m**3] of each component (CompGeom)
+    """
+    vsp.ClearVSPModel()
+    if vehicle.configuration == 'Multirotor':
+        build_NASA_QuadRotor(vehicle)
+    elif vehicle.configuration == 'LiftPlusCruise':
+        build_NASA_LiftPlusCruise(vehicle)
+    vsp.Update()
+    vsp.WriteVSPFile(os.path.join(directory, vsp3_file_name))
+
+    vsp.SetComputationFileName(vsp.DEGEN_GEOM_CSV_TYPE, os.path.join(directory, degen_geom_file_name))
+    vsp.ComputeDegenGeom(vsp.SET_ALL, vsp.DEGEN_GEOM_CSV_TYPE)
+
+    vsp.ComputeCompGeom(vsp.SET_ALL, False, 0)
+    comp_res_id = vsp.FindLatestResultsID('Comp_Geom')
+    summary = {'components': list(vsp.GetStringResults(comp_res_id, 'Comp_Name')),
+               'wetted_area': list(vsp.GetDoubleResults(comp_res_id, 'Wet_Area')),
+               'volume': list(vsp.GetDoubleResults(comp_res_id, 'Wet_Vol'))}
+    vsp.ClearVSPModel()
+
+    return summary
+
+
+_default_store = None
+
+
+def get_geometry_store():
+    """
+    Process-wide GeometryStore at the default location
+    """
+    global _default_store
+    if _default_store is None:
+        _default_store = GeometryStore()
+    return _default_store
+
+
+def export_geometry(vehicle: object, store=True):
+    """
+    Stored entry of the complete geometry of a vehicle (see GeometryStore.get), exported on first use.
+    With store=True, the process-wide store of get_geometry_store() is used; a GeometryStore object may also be given.
+    """
+    return (get_geometry_store() if store is True else store).export(vehicle)
+
+
+def load_geometry(vehicle: object, store=True):
+    """
+    Loads the stored complete geometry of a vehicle into the (cleared) OpenVSP model, e.g., for plotting,
+    instead of building it again; returns the stored entry
+    """
+    entry = export_geometry(vehicle, store)
+    vsp.ClearVSPModel()
+    vsp.ReadVSPFile(entry['vsp3'])
+    vsp.Update()
+    return entry
+
+
+def geometry_summary(vehicle: object, store=True):
+    """
+    Wetted area [m**2] and volume [m**3] of each component of the complete geometry of a vehicle (from the store);
+    dict of component name -> {'wetted_area', 'volume'}, with suffixes (_1, _2, ...) on repeated names
+    """
+    summary = export_geometry(vehicle, store)['summary']
+    counts = {name: summary['components'].count(name) for name in summary['components']}
+    seen = {}
+    components = {}
+    for name, wetted_area, volume in zip(summary['components'], summary['wetted_area'], summary['volume']):
+        if counts[name] > 1:
+            seen[name] = seen.get(name, 0) + 1
+            name = f'{name}_{seen[name]}'
+        components[name] = {'wetted_area': wetted_area, 'volume': volume}
+    return components
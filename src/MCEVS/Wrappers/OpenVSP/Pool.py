@@ -0,0 +1,245 @@
+from multiprocessing.connection import wait
+from types import SimpleNamespace
+from collections import deque
+import multiprocessing as mp
+import traceback
+import time
+from .Cache import get_wetted_area_cache, wetted_area_key, wetted_area_inputs
+
+
+def geometry_from_inputs(inputs: dict):
+    """
+    Lightweight vehicle object holding only the geometric inputs of calc_wetted_area() (inverse of wetted_area_inputs()),
+    so that worker processes receive plain parameter dicts instead of vehicles
+    """
+    def scalar(value):
+        return value[0] if isinstance(value, list) and len(value) == 1 else value
+
+    params = {name: scalar(value) for name, value in inputs.items()}
+    vehicle = SimpleNamespace(configuration=params['configuration'],
+                              fuselage=SimpleNamespace(length=params['fuselage_length'], max_diameter=params['fuselage_max_diameter']),
+                              landing_gear=SimpleNamespace(gear_type=params['gear_type'], strut_length=params['strut_length'],
+                                                           skid_heights=inputs.get('skid_heights'), skid_length=params.get('skid_length')),
+                              lift_rotor=SimpleNamespace(n_rotor=params['n_lift_rotor'], radius=params['r_lift_rotor']))
+
+    if vehicle.configuration == 'LiftPlusCruise':
+        vehicle.wing = SimpleNamespace(area=params['wing_area'], aspect_ratio=params['wing_aspect_ratio'])
+        vehicle.horizontal_tail = SimpleNamespace(area=params['htail_area'], aspect_ratio=params['htail_aspect_ratio'])
+        vehicle.vertical_tail = SimpleNamespace(area=params['vtail_area'], aspect_ratio=params['vtail_aspect_ratio'])
+        vehicle.boom = SimpleNamespace(length=params['boom_length'], max_diameter=params['boom_max_diameter'])
+
+    return vehicle
+
+
+def _worker_main(connection, use_session: bool):
+    """
+    Worker loop: announces itself with (None, 'ready', None) once OpenVSP is imported, then receives (task id, geometric inputs)
+    and sends back (task id, 'ok', (res, boom_geometry)) or (task id, 'error', traceback); None stops the worker
+    """
+    from MCEVS.Wrappers.OpenVSP.Utils import _compute_wetted_area
+    from MCEVS.Wrappers.OpenVSP.Session import OpenVSPSession
+    import openvsp  # noqa: F401 (imported before announcing readiness; the MCEVS modules import it lazily)
+
+    session = OpenVSPSession() if use_session else None
+    connection.send((None, 'ready', None))
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        task_id, inputs = message
+        try:
+            vehicle = geometry_from_inputs(inputs)
+            result = session.wetted_area(vehicle) if use_session else _compute_wetted_area(vehicle)
+            connection.send((task_id, 'ok', result))
+        except Exception:
+            connection.send((task_id, 'error', traceback.format_exc()))
+
+
+class _Worker(object):
+    """
+    One worker process and its connection, with the task it is working on
+    """
+    def __init__(self, context, use_session: bool):
+        super(_Worker, self).__init__()
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_connection, use_session), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.started = time.perf_counter()
+        self.ready = False
+        self.task = None  # (task id, start time)
+
+    def submit(self, task_id: int, inputs: dict):
+        self.connection.send((task_id, inputs))
+        self.task = (task_id, time.perf_counter())
+
+    def stop(self, timeout=5.0):
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+class OpenVSPWorkerPool(object):
+    """
+    Pool of worker processes computing OpenVSP wetted areas concurrently. OpenVSP works on a single global model,
+    so each worker process owns its own OpenVSP state (and, with use_session=True, an OpenVSPSession).
+    Workers receive the geometric inputs of wetted_area_inputs() and return the wetted areas and the boom geometry.
+    A worker that crashes or exceeds the timeout is restarted and its request is retried (max_retries times),
+    after which a RuntimeError (crash or OpenVSP error) or a TimeoutError is raised.
+    Like an OpenVSPSession, a pool can be given to calc_wetted_area(session=...).
+    Parameters:
+            n_workers 	: number of worker processes (default: number of CPUs)
+            timeout 	: maximum duration of one request [s]
+            start_timeout : maximum start-up duration of a worker process [s]
+            max_retries : number of retries of a request whose worker crashed or timed out
+            use_session : whether workers update a persistent OpenVSP model instead of rebuilding it
+    """
+    def __init__(self, n_workers=None, timeout=120.0, start_timeout=60.0, max_retries=1, use_session=True):
+        super(OpenVSPWorkerPool, self).__init__()
+        self.n_workers = mp.cpu_count() if n_workers is None else n_workers
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.max_retries = max_retries
+        self.use_session = use_session
+        self.n_restarts = 0
+        self._context = mp.get_context('spawn')  # OpenVSP state is not inherited from the parent
+        self._workers = [_Worker(self._context, use_session) for _ in range(self.n_workers)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _restart(self, worker: _Worker):
+        worker.process.kill()
+        worker.stop(timeout=0.0)
+        self.n_restarts += 1
+        return _Worker(self._context, self.use_session)
+
+    def run(self, inputs_list: list):
+        """
+        Wetted areas and boom geometries (list of (res, boom_geometry)) of a list of geometric input dicts
+        """
+        if not self._workers:
+            raise RuntimeError('OpenVSPWorkerPool is closed!')
+
+        results = [None] * len(inputs_list)
+        attempts = [0] * len(inputs_list)
+        pending = deque(range(len(inputs_list)))
+        error = None  # first failure; the running requests are completed before it is raised
+
+        while pending or any(worker.task is not None for worker in self._workers):
+            for worker in self._workers:
+                if worker.ready and worker.task is None and pending:
+                    task_id = pending.popleft()
+                    worker.submit(task_id, inputs_list[task_id])
+
+            active = [worker for worker in self._workers if not worker.ready or worker.task is not None]
+            wait([worker.connection for worker in active] + [worker.process.sentinel for worker in active], timeout=0.1)
+
+            for i, worker in enumerate(self._workers):
+                if worker.ready and worker.task is None:
+                    continue
+                failure = None
+                if worker.connection.poll():
+                    try:
+                        task_id, status, output = worker.connection.recv()
+                    except (EOFError, OSError):
+                        failure = RuntimeError('OpenVSP worker process crashed')
+                    else:
+                        if status == 'ready':
+                            worker.ready = True
+                            continue
+                        worker.task = None
+                        if status == 'error':
+                            error = error or RuntimeError(f'OpenVSP worker failed:\n{output}')
+                            pending.clear()
+                        else:
+                            results[task_id] = output
+                        continue
+                elif not worker.process.is_alive():
+                    failure = RuntimeError(f'OpenVSP worker process crashed (exit code {worker.process.exitcode})')
+                elif worker.task is not None and time.perf_counter() - worker.task[1] > self.timeout:
+                    failure = TimeoutError(f'OpenVSP request exceeded the timeout of {self.timeout} s')
+                elif not worker.ready and time.perf_counter() - worker.started > self.start_timeout:
+                    failure = TimeoutError(f'OpenVSP worker did not start within {self.start_timeout} s')
+
+                if failure is not None:
+                    self._workers[i] = self._restart(worker)
+                    if worker.task is None:
+                        # A worker that cannot start (e.g., OpenVSP cannot be imported) will not start after a restart either
+                        self.close()
+                        raise RuntimeError('OpenVSP worker process failed to start') from failure
+                    task_id = worker.task[0]
+                    attempts[task_id] += 1
+                    if attempts[task_id] > self.max_retries:
+                        error = error or failure
+                        pending.clear()
+                    elif error is None:
+                        pending.appendleft(task_id)
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def map(self, vehicles: list, cache=True):
+        """
+        Wetted areas of a list of vehicles, computed concurrently (list of dicts, as returned by calc_wetted_area).
+        With cache=True (the in-memory cache of get_wetted_area_cache(), as in calc_wetted_area), or a WettedAreaCache
+        or MemoryWettedAreaCache object, cached geometries are not recomputed and new ones are stored,
+        so that a parallel pre-computation makes later calc_wetted_area() calls with the same cache hits.
+        Identical geometries are computed once.
+        """
+        cache = get_wetted_area_cache() if cache is True else (cache or None)
+        keys = [wetted_area_key(vehicle) for vehicle in vehicles]
+
+        entries = {}
+        if cache is not None:
+            for key in set(keys):
+                entry = cache.get(key)
+                if entry is not None:
+                    entries[key] = (dict(entry['wetted_area']), entry['boom_geometry'])
+
+        missing = {}
+        for key, vehicle in zip(keys, vehicles):
+            if key not in entries and key not in missing:
+                missing[key] = wetted_area_inputs(vehicle)
+        for (key, inputs), (res, boom_geometry) in zip(missing.items(), self.run(list(missing.values()))):
+            entries[key] = (res, boom_geometry)
+            if cache is not None:
+                cache.set(key, {'wetted_area': res, 'boom_geometry': boom_geometry}, inputs=inputs)
+
+        for key, vehicle in zip(keys, vehicles):
+            boom_geometry = entries[key][1]
+            if vehicle.configuration == 'Multirotor':
+                if vehicle.boom.area is None:
+                    vehicle.boom.area = list(boom_geometry['area'])
+                if vehicle.boom.aspect_ratio is None:
+                    vehicle.boom.aspect_ratio = list(boom_geometry['aspect_ratio'])
+
+        return [dict(entries[key][0]) for key in keys]
+
+    def wetted_area(self, vehicle: object):
+        """
+        Wetted area of each component [m**2] and boom geometry of one vehicle (same interface as OpenVSPSession)
+        """
+        return self.run([wetted_area_inputs(vehicle)])[0]
+
+    def close(self):
+        """
+        Stops the worker processes
+        """
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
@@ -0,0 +1,128 @@
+from MCEVS.Utils.LazyImport import lazy_import
+import numpy as np
+import time
+from .Components.Wing import update_NASA_LPC_Wing
+from .Components.Tail import update_NASA_LPC_Horizontal_Tail, update_NASA_LPC_Vertical_Tail
+from .Components.Boom import update_NASA_QR_Boom, update_NASA_LPC_Boom
+from .Utils import _build_geometry, _boom_geometry, _comp_geom_wetted_area
+from .Cache import wetted_area_inputs
+
+vsp = lazy_import('openvsp')
+
+
+class OpenVSPSession(object):
+    """
+    Persistent OpenVSP model of a vehicle, used to compute wetted areas.
+    The model is built once. On later calls, only the changed design parameters are set in place
+    (vsp.SetParmVal, then a single vsp.Update) before CompGeom is run again; the mesh and the results
+    created by CompGeom are deleted after each call. Any change of another geometric input
+    (e.g., configuration, fuselage, landing gear or number of rotors), or a model cleared by someone else,
+    triggers a rebuild.
+    The session owns the OpenVSP model of the process: do not build other geometries while it is in use.
+    Latency of each call is recorded (see statistics()).
+    """
+
+    # Inputs of wetted_area_inputs() that are updated in place
+    updatable_inputs = {'Multirotor': ['r_lift_rotor'],
+                        'LiftPlusCruise': ['wing_area', 'wing_aspect_ratio', 'htail_area', 'htail_aspect_ratio',
+                                           'vtail_area', 'vtail_aspect_ratio', 'r_lift_rotor', 'boom_length', 'boom_max_diameter']}
+
+    def __init__(self):
+        super(OpenVSPSession, self).__init__()
+        self.geom_ids = None
+        self.inputs = None
+        self.latency = {'build': [], 'update': []}
+
+    def _is_valid(self):
+        return self.geom_ids is not None and self.geom_ids['fuselage'] in vsp.FindGeoms()
+
+    def _changed_inputs(self, inputs: dict):
+        """
+        Names of the changed inputs, or None if the model should be rebuilt
+        """
+        if self.inputs is None or not self._is_valid() or inputs['configuration'] != self.inputs['configuration']:
+            return None
+        updatable = self.updatable_inputs[inputs['configuration']]
+        if any(inputs[name] != self.inputs[name] for name in inputs if name not in updatable):
+            return None
+        return [name for name in updatable if inputs[name] != self.inputs[name]]
+
+    def _update(self, vehicle: object, changed: list):
+        """
+        Sets the changed design parameters in place
+        """
+        if vehicle.configuration == 'Multirotor':
+            update_NASA_QR_Boom(self.geom_ids['booms'], vehicle.lift_rotor.radius, vehicle.fuselage.length)
+
+        elif vehicle.configuration == 'LiftPlusCruise':
+            if 'wing_area' in changed or 'wing_aspect_ratio' in changed:
+                update_NASA_LPC_Wing(self.geom_ids['wing'], vehicle.wing.area, vehicle.wing.aspect_ratio)
+            if 'htail_area' in changed or 'htail_aspect_ratio' in changed:
+                update_NASA_LPC_Horizontal_Tail(self.geom_ids['horizontal_tail'], vehicle.horizontal_tail.area, vehicle.horizontal_tail.aspect_ratio)
+            if 'vtail_area' in changed or 'vtail_aspect_ratio' in changed:
+                update_NASA_LPC_Vertical_Tail(self.geom_ids['vertical_tail'], vehicle.vertical_tail.area, vehicle.vertical_tail.aspect_ratio)
+            if 'r_lift_rotor' in changed or 'boom_length' in changed or 'boom_max_diameter' in changed:
+                update_NASA_LPC_Boom(self.geom_ids['booms'], vehicle.boom.length, vehicle.boom.max_diameter,
+                                     n_lift_rotor=vehicle.lift_rotor.n_rotor, r_lift_rotor=vehicle.lift_rotor.radius)
+
+    def wetted_area(self, vehicle: object):
+        """
+        Wetted area of each component [m**2], and boom geometry (as returned by _compute_wetted_area)
+        """
+        t0 = time.perf_counter()
+        inputs = wetted_area_inputs(vehicle)
+        changed = self._changed_inputs(inputs)
+
+        if changed is None:
+            vsp.ClearVSPModel()
+            self.geom_ids = _build_geometry(vehicle)
+            mode = 'build'
+        else:
+            if changed:
+                self._update(vehicle, changed)
+                vsp.Update()
+            mode = 'update'
+        self.inputs = inputs
+
+        boom_geometry = _boom_geometry(vehicle, self.geom_ids)
+        geoms = set(vsp.FindGeoms())
+        res, comp_res_id = _comp_geom_wetted_area(vehicle)
+
+        # Remove the CompGeom mesh (it would be meshed again by the next CompGeom) and its results
+        vsp.DeleteGeomVec([geom_id for geom_id in vsp.FindGeoms() if geom_id not in geoms])
+        vsp.DeleteResult(comp_res_id)
+
+        self.latency[mode].append(time.perf_counter() - t0)
+
+        return res, boom_geometry
+
+    def close(self):
+        """
+        Clears the OpenVSP model
+        """
+        vsp.ClearVSPModel()
+        self.geom_ids = None
+        self.inputs = None
+
+    def statistics(self):
+        """
+        Number and mean latency [s] of the calls that built the model and of those that updated it in place
+        """
+        stats = {}
+        for mode, latency in self.latency.items():
+            stats[f'n_{mode}'] = len(latency)
+            stats[f'latency_{mode}'] = float(np.mean(latency)) if latency else None
+        return stats
+
+
+_default_session = None
+
+
+def get_openvsp_session():
+    """
+    Process-wide OpenVSPSession
+    """
+    global _default_session
+    if _default_session is None:
+        _default_session = OpenVSPSession()
+    return _default_session
@@ -1,4 +1,5 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
+import shutil
 from .Components.Fuselage import NASA_QR_Fuselage, NASA_LPC_Fuselage
 from .Components.Wing import NASA_LPC_Wing
 from .Components.Tail import NASA_LPC_Horizontal_Tail, NASA_LPC_Vertical_Tail
@@ -7,8 +8,55 @@ from .Components.Rotor import NASA_QR_Lift_Rotor, NASA_LPC_Lift_Rotor, NASA_LPC_
 from .Components.Payload import Human
 from .Components.Boom import NASA_QR_Boom, NASA_LPC_Boom
 
+vsp = lazy_import('openvsp')
 
-def create_NASA_QuadRotor_vsp3(fname: str, vehicle: object):
+
+def create_NASA_QuadRotor_vsp3(fname: str, vehicle: object, store=False):
+    """
+    Writes the complete OpenVSP model of the vehicle to fname. With store=True (the process-wide store of
+    get_geometry_store) or a GeometryStore object, the model is exported once to the geometry store (see Export.py)
+    and later copied from it; with anything else (e.g., False or None), it is built and written directly.
+    """
+    stored = _stored_vsp3(vehicle, store)
+    if stored is not None:
+        shutil.copyfile(stored, fname)
+        return
+    build_NASA_QuadRotor(vehicle)
+    vsp.WriteVSPFile(fname)
+    vsp.ClearVSPModel()
+
+
+def create_NASA_LiftPlusCruise_vsp3(fname: str, vehicle: object, store=False):
+    """
+    Writes the complete OpenVSP model of the vehicle to fname. With store=True (the process-wide store of
+    get_geometry_store) or a GeometryStore object, the model is exported once to the geometry store (see Export.py)
+    and later copied from it; with anything else (e.g., False or None), it is built and written directly.
+    """
+    stored = _stored_vsp3(vehicle, store)
+    if stored is not None:
+        shutil.copyfile(stored, fname)
+        return
+    build_NASA_LiftPlusCruise(vehicle)
+    vsp.WriteVSPFile(fname)
+    vsp.ClearVSPModel()
+
+
+def _stored_vsp3(vehicle: object, store):
+    """
+    vsp3 file of the vehicle in the geometry store (exported on first use), or None if store is neither True nor a GeometryStore
+    """
+    from .Export import GeometryStore, get_geometry_store
+    if store is True:
+        store = get_geometry_store()
+    elif not isinstance(store, GeometryStore):
+        return None
+    return store.export(vehicle)['vsp3']
+
+
+def build_NASA_QuadRotor(vehicle: object):
+    """
+    Builds the complete OpenVSP model of a NASA quadrotor (with passengers and rotors) in the current OpenVSP model
+    """
 
     # Unpacking parameters
     config = vehicle.configuration
@@ -29,11 +77,12 @@ def create_NASA_QuadRotor_vsp3(fname: str, vehicle: object):
     boom_ids = NASA_QR_Boom(n_lift_rotor=4, r_lift_rotor=r_lift_rotor, l_fuse=l_fuse, d_fuse_max=d_fuse_max, fuse_id=fuse_id)
     _ = NASA_QR_Lift_Rotor(n_lift_rotor=n_lift_rotor, r_lift_rotor=r_lift_rotor, r_hub=r_hub, n_blade=n_blade_rotor, l_fuse=l_fuse, d_fuse_max=d_fuse_max, boom_ids=boom_ids)
     _ = NASA_QR_Landing_Gear(gear_type=gear_type, skid_heights=skid_heights, skid_length=skid_length, l_strut=l_strut, fuse_id=fuse_id)
-    vsp.WriteVSPFile(fname)
-    vsp.ClearVSPModel()
 
 
-def create_NASA_LiftPlusCruise_vsp3(fname: str, vehicle: object):
+def build_NASA_LiftPlusCruise(vehicle: object):
+    """
+    Builds the complete OpenVSP model of a NASA lift+cruise (with passengers, rotors and propeller) in the current OpenVSP model
+    """
 
     # Unpacking parameters
     config = vehicle.configuration
@@ -71,5 +120,3 @@ def create_NASA_LiftPlusCruise_vsp3(fname: str, vehicle: object):
     boom_ids = NASA_LPC_Boom(l_boom=l_boom, d_boom=d_boom, n_lift_rotor=n_lift_rotor, r_lift_rotor=r_lift_rotor, l_fuse=l_fuse, wing_S=wing_S, wing_AR=wing_AR, wing_id=wing_id)
     rotor_hub_ids, rotor_ids = NASA_LPC_Lift_Rotor(n_lift_rotor=n_lift_rotor, n_blade=n_blade_rotor, r_lift_rotor=r_lift_rotor, l_hub=l_hub1, d_hub=d_hub1, l_fuse=l_fuse, wing_S=wing_S, wing_AR=wing_AR, boom_ids=boom_ids)
     prop_hub_id, prop_id = NASA_LPC_Propeller(n_propeller=n_propeller, n_blade=n_blade_prop, r_propeller=r_propeller, l_hub=l_hub2, d_hub=d_hub2, l_fuse=l_fuse, fuse_id=fuse_id)
-    vsp.WriteVSPFile(fname)
-    vsp.ClearVSPModel()
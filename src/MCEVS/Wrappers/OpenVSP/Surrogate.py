@@ -0,0 +1,252 @@
+from itertools import combinations_with_replacement
+import numpy as np
+import json
+import time
+from .Cache import wetted_area_inputs
+from .Pool import geometry_from_inputs
+
+# Design parameters of the surrogate by default (the geometric design variables of the build-up)
+default_parameters = {'Multirotor': ['r_lift_rotor'],
+                      'LiftPlusCruise': ['wing_area', 'wing_aspect_ratio', 'r_lift_rotor']}
+
+# Continuous inputs of wetted_area_inputs() that may be parameters of the surrogate
+continuous_inputs = {'Multirotor': ['fuselage_length', 'fuselage_max_diameter', 'r_lift_rotor'],
+                     'LiftPlusCruise': ['fuselage_length', 'fuselage_max_diameter', 'wing_area', 'wing_aspect_ratio',
+                                        'htail_area', 'htail_aspect_ratio', 'vtail_area', 'vtail_aspect_ratio',
+                                        'r_lift_rotor', 'boom_length', 'boom_max_diameter']}
+
+# The LPC builder moves the booms at this lift rotor radius (NASA_LPC_Boom_X_location), so wetted areas jump there
+LPC_BOOM_LOCATION_RADIUS = 1.6
+
+
+class WettedAreaSurrogate(object):
+    """
+    Smooth model of the OpenVSP wetted areas of one vehicle (and, for a multirotor, of the boom areas and aspect ratios
+    used as reference lengths), fitted to OpenVSP samples over a box of design parameters.
+    Each output is a polynomial (of total degree 'degree') of the log-parameters scaled to [-1, 1], in log space:
+            log(S) = sum_k c_k * z**e_k, 	z = 2 * (log(x) - log(x_min)) / (log(x_max) - log(x_min)) - 1
+    so that power laws (e.g., wing wetted area ~ area) are represented exactly, and values and gradients are analytic
+    (complex inputs are also supported). The other geometric inputs are fixed to those of the sampled vehicle.
+    Parameters:
+            configuration 	: 'Multirotor' or 'LiftPlusCruise'
+            parameters 		: names of the varying inputs of wetted_area_inputs() (e.g., ['wing_area', 'r_lift_rotor'])
+            bounds 			: array of shape (n_parameters, 2) with the lower and upper bound of each parameter
+            fixed_inputs 	: wetted_area_inputs() of the sampled vehicle
+            outputs 		: names of the outputs (wetted areas in the order of calc_wetted_area, then boom geometry)
+            degree 			: total degree of the polynomials
+            coefficients 	: array of shape (n_terms, n_outputs), or None before fit()
+    """
+    def __init__(self, configuration: str, parameters: list, bounds, fixed_inputs: dict, outputs: list, degree=2, coefficients=None):
+        super(WettedAreaSurrogate, self).__init__()
+        if any(name not in continuous_inputs[configuration] for name in parameters):
+            raise ValueError(f'Surrogate parameters of a {configuration} should be in {continuous_inputs[configuration]}!')
+        self.configuration = configuration
+        self.parameters = list(parameters)
+        self.bounds = np.asarray(bounds, dtype=float).reshape(len(self.parameters), 2)
+        self.fixed_inputs = dict(fixed_inputs)
+        self.outputs = list(outputs)
+        self.degree = degree
+        self.coefficients = None if coefficients is None else np.asarray(coefficients, dtype=float)
+        self.report = None
+        self.exponents = np.array([np.bincount(term, minlength=len(self.parameters))
+                                   for d in range(degree + 1) for term in combinations_with_replacement(range(len(self.parameters)), d)],
+                                  dtype=int).reshape(-1, len(self.parameters))
+
+    @property
+    def components(self):
+        """
+        Names of the wetted area outputs
+        """
+        return [name for name in self.outputs if not name.startswith('boom_')]
+
+    def _scaled(self, x):
+        log_bounds = np.log(self.bounds)
+        return 2.0 * (np.log(x) - log_bounds[:, 0]) / (log_bounds[:, 1] - log_bounds[:, 0]) - 1.0
+
+    def _features(self, z):
+        return np.prod(z[..., np.newaxis, :]**self.exponents, axis=-1)
+
+    def fit(self, x, y):
+        """
+        Least-squares fit to samples of the parameters, of shape (n_samples, n_parameters), and of the outputs, of shape (n_samples, n_outputs)
+        """
+        x, y = np.atleast_2d(x), np.atleast_2d(y)
+        if np.any(y <= 0.0):
+            raise ValueError('Wetted areas and boom geometry should be positive!')
+        if x.shape[0] < self.exponents.shape[0]:
+            raise ValueError(f'At least {self.exponents.shape[0]} samples are needed for a degree {self.degree} surrogate in {len(self.parameters)} parameters!')
+        features = self._features(self._scaled(x))
+        self.coefficients = np.linalg.lstsq(features, np.log(y), rcond=None)[0]
+        return self
+
+    def predict(self, x):
+        """
+        Outputs of shape (..., n_outputs) for parameters of shape (..., n_parameters)
+        """
+        return np.exp(self._features(self._scaled(np.asarray(x))) @ self.coefficients)
+
+    def predict_with_gradient(self, x):
+        """
+        Outputs of shape (n_outputs,) and their analytic derivatives with respect to the parameters, of shape (n_outputs, n_parameters)
+        """
+        x = np.asarray(x)
+        z = self._scaled(x)
+        y = np.exp(self._features(z) @ self.coefficients)
+        log_bounds = np.log(self.bounds)
+        dz_dx = 2.0 / ((log_bounds[:, 1] - log_bounds[:, 0]) * x)
+        jacobian = np.zeros((len(self.outputs), len(self.parameters)), dtype=np.result_type(x, float))
+        for k in range(len(self.parameters)):
+            exponents = self.exponents.copy()
+            exponents[:, k] = np.maximum(exponents[:, k] - 1, 0)
+            dfeatures_dz = self.exponents[:, k] * np.prod(z**exponents, axis=-1)
+            jacobian[:, k] = y * (dfeatures_dz @ self.coefficients) * dz_dx[k]
+        return y, jacobian
+
+    def parameter_values(self, vehicle: object):
+        """
+        Parameters of a vehicle, after checking that its other geometric inputs are those of the surrogate
+        """
+        inputs = wetted_area_inputs(vehicle)
+        different = [name for name in inputs if name not in self.parameters and inputs[name] != self.fixed_inputs.get(name)]
+        if different:
+            raise ValueError(f'Wetted area surrogate is not valid for this vehicle (different {different})!')
+        return np.array([inputs[name][0] for name in self.parameters])
+
+    def wetted_area(self, vehicle: object):
+        """
+        Wetted area of each component [m**2] of a vehicle (as returned by calc_wetted_area)
+        """
+        y = self.predict(self.parameter_values(vehicle))
+        return {name: float(y[i]) for i, name in enumerate(self.outputs) if name in self.components}
+
+    def accuracy(self, x, y):
+        """
+        Maximum and root mean square relative errors of each output with respect to reference samples
+        """
+        error = self.predict(np.atleast_2d(x)) / np.atleast_2d(y) - 1.0
+        return {name: {'max_relative_error': float(np.max(np.abs(error[:, i]))),
+                       'rms_relative_error': float(np.sqrt(np.mean(error[:, i]**2)))} for i, name in enumerate(self.outputs)}
+
+    def save(self, path: str):
+        """
+        Saves the surrogate (and its accuracy report) to a .npz file
+        """
+        metadata = {'configuration': self.configuration, 'parameters': self.parameters, 'fixed_inputs': self.fixed_inputs,
+                    'outputs': self.outputs, 'degree': self.degree, 'report': self.report}
+        np.savez(path, bounds=self.bounds, coefficients=self.coefficients, metadata=json.dumps(metadata))
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Loads a surrogate saved by save()
+        """
+        with np.load(path) as data:
+            metadata = json.loads(str(data['metadata']))
+            surrogate = cls(metadata['configuration'], metadata['parameters'], data['bounds'], metadata['fixed_inputs'],
+                            metadata['outputs'], degree=metadata['degree'], coefficients=data['coefficients'])
+        surrogate.report = metadata['report']
+        return surrogate
+
+
+def default_bounds(vehicle: object, parameters: list, scale=(0.7, 1.3)):
+    """
+    Bounds of the parameters: the values of the vehicle times scale; for a LPC, the lift rotor radius range
+    does not cross LPC_BOOM_LOCATION_RADIUS (where the booms are moved by the builder)
+    """
+    inputs = wetted_area_inputs(vehicle)
+    bounds = np.array([[inputs[name][0] * scale[0], inputs[name][0] * scale[1]] for name in parameters])
+    if vehicle.configuration == 'LiftPlusCruise' and 'r_lift_rotor' in parameters:
+        i = parameters.index('r_lift_rotor')
+        if inputs['r_lift_rotor'][0] <= LPC_BOOM_LOCATION_RADIUS:
+            bounds[i, 1] = min(bounds[i, 1], LPC_BOOM_LOCATION_RADIUS)
+        else:
+            bounds[i, 0] = max(bounds[i, 0], LPC_BOOM_LOCATION_RADIUS * (1.0 + 1e-6))
+    return bounds
+
+
+def sample_wetted_areas(vehicle: object, parameters: list, bounds, n_samples: int, seed=0, pool=None):
+    """
+    Wetted areas and boom geometry computed by OpenVSP at n_samples Latin hypercube samples of the parameters
+    (log-uniform within the bounds), the other geometric inputs being those of the vehicle.
+    The samples are computed by an OpenVSPWorkerPool if given, and by an OpenVSPSession otherwise.
+    Outputs:
+            x 			: parameters, of shape (n_samples, n_parameters)
+            y 			: outputs, of shape (n_samples, n_outputs)
+            outputs 	: names of the outputs (wetted areas, then 'boom_area_i' and 'boom_aspect_ratio_i' for a multirotor)
+    """
+    from scipy.stats import qmc
+
+    bounds = np.asarray(bounds, dtype=float)
+    unit = qmc.LatinHypercube(d=len(parameters), seed=seed).random(n_samples)
+    x = np.exp(np.log(bounds[:, 0]) + unit * (np.log(bounds[:, 1]) - np.log(bounds[:, 0])))
+
+    inputs = wetted_area_inputs(vehicle)
+    inputs_list = [dict(inputs, **{name: [float(value)] for name, value in zip(parameters, x_i)}) for x_i in x]
+    if pool is not None:
+        results = pool.run(inputs_list)
+    else:
+        from .Session import OpenVSPSession
+        session = OpenVSPSession()
+        try:
+            results = [session.wetted_area(geometry_from_inputs(sample)) for sample in inputs_list]
+        finally:
+            session.close()
+
+    outputs = list(results[0][0])
+    if results[0][1] is not None:
+        n_boom = len(results[0][1]['area'])
+        outputs += [f'boom_area_{i + 1}' for i in range(n_boom)] + [f'boom_aspect_ratio_{i + 1}' for i in range(n_boom)]
+    y = np.array([[res[name] for name in res] + ([] if boom is None else list(boom['area']) + list(boom['aspect_ratio']))
+                  for res, boom in results])
+
+    return x, y, outputs
+
+
+def fit_wetted_area_surrogate(vehicle: object, parameters=None, bounds=None, degree=2, n_samples=None, n_test=None, seed=0, pool=None):
+    """
+    Samples OpenVSP around a vehicle and fits a WettedAreaSurrogate; its accuracy on n_test independent
+    samples is stored in surrogate.report.
+    Parameters:
+            vehicle 	: MCEVS vehicle object (its geometric inputs other than the parameters are fixed)
+            parameters 	: names of the varying inputs of wetted_area_inputs() (default: default_parameters)
+            bounds 		: array of shape (n_parameters, 2) (default: default_bounds())
+            degree 		: total degree of the polynomials
+            n_samples 	: number of training samples (default: 10 times the number of polynomial terms)
+            n_test 		: number of test samples (default: a quarter of n_samples)
+            seed 		: seed of the Latin hypercube sampling
+            pool 		: OpenVSPWorkerPool computing the samples concurrently, or None
+    """
+    parameters = default_parameters[vehicle.configuration] if parameters is None else list(parameters)
+    bounds = default_bounds(vehicle, parameters) if bounds is None else np.asarray(bounds, dtype=float)
+
+    surrogate = WettedAreaSurrogate(vehicle.configuration, parameters, bounds, wetted_area_inputs(vehicle), outputs=[], degree=degree)
+    n_samples = 10 * surrogate.exponents.shape[0] if n_samples is None else n_samples
+    n_test = max(n_samples // 4, 1) if n_test is None else n_test
+
+    t0 = time.perf_counter()
+    x, y, surrogate.outputs = sample_wetted_areas(vehicle, parameters, bounds, n_samples + n_test, seed=seed, pool=pool)
+    elapsed_sampling = time.perf_counter() - t0
+    surrogate.fit(x[:n_samples], y[:n_samples])
+
+    surrogate.report = {'n_samples': n_samples,
+                        'n_test': n_test,
+                        'elapsed_sampling': elapsed_sampling,
+                        'training': surrogate.accuracy(x[:n_samples], y[:n_samples]),
+                        'test': surrogate.accuracy(x[n_samples:], y[n_samples:])}
+
+    return surrogate
+
+
+def accuracy_report(surrogate: WettedAreaSurrogate):
+    """
+    Table of the relative errors of a fitted surrogate with respect to OpenVSP, on the training and test samples
+    """
+    report = surrogate.report
+    lines = [f"{surrogate.configuration} wetted area surrogate (degree {surrogate.degree} in {', '.join(surrogate.parameters)}), "
+             f"{report['n_samples']} training and {report['n_test']} test samples",
+             f"{'output':<22}{'train max':>12}{'train rms':>12}{'test max':>12}{'test rms':>12}"]
+    for name in surrogate.outputs:
+        training, test = report['training'][name], report['test'][name]
+        lines.append(f"{name:<22}{training['max_relative_error']:>12.2e}{training['rms_relative_error']:>12.2e}"
+                     f"{test['max_relative_error']:>12.2e}{test['rms_relative_error']:>12.2e}")
+    return '\n'.join(lines)
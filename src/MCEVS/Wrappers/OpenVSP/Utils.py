@@ -1,13 +1,77 @@
-import openvsp as vsp
+from MCEVS.Utils.LazyImport import lazy_import
 from .Components.Fuselage import NASA_QR_Fuselage, NASA_LPC_Fuselage
 from .Components.Wing import NASA_LPC_Wing
 from .Components.Tail import NASA_LPC_Horizontal_Tail, NASA_LPC_Vertical_Tail
 from .Components.Landing_Gear import NASA_QR_Landing_Gear, NASA_LPC_Landing_Gear
 # from .Components.Rotor import NASA_QR_Lift_Rotor, NASA_LPC_Lift_Rotor, NASA_LPC_Propeller
 from .Components.Boom import NASA_QR_Boom, NASA_LPC_Boom
+from .Cache import get_wetted_area_cache, wetted_area_key, wetted_area_inputs
 
+vsp = lazy_import('openvsp')
 
-def calc_wetted_area(vehicle: object):
+
+def calc_wetted_area(vehicle: object, cache=True, session=False):
+    """
+    Wetted area of each component [m**2], computed by OpenVSP (CompGeom).
+    With cache=True, results are looked up in (and stored into) the process-wide in-memory cache returned by
+    get_wetted_area_cache(), keyed by a hash of the geometric inputs, which writes nothing to disk; a persistent
+    cache is opt-in (cache=get_wetted_area_cache(persistent=True), or any WettedAreaCache or MemoryWettedAreaCache
+    object), and cache=False disables caching.
+    With session=True, the wetted areas that are not cached are computed by the process-wide OpenVSPSession
+    (persistent model updated in place); an OpenVSPSession or an OpenVSPWorkerPool may also be given,
+    and session=False rebuilds the model.
+    For a multirotor, boom area and aspect ratio are forwarded to vehicle.boom if undefined (also on cache hits).
+    """
+    if session is False:
+        compute = _compute_wetted_area
+    else:
+        from .Session import get_openvsp_session
+        compute = (get_openvsp_session() if session is True else session).wetted_area
+
+    if cache is False:
+        res, boom_geometry = compute(vehicle)
+    else:
+        cache = get_wetted_area_cache() if cache is True else cache
+        key = wetted_area_key(vehicle)
+        entry = cache.get(key)
+        if entry is None:
+            res, boom_geometry = compute(vehicle)
+            cache.set(key, {'wetted_area': res, 'boom_geometry': boom_geometry}, inputs=wetted_area_inputs(vehicle))
+        else:
+            res, boom_geometry = dict(entry['wetted_area']), entry['boom_geometry']
+
+    # Forwarding area and aspect ratio of booms
+    if vehicle.configuration == 'Multirotor':
+        if vehicle.boom.area is None:
+            vehicle.boom.area = list(boom_geometry['area'])
+        if vehicle.boom.aspect_ratio is None:
+            vehicle.boom.aspect_ratio = list(boom_geometry['aspect_ratio'])
+
+    return res
+
+
+def _compute_wetted_area(vehicle: object):
+    """
+    Builds the OpenVSP model of the vehicle and computes the wetted areas (uncached; see calc_wetted_area)
+    Outputs:
+            res 			: wetted area of each component [m**2]
+            boom_geometry 	: area and aspect ratio of each boom as modeled in OpenVSP (multirotor only; None otherwise)
+    """
+    geom_ids = _build_geometry(vehicle)
+    boom_geometry = _boom_geometry(vehicle, geom_ids)
+    res = _comp_geom_wetted_area(vehicle)[0]
+    vsp.ClearVSPModel()
+
+    return res, boom_geometry
+
+
+def _build_geometry(vehicle: object):
+    """
+    Builds the OpenVSP model of the vehicle (components used for the wetted areas only)
+    Outputs:
+            geom_ids 		: dict of the OpenVSP ids of the components ('fuselage', 'wing', 'horizontal_tail',
+                              'vertical_tail', 'booms', 'landing_gears')
+    """
 
     # Unpacking parameters
     config = vehicle.configuration
@@ -35,26 +99,52 @@ def calc_wetted_area(vehicle: object):
         l_boom = vehicle.boom.length
         d_boom = vehicle.boom.max_diameter
 
+    geom_ids = {}
     if config == 'Multirotor':
-        fuse_id = NASA_QR_Fuselage(l_fuse, d_fuse_max)
-        boom_ids = NASA_QR_Boom(n_lift_rotor=n_lift_rotor, r_lift_rotor=r_lift_rotor, l_fuse=l_fuse, d_fuse_max=d_fuse_max, fuse_id=fuse_id)
-        lg_ids = NASA_QR_Landing_Gear(gear_type=gear_type, skid_heights=skid_heights, skid_length=skid_length, l_strut=l_strut, fuse_id=fuse_id)
-        # Forwarding area and aspect ratio of booms
-        if vehicle.boom.area is None:
-            vehicle.boom.area = []
-            for boom_id in boom_ids:
-                vehicle.boom.area.append(vsp.GetParmVal(boom_id, 'TotalArea', 'WingGeom'))
-        if vehicle.boom.aspect_ratio is None:
-            vehicle.boom.aspect_ratio = []
-            for boom_id in boom_ids:
-                vehicle.boom.aspect_ratio.append(vsp.GetParmVal(boom_id, 'TotalAR', 'WingGeom'))
+        geom_ids['fuselage'] = NASA_QR_Fuselage(l_fuse, d_fuse_max)
+        geom_ids['booms'] = NASA_QR_Boom(n_lift_rotor=n_lift_rotor, r_lift_rotor=r_lift_rotor, l_fuse=l_fuse, d_fuse_max=d_fuse_max, fuse_id=geom_ids['fuselage'])
+        geom_ids['landing_gears'] = NASA_QR_Landing_Gear(gear_type=gear_type, skid_heights=skid_heights, skid_length=skid_length, l_strut=l_strut, fuse_id=geom_ids['fuselage'])
         # vsp.WriteVSPFile('multirotor_check.vsp3')
 
-        _ = vsp.ComputeCompGeom(vsp.SET_ALL, False, 0)
-        comp_res_id = vsp.FindLatestResultsID('Comp_Geom')
-        double_arr = vsp.GetDoubleResults(comp_res_id, 'Wet_Area')
+    elif config == 'LiftPlusCruise':
+        geom_ids['fuselage'] = NASA_LPC_Fuselage(l_fuse, d_fuse_max)
+        geom_ids['wing'] = NASA_LPC_Wing(area=wing_S, aspect_ratio=wing_AR, l_fuse=l_fuse, fuse_id=geom_ids['fuselage'])
+        geom_ids['horizontal_tail'] = NASA_LPC_Horizontal_Tail(area=htail_S, aspect_ratio=htail_AR, l_fuse=l_fuse, fuse_id=geom_ids['fuselage'])
+        geom_ids['vertical_tail'] = NASA_LPC_Vertical_Tail(area=vtail_S, aspect_ratio=vtail_AR, l_fuse=l_fuse, fuse_id=geom_ids['fuselage'])
+        lg_ids, wheel_ids = NASA_LPC_Landing_Gear(gear_type=gear_type, l_strut=l_strut, fuse_id=geom_ids['fuselage'])
+        geom_ids['landing_gears'] = lg_ids + wheel_ids
+        geom_ids['booms'] = NASA_LPC_Boom(l_boom=l_boom, d_boom=d_boom, n_lift_rotor=n_lift_rotor, r_lift_rotor=r_lift_rotor, l_fuse=l_fuse, wing_S=wing_S, wing_AR=wing_AR, wing_id=geom_ids['wing'])
+        # vsp.WriteVSPFile('liftpluscruise_check.vsp3')
+
+    return geom_ids
+
+
+def _boom_geometry(vehicle: object, geom_ids: dict):
+    """
+    Area and aspect ratio of each boom of a multirotor as modeled in OpenVSP (None for other configurations)
+    """
+    if vehicle.configuration != 'Multirotor':
+        return None
+    return {'area': [vsp.GetParmVal(boom_id, 'TotalArea', 'WingGeom') for boom_id in geom_ids['booms']],
+            'aspect_ratio': [vsp.GetParmVal(boom_id, 'TotalAR', 'WingGeom') for boom_id in geom_ids['booms']]}
+
+
+def _comp_geom_wetted_area(vehicle: object):
+    """
+    Runs CompGeom on the current OpenVSP model and reads the wetted area of each component [m**2]
+    Outputs:
+            res 			: wetted area of each component [m**2]
+            comp_res_id 	: id of the Comp_Geom results
+    """
+    config = vehicle.configuration
+    gear_type = vehicle.landing_gear.gear_type
+
+    _ = vsp.ComputeCompGeom(vsp.SET_ALL, False, 0)
+    comp_res_id = vsp.FindLatestResultsID('Comp_Geom')
+    double_arr = vsp.GetDoubleResults(comp_res_id, 'Wet_Area')
 
-        res = {}
+    res = {}
+    if config == 'Multirotor':
         res['Fuselage'] = double_arr[0]
         res['Boom_1'] = double_arr[1]
         res['Boom_2'] = double_arr[2]
@@ -75,24 +165,7 @@ def calc_wetted_area(vehicle: object):
             res['RearStrut_1'] = double_arr[9]
             res['RearStrut_2'] = double_arr[10]
 
-        vsp.ClearVSPModel()
-
-        return res
-
     elif config == 'LiftPlusCruise':
-        fuse_id = NASA_LPC_Fuselage(l_fuse, d_fuse_max)
-        wing_id = NASA_LPC_Wing(area=wing_S, aspect_ratio=wing_AR, l_fuse=l_fuse, fuse_id=fuse_id)
-        _ = NASA_LPC_Horizontal_Tail(area=htail_S, aspect_ratio=htail_AR, l_fuse=l_fuse, fuse_id=fuse_id)
-        _ = NASA_LPC_Vertical_Tail(area=vtail_S, aspect_ratio=vtail_AR, l_fuse=l_fuse, fuse_id=fuse_id)
-        lg_ids, wheel_ids = NASA_LPC_Landing_Gear(gear_type=gear_type, l_strut=l_strut, fuse_id=fuse_id)
-        boom_ids = NASA_LPC_Boom(l_boom=l_boom, d_boom=d_boom, n_lift_rotor=n_lift_rotor, r_lift_rotor=r_lift_rotor, l_fuse=l_fuse, wing_S=wing_S, wing_AR=wing_AR, wing_id=wing_id)
-        # vsp.WriteVSPFile('liftpluscruise_check.vsp3')
-
-        _ = vsp.ComputeCompGeom(vsp.SET_ALL, False, 0)
-        comp_res_id = vsp.FindLatestResultsID('Comp_Geom')
-        double_arr = vsp.GetDoubleResults(comp_res_id, 'Wet_Area')
-
-        res = {}
         res['Fuselage'] = double_arr[0]
         res['Wing'] = double_arr[1]
         res['HTail'] = double_arr[6]
@@ -116,6 +189,4 @@ def calc_wetted_area(vehicle: object):
             res['RearStrut_1'] = double_arr[12]
             res['RearStrut_2'] = double_arr[13]
 
-        vsp.ClearVSPModel()
-
-        return res
+    return res, comp_res_id
@@ -0,0 +1,61 @@
+import pytest
+from MCEVS.Analyses.Aerodynamics import Parasite
+from MCEVS.Vehicles.Standard import StandardLiftPlusCruiseEVTOL, StandardMultirotorEVTOL
+from MCEVS.Missions.Container import Mission
+
+
+@pytest.fixture
+def fidelity():
+    return {'aerodynamics': {'parasite': 'WeightBasedRegression', 'induced': 'ParabolicDragPolar'},
+            'power_model': {'hover_climb': 'MomentumTheory'},
+            'weight_model': {'structure': 'Roskam'},
+            'stability': {'AoA_trim': {'cruise': 'ManualFixedValue'}}}
+
+
+@pytest.fixture
+def lift_plus_cruise():
+    return StandardLiftPlusCruiseEVTOL({'r_lift_rotor': 1.5, 'r_propeller': 1.4, 'wing_area': 14.0, 'wing_aspect_ratio': 10.0},
+                                       operation_var={'RPM_lift_rotor': {'hover_climb': 400.0}, 'RPM_propeller': {'cruise': 450.0}},
+                                       mtow=2500.0)
+
+
+@pytest.fixture
+def multirotor():
+    return StandardMultirotorEVTOL({'r_lift_rotor': 1.8},
+                                   operation_var={'RPM_lift_rotor': {'hover_climb': 400.0, 'cruise': 450.0}},
+                                   mtow=1500.0)
+
+
+@pytest.fixture
+def make_hover_stay_mission():
+    def make(duration=30.0):
+        mission = Mission(planet='Earth', takeoff_altitude=5000 * 0.3048, n_repetition=1)
+        mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=2.54, distance=304.8, n_discrete=10)
+        mission.add_segment(name='Hover', kind='HoverStay', duration=duration, n_discrete=10)
+        mission.add_segment('Cruise', kind='CruiseConstantSpeed', speed=50.0, distance=50e3, AoA=5.0, n_discrete=10)
+        mission.add_segment(name='Hover Descent', kind='HoverDescentConstantSpeed', speed=1.524, distance=304.8, n_discrete=10)
+        mission.add_segment(name='Reserve Cruise', kind='ReserveCruise', duration=20 * 60)
+        return mission
+    return make
+
+
+@pytest.fixture
+def hover_stay_mission(make_hover_stay_mission):
+    return make_hover_stay_mission()
+
+
+@pytest.fixture
+def stand_in_wetted_area(monkeypatch):
+    # Stand-in for OpenVSP: areas scaling with the lift rotor radius (and wing area), booms forwarded as calc_wetted_area does
+    calls = []
+
+    def calc_wetted_area(design):
+        calls.append(design)
+        r = design.lift_rotor.radius
+        if design.configuration == 'Multirotor':
+            design.boom.area, design.boom.aspect_ratio = [0.5 * r] * 4, [8.0] * 4
+            return {f'component_{i}': (1.0 + 0.1 * i) * r for i in range(11)}
+        return {f'component_{i}': (1.0 + 0.1 * i) * r + design.wing.area for i in range(14)}
+
+    monkeypatch.setattr(Parasite, 'calc_wetted_area', calc_wetted_area)
+    return calls
@@ -0,0 +1,119 @@
+import copy
+import numpy as np
+import pytest
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials
+from MCEVS.Analyses.Aerodynamics.Empirical import calc_multirotor_parasite_drag, MultirotorParasiteDragViaWeightBasedRegression
+from MCEVS.Analyses.Aerodynamics.Empirical import WingedParasiteDragViaWeightBasedRegression, RotorHubParasiteDragFidelityZero
+from MCEVS.Analyses.Aerodynamics.Parasite import ParasiteDragNonHubFidelityOne, ParasiteDragNonHubMultiSegment, FlatPlateAreaCache
+
+
+def test_weight_regression_drag_vectorized():
+    rng = np.random.default_rng(0)
+    W_takeoff = rng.uniform(500.0, 3000.0, 20)
+    v = rng.uniform(20.0, 60.0, 20)
+    r = rng.uniform(1.0, 3.0, 20)
+    results = calc_multirotor_parasite_drag(1.225, W_takeoff, v, r, 4)
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('drag', MultirotorParasiteDragViaWeightBasedRegression(N_rotor=4, rho_air=1.225), promotes=['*'])
+    prob.setup(check=False)
+    for i in range(len(W_takeoff)):
+        prob.set_val('Weight|takeoff', W_takeoff[i])
+        prob.set_val('Aero|speed', v[i])
+        prob.set_val('Rotor|radius', r[i])
+        prob.run_model()
+        np.testing.assert_allclose(prob.get_val('Aero|total_drag')[0], results['drag'][i], rtol=1e-12)
+
+
+def test_weight_regression_drag_partials(lift_plus_cruise):
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('multirotor', MultirotorParasiteDragViaWeightBasedRegression(N_rotor=4, rho_air=1.225))
+    prob.model.add_subsystem('winged', WingedParasiteDragViaWeightBasedRegression(rho_air=1.225))
+    prob.model.add_subsystem('rotor_hub', RotorHubParasiteDragFidelityZero(vehicle=lift_plus_cruise, rho_air=1.225))
+    prob.setup(force_alloc_complex=True)
+    for name in ['multirotor', 'winged', 'rotor_hub']:
+        prob.set_val(f'{name}.Weight|takeoff', 2500.0)
+        prob.set_val(f'{name}.Aero|speed', 50.0)
+    prob.set_val('multirotor.Rotor|radius', 1.5)
+    prob.set_val('winged.Wing|area', 14.0)
+    prob.run_model()
+    assert_check_partials(prob.check_partials(method='cs', out_stream=None), atol=1e-8, rtol=1e-8)
+
+
+@pytest.mark.parametrize('configuration', ['LiftPlusCruise', 'Multirotor'])
+def test_build_up_drag_partials(configuration, lift_plus_cruise, multirotor):
+    pytest.importorskip('openvsp')
+    vehicle = lift_plus_cruise if configuration == 'LiftPlusCruise' else multirotor
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('drag', ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=1.225, mu_air=1.789e-5, segment_name='cruise', cache=False),
+                             promotes=['*'])
+    prob.setup()
+    prob.set_val('Aero|speed', 50.0)
+    prob.run_model()
+
+    # Geometric partials are finite differences of OpenVSP wetted areas: checked by central differences
+    data = prob.check_partials(method='fd', form='central', out_stream=None)
+    wrt = {name for component in data.values() for _, name in component}
+    assert wrt == ({'Aero|speed', 'Rotor|radius', 'Wing|area', 'Wing|aspect_ratio'} if configuration == 'LiftPlusCruise' else {'Aero|speed', 'Rotor|radius'})
+    assert_check_partials(data, atol=1e-6, rtol=1e-4)
+
+
+@pytest.mark.parametrize('configuration', ['LiftPlusCruise', 'Multirotor'])
+def test_build_up_drag_cache(configuration, lift_plus_cruise, multirotor, stand_in_wetted_area):
+    vehicle = lift_plus_cruise if configuration == 'LiftPlusCruise' else multirotor
+    calls = stand_in_wetted_area
+    cache = FlatPlateAreaCache()
+
+    def evaluate(vehicle, radius):
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem('drag', ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=1.225, mu_air=1.789e-5, segment_name='cruise', cache=cache),
+                                 promotes=['*'])
+        prob.setup()
+        prob.set_val('Aero|speed', 50.0)
+        prob.set_val('Rotor|radius', radius)
+        prob.run_model()
+        return prob.get_val('Aero|f_non_hub')[0]
+
+    # A second, identical vehicle is served by the cache, and gets the same wetted areas and boom geometry
+    other = copy.deepcopy(vehicle)
+    f_non_hub = evaluate(vehicle, 1.5)
+    assert evaluate(other, 1.5) == f_non_hub
+    assert len(calls) == 1 and cache.statistics()['hits'] == 1
+    np.testing.assert_array_equal(other.S_wetted, vehicle.S_wetted)
+    assert other.S_wetted.shape == ((5,) if configuration == 'Multirotor' else (8,))
+    assert other.boom.area == vehicle.boom.area
+
+    # A design change is a new entry
+    assert evaluate(other, 1.6) != f_non_hub
+    assert len(calls) == 2 and cache.statistics()['misses'] == 2
+    assert not np.array_equal(other.S_wetted, vehicle.S_wetted)
+
+
+@pytest.mark.parametrize('configuration', ['LiftPlusCruise', 'Multirotor'])
+def test_build_up_drag_segments(configuration, lift_plus_cruise, multirotor, stand_in_wetted_area):
+    vehicle = lift_plus_cruise if configuration == 'LiftPlusCruise' else multirotor
+    rho_air, mu_air, v = [1.225, 1.1, 1.0], [1.789e-5, 1.75e-5, 1.7e-5], np.array([30.0, 50.0, 70.0])
+    outputs = ['Aero|f_non_hub', 'Aero|parasite_drag_non_hub'] + (['Aero|Cd0'] if configuration == 'LiftPlusCruise' else [])
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('segments', ParasiteDragNonHubMultiSegment(vehicle=vehicle, rho_air=rho_air, mu_air=mu_air, segment_names=['climb', 'cruise', 'descent']),
+                             promotes=['*'])
+    prob.setup()
+    prob.set_val('Aero|speed', v)
+    prob.set_val('Rotor|radius', 1.6)
+    prob.run_model()
+
+    # Same outputs as one single-segment component per segment
+    for i in range(3):
+        single = om.Problem(reports=False)
+        single.model.add_subsystem('drag', ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=rho_air[i], mu_air=mu_air[i], segment_name='cruise', cache=False),
+                                   promotes=['*'])
+        single.setup()
+        single.set_val('Aero|speed', v[i])
+        single.set_val('Rotor|radius', 1.6)
+        single.run_model()
+        for name in outputs:
+            np.testing.assert_allclose(prob.get_val(name)[i], single.get_val(name)[0], rtol=1e-12)
+
+    assert_check_partials(prob.check_partials(method='fd', form='central', out_stream=None), atol=1e-6, rtol=1e-4)
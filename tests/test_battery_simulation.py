@@ -0,0 +1,43 @@
+import numpy as np
+from MCEVS.Analyses.Energy.Simulation import BatteryEquivalentCircuit, simulate_battery
+
+# Flat open-circuit voltage, so that the response of the circuit has a closed form
+flat_ocv_table = (np.array([0.0, 1.0]), np.array([3.6, 3.6]))
+
+
+def test_constant_current_discharge():
+    battery = BatteryEquivalentCircuit(capacity=100e3, cell_ocv_table=flat_ocv_table)
+    ocv = battery.open_circuit_voltage(1.0)
+    current = 150.0
+    t = np.linspace(0.0, 600.0, 301)
+
+    # Closed-form RC response to a constant current, and the power drawing that current
+    v_rc = current * battery.R1 * (1.0 - np.exp(-t / battery.tau))
+    voltage = ocv - v_rc - current * battery.R0
+    power = current * voltage
+    results = simulate_battery(t, power, battery)
+
+    np.testing.assert_allclose(results['current'][0], current, rtol=1e-9)
+    np.testing.assert_allclose(results['voltage'][0], voltage, rtol=1e-9)
+    np.testing.assert_allclose(results['soc'][0], 1.0 - current * t / battery.charge, rtol=1e-9)
+    np.testing.assert_allclose(results['energy'][0], np.sum(0.5 * (power[1:] + power[:-1]) * np.diff(t)), rtol=1e-12)
+    assert not results['terminated'][0]
+
+
+def test_soc_floor_cutoff():
+    # Two packs of different capacities under the same constant power; only the smaller one reaches the floor
+    battery = BatteryEquivalentCircuit(capacity=np.array([20e3, 200e3]), cell_R1=0.0, cell_ocv_table=flat_ocv_table, soc_floor=0.2)
+    power = 100e3
+    t = np.linspace(0.0, 700.0, 36)  # 20 s steps, the floor is crossed between two nodes
+    results = simulate_battery(t, np.full_like(t, power), battery)
+
+    ocv = battery.open_circuit_voltage(1.0)
+    current = (ocv - np.sqrt(ocv**2 - 4.0 * battery.R0 * power)) / (2.0 * battery.R0)
+    t_floor = (1.0 - battery.soc_floor) * battery.charge / current
+
+    np.testing.assert_array_equal(results['terminated'], [True, False])
+    assert t[0] < t_floor[0] < t[-1] and not np.any(np.isclose(t, t_floor[0]))
+    np.testing.assert_allclose(results['termination_time'][0], t_floor[0], rtol=1e-9)
+    after = t > t_floor[0] + 20.0
+    assert np.all(np.isnan(results['soc'][0, after])) and np.all(np.isfinite(results['soc'][1]))
+    np.testing.assert_allclose(results['soc'][1, -1], 1.0 - current[1] * t[-1] / battery.charge[1], rtol=1e-9)
@@ -0,0 +1,40 @@
+import numpy as np
+from MCEVS.Constants.Container import EarthGravityAndAtmosphere, AtmosphereProvider, get_atmosphere_provider
+from MCEVS.Missions.Container import Mission
+
+keys = ['P', 'T', 'rho', 'mu', 'v_sound', 'g']
+
+
+def test_provider_matches_model():
+    model = EarthGravityAndAtmosphere('US_Standard_1976')
+    provider = get_atmosphere_provider('US_Standard_1976')
+    assert provider is get_atmosphere_provider('US_Standard_1976')
+    for altitude in [0.0, 1524.0, 1836.42, 3000.0]:
+        exact = model.compute_constants(altitude)
+        for key in keys:
+            np.testing.assert_allclose(provider.compute_constants(altitude)[key], exact[key], rtol=1e-12)
+
+
+def test_table_provider_accuracy():
+    model = EarthGravityAndAtmosphere('US_Standard_1976')
+    table = AtmosphereProvider('US_Standard_1976', table_resolution=10.0)
+    H = np.linspace(0.0, 3000.0, 1001)
+    exact = model.compute_constants_array(H)
+    approximate = table.compute_constants_array(H)
+    for key in keys:
+        np.testing.assert_allclose(approximate[key], exact[key], rtol=1e-4)
+
+
+def test_table_provider_in_missions():
+    table = get_atmosphere_provider('US_Standard_1976', table_resolution=10.0)
+    assert table is get_atmosphere_provider('US_Standard_1976', table_resolution=10.0)
+    assert table is not get_atmosphere_provider('US_Standard_1976')
+
+    n_calls = table.cache_info().hits + table.cache_info().misses
+    missions = [Mission(planet='Earth', takeoff_altitude=1524.0, n_repetition=1, atmosphere_table_resolution=resolution) for resolution in [None, 10.0]]
+    for mission in missions:
+        mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=2.54, distance=304.8, n_discrete=10)
+    assert table.cache_info().hits + table.cache_info().misses == n_calls + 1
+    exact, approximate = (mission.segments[0].constants for mission in missions)
+    for key in keys:
+        np.testing.assert_allclose(approximate[key], exact[key], rtol=1e-4)
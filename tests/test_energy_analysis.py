@@ -0,0 +1,71 @@
+import copy
+import numpy as np
+import openmdao.api as om
+from MCEVS.Missions.Standard import StandardMissionProfile
+from MCEVS.Analyses.Energy.Analysis import EnergyAnalysis, MissionEnergy
+from MCEVS.Analyses.Energy.TimeResolved import trapezoid_weights
+from MCEVS.Analyses.Power.TimeResolved import fixed_duration_kinds
+
+
+def evaluate_energy(vehicle, mission, fidelity):
+    prob = EnergyAnalysis(vehicle, mission, fidelity).evaluate()
+    # Every mission input (e.g., the distance and speed of a segment) is set by the analysis
+    names = {meta['prom_name'] for _, meta in prob.model.list_inputs(prom_name=True, out_stream=None)}
+    unconnected = [name for name in names if name.startswith('Mission|') and prob.model.get_source(name).startswith('_auto_ivc.')]
+    assert unconnected == []
+    return prob.get_val('Energy|entire_mission', 'kW*h')[0], prob.get_val('Mission|total_time', 's')[0]
+
+
+def test_fixed_duration_kinds(fidelity):
+    assert fixed_duration_kinds(fidelity) == ['ConstantPower', 'NoCreditClimb', 'NoCreditDescent', 'ReserveCruise', 'HoverStay']
+    time_resolved = copy.deepcopy(fidelity)
+    time_resolved['power_model']['time_resolved'] = True
+    assert set(fixed_duration_kinds(time_resolved)) - set(fixed_duration_kinds(fidelity)) == {'HoverClimbConstantAcceleration', 'HoverDescentConstantDeceleration'}
+
+
+def test_energy_standard_mission_unchanged(lift_plus_cruise, fidelity):
+    # Reference values of the segment-by-segment energy model that MissionEnergy replaced
+    energy, total_time = evaluate_energy(lift_plus_cruise, StandardMissionProfile(50e3, 50.0), fidelity)
+    np.testing.assert_allclose(energy, 110.53889495523016, rtol=1e-10)
+    np.testing.assert_allclose(total_time, 1320.0, rtol=1e-12)
+
+
+def test_energy_hover_stay(lift_plus_cruise, hover_stay_mission, fidelity):
+    # Hover stay lasts its duration (30 s) with and without the time-resolved mode
+    energy, total_time = evaluate_energy(lift_plus_cruise, hover_stay_mission, fidelity)
+    np.testing.assert_allclose(total_time, 1350.0, rtol=1e-12)
+
+    fidelity['power_model']['time_resolved'] = True
+    energy_time_resolved, total_time = evaluate_energy(lift_plus_cruise, hover_stay_mission, fidelity)
+    np.testing.assert_allclose(total_time, 1350.0, rtol=1e-12)
+    np.testing.assert_allclose(energy_time_resolved, energy, rtol=1e-2)
+
+
+def test_energy_hover_stay_duration(lift_plus_cruise, make_hover_stay_mission, fidelity):
+    energy, _ = evaluate_energy(lift_plus_cruise, make_hover_stay_mission(30.0), fidelity)
+    energy_longer, total_time = evaluate_energy(lift_plus_cruise, make_hover_stay_mission(60.0), fidelity)
+    np.testing.assert_allclose(total_time, 1380.0, rtol=1e-12)
+    assert energy_longer > energy
+
+
+def test_mission_energy_partials():
+    # A time-resolved segment with a fixed duration, a segment whose duration is distance / speed, and a reserve
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('energy', MissionEnergy(weights_list=[trapezoid_weights(np.linspace(0.0, 1.0, 5)), trapezoid_weights([0.0])],
+                                                     fixed_durations=[30.0, np.nan], reserve_duration=1200.0), promotes=['*'])
+    prob.setup(force_alloc_complex=True)
+    prob.set_val('power_segment_1', np.linspace(300e3, 350e3, 5))
+    prob.set_val('power_segment_2', 150e3)
+    prob.set_val('distance_segment_2', 50e3)
+    prob.set_val('speed_segment_2', 50.0)
+    prob.set_val('power_reserve', 140e3)
+    prob.set_val('n_repetition', 2.0)
+    prob.run_model()
+
+    energy_one_mission = 30.0 * 325e3 + 1000.0 * 150e3
+    np.testing.assert_allclose(prob.get_val('energy_one_mission'), energy_one_mission, rtol=1e-12)
+    np.testing.assert_allclose(prob.get_val('energy_total'), 2.0 * energy_one_mission + 1200.0 * 140e3, rtol=1e-12)
+
+    data = prob.check_partials(method='cs', out_stream=None)
+    for key, value in data['energy'].items():
+        np.testing.assert_allclose(value['J_fwd'], value['J_fd'], rtol=1e-12, atol=1e-12, err_msg=str(key))
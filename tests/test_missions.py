@@ -0,0 +1,83 @@
+import numpy as np
+from MCEVS.Missions.Container import Mission
+from MCEVS.Missions.Segments.Discretization import discretization_error
+from MCEVS.Missions.Segments.Vectorized import channels
+from MCEVS.Missions.Segments.HoverClimb.Constant_Speed import HoverClimbConstantSpeed
+from MCEVS.Missions.Segments.HoverClimb.Constant_Acceleration import HoverClimbConstantAcceleration
+from MCEVS.Missions.Segments.Climb.Constant_Vy_Constant_Ax import ClimbConstantVyConstantAx
+from MCEVS.Missions.Segments.Descent.Constant_Vy_Constant_Ax import DescentConstantVyConstantAx
+from MCEVS.Missions.Segments.HoverDescent.Constant_Deceleration import HoverDescentConstantDeceleration
+from MCEVS.Missions.Segments.Climb.No_Credit import NoCreditClimb
+from MCEVS.Missions.Segments.Cruise.Constant_Speed import CruiseConstantSpeed
+from MCEVS.Missions.Segments.Descent.No_Credit import NoCreditDescent
+from MCEVS.Missions.Segments.HoverDescent.Constant_Speed import HoverDescentConstantSpeed
+
+
+def uber_mission(discretization_tol=None):
+    mission = Mission(planet='Earth', takeoff_altitude=0.0, n_repetition=1, discretization_tol=discretization_tol)
+    mission.add_segment(name='Hover Climb', kind='HoverClimbConstantAcceleration', final_speed=2.54, distance=15.24, n_discrete=10)
+    mission.add_segment(name='Transition + Climb', kind='ClimbConstantVyConstantAx', distance_Y=76.2, speed_Y=2.54, final_speed_X=40.0, n_discrete=10)
+    mission.add_segment(name='Departure Terminal Procedures', kind='CruiseConstantSpeed', speed=40.0, duration=60.0, n_discrete=5)
+    mission.add_segment(name='Cruise', kind='CruiseConstantSpeed', speed=40.0, distance=40e3, n_discrete=5)
+    mission.add_segment(name='Transition + Descent', kind='DescentConstantVyConstantAx', distance_Y=76.2, speed_Y=1.524, final_speed_X=0.0, n_discrete=10)
+    mission.add_segment(name='Hover Descent', kind='HoverDescentConstantDeceleration', initial_speed=1.524, final_speed=0.0, distance=15.24, n_discrete=10)
+    return mission
+
+
+def test_vectorized_kinematics_match_missions():
+    hover_climb_speed = np.array([2.0, 2.54, 3.0])
+    cruise_speed = np.array([40.0, 50.0, 70.0])
+    mission_range = np.array([10e3, 50e3, 100e3])
+
+    hover_climb = HoverClimbConstantSpeed.vectorized_kinematics(10, None, speed=hover_climb_speed, distance=304.8)
+    no_credit_climb = NoCreditClimb.vectorized_kinematics(10, hover_climb, distance_Y=152.4, distance_X=0.0)
+    cruise = CruiseConstantSpeed.vectorized_kinematics(10, no_credit_climb, speed=cruise_speed, distance=mission_range)
+    no_credit_descent = NoCreditDescent.vectorized_kinematics(10, cruise, distance_Y=152.4, distance_X=0.0)
+    hover_descent = HoverDescentConstantSpeed.vectorized_kinematics(10, no_credit_descent, speed=1.524, distance=304.8)
+
+    for i in range(len(cruise_speed)):
+        mission = Mission(planet='Earth', takeoff_altitude=5000 * 0.3048, n_repetition=1)
+        mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=hover_climb_speed[i], distance=304.8, n_discrete=10)
+        mission.add_segment(name='No Credit Climb', kind='NoCreditClimb', distance_Y=152.4, distance_X=0.0, n_discrete=10)
+        mission.add_segment('Cruise', kind='CruiseConstantSpeed', speed=cruise_speed[i], distance=mission_range[i], n_discrete=10)
+        mission.add_segment(name='No Credit Descent', kind='NoCreditDescent', distance_Y=152.4, distance_X=0.0, n_discrete=10)
+        mission.add_segment(name='Hover Descent', kind='HoverDescentConstantSpeed', speed=1.524, distance=304.8, n_discrete=10)
+        for j, segment in enumerate([hover_climb, no_credit_climb, cruise, no_credit_descent, hover_descent]):
+            for channel in channels:
+                np.testing.assert_allclose(segment[channel][i], getattr(mission, channel)[j], rtol=1e-12, atol=1e-9)
+
+
+def test_vectorized_kinematics_initial_values():
+    # Segments starting from the speed of the previous one (initial_values), or from a given initial speed
+    hover_climb = HoverClimbConstantAcceleration.vectorized_kinematics(10, None, final_speed=2.54, distance=15.24)
+    climb = ClimbConstantVyConstantAx.vectorized_kinematics(10, hover_climb, distance_Y=76.2, speed_Y=2.54, final_speed_X=40.0)
+    terminal = CruiseConstantSpeed.vectorized_kinematics(5, climb, speed=40.0, duration=60.0)
+    cruise = CruiseConstantSpeed.vectorized_kinematics(5, terminal, speed=40.0, distance=40e3)
+    descent = DescentConstantVyConstantAx.vectorized_kinematics(10, cruise, distance_Y=76.2, speed_Y=1.524, final_speed_X=0.0)
+    hover_descent = HoverDescentConstantDeceleration.vectorized_kinematics(10, descent, initial_speed=1.524, final_speed=0.0, distance=15.24)
+
+    mission = uber_mission()
+    for j, segment in enumerate([hover_climb, climb, terminal, cruise, descent, hover_descent]):
+        for channel in channels:
+            np.testing.assert_allclose(segment[channel][0], getattr(mission, channel)[j], rtol=1e-12, atol=1e-9)
+
+
+def test_adaptive_discretization():
+    # The errors of the fixed discretization as tolerances: fewer nodes, same accuracy
+    fixed = uber_mission()
+    error = discretization_error(fixed)
+    adaptive = uber_mission({'position': error['position'], 'velocity': error['velocity']})
+    adaptive_error = discretization_error(adaptive)
+    assert adaptive.trajectory.n_nodes < fixed.trajectory.n_nodes
+    assert adaptive_error['position'] <= error['position'] * (1 + 1e-9)
+    assert adaptive_error['velocity'] <= error['velocity'] * (1 + 1e-9)
+
+
+def test_adaptive_n_discrete_per_kind():
+    mission = uber_mission({'position': 0.1, 'velocity': 0.1})
+    mission.add_segment(name='No Credit Climb', kind='NoCreditClimb', distance_Y=152.4, distance_X=0.0, n_discrete=10)
+    mission.add_segment(name='Hover', kind='HoverStay', duration=30.0, n_discrete=10)
+    mission.add_segment(name='Reserve Cruise', kind='ReserveCruise', duration=20 * 60)
+    for segment in mission.segments:
+        accelerating = segment.kind in ['HoverClimbConstantAcceleration', 'ClimbConstantVyConstantAx', 'DescentConstantVyConstantAx', 'HoverDescentConstantDeceleration']
+        assert (segment.n_discrete > 1) == accelerating
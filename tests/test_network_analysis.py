@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from MCEVS.Analyses.Weight.Analysis import WeightAnalysis
+from MCEVS.Analyses.Network.Analysis import RouteNetworkAnalysis, complete_route_table, route_mission_parameters, build_route_problem
+from MCEVS.Missions.Standard import StandardMissionProfile, RouteMissionProfile
+
+
+@pytest.fixture
+def sized_lift_plus_cruise(lift_plus_cruise, fidelity):
+    WeightAnalysis(lift_plus_cruise, StandardMissionProfile(60e3, 50.0), fidelity, weight_type='maximum', sizing_mode=True, solved_by='optimization').evaluate(print=False)
+    return lift_plus_cruise
+
+
+def test_complete_route_table():
+    routes = complete_route_table(pd.DataFrame({'range': [50e3], 'cruise_speed': [50.0], 'origin': ['A']}))
+    assert routes.loc[0, 'hover_time_departure'] == 0.0 and routes.loc[0, 'origin'] == 'A'
+    with pytest.raises(ValueError):
+        complete_route_table(pd.DataFrame({'range': [50e3]}))
+
+
+def test_routes_close_the_weight_balance(sized_lift_plus_cruise, fidelity):
+    routes = pd.DataFrame({'range': [60e3, 30e3, 500e3], 'cruise_speed': [50.0, 55.0, 50.0], 'cruise_altitude': [1981.2, 2286.0, 1981.2]})
+    results = RouteNetworkAnalysis(sized_lift_plus_cruise, routes, fidelity).evaluate()
+
+    # No takeoff weight closes the weight balance on a 500 km route
+    assert results['converged'].tolist() == [True, True, False]
+    assert results['feasible'].tolist()[2] is False
+
+    # Each converged route, evaluated on its own problem at its gross takeoff weight
+    for i in [0, 1]:
+        mission = RouteMissionProfile(**route_mission_parameters(complete_route_table(routes))[i])
+        prob = build_route_problem(sized_lift_plus_cruise, mission, fidelity)
+        prob.run_model()  # as in evaluate_route_group, the inner solvers start from a converged state
+        prob.set_val('Weight|takeoff', results.loc[i, 'Weight|takeoff'], 'kg')
+        prob.run_model()
+        W_fixed = sum(prob.get_val(f'Weight|{name}', 'kg')[0] for name in ['payload', 'propulsion', 'structure', 'equipment'])
+        np.testing.assert_allclose(W_fixed + prob.get_val('Weight|battery', 'kg')[0], results.loc[i, 'Weight|takeoff'], rtol=1e-5)
+        np.testing.assert_allclose(prob.get_val('Energy|entire_mission', 'W*s')[0], results.loc[i, 'Energy|entire_mission'], rtol=1e-5)
+    assert results.loc[1, 'Weight|takeoff'] < results.loc[0, 'Weight|takeoff']
+
+
+def test_route_hover_times(sized_lift_plus_cruise, fidelity):
+    # Each route has its own departure and arrival hover times, costed for their whole duration
+    hover_times = [0.0, 30.0, 120.0]
+    routes = pd.DataFrame({'range': 30e3, 'cruise_speed': 50.0, 'hover_time_departure': hover_times, 'hover_time_arrival': hover_times})
+    results = RouteNetworkAnalysis(sized_lift_plus_cruise, routes, fidelity).evaluate()
+    energy = results['Energy|entire_mission'].to_numpy()
+    weight = results['Weight|takeoff'].to_numpy()
+    assert np.all(np.diff(energy) > 0.0) and np.all(np.diff(weight) > 0.0)
+
+    # At a given takeoff weight, each hover stay costs its power for its whole duration
+    energy, power = [], []
+    for hover_time in [0.0, 60.0]:
+        mission = RouteMissionProfile(30e3, 50.0, hover_time_departure=hover_time, hover_time_arrival=hover_time)
+        prob = build_route_problem(sized_lift_plus_cruise, mission, fidelity)
+        prob.run_model()
+        energy.append(prob.get_val('Energy|entire_mission', 'W*s')[0])
+        power += [prob.get_val(f'Power|segment_{segment.id}', 'W')[0] for segment in mission.segments if segment.kind == 'HoverStay']
+    np.testing.assert_allclose(energy[1] - energy[0], 60.0 * sum(power), rtol=1e-6)
@@ -0,0 +1,45 @@
+import os
+from MCEVS.Wrappers.OpenVSP import Utils
+from MCEVS.Wrappers.OpenVSP.Cache import MemoryWettedAreaCache, WettedAreaCache, get_wetted_area_cache
+
+
+def test_memory_cache_is_bounded():
+    cache = MemoryWettedAreaCache(maxsize=2)
+    cache.set('a', {'wetted_area': {}})
+    cache.set('b', {'wetted_area': {}})
+    assert cache.get('a') is not None   # 'b' becomes the least recently used entry
+    cache.set('c', {'wetted_area': {}})
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.statistics()['n_entries'] == 2
+
+
+def test_lookups_do_not_write_to_database(tmp_path):
+    cache = WettedAreaCache(str(tmp_path / 'wetted_area.sqlite'), flush_every=10)
+    cache.set('a', {'wetted_area': {'Wing': 28.0}})
+    statements = []
+    cache._connection().set_trace_callback(statements.append)
+    for _ in range(9):
+        cache.get('a')
+    assert not any(statement.startswith('UPDATE') for statement in statements)
+    cache.get('a')
+    assert any(statement.startswith('UPDATE') for statement in statements)
+
+    cache.get('b')
+    statistics = cache.statistics()
+    assert (statistics['shared_hits'], statistics['shared_misses']) == (10, 1)
+
+
+def test_default_cache_is_in_memory(lift_plus_cruise, tmp_path, monkeypatch):
+    monkeypatch.setenv('MCEVS_CACHE_DIR', str(tmp_path))
+    calls = []
+
+    def compute(vehicle):
+        calls.append(vehicle)
+        return {'Fuselage': 25.0}, None
+
+    monkeypatch.setattr(Utils, '_compute_wetted_area', compute)
+    get_wetted_area_cache().clear()
+    assert Utils.calc_wetted_area(lift_plus_cruise) == Utils.calc_wetted_area(lift_plus_cruise) == {'Fuselage': 25.0}
+    assert len(calls) == 1
+    assert os.listdir(tmp_path) == []
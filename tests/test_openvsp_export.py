@@ -0,0 +1,43 @@
+import os
+import pytest
+from MCEVS.Wrappers.OpenVSP import Export
+from MCEVS.Wrappers.OpenVSP.Standard_Vehicles import create_NASA_LiftPlusCruise_vsp3, create_NASA_QuadRotor_vsp3
+
+
+class RecordingStore(Export.GeometryStore):
+    """
+    GeometryStore whose exports write a placeholder vsp3 file instead of building the geometry
+    """
+    def __init__(self, directory):
+        super(RecordingStore, self).__init__(directory)
+        self.exported = []
+
+    def export(self, vehicle):
+        self.exported.append(vehicle)
+        path = os.path.join(self.directory, 'vehicle.vsp3')
+        with open(path, 'w') as file:
+            file.write(vehicle.configuration)
+        return {'vsp3': path}
+
+
+@pytest.mark.parametrize('create, vehicle_name', [(create_NASA_LiftPlusCruise_vsp3, 'lift_plus_cruise'), (create_NASA_QuadRotor_vsp3, 'multirotor')])
+def test_vsp3_from_store(create, vehicle_name, request, tmp_path, monkeypatch):
+    vehicle = request.getfixturevalue(vehicle_name)
+    given, default = RecordingStore(str(tmp_path / 'given')), RecordingStore(str(tmp_path / 'default'))
+    monkeypatch.setattr(Export, '_default_store', default)
+
+    create(str(tmp_path / 'given.vsp3'), vehicle, store=given)
+    create(str(tmp_path / 'default.vsp3'), vehicle, store=True)
+    assert given.exported == [vehicle] and default.exported == [vehicle]
+    assert (tmp_path / 'given.vsp3').read_text() == (tmp_path / 'default.vsp3').read_text() == vehicle.configuration
+
+
+@pytest.mark.parametrize('store', [False, None, 'store'])
+def test_vsp3_without_store(store, lift_plus_cruise, tmp_path, monkeypatch):
+    pytest.importorskip('openvsp')
+    default = RecordingStore(str(tmp_path / 'default'))
+    monkeypatch.setattr(Export, '_default_store', default)
+
+    create_NASA_LiftPlusCruise_vsp3(str(tmp_path / 'vehicle.vsp3'), lift_plus_cruise, store=store)
+    assert default.exported == []
+    assert os.path.exists(tmp_path / 'vehicle.vsp3')
@@ -0,0 +1,108 @@
+import copy
+import pytest
+from MCEVS.Wrappers.OpenVSP.Cache import MemoryWettedAreaCache, wetted_area_inputs
+from MCEVS.Wrappers.OpenVSP.Pool import OpenVSPWorkerPool
+
+# Stand-in for the openvsp module of the worker processes: the wetted areas depend on every parameter value set,
+# and a fuselage length of 99 m crashes the worker, 98 m hangs it, and 97 m crashes it once (then succeeds)
+mock_openvsp = """
+import time
+import os
+
+_values = []
+
+
+def ClearVSPModel():
+    _values.clear()
+
+
+def SetParmVal(*args):
+    value = args[-1]
+    _values.append(float(value))
+    if args[1:3] == ('Length', 'Design'):
+        if value == 99.0:
+            os._exit(3)
+        if value == 98.0:
+            time.sleep(600)
+        if value == 97.0 and not os.path.exists(os.environ['MOCK_OPENVSP_MARKER']):
+            open(os.environ['MOCK_OPENVSP_MARKER'], 'w').close()
+            os._exit(3)
+
+
+SetParmValUpdate = SetParmVal
+
+
+def GetParmVal(*args):
+    return 1.0
+
+
+def GetNumXSec(*args):
+    return 5
+
+
+def GetDoubleResults(*args):
+    return [sum(_values) + i for i in range(14)]
+
+
+def __getattr__(name):
+    return lambda *args, **kwargs: name
+"""
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    # Worker processes are spawned with the sys.path and the environment of this process
+    (tmp_path / 'openvsp.py').write_text(mock_openvsp)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv('MOCK_OPENVSP_MARKER', str(tmp_path / 'crashed'))
+    with OpenVSPWorkerPool(n_workers=2, timeout=2.0, max_retries=1, use_session=False) as pool:
+        yield pool
+
+
+def with_fuselage_length(vehicle, length):
+    inputs = wetted_area_inputs(vehicle)
+    inputs['fuselage_length'] = [length]
+    return inputs
+
+
+def test_map_computes_each_geometry_once(pool, lift_plus_cruise, monkeypatch):
+    other = copy.deepcopy(lift_plus_cruise)
+    other.wing.area = 16.0
+    run = pool.run
+    requests = []
+
+    def recording_run(inputs_list):
+        requests.append(inputs_list)
+        return run(inputs_list)
+
+    monkeypatch.setattr(pool, 'run', recording_run)
+    cache = MemoryWettedAreaCache()
+    vehicles = [lift_plus_cruise, other, copy.deepcopy(lift_plus_cruise)]
+    results = pool.map(vehicles, cache=cache)
+    assert [len(inputs_list) for inputs_list in requests] == [2]
+    assert results[0] == results[2] != results[1]
+    assert results == [res for res, _ in run([wetted_area_inputs(vehicle) for vehicle in vehicles])]
+
+    # Served by the cache
+    assert pool.map(vehicles, cache=cache) == results
+    assert [len(inputs_list) for inputs_list in requests] == [2, 0]
+
+
+def test_run_recovers_from_crashes_and_timeouts(pool, lift_plus_cruise):
+    reference = pool.run([with_fuselage_length(lift_plus_cruise, 96.0)])[0][0]
+
+    # Crashing once: restarted and retried
+    res = pool.run([with_fuselage_length(lift_plus_cruise, 97.0)])[0][0]
+    assert res['Fuselage'] == reference['Fuselage'] + 1.0
+    assert pool.n_restarts == 1
+
+    # Crashing or hanging on every attempt: restarted, retried once, then raised
+    with pytest.raises(RuntimeError, match='crashed'):
+        pool.run([with_fuselage_length(lift_plus_cruise, 99.0), with_fuselage_length(lift_plus_cruise, 96.0)])
+    assert pool.n_restarts == 3
+    with pytest.raises(TimeoutError):
+        pool.run([with_fuselage_length(lift_plus_cruise, 98.0)])
+    assert pool.n_restarts == 5
+
+    # The restarted workers serve the next requests
+    assert [res for res, _ in pool.run([with_fuselage_length(lift_plus_cruise, 96.0)] * 3)] == [reference] * 3
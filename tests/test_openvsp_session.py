@@ -0,0 +1,48 @@
+import time
+import numpy as np
+import pytest
+from MCEVS.Vehicles.Standard import StandardLiftPlusCruiseEVTOL, StandardMultirotorEVTOL
+
+pytest.importorskip('openvsp')
+
+from MCEVS.Wrappers.OpenVSP.Utils import _compute_wetted_area  # noqa: E402
+from MCEVS.Wrappers.OpenVSP.Session import OpenVSPSession  # noqa: E402
+
+
+def geometry_changes(n_designs=10, seed=0):
+    """
+    Standard LPC with random wing areas, wing aspect ratios and lift rotor radii (updated in place by a session),
+    a longer fuselage (rebuild), and multirotors with random lift rotor radii (rebuild, then updated in place)
+    """
+    rng = np.random.default_rng(seed)
+    vehicles = [StandardLiftPlusCruiseEVTOL({'r_lift_rotor': rng.uniform(1.0, 2.0), 'r_propeller': 1.4,
+                                             'wing_area': rng.uniform(10.0, 20.0), 'wing_aspect_ratio': rng.uniform(8.0, 12.0)})
+                for _ in range(n_designs)]
+    vehicles[-1].fuselage.length *= 1.1
+    vehicles += [StandardMultirotorEVTOL({'r_lift_rotor': rng.uniform(1.5, 2.5)}) for _ in range(n_designs)]
+    return vehicles
+
+
+def test_session_matches_rebuild(record_property):
+    vehicles = geometry_changes()
+
+    t0 = time.perf_counter()
+    rebuilt = [_compute_wetted_area(vehicle)[0] for vehicle in vehicles]
+    latency_rebuild = (time.perf_counter() - t0) / len(vehicles)
+
+    session = OpenVSPSession()
+    updated = [session.wetted_area(vehicle)[0] for vehicle in vehicles]
+    session.close()
+
+    for res_rebuilt, res_updated in zip(rebuilt, updated):
+        assert res_updated.keys() == res_rebuilt.keys()
+        for name in res_rebuilt:
+            assert res_updated[name] == pytest.approx(res_rebuilt[name], rel=1e-6)
+
+    statistics = session.statistics()
+    assert statistics['n_build'] == 3 and statistics['n_update'] == len(vehicles) - 3
+    record_property('latency_rebuild', latency_rebuild)
+    for name, value in statistics.items():
+        record_property(name, value)
+    print(f"\nwetted area latency [s]: rebuild {latency_rebuild:.4g}, session update {statistics['latency_update']:.4g}, "
+          f"session build {statistics['latency_build']:.4g}")
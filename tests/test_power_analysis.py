@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+import openmdao.api as om
+from MCEVS.Missions.Container import Mission
+from MCEVS.Missions.Standard import StandardMissionProfile
+from MCEVS.Analyses.Energy.Analysis import EnergyAnalysis
+from MCEVS.Analyses.Weight.Analysis import WeightAnalysis
+from MCEVS.Utils.Functions import Maximum
+from MCEVS.Analyses.Aerodynamics.Parasite import ParasiteDragNonHubFidelityOne
+
+
+def test_multirotor_energy(multirotor, fidelity):
+    mission = StandardMissionProfile(50e3, 50.0)
+    prob = EnergyAnalysis(multirotor, mission, fidelity).evaluate()
+    for i in range(1, mission.n_segments + 1):
+        np.testing.assert_allclose(prob.get_val(f'Power|segment_{i}', 'W'), prob.get_val(f'Power|LiftRotor|segment_{i}', 'W'))
+    assert np.isfinite(prob.get_val('Energy|entire_mission', 'kW*h')[0])
+    assert prob.get_val('Energy|entire_mission', 'kW*h')[0] > 0.0
+
+
+def test_multirotor_weight(multirotor, fidelity):
+    prob = WeightAnalysis(multirotor, StandardMissionProfile(50e3, 50.0), fidelity, weight_type='maximum', sizing_mode=False).evaluate(print=False, weight_guess=1500.0)
+    assert np.isfinite(prob.get_val('Weight|residual')[0])
+    assert prob.get_val('Weight|battery', 'kg')[0] > 0.0
+
+
+def test_maximum_tie():
+    # Lift rotor thrusts in hover climb and hover descent are equal (W*g/N): only one of them carries the derivative
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem('max', Maximum(names=['a', 'b', 'c'], units='N'), promotes=['*'])
+    prob.setup(force_alloc_complex=True)
+    prob.set_val('a', 2.0)
+    prob.set_val('b', 1.0)
+    prob.set_val('c', 2.0)
+    prob.run_model()
+    totals = prob.compute_totals(['fmax'], ['a', 'b', 'c'])
+    assert prob.get_val('fmax')[0] == 2.0
+    assert sum(totals['fmax', name].item() for name in ['a', 'b', 'c']) == 1.0
+
+
+def test_weight_residual_total_derivative(lift_plus_cruise, fidelity):
+    # The derivative driving the MTOW sizing must agree with finite differences
+    prob = WeightAnalysis(lift_plus_cruise, StandardMissionProfile(50e3, 50.0), fidelity, weight_type='maximum', sizing_mode=False).evaluate(print=False, weight_guess=2460.0)
+    derivative = prob.compute_totals(['Weight|residual'], ['Weight|takeoff'])['Weight|residual', 'Weight|takeoff'].item()
+    residuals = []
+    for weight in [2460.0, 2460.01]:
+        prob.set_val('Weight|takeoff', weight, units='kg')
+        prob.run_model()
+        residuals.append(prob.get_val('Weight|residual')[0])
+    derivative_fd = (residuals[1] - residuals[0]) / 0.01
+    np.testing.assert_allclose(derivative, derivative_fd, rtol=1e-2)
+
+
+@pytest.mark.parametrize('configuration', ['LiftPlusCruise', 'Multirotor'])
+def test_build_up_drag_shared_by_segments(configuration, lift_plus_cruise, multirotor, fidelity, stand_in_wetted_area):
+    vehicle = lift_plus_cruise if configuration == 'LiftPlusCruise' else multirotor
+    for component in [vehicle.lift_rotor] + ([vehicle.propeller] if configuration == 'LiftPlusCruise' else []):
+        component.RPM.update({'climb': 450.0, 'cruise': 450.0, 'descent': 450.0})
+    mission = Mission(planet='Earth', takeoff_altitude=0.0, n_repetition=1)
+    mission.add_segment(name='Hover Climb', kind='HoverClimbConstantSpeed', speed=2.54, distance=152.4, n_discrete=5)
+    mission.add_segment(name='Climb', kind='ClimbConstantVyConstantVx', speed_Y=2.54, distance_Y=304.8, speed_X=45.0, n_discrete=5)
+    mission.add_segment(name='Cruise', kind='CruiseConstantSpeed', speed=50.0, distance=30e3, AoA=5.0, n_discrete=5)
+    mission.add_segment(name='Descent', kind='DescentConstantVyConstantVx', speed_Y=1.524, distance_Y=304.8, speed_X=40.0, n_discrete=5)
+    mission.add_segment(name='Hover Descent', kind='HoverDescentConstantSpeed', speed=1.524, distance=152.4, n_discrete=5)
+    fidelity['aerodynamics']['parasite'] = 'ComponentBuildUp'
+    prob = EnergyAnalysis(vehicle, mission, fidelity).evaluate()
+
+    # One build-up for all forward flight segments, giving each the drag of its own flow conditions
+    power_requirement = prob.model.energy_model.power_requirement
+    for segment in mission.segments[1:4]:
+        assert not hasattr(getattr(power_requirement, f'segment_{segment.id}_power').parasite_drag, 'parasite_drag_without_rotor_hub')
+        single = om.Problem(reports=False)
+        single.model.add_subsystem('drag', ParasiteDragNonHubFidelityOne(vehicle=vehicle, rho_air=segment.constants['rho'], mu_air=segment.constants['mu'], segment_name='cruise', cache=False),
+                                   promotes=['*'])
+        single.setup()
+        single.set_val('Aero|speed', segment.speed)
+        single.run_model()
+        f_non_hub = prob.get_val(f'energy_model.power_requirement.segment_{segment.id}_power.parasite_drag.Aero|f_non_hub')
+        np.testing.assert_allclose(f_non_hub, single.get_val('Aero|f_non_hub'), rtol=1e-12)
+    assert np.isfinite(prob.get_val('Energy|entire_mission', 'kW*h')[0])
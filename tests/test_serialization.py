@@ -0,0 +1,27 @@
+import pickle
+import numpy as np
+import pytest
+from MCEVS.Missions.Standard import StandardMissionProfile
+from MCEVS.Utils.Serialization import to_dict, from_dict, dumps, loads, save, load
+
+
+def test_round_trip(lift_plus_cruise, multirotor, tmp_path):
+    mission = StandardMissionProfile(50e3, 50.0)
+    for obj in [lift_plus_cruise, multirotor, mission]:
+        path = str(tmp_path / 'object.npz')
+        save(obj, path)
+        for copy in [from_dict(*to_dict(obj)), loads(dumps(obj)), load(path)]:
+            assert type(copy) is type(obj)
+            (params, arrays), (params_copy, arrays_copy) = to_dict(obj), to_dict(copy)
+            assert params_copy == params and arrays_copy.keys() == arrays.keys()
+            for key in arrays:
+                np.testing.assert_array_equal(arrays_copy[key], arrays[key])
+
+
+def test_loads_is_restricted(lift_plus_cruise):
+    with pytest.raises(ValueError):
+        loads(pickle.dumps(lift_plus_cruise))
+    with pytest.raises(pickle.UnpicklingError):
+        loads(dumps(lift_plus_cruise)[:6] + pickle.dumps(print))
+    with pytest.raises(TypeError):
+        dumps(lift_plus_cruise.wing)